@@ -25,7 +25,7 @@ from app.core.models import SQLModel  # noqa
 from app.models.user import User
 from app.models.epigraph import Epigraph
 from app.models.analytics_cache import AnalyticsCache
-from app.models.word import Word
+from app.models.word import EpigraphWordIndex, Word
 from app.models.site import Site
 from app.models.object import Object
 from app.models.links import (
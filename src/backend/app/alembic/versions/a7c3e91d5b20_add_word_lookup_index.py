@@ -0,0 +1,23 @@
+"""Add word lookup index
+
+Revision ID: a7c3e91d5b20
+Revises: f4f7a1c2d9e0
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "a7c3e91d5b20"
+down_revision = "f4f7a1c2d9e0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_word_word_classification", "word", ["word", "classification"], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_word_word_classification", table_name="word")
@@ -0,0 +1,35 @@
+"""Add epigraph word index state
+
+Revision ID: c2d8e4f61a93
+Revises: a7c3e91d5b20
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from sqlalchemy.dialects import postgresql
+
+
+revision = "c2d8e4f61a93"
+down_revision = "a7c3e91d5b20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "epigraphwordindex",
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("epigraph_id", sa.Integer(), nullable=False),
+        sa.Column("text_hash", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("word_counts", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("bigram_counts", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.PrimaryKeyConstraint("epigraph_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("epigraphwordindex")
@@ -0,0 +1,64 @@
+"""Add word stats
+
+Revision ID: d5a1f7b3c824
+Revises: c2d8e4f61a93
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d5a1f7b3c824"
+down_revision = "c2d8e4f61a93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("word", sa.Column("epigraph_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("word", sa.Column("outgoing_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("word", sa.Column("incoming_count", sa.Integer(), server_default="0", nullable=False))
+
+    op.create_index(op.f("ix_epigraphwordlink_word_id"), "epigraphwordlink", ["word_id"], unique=False)
+    op.create_index(op.f("ix_wordlink_to_word_id"), "wordlink", ["to_word_id"], unique=False)
+
+    op.execute(
+        """
+        UPDATE word SET epigraph_count = stats.count
+        FROM (SELECT word_id, count(*) AS count FROM epigraphwordlink GROUP BY word_id) AS stats
+        WHERE word.id = stats.word_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE word SET outgoing_count = stats.count
+        FROM (SELECT from_word_id, count(*) AS count FROM wordlink GROUP BY from_word_id) AS stats
+        WHERE word.id = stats.from_word_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE word SET incoming_count = stats.count
+        FROM (SELECT to_word_id, count(*) AS count FROM wordlink GROUP BY to_word_id) AS stats
+        WHERE word.id = stats.to_word_id
+        """
+    )
+
+    op.create_index("ix_word_frequency_id", "word", ["frequency", "id"], unique=False)
+    op.create_index("ix_word_epigraph_count_id", "word", ["epigraph_count", "id"], unique=False)
+    op.create_index("ix_word_outgoing_count_id", "word", ["outgoing_count", "id"], unique=False)
+    op.create_index("ix_word_incoming_count_id", "word", ["incoming_count", "id"], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_word_incoming_count_id", table_name="word")
+    op.drop_index("ix_word_outgoing_count_id", table_name="word")
+    op.drop_index("ix_word_epigraph_count_id", table_name="word")
+    op.drop_index("ix_word_frequency_id", table_name="word")
+    op.drop_index(op.f("ix_wordlink_to_word_id"), table_name="wordlink")
+    op.drop_index(op.f("ix_epigraphwordlink_word_id"), table_name="epigraphwordlink")
+    op.drop_column("word", "incoming_count")
+    op.drop_column("word", "outgoing_count")
+    op.drop_column("word", "epigraph_count")
@@ -3,9 +3,9 @@ import logging
 import os
 import re
 import shutil
-from typing import Any, Dict, List, Optional, Sequence, cast
+from typing import Annotated, Any, Dict, List, Optional, Sequence, cast
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy import text as sql_text
 from sqlmodel import asc, desc, func, select
@@ -40,6 +40,7 @@ from app.models.pipeline_run import PipelineRun, PipelineRunOut
 from app.services.enrichment.embeddings import EmbeddingsService
 from app.services.importers.epigraph import EpigraphImportService
 from app.services.pipeline.dispatch import dispatch_dasi_pipeline
+from app.services.search.cursor import InvalidCursorError
 from app.services.search.epigraph_fields import get_epigraph_facet_schema, get_epigraph_facet_values
 from app.services.search.epigraph_search_schema import (
     expand_epigraph_search_scope_keys,
@@ -48,7 +49,7 @@ from app.services.search.epigraph_search_schema import (
     validate_epigraph_search_field_keys,
 )
 from app.services.search.service import SearchService
-from app.services.text.word_parser import WordParser
+from app.services.text.word_index import WordIndexBuilder
 from app.utils import parse_period
 
 
@@ -134,6 +135,8 @@ class EpigraphQueryRequest(BaseModel):
     page_size: int = Field(default=25, ge=1, le=250)
     sort_field: str | None = None
     sort_order: str | None = None
+    cursor: str | None = None
+    include_facets: bool = True
 
 
 class EpigraphFacetBucket(BaseModel):
@@ -141,6 +144,14 @@ class EpigraphFacetBucket(BaseModel):
     count: int
 
 
+class EpigraphQueryTimings(BaseModel):
+    hits_ms: float | None = None
+    facets_ms: float | None = None
+    page_cached: bool = False
+    facets_cached: bool = False
+    total_ms: float | None = None
+
+
 class EpigraphQueryResponse(BaseModel):
     results: EpigraphsOut
     facets: Dict[str, List[FacetValue]]
@@ -150,6 +161,9 @@ class EpigraphQueryResponse(BaseModel):
     page_size: int
     sort_field: str | None = None
     sort_order: str
+    next_cursor: str | None = None
+    count_exact: bool = True
+    timings: EpigraphQueryTimings | None = None
 
 
 class EpigraphMapMarkerResponse(BaseModel):
@@ -167,6 +181,58 @@ class EpigraphMapMarkersResponse(BaseModel):
     mapped_count: int
 
 
+class EpigraphHighlightRequest(BaseModel):
+    search_text: str = ""
+    fields: list[str] = Field(default_factory=list)
+    scope_keys: list[str] | None = None
+    ids: list[int] = Field(default_factory=list, max_length=250)
+
+
+class EpigraphHighlightResponse(BaseModel):
+    highlights: Dict[int, Dict[str, list[str]]]
+
+
+class EpigraphMapBounds(BaseModel):
+    west: float = Field(ge=-180, le=180)
+    south: float = Field(ge=-90, le=90)
+    east: float = Field(ge=-180, le=180)
+    north: float = Field(ge=-90, le=90)
+
+
+class EpigraphMapRequest(BaseModel):
+    search_text: str = ""
+    fields: list[str] = Field(default_factory=list)
+    scope_keys: list[str] | None = None
+    filters: dict[str, Any] = Field(default_factory=dict)
+    zoom: int = Field(ge=0, le=24)
+    bounds: EpigraphMapBounds | None = None
+
+
+class EpigraphMapClusterColumns(BaseModel):
+    keys: list[str]
+    latitudes: list[float]
+    longitudes: list[float]
+    counts: list[int]
+
+
+class EpigraphMapMarkerColumns(BaseModel):
+    ids: list[int]
+    dasi_ids: list[int]
+    titles: list[str]
+    site_names: list[str | None]
+    latitudes: list[float]
+    longitudes: list[float]
+
+
+class EpigraphMapResponse(BaseModel):
+    zoom: int
+    clustered: bool
+    result_count: int
+    mapped_count: int
+    clusters: EpigraphMapClusterColumns | None = None
+    markers: EpigraphMapMarkerColumns | None = None
+
+
 class EpigraphResultLocationRequest(BaseModel):
     dasi_id: int
     search_text: str = ""
@@ -185,7 +251,7 @@ class EpigraphResultLocationResponse(BaseModel):
     index: int | None = None
 
 
-def _build_epigraphs_out(epigraphs: Sequence[Epigraph], count: int) -> EpigraphsOut:
+def _build_epigraphs_out(epigraphs: Sequence[Epigraph | EpigraphOut], count: int) -> EpigraphsOut:
     return EpigraphsOut(
         epigraphs=[EpigraphOut.model_validate(epigraph) for epigraph in epigraphs],
         count=count,
@@ -405,7 +471,19 @@ def query_epigraphs(
     request: EpigraphQueryRequest,
     session: SessionDep,
 ) -> EpigraphQueryResponse:
-    """Run the new canonical epigraph query contract backed by OpenSearch plus canonical facet values."""
+    """
+    Run the new canonical epigraph query contract backed by OpenSearch plus canonical facet values.
+
+    While OpenSearch is unavailable the results come from PostgreSQL, without facet counts.
+
+    Pass a response's `next_cursor` back as `cursor`, with the same query, to
+    read the following page; `page` is then ignored.
+
+    Set `include_facets` to false when only the page changed and the facets
+    from an earlier page are still shown: no facets are computed or returned,
+    and the count may be a lower bound, see `count_exact`. `timings` splits
+    OpenSearch time between hits and facets.
+    """
     search_service = SearchService(session)
 
     published_filters = {"dasi_published": True, **request.filters}
@@ -427,7 +505,14 @@ def query_epigraphs(
             filters=published_filters,
             skip=(request.page - 1) * request.page_size,
             limit=request.page_size,
+            cursor=request.cursor,
+            include_facets=request.include_facets,
         )
+    except InvalidCursorError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
     except RuntimeError as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -436,13 +521,16 @@ def query_epigraphs(
 
     return EpigraphQueryResponse(
         results=_build_epigraphs_out(query_result["epigraphs"], query_result["count"]),
-        facets=get_epigraph_facet_values(session, filters=published_filters),
+        facets=get_epigraph_facet_values(session, filters=published_filters) if request.include_facets else {},
         facet_counts=query_result["facet_counts"],
         facet_schema=get_epigraph_facet_schema(),
-        page=request.page,
+        page=query_result.get("page", request.page),
         page_size=request.page_size,
         sort_field=sort_field,
         sort_order=sort_order,
+        next_cursor=query_result.get("next_cursor"),
+        count_exact=query_result.get("count_exact", True),
+        timings=query_result.get("timings"),
     )
 
 
@@ -529,6 +617,81 @@ def query_epigraph_map_markers(
     return EpigraphMapMarkersResponse(**marker_result)
 
 
+@router.post(
+    "/query/highlight",
+    response_model=EpigraphHighlightResponse,
+)
+def highlight_epigraph_query_results(
+    request: EpigraphHighlightRequest,
+    session: SessionDep,
+) -> EpigraphHighlightResponse:
+    """
+    Return highlighted fragments of the canonical query for the given epigraph ids.
+
+    Query results come without highlights; request them here for the results
+    on screen. Epigraphs the query doesn't match are left out.
+    """
+    search_service = SearchService(session)
+    resolved_fields = validate_epigraph_search_field_keys(request.fields)
+
+    if request.scope_keys is not None:
+        resolved_fields = expand_epigraph_search_scope_keys(request.scope_keys)
+
+    try:
+        highlights = search_service.opensearch_highlight_epigraphs(
+            search_text=request.search_text,
+            epigraph_ids=request.ids,
+            fields=",".join(resolved_fields) if resolved_fields else None,
+        )
+    except RuntimeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+        ) from exc
+
+    return EpigraphHighlightResponse(highlights=highlights)
+
+
+@router.post(
+    "/query/map",
+    response_model=EpigraphMapResponse,
+)
+def query_epigraph_map(
+    request: EpigraphMapRequest,
+    session: SessionDep,
+) -> EpigraphMapResponse:
+    """
+    Return clustered map markers for the published epigraphs matching the canonical query filters.
+
+    Below a configured zoom level the sites in `bounds` are aggregated into
+    clusters, each a centroid and an epigraph count; at and above it the
+    individual markers in view are returned. Both come as parallel arrays.
+    """
+    search_service = SearchService(session)
+
+    published_filters = {"dasi_published": True, **request.filters}
+    resolved_fields = validate_epigraph_search_field_keys(request.fields)
+
+    if request.scope_keys is not None:
+        resolved_fields = expand_epigraph_search_scope_keys(request.scope_keys)
+
+    try:
+        map_result = search_service.opensearch_query_epigraph_map(
+            search_text=request.search_text,
+            zoom=request.zoom,
+            fields=",".join(resolved_fields) if resolved_fields else None,
+            filters=published_filters,
+            bounds=request.bounds.model_dump() if request.bounds else None,
+        )
+    except RuntimeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+        ) from exc
+
+    return EpigraphMapResponse(**map_result)
+
+
 @router.get(
     "/schema/search",
     response_model=EpigraphSearchSchemaResponse,
@@ -742,9 +905,11 @@ def import_epigraphs_range(
     end_id: int,
     dasi_published: Optional[bool] = None,
     update_existing: bool = False,
+    shard_size: Annotated[Optional[int], Query(ge=1)] = None,
 ) -> PipelineRun:
     """
     Import epigraphs from external api in a range.
+    Ranges wider than `shard_size` are split into shards imported in parallel.
     """
     return dispatch_dasi_pipeline(
         session,
@@ -756,6 +921,7 @@ def import_epigraphs_range(
             "end_id": end_id,
             "dasi_published": dasi_published,
             "update_existing": update_existing,
+            "shard_size": shard_size,
             "run_chunking": False,
             "generate_embeddings": False,
             "reindex_search": False,
@@ -1221,8 +1387,7 @@ def parse_words(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Epigraph not found",
         )
-    word_parser = WordParser(session, epigraph)
-    return word_parser.parse()
+    return WordIndexBuilder(session).index_epigraph(epigraph)
 
 
 @router.post(
@@ -1231,15 +1396,20 @@ def parse_words(
 )
 def parse_all_words(
     session: SessionDep,
+    full_rebuild: bool = False,
 ):
     """
-    Parse words in all epigraphs.
+    Update the word index for epigraphs whose text changed, or rebuild it from all epigraphs.
     """
-    epigraphs = session.exec(select(Epigraph)).all()
-    for epigraph in epigraphs:
-        word_parser = WordParser(session, epigraph)
-        word_parser.parse()
-    return {"status": "success", "message": "Words parsed for all epigraphs"}
+    builder = WordIndexBuilder(session)
+    result = builder.rebuild() if full_rebuild else builder.update_changed()
+    if result["status"] == "error":
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=result["error"],
+        )
+    message = "Word index rebuilt" if full_rebuild else "Word index updated for changed epigraphs"
+    return {**result, "message": message}
 
 
 @router.get(
@@ -1335,6 +1505,21 @@ async def import_images_range(
     )
 
 
+@router.post(
+    "/image_derivatives/all",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def generate_all_image_derivatives(
+    session: SessionDep,
+    update_existing: bool = False,
+) -> dict:
+    """
+    Generate resized WebP/JPEG variants for all public epigraph images.
+    """
+    epigraph_import_service = EpigraphImportService(session)
+    return await epigraph_import_service.generate_image_derivatives(update_existing=update_existing)
+
+
 @router.post(
     "/scrape_images/range",
     dependencies=[Depends(get_current_active_superuser)],
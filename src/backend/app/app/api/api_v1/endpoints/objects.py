@@ -192,9 +192,11 @@ def import_objects_range(
     end_id: Annotated[int, Query(ge=1)],
     dasi_published: Optional[bool] = None,
     update_existing: bool = False,
+    shard_size: Annotated[Optional[int], Query(ge=1)] = None,
 ) -> PipelineRun:
     """
     Import objects from external api in a range.
+    Ranges wider than `shard_size` are split into shards imported in parallel.
     """
     return dispatch_dasi_pipeline(
         session,
@@ -206,6 +208,7 @@ def import_objects_range(
             "end_id": end_id,
             "dasi_published": dasi_published,
             "update_existing": update_existing,
+            "shard_size": shard_size,
             "run_chunking": False,
             "generate_embeddings": False,
             "reindex_search": False,
@@ -8,6 +8,9 @@ from app.api.params import ResourceIdPath
 from app.models.epigraph import Epigraph
 from app.models.pipeline_run import PipelineRunOut
 from app.services.pipeline.dispatch import dispatch_dasi_pipeline
+from app.services.search.breaker import opensearch_breaker
+from app.services.search.client import opensearch_clients
+from app.services.search.result_cache import search_result_cache
 from app.services.search.service import SearchService
 
 router = APIRouter(prefix="/opensearch", tags=["opensearch"])
@@ -45,6 +48,22 @@ def get_opensearch_stats(
     return stats
 
 
+@router.get("/health", dependencies=[Depends(get_current_active_superuser)])
+def get_opensearch_health(
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    Get the cached OpenSearch cluster health and info, checking again if `refresh` is set,
+    together with the state and transitions of the OpenSearch circuit breaker and
+    the hit/miss counters of the search result cache in this process.
+    """
+    return {
+        **opensearch_clients.health(force=refresh),
+        "breaker": opensearch_breaker.snapshot(),
+        "result_cache": search_result_cache.snapshot(),
+    }
+
+
 @router.post("/index/{epigraph_id}", dependencies=[Depends(get_current_active_superuser)])
 def index_epigraph(
     epigraph_id: ResourceIdPath,
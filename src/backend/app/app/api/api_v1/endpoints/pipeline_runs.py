@@ -74,6 +74,7 @@ def trigger_dasi_sync(
             request.import_sites,
             request.import_objects,
             request.import_epigraphs,
+            request.update_word_index,
             request.run_chunking,
             request.reindex_search,
         ]
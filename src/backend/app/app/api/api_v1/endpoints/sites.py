@@ -1,5 +1,5 @@
 import json
-from typing import Any, Annotated
+from typing import Any, Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import select, func, asc, desc
@@ -230,9 +230,11 @@ def import_sites_range(
     start_id: Annotated[int, Query(ge=1)],
     end_id: Annotated[int, Query(ge=1)],
     update_existing: bool = False,
+    shard_size: Annotated[Optional[int], Query(ge=1)] = None,
 ) -> PipelineRun:
     """
     Import sites from external api in a range.
+    Ranges wider than `shard_size` are split into shards imported in parallel.
     """
     return dispatch_dasi_pipeline(
         session,
@@ -243,6 +245,7 @@ def import_sites_range(
             "start_id": start_id,
             "end_id": end_id,
             "update_existing": update_existing,
+            "shard_size": shard_size,
             "run_chunking": False,
             "generate_embeddings": False,
             "reindex_search": False,
@@ -1,13 +1,25 @@
+import base64
+import binascii
 import json
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import select, func, asc, desc
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import select, func, tuple_
 
 from app.api.deps import (
     SessionDep,
     get_current_active_superuser,
 )
-from app.api.params import JsonFiltersParam, PageLimit, PageOffset, ResourceIdPath, SortFieldParam, SortOrderParam
+from app.api.params import (
+    JsonFiltersParam,
+    PageCursor,
+    PageLimit,
+    PageOffset,
+    ResourceIdPath,
+    SortFieldParam,
+    SortOrderParam,
+    TypeaheadTextParam,
+)
 from app.crud.crud_word import word as crud_word
 from app.models.word import (
     Word,
@@ -15,13 +27,87 @@ from app.models.word import (
     WordUpdate,
     WordOut,
     WordsOut,
+    WordSuggestion,
+    WordGraphEdge,
+    WordGraphNeighbourhood,
+    WordGraphNode,
+    WordGraphPath,
+    WordGraphReach,
+    WordMinimal,
 )
-from app.models.links import EpigraphWordLink, WordLink
+from app.services.text.word_graph import word_graph
+from app.services.text.word_lookup import MAX_SUGGESTIONS, word_lookup
 
 
 router = APIRouter()
 router = APIRouter(prefix="/words", tags=["words"])
 
+# Each of these has an index on (column, id), so listing in any of these orders
+# is an index scan and can be paged by cursor; "words" and "epigraphs" are the
+# original sort names. Other Word columns still sort, paged by offset only.
+WORD_SORT_COLUMNS = {
+    "id": Word.id,
+    "frequency": Word.frequency,
+    "epigraph_count": Word.epigraph_count,
+    "epigraphs": Word.epigraph_count,
+    "outgoing_count": Word.outgoing_count,
+    "words": Word.outgoing_count,
+    "incoming_count": Word.incoming_count,
+}
+
+
+GraphLimit = Annotated[int, Query(ge=1, le=200, description="Maximum number of neighbours to return")]
+GraphDirection = Annotated[
+    Literal["successors", "predecessors", "both"],
+    Query(description="Follow words that come after, before, or either side"),
+]
+
+
+def _get_word_or_404(session: SessionDep, word_id: int) -> Word:
+    word = crud_word.get(session, id=word_id)
+    if not word:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Word not found",
+        )
+    return word
+
+
+def _words_by_id(session: SessionDep, word_ids: list[int]) -> dict[int, Word]:
+    if not word_ids:
+        return {}
+    return {word.id: word for word in session.exec(select(Word).where(Word.id.in_(word_ids))).all()}
+
+
+def _graph_edges(session: SessionDep, neighbours: list[tuple[int, int]]) -> list[WordGraphEdge]:
+    words_by_id = _words_by_id(session, [word_id for word_id, _ in neighbours])
+    return [
+        WordGraphEdge(
+            id=word_id,
+            word=words_by_id[word_id].word,
+            classification=words_by_id[word_id].classification,
+            count=count,
+        )
+        for word_id, count in neighbours
+        if word_id in words_by_id
+    ]
+
+
+def _encode_cursor(sort_value: int, word_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort_value, word_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[int, int]:
+    try:
+        sort_value, word_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(sort_value), int(word_id)
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from exc
+
+
 @router.get(
     "/",
     response_model=WordsOut,
@@ -33,48 +119,80 @@ def read_words(
         sort_field: SortFieldParam = None,
         sort_order: SortOrderParam = None,
         filters: JsonFiltersParam = None,
+        cursor: PageCursor = None,
 ) -> WordsOut:
     """
     Retrieve words.
-    """
-    total_count_statement = select(func.count()).select_from(Word)
-    total_count = session.exec(total_count_statement).one()
 
-    words_statement = select(Word).offset(skip).limit(limit)
+    Pass the returned `next_cursor` as `cursor` to fetch the following page;
+    `skip` is only applied when no cursor is given. Sorting by a column other
+    than id, frequency or the link counts pages by `skip` and returns no cursor.
+    """
+    sort_column = WORD_SORT_COLUMNS.get(sort_field or "id")
+    keyset = sort_column is not None
+    if sort_column is None:
+        if sort_field not in Word.model_fields:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot sort words by {sort_field}",
+            )
+        if cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Words sorted by {sort_field} are paged by skip, not cursor",
+            )
+        sort_column = getattr(Word, sort_field)
 
+    conditions = []
     if filters:
-        filters_dict = json.loads(filters)
-        for key, value in filters_dict.items():
-            if isinstance(value, bool):
-                words_statement = words_statement.where(
-                    getattr(Word, key).is_(value)
-                )
-            else:
-                words_statement = words_statement.where(
-                    getattr(Word, key) == value
+        for key, value in json.loads(filters).items():
+            if key not in Word.model_fields:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Cannot filter words by {key}",
                 )
+            column = getattr(Word, key)
+            conditions.append(column.is_(value) if isinstance(value, bool) else column == value)
 
-    if sort_field:
-        if sort_field == "words":
-            sort_field = (
-                select(func.count(WordLink.to_word_id))
-                .where(WordLink.from_word_id == Word.id)
-                .scalar_subquery()
-            )
-        elif sort_field == "epigraphs":
-            sort_field = (
-                select(func.count(EpigraphWordLink.epigraph_id))
-                .where(EpigraphWordLink.word_id == Word.id)
-                .scalar_subquery()
-            )
-        if sort_order == "desc":
-            words_statement = words_statement.order_by(desc(sort_field))
-        else:
-            words_statement = words_statement.order_by(asc(sort_field))
+    total_count = session.exec(select(func.count()).select_from(Word).where(*conditions)).one()
 
-    words = session.exec(words_statement).all()
+    descending = sort_order == "desc"
+    words_statement = select(Word).where(*conditions)
+    if cursor:
+        position = tuple_(sort_column, Word.id)
+        after = tuple_(*_decode_cursor(cursor))
+        words_statement = words_statement.where(position < after if descending else position > after)
+    else:
+        words_statement = words_statement.offset(skip)
 
-    return WordsOut(words=words, count=total_count)
+    if descending:
+        words_statement = words_statement.order_by(sort_column.desc(), Word.id.desc())
+    else:
+        words_statement = words_statement.order_by(sort_column.asc(), Word.id.asc())
+
+    words = session.exec(words_statement.limit(limit)).all()
+
+    next_cursor = None
+    if keyset and len(words) == limit:
+        last_word = words[-1]
+        next_cursor = _encode_cursor(getattr(last_word, sort_column.key), last_word.id)
+
+    return WordsOut(words=words, count=total_count, next_cursor=next_cursor)
+
+
+@router.get(
+    "/suggest",
+    response_model=list[WordSuggestion],
+)
+def suggest_words(
+    session: SessionDep,
+    q: TypeaheadTextParam,
+    limit: Annotated[int, Query(ge=1, le=MAX_SUGGESTIONS)] = 10,
+) -> list[WordSuggestion]:
+    """
+    Suggest words starting with `q`, ignoring case, diacritics and aleph/ayin marks.
+    """
+    return word_lookup.suggest(session, q, limit)
 
 
 @router.get(
@@ -97,6 +215,118 @@ def read_word(
     return word
 
 
+@router.get(
+    "/{word_id}/graph",
+    response_model=WordGraphNeighbourhood,
+)
+def read_word_graph(
+    word_id: ResourceIdPath,
+    session: SessionDep,
+    limit: GraphLimit = 10,
+) -> WordGraphNeighbourhood:
+    """
+    Retrieve the most frequent words directly after and before a word.
+    """
+    _get_word_or_404(session, word_id)
+    graph = word_graph.get_graph(session)
+    return WordGraphNeighbourhood(
+        word_id=word_id,
+        successors=_graph_edges(session, graph.top_neighbours(word_id, "successors", limit)),
+        predecessors=_graph_edges(session, graph.top_neighbours(word_id, "predecessors", limit)),
+    )
+
+
+@router.get(
+    "/{word_id}/graph/successors",
+    response_model=list[WordGraphEdge],
+)
+def read_word_successors(
+    word_id: ResourceIdPath,
+    session: SessionDep,
+    limit: GraphLimit = 10,
+) -> list[WordGraphEdge]:
+    """
+    Retrieve the most frequent words that follow a word.
+    """
+    _get_word_or_404(session, word_id)
+    return _graph_edges(session, word_graph.get_graph(session).top_neighbours(word_id, "successors", limit))
+
+
+@router.get(
+    "/{word_id}/graph/predecessors",
+    response_model=list[WordGraphEdge],
+)
+def read_word_predecessors(
+    word_id: ResourceIdPath,
+    session: SessionDep,
+    limit: GraphLimit = 10,
+) -> list[WordGraphEdge]:
+    """
+    Retrieve the most frequent words that precede a word.
+    """
+    _get_word_or_404(session, word_id)
+    return _graph_edges(session, word_graph.get_graph(session).top_neighbours(word_id, "predecessors", limit))
+
+
+@router.get(
+    "/{word_id}/graph/reach",
+    response_model=WordGraphReach,
+)
+def read_word_reach(
+    word_id: ResourceIdPath,
+    session: SessionDep,
+    direction: GraphDirection = "successors",
+    depth: Annotated[int, Query(ge=1, le=6, description="Maximum number of steps")] = 2,
+    limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of words to return")] = 100,
+) -> WordGraphReach:
+    """
+    Retrieve the words reachable from a word within `depth` steps, nearest first.
+    """
+    _get_word_or_404(session, word_id)
+    reached = word_graph.get_graph(session).reach(word_id, direction, depth, limit)
+    words_by_id = _words_by_id(session, [reached_id for reached_id, _ in reached])
+    return WordGraphReach(
+        word_id=word_id,
+        direction=direction,
+        nodes=[
+            WordGraphNode(
+                id=reached_id,
+                word=words_by_id[reached_id].word,
+                classification=words_by_id[reached_id].classification,
+                depth=reached_depth,
+            )
+            for reached_id, reached_depth in reached
+            if reached_id in words_by_id
+        ],
+    )
+
+
+@router.get(
+    "/{word_id}/graph/path/{target_id}",
+    response_model=WordGraphPath,
+)
+def read_word_path(
+    word_id: ResourceIdPath,
+    target_id: ResourceIdPath,
+    session: SessionDep,
+    direction: GraphDirection = "successors",
+    max_depth: Annotated[int, Query(ge=1, le=10, description="Maximum path length")] = 6,
+) -> WordGraphPath:
+    """
+    Retrieve a shortest chain of adjacent words from one word to another.
+    """
+    _get_word_or_404(session, word_id)
+    _get_word_or_404(session, target_id)
+    path = word_graph.get_graph(session).shortest_path(word_id, target_id, direction, max_depth)
+    words_by_id = _words_by_id(session, path or [])
+    return WordGraphPath(
+        source_id=word_id,
+        target_id=target_id,
+        found=path is not None,
+        words=[WordMinimal(id=path_id, word=words_by_id[path_id].word) for path_id in path or []],
+    )
+
+
 @router.post(
     "/",
     response_model=WordOut,
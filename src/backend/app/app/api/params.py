@@ -11,6 +11,10 @@ PageLimit = Annotated[
     int,
     Query(ge=1, le=500, description="Maximum number of records to return"),
 ]
+PageCursor = Annotated[
+    str | None,
+    Query(min_length=1, description="Opaque cursor returned by the previous page"),
+]
 BatchListLimit = Annotated[
     int,
     Query(ge=1, le=100, description="Maximum number of batch jobs to return"),
@@ -31,6 +35,10 @@ SearchTextParam = Annotated[
     str,
     Query(min_length=1, description="Search text to execute against the corpus"),
 ]
+TypeaheadTextParam = Annotated[
+    str,
+    Query(min_length=1, max_length=100, description="Prefix typed so far"),
+]
 TranslationTextParam = Annotated[
     str,
     Query(min_length=1, description="Translation text to search for"),
@@ -91,6 +91,29 @@ class Settings(BaseSettings):
 
     OPENSEARCH_USERNAME: str
     OPENSEARCH_PASSWORD: str
+    OPENSEARCH_HOST: str = "opensearch"
+    OPENSEARCH_PORT: int = 9200
+    OPENSEARCH_POOL_MAXSIZE: int = 10
+    OPENSEARCH_TIMEOUT_SECONDS: float = 10.0
+    OPENSEARCH_MAX_RETRIES: int = 2
+    OPENSEARCH_RETRY_ON_TIMEOUT: bool = True
+    OPENSEARCH_HEALTH_TTL_SECONDS: int = 30
+    OPENSEARCH_HEALTH_TIMEOUT_SECONDS: float = 2.0
+    OPENSEARCH_BREAKER_FAILURE_RATE: float = 0.5
+    OPENSEARCH_BREAKER_MIN_CALLS: int = 5
+    OPENSEARCH_BREAKER_WINDOW_SECONDS: float = 30.0
+    OPENSEARCH_BREAKER_SLOW_CALL_SECONDS: float = 2.0
+    OPENSEARCH_BREAKER_COOLDOWN_SECONDS: float = 15.0
+    OPENSEARCH_BREAKER_HALF_OPEN_PROBES: int = 1
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_LOCAL_SIZE: int = 512
+    SEARCH_CACHE_TTL_SECONDS: int = 3600
+    SEARCH_CACHE_GENERATION_CHECK_SECONDS: float = 2.0
+    SEARCH_SOURCE_ONLY_RESULTS: bool = True
+    SEARCH_TOTAL_HITS_CAP: int = 10_000
+    MAP_CLUSTER_MARKER_ZOOM: int = 12
+    MAP_CLUSTER_MAX_TILES: int = 4000
+    MAP_MARKER_LIMIT: int = 10_000
     REDIS_URL: str = "redis://redis:6379/0"
     CELERY_BROKER_URL: Optional[str] = None
     CELERY_RESULT_BACKEND: Optional[str] = None
@@ -124,6 +147,22 @@ class Settings(BaseSettings):
     DASI_API_URL: str
     DASI_ADDRESS: str
     DASI_INCREMENTAL_LOOKBACK_PAGES: int = 1
+    DASI_REQUESTS_PER_SECOND: float = 0.5
+    DASI_RATE_LIMIT_BURST: int = 1
+    DASI_MAX_CONCURRENT_REQUESTS: int = 4
+    DASI_REQUEST_TIMEOUT_SECONDS: float = 30.0
+    DASI_MAX_RETRIES: int = 3
+    DASI_RANGE_SHARD_SIZE: int = 500
+    DASI_RANGE_SHARD_RETRY_ROUNDS: int = 1
+    DASI_ARCHIVE_DIR: str = "private/dasi_archive"
+    DASI_ARCHIVE_MODE: str = "off"
+    DASI_IMAGE_MAX_CONCURRENT_DOWNLOADS: int = 4
+    IMAGE_DERIVATIVE_WIDTHS: str = "320,640,1280"
+    IMAGE_DERIVATIVE_WORKERS: int = 2
+    PUBLIC_IMMUTABLE_CACHE_SECONDS: int = 31536000
+    WORD_INDEX_WORKERS: int = 2
+    WORD_LOOKUP_REFRESH_SECONDS: int = 30
+    WORD_GRAPH_DIR: str = "private/word_graph"
 
     model_config = SettingsConfigDict(case_sensitive=True)
 
@@ -28,14 +28,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> List[ModelType]:
         return db.query(self.model).offset(skip).limit(limit).all()
 
-    def create(self, db: Session, *, obj_in: CreateSchemaType, **kwargs: Any) -> ModelType:
+    def create(
+        self, db: Session, *, obj_in: CreateSchemaType, commit: bool = True, **kwargs: Any
+    ) -> ModelType:
         # obj_in_data = jsonable_encoder(obj_in)
         # db_obj = self.model(**obj_in_data, **kwargs)  # type: ignore
         
         db_obj = self.model.model_validate(obj_in)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._save(db, db_obj, commit=commit)
         return db_obj
 
     def update(
@@ -44,6 +45,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         *,
         db_obj: ModelType,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        commit: bool = True,
         **kwargs: Any,
     ) -> ModelType:
         if isinstance(obj_in, dict):
@@ -64,10 +66,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             setattr(db_obj, key, value)
 
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._save(db, db_obj, commit=commit)
         return db_obj
 
+    def _save(self, db: Session, db_obj: ModelType, *, commit: bool) -> None:
+        """Commit and refresh unless the caller owns the transaction and flushes itself."""
+        if commit:
+            db.commit()
+            db.refresh(db_obj)
+
     def remove(self, db: Session, *, id: Any) -> ModelType | None:
         obj = self.get(db, id=id)
         if obj is None:
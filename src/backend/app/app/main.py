@@ -8,6 +8,7 @@ from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
+from starlette.types import Scope
 
 from app.api.api_v1.api import api_router
 from app.api.api_v1.endpoints.social_meta import router as social_meta_router
@@ -78,11 +79,25 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
+class PublicStaticFiles(StaticFiles):
+    """Serve `/public`, marking content-hashed image derivatives as immutable."""
+
+    immutable_prefix = "images/derivatives/"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and path.startswith(self.immutable_prefix):
+            response.headers["Cache-Control"] = (
+                f"public, max-age={settings.PUBLIC_IMMUTABLE_CACHE_SECONDS}, immutable"
+            )
+        return response
+
+
 @app.get("/api/v1/", include_in_schema=False)
 def read_root() -> dict[str, str]:
     return {"Hello": "World"}
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 app.include_router(social_meta_router)
-app.mount("/public", StaticFiles(directory="public"), name="public")
+app.mount("/public", PublicStaticFiles(directory="public"), name="public")
 app.add_middleware(RateLimitMiddleware, max_requests=60, window_seconds=60)
@@ -17,7 +17,7 @@ class EpigraphWordLink(SQLModel, table=True):
         default=None, foreign_key="epigraph.id", primary_key=True
     )
     word_id: Optional[int] = Field(
-        default=None, foreign_key="word.id", primary_key=True
+        default=None, foreign_key="word.id", primary_key=True, index=True
     )
 
 
@@ -44,6 +44,6 @@ class WordLink(SQLModel, table=True):
         default=None, foreign_key="word.id", primary_key=True
     )
     to_word_id: int = Field(
-        default=None, foreign_key="word.id", primary_key=True
+        default=None, foreign_key="word.id", primary_key=True, index=True
     )
     count: int = Field(default=1)
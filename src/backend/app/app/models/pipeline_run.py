@@ -96,9 +96,11 @@ class TriggerDasiPipelineRequest(SQLModel):
     end_id: Optional[int] = None
     dasi_published: Optional[bool] = None
     update_existing: bool = False
+    update_word_index: Optional[bool] = None
     run_chunking: bool = True
     generate_embeddings: bool = True
     rechunk: bool = False
     reindex_search: bool = True
     rate_limit_delay: float = 10.0
+    archive_mode: Optional[str] = None
     chunk_limit: Optional[int] = None
\ No newline at end of file
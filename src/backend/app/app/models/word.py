@@ -1,6 +1,7 @@
 from typing import Optional
 
 from sqlmodel import Column, Field, Relationship, SQLModel
+from sqlalchemy import Index
 from sqlalchemy.dialects.postgresql import JSONB
 
 from app.core.models import TimeStampModel
@@ -28,8 +29,20 @@ class Word(
     WordBase,
     table=True,
 ):
+    __table_args__ = (
+        Index("ix_word_word_classification", "word", "classification"),
+        Index("ix_word_frequency_id", "frequency", "id"),
+        Index("ix_word_epigraph_count_id", "epigraph_count", "id"),
+        Index("ix_word_outgoing_count_id", "outgoing_count", "id"),
+        Index("ix_word_incoming_count_id", "incoming_count", "id"),
+    )
+
     id: int = Field(default=None, primary_key=True)
     frequency: int = Field(default=1)
+    # Rollups maintained by the word indexer for sorting without aggregating links.
+    epigraph_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    outgoing_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    incoming_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
     epigraphs: list["Epigraph"] = Relationship(back_populates="words", link_model=EpigraphWordLink)
 
@@ -43,6 +56,15 @@ class Word(
         },
     )
 
+class EpigraphWordIndex(TimeStampModel, table=True):
+    """Fingerprint and word counts an epigraph last contributed to the word index."""
+
+    epigraph_id: int = Field(primary_key=True)
+    text_hash: str
+    word_counts: list = Field(sa_column=Column(JSONB, nullable=False), default=[])
+    bigram_counts: list = Field(sa_column=Column(JSONB, nullable=False), default=[])
+
+
 class WordMinimal(SQLModel):
     id: int
     word: str
@@ -54,9 +76,52 @@ class WordConnection(SQLModel):
     # count: int
 
 
+class WordSuggestion(SQLModel):
+    id: int
+    word: str
+    classification: Optional[str] = None
+    frequency: int
+
+
+class WordGraphEdge(SQLModel):
+    id: int
+    word: str
+    classification: Optional[str] = None
+    count: int
+
+
+class WordGraphNeighbourhood(SQLModel):
+    word_id: int
+    successors: list[WordGraphEdge]
+    predecessors: list[WordGraphEdge]
+
+
+class WordGraphNode(SQLModel):
+    id: int
+    word: str
+    classification: Optional[str] = None
+    depth: int
+
+
+class WordGraphReach(SQLModel):
+    word_id: int
+    direction: str
+    nodes: list[WordGraphNode]
+
+
+class WordGraphPath(SQLModel):
+    source_id: int
+    target_id: int
+    found: bool
+    words: list[WordMinimal] = []
+
+
 class WordOut(WordBase):
     id: int
     frequency: int
+    epigraph_count: int = 0
+    outgoing_count: int = 0
+    incoming_count: int = 0
     # epigraphs: list = []
     words: list[WordConnection] = []
 
@@ -64,3 +129,4 @@ class WordOut(WordBase):
 class WordsOut(SQLModel):
     words: list[WordOut]
     count: int
+    next_cursor: Optional[str] = None
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+
+class DasiArchiveMode:
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+    ALL = (OFF, RECORD, REPLAY)
+
+
+@dataclass
+class ArchiveEntry:
+    url: str
+    body_hash: str
+    etag: str | None = None
+    last_modified: str | None = None
+    content_type: str | None = None
+    fetched_at: str | None = None
+
+
+class ResponseArchive:
+    """
+    Content-addressed on-disk store of DASI responses keyed by request URL.
+
+    Bodies live under `objects/` named by their SHA-256 so identical payloads
+    are stored once; `index/` maps each URL to the body hash plus the
+    validators (ETag/Last-Modified) needed for conditional requests.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_dir = self.root / "index"
+
+    @staticmethod
+    def build_key(url: str, params: dict[str, Any] | None = None) -> str:
+        if not params:
+            return url
+        query = urlencode(sorted((str(key), str(value)) for key, value in params.items()))
+        separator = "&" if "?" in url else "?"
+        return f"{url}{separator}{query}"
+
+    @staticmethod
+    def hash_body(body: bytes) -> str:
+        return hashlib.sha256(body).hexdigest()
+
+    def _index_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.index_dir / digest[:2] / f"{digest}.json"
+
+    def _object_path(self, body_hash: str) -> Path:
+        return self.objects_dir / body_hash[:2] / body_hash
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_handle:
+                file_handle.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def get(self, key: str) -> ArchiveEntry | None:
+        index_path = self._index_path(key)
+        if not index_path.exists():
+            return None
+
+        try:
+            entry = ArchiveEntry(**json.loads(index_path.read_text(encoding="utf-8")))
+        except (OSError, TypeError, ValueError):
+            return None
+
+        if not self._object_path(entry.body_hash).exists():
+            return None
+        return entry
+
+    def read_body(self, entry: ArchiveEntry) -> bytes:
+        return self._object_path(entry.body_hash).read_bytes()
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_type: str | None = None,
+    ) -> tuple[ArchiveEntry, bool]:
+        """Store a response body and return the entry and whether the body changed."""
+        previous = self.get(key)
+        body_hash = self.hash_body(body)
+
+        object_path = self._object_path(body_hash)
+        if not object_path.exists():
+            self._write_atomic(object_path, body)
+
+        entry = ArchiveEntry(
+            url=key,
+            body_hash=body_hash,
+            etag=etag,
+            last_modified=last_modified,
+            content_type=content_type,
+            fetched_at=datetime.now(timezone.utc).isoformat(),
+        )
+        self._write_atomic(
+            self._index_path(key),
+            json.dumps(asdict(entry), ensure_ascii=False).encode("utf-8"),
+        )
+        return entry, previous is None or previous.body_hash != body_hash
+
+    def conditional_headers(self, entry: ArchiveEntry | None) -> dict[str, str]:
+        if entry is None:
+            return {}
+
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
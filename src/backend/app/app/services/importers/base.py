@@ -1,18 +1,29 @@
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
-from pathlib import Path
+import logging
 import re
 import time
-from typing import Any, Generic, Optional, Type, TypeVar, cast
+from typing import Any, AsyncIterator, Generic, Optional, Type, TypeVar, cast
 from urllib.parse import urlparse
 
 import aiohttp
-import requests
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.exc import OperationalError
 from sqlmodel import Session
 
 from app.core.config import settings
 from app.crud.base import CRUDBase
-from app.models.dasi_sync import DasiImportCursor
+from app.models.dasi_sync import DasiImportCursor, DasiSourceSnapshot
+from app.models.epigraph import Epigraph
+from app.models.object import Object
+from app.models.site import Site
+from app.services.importers.archive import DasiArchiveMode, ResponseArchive
+from app.services.importers.fetcher import DasiFetcher, FetchedDocument
+from app.services.importers.images import ImageDownloader
+from app.services.importers.link_writer import LinkBatchWriter
+from app.services.importers.rate_limit import RedisRateLimiter
+from app.services.importers.resolver import DasiIdResolver
 from app.services.importers.sync_state import DasiSyncStateService
 
 ModelType = TypeVar("ModelType")
@@ -22,6 +33,13 @@ UpdateSchemaType = TypeVar("UpdateSchemaType")
 
 class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     MAX_RELATED_ENTITY_LINKS = 5
+    RANGE_BATCH_SIZE = 30
+    PAGE_PERSIST_RETRIES = 2
+    RELATED_RELATION_KEYS = {
+        "site": ("epigraphs", "objects"),
+        "epigraph": ("sites", "objects"),
+        "object": ("sites", "epigraphs"),
+    }
 
     def __init__(
         self,
@@ -38,6 +56,16 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         self.create_schema = create_schema
         self.update_schema = update_schema
         self.sync_state = DasiSyncStateService(session)
+        self.fetcher: DasiFetcher | None = None
+        self.image_downloader: ImageDownloader | None = None
+        self.archive_mode = settings.DASI_ARCHIVE_MODE
+        self.shared_rate_limit_key: str | None = None
+        self.unchanged_items = 0
+        self.resolver = DasiIdResolver(
+            session,
+            models={"epigraphs": Epigraph, "objects": Object, "sites": Site},
+        )
+        self.link_writer = LinkBatchWriter(session)
 
     def _camel_to_snake(self, name: str) -> str:
         name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
@@ -54,26 +82,9 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         raise ValueError(f"Unknown link type: {link}")
 
     def _get_entity_local_id(self, entity: str, dasi_id: int) -> int | None:
-        from app.crud.crud_epigraph import epigraph as crud_epigraph
-        from app.crud.crud_object import obj as crud_object
-        from app.crud.crud_site import site as crud_site
-
-        crud_map = {
-            "epigraphs": crud_epigraph,
-            "objects": crud_object,
-            "sites": crud_site,
-        }
         try:
-            crud = crud_map.get(entity)
-            if not crud:
-                raise ValueError(f"Unknown entity type: {entity}")
-
-            local_entity = crud.get_by_dasi_id(self.session, dasi_id=dasi_id)
-            if local_entity:
-                return cast(int | None, getattr(local_entity, "id", None))
-
-            raise ValueError(f"Entity with DASI ID {dasi_id} not found in local database.")
-        except Exception:
+            return self.resolver.resolve(entity, dasi_id)
+        except ValueError:
             return None
 
     def _process_link(self, link: str) -> str:
@@ -163,13 +174,7 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         relation_key: str,
         related_dasi_ids: list[int],
     ) -> set[int]:
-        resolved_local_ids: set[int] = set()
-        for dasi_id in related_dasi_ids:
-            local_id = self._get_entity_local_id(relation_key, dasi_id)
-            if local_id is not None:
-                resolved_local_ids.add(local_id)
-
-        return resolved_local_ids
+        return set(self.resolver.resolve_many(relation_key, related_dasi_ids).values())
 
     def _get_supported_related_local_ids(
         self,
@@ -182,178 +187,168 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return self._resolve_related_local_ids(relation_key, related_dasi_ids)
 
-    def _reverse_payload_supports_link(
+    def _stream_related_claims(
         self,
+        model: type[Any],
         relation_key: str,
-        related_local_id: int,
-        current_dasi_id: int,
-    ) -> bool:
-        related_entity = self._get_related_crud(relation_key).get(self.session, id=related_local_id)
-        if not related_entity:
-            return False
-
-        reverse_detail_data = cast(dict[str, Any], getattr(related_entity, "dasi_object", {}) or {})
-        reverse_relation_key = self._get_current_entity_relation_key()
-        reverse_related_dasi_ids = self._extract_related_dasi_ids(
-            reverse_detail_data,
-            reverse_relation_key,
+        batch_size: int,
+    ) -> tuple[dict[int, int], dict[int, list[int]], int]:
+        """
+        Stream `(id, dasi_id, dasi_object -> relation_key)` for every row of `model`.
+
+        Returns the `dasi_id -> id` map, the related DASI ids each row claims
+        (only for payloads within the reliability threshold) and the row count.
+        """
+        dasi_to_local: dict[int, int] = {}
+        claims: dict[int, list[int]] = {}
+        scanned_rows = 0
+
+        statement = select(model.id, model.dasi_id, model.dasi_object[relation_key]).execution_options(
+            yield_per=batch_size
         )
-        if len(reverse_related_dasi_ids) > self.MAX_RELATED_ENTITY_LINKS:
-            return False
+        for local_id, dasi_id, related_payload in self.session.execute(statement):
+            scanned_rows += 1
+            if dasi_id is not None:
+                dasi_to_local[dasi_id] = local_id
 
-        return current_dasi_id in reverse_related_dasi_ids
+            if not isinstance(related_payload, list):
+                continue
 
-    def _cleanup_related_links(
-        self,
-        db_item: ModelType,
-        detail_data: dict[str, Any],
-        relation_key: str,
-    ) -> int:
-        db_item_id = cast(int | None, getattr(db_item, "id", None))
-        current_dasi_id = cast(int | None, getattr(db_item, "dasi_id", None))
-        if db_item_id is None or current_dasi_id is None:
-            return 0
+            related_dasi_ids = self._extract_related_dasi_ids({relation_key: related_payload}, relation_key)
+            if related_dasi_ids and len(related_dasi_ids) <= self.MAX_RELATED_ENTITY_LINKS:
+                claims[local_id] = related_dasi_ids
 
-        supported_local_ids = self._get_supported_related_local_ids(detail_data, relation_key)
+        return dasi_to_local, claims, scanned_rows
 
+    def _find_unreliable_links(
+        self,
+        relation_key: str,
+        batch_size: int,
+    ) -> tuple[list[tuple[int, int]], int, int]:
+        """
+        Compute the links of one relation that neither side's payload supports.
+
+        A link is supported when the current entity's payload lists the related
+        entity, or the related entity's payload lists the current entity, as
+        long as the listing payload is within `MAX_RELATED_ENTITY_LINKS`.
+        """
+        current_model = self._get_related_crud(self._get_current_entity_relation_key()).model
+        related_model = self._get_related_crud(relation_key).model
         link_model, source_column_name, target_column_name = self._get_related_link_config(relation_key)
-        source_column = getattr(link_model, source_column_name)
-        links = self.session.query(link_model).filter(source_column == db_item_id).all()
 
-        removed_links = 0
+        current_ids, forward_claims, current_rows = self._stream_related_claims(
+            current_model, relation_key, batch_size
+        )
+        related_ids, reverse_claims, related_rows = self._stream_related_claims(
+            related_model, self._get_current_entity_relation_key(), batch_size
+        )
 
-        for link in links:
-            target_id = cast(int | None, getattr(link, target_column_name, None))
-            if target_id is None:
-                continue
-            if target_id in supported_local_ids:
-                continue
-            if self._reverse_payload_supports_link(relation_key, target_id, current_dasi_id):
-                continue
+        supported_pairs: set[tuple[int, int]] = set()
+        for source_id, related_dasi_ids in forward_claims.items():
+            for related_dasi_id in related_dasi_ids:
+                target_id = related_ids.get(related_dasi_id)
+                if target_id is not None:
+                    supported_pairs.add((source_id, target_id))
+        for target_id, current_dasi_ids in reverse_claims.items():
+            for current_dasi_id in current_dasi_ids:
+                source_id = current_ids.get(current_dasi_id)
+                if source_id is not None:
+                    supported_pairs.add((source_id, target_id))
 
-            self.session.delete(link)
-            removed_links += 1
+        source_column = getattr(link_model, source_column_name)
+        target_column = getattr(link_model, target_column_name)
+        link_rows = self.session.execute(
+            select(source_column, target_column).execution_options(yield_per=batch_size)
+        ).all()
+
+        unreliable_links = [
+            (source_id, target_id)
+            for source_id, target_id in link_rows
+            if source_id is not None and target_id is not None and (source_id, target_id) not in supported_pairs
+        ]
+        return unreliable_links, current_rows, related_rows + len(link_rows)
+
+    def _delete_links(
+        self,
+        relation_key: str,
+        links: list[tuple[int, int]],
+        batch_size: int,
+    ) -> int:
+        link_model, source_column_name, target_column_name = self._get_related_link_config(relation_key)
+        link_columns = tuple_(getattr(link_model, source_column_name), getattr(link_model, target_column_name))
 
-        if removed_links:
-            self.session.commit()
+        removed_links = 0
+        for offset in range(0, len(links), batch_size):
+            result = self.session.execute(
+                delete(link_model).where(link_columns.in_(links[offset:offset + batch_size]))
+            )
+            removed_links += max(result.rowcount or 0, 0)
 
         return removed_links
 
     def cleanup_unreliable_related_links(
         self,
-        batch_size: int = 100,
+        batch_size: int = 1000,
     ) -> dict[str, Any]:
+        """
+        Remove links not supported by either side's DASI payload, set-wise.
+
+        Payloads are streamed once per relation with only the relevant JSONB key
+        selected, supported pairs are computed in memory and all unsupported
+        links are deleted in bulk inside a single transaction.
+        """
         entity_type = self._determine_entity_type()
-        relation_keys_by_entity = {
-            "site": ("epigraphs", "objects"),
-            "epigraph": ("sites", "objects"),
-            "object": ("sites", "epigraphs"),
-        }
         processed_items = 0
-        cleaned_items = 0
+        cleaned_item_ids: set[int] = set()
         removed_links = 0
-        skip = 0
-
-        try:
-            while True:
-                items = self.crud.get_multi(self.session, skip=skip, limit=batch_size)
-                if not items:
-                    break
-
-                for db_item in items:
-                    processed_items += 1
-                    detail_data = cast(dict[str, Any], getattr(db_item, "dasi_object", {}) or {})
-                    removed_for_item = 0
-                    for relation_key in relation_keys_by_entity[entity_type]:
-                        removed_for_relation = self._cleanup_related_links(
-                            db_item,
-                            detail_data,
-                            relation_key,
-                        )
-                        removed_for_item += removed_for_relation
-
-                    if removed_for_item > 0:
-                        cleaned_items += 1
-
-                    removed_links += removed_for_item
-
-                if len(items) < batch_size:
-                    break
-
-                skip += batch_size
+        scanned_rows = 0
+        started_at = time.perf_counter()
 
+        def build_result(status: str, **extra: Any) -> dict[str, Any]:
+            duration_seconds = time.perf_counter() - started_at
             return {
-                "status": "success",
+                "status": status,
+                **extra,
                 "entity_type": self.entity_type,
                 "processed_items": processed_items,
-                "cleaned_items": cleaned_items,
+                "cleaned_items": len(cleaned_item_ids),
                 "removed_links": removed_links,
+                "scanned_rows": scanned_rows,
+                "duration_seconds": round(duration_seconds, 3),
+                "scanned_rows_per_second": round(scanned_rows / duration_seconds, 1) if duration_seconds else None,
+                "removed_links_per_second": round(removed_links / duration_seconds, 1) if duration_seconds else None,
             }
+
+        try:
+            for relation_key in self.RELATED_RELATION_KEYS[entity_type]:
+                unreliable_links, current_rows, other_rows = self._find_unreliable_links(relation_key, batch_size)
+                processed_items = current_rows
+                scanned_rows += current_rows + other_rows
+
+                removed_links += self._delete_links(relation_key, unreliable_links, batch_size)
+                cleaned_item_ids.update(source_id for source_id, _ in unreliable_links)
+
+            self.session.commit()
+            return build_result("success")
         except Exception as exc:
             self.session.rollback()
-            return {
-                "status": "error",
-                "error": str(exc),
-                "entity_type": self.entity_type,
-                "processed_items": processed_items,
-                "cleaned_items": cleaned_items,
-                "removed_links": removed_links,
-            }
+            removed_links = 0
+            cleaned_item_ids.clear()
+            return build_result("error", error=str(exc))
 
     def _link_to_related_entities(self, db_item: ModelType, detail_data: dict[str, Any]) -> ModelType:
-        from app.crud.crud_epigraph import epigraph as crud_epigraph
-        from app.crud.crud_object import obj as crud_object
-        from app.crud.crud_site import site as crud_site
-
-        entity_type = self._determine_entity_type()
-
-        if entity_type == "site":
-            site_item = cast(Any, db_item)
-            epigraph_dasi_ids = self._extract_related_dasi_ids(detail_data, "epigraphs")
-            if len(epigraph_dasi_ids) <= self.MAX_RELATED_ENTITY_LINKS:
-                for epigraph_dasi_id in epigraph_dasi_ids:
-                    epigraph = crud_epigraph.get_by_dasi_id(self.session, dasi_id=epigraph_dasi_id)
-                    if epigraph and epigraph.id is not None:
-                        crud_site.link_to_epigraph(self.session, site=site_item, epigraph_id=epigraph.id)
-
-            object_dasi_ids = self._extract_related_dasi_ids(detail_data, "objects")
-            if len(object_dasi_ids) <= self.MAX_RELATED_ENTITY_LINKS:
-                for object_dasi_id in object_dasi_ids:
-                    obj = crud_object.get_by_dasi_id(self.session, dasi_id=object_dasi_id)
-                    if obj and obj.id is not None:
-                        crud_site.link_to_object(self.session, site=site_item, object_id=obj.id)
-
-        elif entity_type == "epigraph":
-            epigraph_item = cast(Any, db_item)
-            site_dasi_ids = self._extract_related_dasi_ids(detail_data, "sites")
-            if len(site_dasi_ids) <= self.MAX_RELATED_ENTITY_LINKS:
-                for site_dasi_id in site_dasi_ids:
-                    site = crud_site.get_by_dasi_id(self.session, dasi_id=site_dasi_id)
-                    if site and site.id is not None:
-                        crud_epigraph.link_to_site(self.session, epigraph=epigraph_item, site_id=site.id)
-
-            object_dasi_ids = self._extract_related_dasi_ids(detail_data, "objects")
-            if len(object_dasi_ids) <= self.MAX_RELATED_ENTITY_LINKS:
-                for object_dasi_id in object_dasi_ids:
-                    obj = crud_object.get_by_dasi_id(self.session, dasi_id=object_dasi_id)
-                    if obj and obj.id is not None:
-                        crud_epigraph.link_to_object(self.session, epigraph=epigraph_item, object_id=obj.id)
-
-        elif entity_type == "object":
-            object_item = cast(Any, db_item)
-            site_dasi_ids = self._extract_related_dasi_ids(detail_data, "sites")
-            if len(site_dasi_ids) <= self.MAX_RELATED_ENTITY_LINKS:
-                for site_dasi_id in site_dasi_ids:
-                    site = crud_site.get_by_dasi_id(self.session, dasi_id=site_dasi_id)
-                    if site and site.id is not None:
-                        crud_object.link_to_site(self.session, obj=object_item, site_id=site.id)
-
-            epigraph_dasi_ids = self._extract_related_dasi_ids(detail_data, "epigraphs")
-            if len(epigraph_dasi_ids) <= self.MAX_RELATED_ENTITY_LINKS:
-                for epigraph_dasi_id in epigraph_dasi_ids:
-                    epigraph = crud_epigraph.get_by_dasi_id(self.session, dasi_id=epigraph_dasi_id)
-                    if epigraph and epigraph.id is not None:
-                        crud_object.link_to_epigraph(self.session, obj=object_item, epigraph_id=epigraph.id)
+        """Queue link rows for related entities; they are written when the page is flushed."""
+        db_item_id = cast(int | None, getattr(db_item, "id", None))
+        if db_item_id is None:
+            return db_item
+
+        for relation_key in self.RELATED_RELATION_KEYS[self._determine_entity_type()]:
+            link_model, source_column_name, target_column_name = self._get_related_link_config(relation_key)
+            for related_local_id in self._get_supported_related_local_ids(detail_data, relation_key):
+                self.link_writer.add(
+                    link_model,
+                    **{source_column_name: db_item_id, target_column_name: related_local_id},
+                )
 
         return db_item
 
@@ -402,6 +397,38 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return item_id > (cursor.last_seen_dasi_id or 0)
 
+    def _parse_listing_last_modified(self, item: dict[str, Any]) -> datetime | None:
+        value = item.get("lastModified")
+        if not value:
+            return None
+
+        try:
+            return datetime.strptime(str(value), "%Y-%m-%d")
+        except ValueError:
+            return None
+
+    def _is_unchanged_since_snapshot(
+        self,
+        item: dict[str, Any],
+        snapshot: DasiSourceSnapshot | None,
+    ) -> bool:
+        """
+        Compare the listing entry's `lastModified` with the stored snapshot.
+
+        Only a positive match counts as unchanged; listings without a timestamp
+        fall through to a detail fetch, which is conditional when the response
+        archive is enabled.
+        """
+        if snapshot is None or snapshot.source_last_modified is None:
+            return False
+
+        listing_last_modified = self._parse_listing_last_modified(item)
+        if listing_last_modified is None:
+            return False
+
+        stored_last_modified = snapshot.source_last_modified.replace(tzinfo=None)
+        return listing_last_modified <= stored_last_modified
+
     def _should_skip_existing_item(
         self,
         *,
@@ -411,36 +438,46 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> bool:
         return db_item is not None and not update_existing
 
-    def _store_snapshot(
-        self,
-        *,
-        item_id: int,
-        detail_data: dict[str, Any],
-        parsed_data: dict[str, Any],
-    ) -> None:
-        self.sync_state.upsert_snapshot(
-            entity_type=self.entity_type,
-            dasi_id=item_id,
-            source_url=self._detail_url(item_id),
-            payload=detail_data,
-            source_last_modified=parsed_data.get("last_modified"),
-        )
+    def _load_existing_items(self, item_ids: list[int]) -> dict[int, ModelType]:
+        if not item_ids:
+            return {}
 
-    def _persist_detail_data(
+        model = self.crud.model
+        statement = select(model).where(model.dasi_id.in_(item_ids))
+        return {db_item.dasi_id: db_item for db_item in self.session.execute(statement).scalars()}
+
+    def _write_page(
         self,
+        items: list[tuple[int, dict[str, Any]]],
         *,
-        item_id: int,
-        detail_data: dict[str, Any],
         dasi_published: bool | None,
-    ) -> ModelType:
-        parsed_data = self._parse_fields(detail_data)
-        self._store_snapshot(item_id=item_id, detail_data=detail_data, parsed_data=parsed_data)
-
-        db_item = self.crud.get_by_dasi_id(self.session, dasi_id=item_id)
-        if db_item:
-            return cast(
-                ModelType,
-                self.crud.update(
+    ) -> dict[int, ModelType]:
+        """
+        Stage snapshots, entity upserts and link rows for one page without committing.
+
+        Snapshots go out as a single multi-row upsert, entities are flushed
+        together to obtain their ids and link rows are inserted per link table.
+        """
+        parsed_items = [(item_id, detail_data, self._parse_fields(detail_data)) for item_id, detail_data in items]
+        self.sync_state.upsert_snapshots(
+            self.entity_type,
+            [
+                {
+                    "dasi_id": item_id,
+                    "source_url": self._detail_url(item_id),
+                    "payload": detail_data,
+                    "source_last_modified": parsed_data.get("last_modified"),
+                }
+                for item_id, detail_data, parsed_data in parsed_items
+            ],
+        )
+
+        existing_items = self._load_existing_items([item_id for item_id, _ in items])
+        persisted: dict[int, ModelType] = {}
+        for item_id, detail_data, parsed_data in parsed_items:
+            db_item = existing_items.get(item_id)
+            if db_item is not None:
+                persisted[item_id] = self.crud.update(
                     db=self.session,
                     db_obj=db_item,
                     obj_in=self.update_schema(
@@ -449,35 +486,116 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                         dasi_published=dasi_published,
                         **parsed_data,
                     ),
-                ),
-            )
+                    commit=False,
+                )
+            else:
+                persisted[item_id] = self.crud.create(
+                    db=self.session,
+                    obj_in=self.create_schema(
+                        dasi_id=item_id,
+                        dasi_object=detail_data,
+                        dasi_published=dasi_published,
+                        **parsed_data,
+                    ),
+                    commit=False,
+                )
 
-        return cast(
-            ModelType,
-            self.crud.create(
-                db=self.session,
-                obj_in=self.create_schema(
-                    dasi_id=item_id,
-                    dasi_object=detail_data,
-                    dasi_published=dasi_published,
-                    **parsed_data,
-                ),
-            ),
+        self.session.flush()
+        for item_id, detail_data, _ in parsed_items:
+            db_item = persisted[item_id]
+            self.resolver.remember(self.entity_type, item_id, getattr(db_item, "id", None))
+            self._finalize_imported_item(db_item, detail_data)
+        self.link_writer.flush(commit=False)
+
+        return persisted
+
+    async def _persist_page(
+        self,
+        items: list[tuple[int, dict[str, Any]]],
+        *,
+        dasi_published: bool | None,
+    ) -> dict[int, ModelType]:
+        """Write one page in a single transaction, retrying it on transient database errors."""
+        if not items:
+            return {}
+
+        attempt = 0
+        while True:
+            try:
+                persisted = self._write_page(items, dasi_published=dasi_published)
+                self.session.commit()
+                return persisted
+            except OperationalError as exc:
+                self.session.rollback()
+                self.link_writer.clear()
+                if attempt >= self.PAGE_PERSIST_RETRIES:
+                    raise
+
+                attempt += 1
+                logging.warning(f"Transient error persisting {self.entity_type} page: {exc!r}. Retrying...")
+                await asyncio.sleep(attempt)
+
+    def _requests_per_second(self, rate_limit_delay: float | None) -> float | None:
+        if rate_limit_delay is None:
+            return settings.DASI_REQUESTS_PER_SECOND
+        if rate_limit_delay <= 0:
+            return None
+        return 1.0 / rate_limit_delay
+
+    @asynccontextmanager
+    async def _fetch_session(self, rate_limit_delay: float | None = None) -> AsyncIterator[DasiFetcher]:
+        """
+        Yield the fetcher of the current import run, opening one if none is active.
+
+        Nested calls share the outer fetcher so every request of a run goes through
+        the same connection pool and rate limiter. The run also gets a fresh
+        DASI id resolver and image downloader.
+        """
+        if self.fetcher is not None:
+            yield self.fetcher
+            return
+
+        async with self._build_fetcher(rate_limit_delay) as fetcher:
+            self.fetcher = fetcher
+            self.image_downloader = ImageDownloader(fetcher)
+            self.unchanged_items = 0
+            self.resolver.reset()
+            try:
+                yield fetcher
+            finally:
+                self.link_writer.clear()
+                self.image_downloader = None
+                self.fetcher = None
+
+    def _build_fetcher(self, rate_limit_delay: float | None) -> DasiFetcher:
+        if self.archive_mode not in DasiArchiveMode.ALL:
+            raise ValueError(f"Unknown archive mode: {self.archive_mode}")
+
+        archive = None
+        if self.archive_mode != DasiArchiveMode.OFF:
+            archive = ResponseArchive(settings.DASI_ARCHIVE_DIR)
+
+        requests_per_second = self._requests_per_second(rate_limit_delay)
+        shared_limiter = None
+        if self.shared_rate_limit_key and self.archive_mode != DasiArchiveMode.REPLAY:
+            shared_limiter = RedisRateLimiter(self.shared_rate_limit_key, requests_per_second)
+
+        return DasiFetcher(
+            requests_per_second=requests_per_second,
+            archive=archive,
+            replay=self.archive_mode == DasiArchiveMode.REPLAY,
+            shared_limiter=shared_limiter,
         )
 
-    def _fetch_detail_data(self, item_id: int, rate_limit_delay: float) -> dict[str, Any]:
-        time.sleep(rate_limit_delay)
-        detail_response = requests.get(self._detail_url(item_id), timeout=30)
-        detail_response.raise_for_status()
-        return cast(dict[str, Any], detail_response.json())
+    async def _fetch_detail_document(self, item_id: int) -> FetchedDocument:
+        async with self._fetch_session() as fetcher:
+            return await fetcher.get_document(self._detail_url(item_id))
 
-    def _fetch_page(self, page: int, rate_limit_delay: float) -> dict[str, Any]:
-        time.sleep(rate_limit_delay)
-        response = requests.get(self.base_url, params={"page": page}, timeout=30)
-        response.raise_for_status()
-        return cast(dict[str, Any], response.json())
+    async def _fetch_page(self, page: int) -> dict[str, Any]:
+        async with self._fetch_session() as fetcher:
+            return await fetcher.get_json(self.base_url, params={"page": page})
 
-    def _post_process_imported_item(
+    async def _post_process_imported_item(
         self,
         db_item: ModelType,
         *,
@@ -497,79 +615,212 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         dasi_published: bool | None = None,
         rate_limit_delay: float = 10.0,
     ) -> ModelType:
-        detail_data = self._fetch_detail_data(item_id, rate_limit_delay)
-        db_item = self._persist_detail_data(
-            item_id=item_id,
-            detail_data=detail_data,
-            dasi_published=dasi_published,
-        )
-        db_item = self._post_process_imported_item(
-            db_item,
-            item_id=item_id,
-            detail_data=detail_data,
-            dasi_published=dasi_published,
-            rate_limit_delay=rate_limit_delay,
+        return asyncio.run(
+            self._import_single_async(
+                item_id,
+                dasi_published=dasi_published,
+                rate_limit_delay=rate_limit_delay,
+            )
         )
-        return self._finalize_imported_item(db_item, detail_data)
+
+    async def _import_single_async(
+        self,
+        item_id: int,
+        dasi_published: bool | None = None,
+        rate_limit_delay: float = 10.0,
+    ) -> ModelType:
+        async with self._fetch_session(rate_limit_delay):
+            outcome = (
+                await self._import_many(
+                    [item_id],
+                    dasi_published=dasi_published,
+                    rate_limit_delay=rate_limit_delay,
+                )
+            )[0]
+
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    async def _import_many(
+        self,
+        item_ids: list[int],
+        *,
+        dasi_published: bool | None = None,
+        rate_limit_delay: float = 10.0,
+    ) -> list[ModelType | BaseException]:
+        """
+        Import one page of items as a single unit of work.
+
+        Detail documents are fetched concurrently through the active fetcher,
+        then every changed item is persisted in one transaction before the
+        per-item post-processing (scraping) runs. Outcomes are returned in the
+        order of `item_ids`; failures are returned as exceptions rather than
+        raised so callers can decide how to count them.
+        """
+        outcomes: dict[int, ModelType | BaseException] = {}
+
+        async with self._fetch_session(rate_limit_delay):
+            documents = await asyncio.gather(
+                *(self._fetch_detail_document(item_id) for item_id in item_ids),
+                return_exceptions=True,
+            )
+
+            fetched = {
+                item_id: document
+                for item_id, document in zip(item_ids, documents)
+                if not isinstance(document, BaseException)
+            }
+            outcomes.update(
+                (item_id, document)
+                for item_id, document in zip(item_ids, documents)
+                if isinstance(document, BaseException)
+            )
+
+            existing_items = self._load_existing_items(
+                [item_id for item_id, document in fetched.items() if not document.changed]
+            )
+            page_items: list[tuple[int, dict[str, Any]]] = []
+            for item_id, document in fetched.items():
+                existing_item = existing_items.get(item_id)
+                if existing_item is not None and dasi_published in (None, cast(Any, existing_item).dasi_published):
+                    self.unchanged_items += 1
+                    outcomes[item_id] = existing_item
+                    continue
+
+                try:
+                    page_items.append((item_id, document.json()))
+                except ValueError as exc:
+                    outcomes[item_id] = exc
+
+            try:
+                persisted = await self._persist_page(page_items, dasi_published=dasi_published)
+            except Exception as exc:
+                self.session.rollback()
+                persisted = {}
+                outcomes.update((item_id, exc) for item_id, _ in page_items)
+
+            detail_by_id = dict(page_items)
+            post_processed = await asyncio.gather(
+                *(
+                    self._post_process_imported_item(
+                        db_item,
+                        item_id=item_id,
+                        detail_data=detail_by_id[item_id],
+                        dasi_published=dasi_published,
+                        rate_limit_delay=rate_limit_delay,
+                    )
+                    for item_id, db_item in persisted.items()
+                ),
+                return_exceptions=True,
+            )
+            outcomes.update(zip(persisted.keys(), post_processed))
+
+        if any(isinstance(outcome, BaseException) for outcome in post_processed):
+            self.session.rollback()
+        return [outcomes[item_id] for item_id in item_ids]
+
+    def _raise_first_failure(self, outcomes: list[ModelType | BaseException]) -> None:
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
 
     def import_all(
         self,
         rate_limit_delay: float = 10,
         update_existing: bool = False,
     ) -> dict[str, Any]:
-        items_per_page = 30
+        return asyncio.run(
+            self._import_all_async(
+                rate_limit_delay=rate_limit_delay,
+                update_existing=update_existing,
+            )
+        )
+
+    async def _import_all_async(
+        self,
+        rate_limit_delay: float = 10,
+        update_existing: bool = False,
+    ) -> dict[str, Any]:
         total_imported = 0
         total_skipped = 0
         total_items = None
         failed_items = 0
-        current_page = (total_imported // items_per_page) + 1
-
-        try:
-            while True:
-                data = self._fetch_page(current_page, rate_limit_delay)
-                total_items = data.get("totalItems", total_items)
-
-                for item in data.get("member", []):
-                    item_id = self._extract_item_id(item)
-                    db_item = self.crud.get_by_dasi_id(self.session, dasi_id=item_id)
-                    if self._should_skip_existing_item(
-                        db_item=db_item,
-                        update_existing=update_existing,
-                        mode="all",
-                    ):
-                        total_skipped += 1
-                        continue
-
-                    self.import_single(item_id)
-                    total_imported += 1
-
-                if "next" not in data.get("view", {}):
-                    break
-
-                current_page += 1
-
-            return {
-                "status": "success",
-                "processed_items": total_imported,
-                "skipped_items": total_skipped,
-                "failed_items": failed_items,
-                "total_items": total_items,
-            }
+        current_page = 1
 
-        except Exception as exc:
-            return {
-                "status": "error",
-                "error": str(exc),
-                "processed_items": total_imported,
-                "skipped_items": total_skipped,
-                "failed_items": failed_items,
-                "total_items": total_items,
-            }
+        async with self._fetch_session(rate_limit_delay) as fetcher:
+            try:
+                while True:
+                    data = await self._fetch_page(current_page)
+                    total_items = data.get("totalItems", total_items)
+
+                    member_ids = [self._extract_item_id(item) for item in data.get("member", [])]
+                    existing_items = self._load_existing_items(member_ids)
+
+                    item_ids = []
+                    for item_id in member_ids:
+                        db_item = existing_items.get(item_id)
+                        if self._should_skip_existing_item(
+                            db_item=db_item,
+                            update_existing=update_existing,
+                            mode="all",
+                        ):
+                            total_skipped += 1
+                            continue
+
+                        item_ids.append(item_id)
+
+                    outcomes = await self._import_many(item_ids, rate_limit_delay=rate_limit_delay)
+                    total_imported += sum(
+                        1 for outcome in outcomes if not isinstance(outcome, BaseException)
+                    )
+                    self._raise_first_failure(outcomes)
+
+                    if "next" not in data.get("view", {}):
+                        break
+
+                    current_page += 1
+
+                return {
+                    "status": "success",
+                    "processed_items": total_imported,
+                    "skipped_items": total_skipped,
+                    "failed_items": failed_items,
+                    "total_items": total_items,
+                    "unchanged_items": self.unchanged_items,
+                    "fetch": fetcher.stats(),
+                    "images": self._image_stats(),
+                }
+
+            except Exception as exc:
+                return {
+                    "status": "error",
+                    "error": str(exc),
+                    "processed_items": total_imported,
+                    "skipped_items": total_skipped,
+                    "failed_items": failed_items,
+                    "total_items": total_items,
+                    "unchanged_items": self.unchanged_items,
+                    "fetch": fetcher.stats(),
+                    "images": self._image_stats(),
+                }
 
     def import_incremental(
         self,
         rate_limit_delay: float = 10,
         update_existing: bool = True,
+    ) -> dict[str, Any]:
+        return asyncio.run(
+            self._import_incremental_async(
+                rate_limit_delay=rate_limit_delay,
+                update_existing=update_existing,
+            )
+        )
+
+    async def _import_incremental_async(
+        self,
+        rate_limit_delay: float = 10,
+        update_existing: bool = True,
     ) -> dict[str, Any]:
         cursor = self.sync_state.mark_cursor_started(self.entity_type)
         start_page = self._get_incremental_start_page(cursor)
@@ -579,71 +830,101 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         total_imported = 0
         total_skipped = 0
         failed_items = 0
+        planned_fetches = 0
+        avoided_fetches = 0
         total_items = cursor.total_items_hint
 
-        try:
-            while True:
-                data = self._fetch_page(current_page, rate_limit_delay)
-                total_items = data.get("totalItems", total_items)
-                members = data.get("member", [])
-
-                if not members:
-                    break
-
-                for item in members:
-                    item_id = self._extract_item_id(item)
-                    db_item = self.crud.get_by_dasi_id(self.session, dasi_id=item_id)
-                    if not self._should_import_incremental_item(
-                        db_item=db_item,
-                        item_id=item_id,
-                        current_page=current_page,
-                        cursor=cursor,
-                        update_existing=update_existing,
-                    ):
-                        total_skipped += 1
-                        continue
-
-                    self.import_single(item_id, rate_limit_delay=rate_limit_delay)
-                    total_imported += 1
-                    if last_seen_dasi_id is None or item_id > last_seen_dasi_id:
-                        last_seen_dasi_id = item_id
-
-                last_completed_page = current_page
-                if "next" not in data.get("view", {}):
-                    break
-                current_page += 1
-
-            self.sync_state.mark_cursor_completed(
-                self.entity_type,
-                last_completed_page=last_completed_page,
-                last_seen_dasi_id=last_seen_dasi_id,
-                total_items_hint=total_items,
-            )
-            return {
-                "status": "success",
-                "mode": "incremental",
-                "processed_items": total_imported,
-                "skipped_items": total_skipped,
-                "failed_items": failed_items,
-                "total_items": total_items,
-                "start_page": start_page,
-                "last_completed_page": last_completed_page,
-                "last_seen_dasi_id": last_seen_dasi_id,
-            }
-        except Exception as exc:
-            self.sync_state.mark_cursor_failed(self.entity_type, str(exc))
-            return {
-                "status": "error",
-                "error": str(exc),
-                "mode": "incremental",
-                "processed_items": total_imported,
-                "skipped_items": total_skipped,
-                "failed_items": failed_items,
-                "total_items": total_items,
-                "start_page": start_page,
-                "last_completed_page": last_completed_page,
-                "last_seen_dasi_id": last_seen_dasi_id,
-            }
+        async with self._fetch_session(rate_limit_delay) as fetcher:
+            try:
+                while True:
+                    data = await self._fetch_page(current_page)
+                    total_items = data.get("totalItems", total_items)
+                    members = data.get("member", [])
+
+                    if not members:
+                        break
+
+                    member_ids = [self._extract_item_id(item) for item in members]
+                    snapshots = self.sync_state.get_snapshots(self.entity_type, member_ids)
+                    existing_items = self._load_existing_items(member_ids)
+
+                    item_ids = []
+                    for item, item_id in zip(members, member_ids):
+                        db_item = existing_items.get(item_id)
+                        if not self._should_import_incremental_item(
+                            db_item=db_item,
+                            item_id=item_id,
+                            current_page=current_page,
+                            cursor=cursor,
+                            update_existing=update_existing,
+                        ):
+                            total_skipped += 1
+                            continue
+
+                        if db_item is not None and self._is_unchanged_since_snapshot(item, snapshots.get(item_id)):
+                            total_skipped += 1
+                            avoided_fetches += 1
+                            continue
+
+                        item_ids.append(item_id)
+
+                    planned_fetches += len(item_ids)
+
+                    outcomes = await self._import_many(item_ids, rate_limit_delay=rate_limit_delay)
+                    for item_id, outcome in zip(item_ids, outcomes):
+                        if isinstance(outcome, BaseException):
+                            continue
+                        total_imported += 1
+                        if last_seen_dasi_id is None or item_id > last_seen_dasi_id:
+                            last_seen_dasi_id = item_id
+                    self._raise_first_failure(outcomes)
+
+                    last_completed_page = current_page
+                    if "next" not in data.get("view", {}):
+                        break
+                    current_page += 1
+
+                self.sync_state.mark_cursor_completed(
+                    self.entity_type,
+                    last_completed_page=last_completed_page,
+                    last_seen_dasi_id=last_seen_dasi_id,
+                    total_items_hint=total_items,
+                )
+                return {
+                    "status": "success",
+                    "mode": "incremental",
+                    "processed_items": total_imported,
+                    "skipped_items": total_skipped,
+                    "failed_items": failed_items,
+                    "total_items": total_items,
+                    "start_page": start_page,
+                    "last_completed_page": last_completed_page,
+                    "last_seen_dasi_id": last_seen_dasi_id,
+                    "planned_fetches": planned_fetches,
+                    "avoided_fetches": avoided_fetches,
+                    "unchanged_items": self.unchanged_items,
+                    "fetch": fetcher.stats(),
+                    "images": self._image_stats(),
+                }
+            except Exception as exc:
+                self.sync_state.mark_cursor_failed(self.entity_type, str(exc))
+                return {
+                    "status": "error",
+                    "error": str(exc),
+                    "mode": "incremental",
+                    "processed_items": total_imported,
+                    "skipped_items": total_skipped,
+                    "failed_items": failed_items,
+                    "total_items": total_items,
+                    "start_page": start_page,
+                    "last_completed_page": last_completed_page,
+                    "last_seen_dasi_id": last_seen_dasi_id,
+                    "planned_fetches": planned_fetches,
+                    "avoided_fetches": avoided_fetches,
+                    "unchanged_items": self.unchanged_items,
+                    "fetch": fetcher.stats(),
+                    "images": self._image_stats(),
+                }
 
     def transfer_fields(self, data: dict[str, Any]) -> UpdateSchemaType:
         item_fields: dict[str, Any] = {}
@@ -663,66 +944,132 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         rate_limit_delay: float = 10,
         update_existing: bool = False,
     ) -> dict[str, Any]:
+        return asyncio.run(
+            self._import_range_async(
+                start_id=start_id,
+                end_id=end_id,
+                dasi_published=dasi_published,
+                rate_limit_delay=rate_limit_delay,
+                update_existing=update_existing,
+            )
+        )
+
+    async def _import_range_async(
+        self,
+        start_id: int,
+        end_id: int,
+        dasi_published: bool | None = None,
+        rate_limit_delay: float = 10,
+        update_existing: bool = False,
+    ) -> dict[str, Any]:
+        result = await self._import_ids_async(
+            list(range(start_id, end_id + 1)),
+            dasi_published=dasi_published,
+            rate_limit_delay=rate_limit_delay,
+            update_existing=update_existing,
+        )
+        return {**result, "range": f"{start_id}-{end_id}"}
+
+    def import_ids(
+        self,
+        item_ids: list[int],
+        dasi_published: bool | None = None,
+        rate_limit_delay: float = 10,
+        update_existing: bool = False,
+    ) -> dict[str, Any]:
+        return asyncio.run(
+            self._import_ids_async(
+                item_ids,
+                dasi_published=dasi_published,
+                rate_limit_delay=rate_limit_delay,
+                update_existing=update_existing,
+            )
+        )
+
+    async def _import_ids_async(
+        self,
+        item_ids: list[int],
+        dasi_published: bool | None = None,
+        rate_limit_delay: float = 10,
+        update_existing: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Import an explicit list of DASI ids in batches.
+
+        Ids whose detail request keeps failing with a server error are counted
+        as failed and returned in `failed_ids` so they can be retried later. If
+        the import aborts, the ids of the unfinished batches are reported too.
+        """
         total_imported = 0
         total_skipped = 0
-        failed_items = 0
-        total_items = end_id - start_id + 1
-
-        try:
-            for item_id in range(start_id, end_id + 1):
-                db_item = self.crud.get_by_dasi_id(self.session, dasi_id=item_id)
-                if self._should_skip_existing_item(
-                    db_item=db_item,
-                    update_existing=update_existing,
-                    mode="range",
-                ):
-                    total_skipped += 1
-                    continue
+        failed_ids: list[int] = []
+        total_items = len(item_ids)
+        batch_start = 0
 
-                try:
-                    self.import_single(
-                        item_id,
+        async with self._fetch_session(rate_limit_delay) as fetcher:
+            try:
+                for batch_start in range(0, total_items, self.RANGE_BATCH_SIZE):
+                    batch_ids = item_ids[batch_start:batch_start + self.RANGE_BATCH_SIZE]
+                    existing_items = self._load_existing_items(batch_ids)
+                    import_ids = []
+                    for item_id in batch_ids:
+                        if self._should_skip_existing_item(
+                            db_item=existing_items.get(item_id),
+                            update_existing=update_existing,
+                            mode="range",
+                        ):
+                            total_skipped += 1
+                            continue
+
+                        import_ids.append(item_id)
+
+                    outcomes = await self._import_many(
+                        import_ids,
                         dasi_published=dasi_published,
                         rate_limit_delay=rate_limit_delay,
                     )
-                    total_imported += 1
-                except requests.exceptions.HTTPError as exc:
-                    if exc.response.status_code == 404:
-                        continue
-                    if exc.response.status_code == 500:
-                        time.sleep(rate_limit_delay * 2)
-                        try:
-                            self.import_single(
-                                item_id,
-                                dasi_published=dasi_published,
-                                rate_limit_delay=rate_limit_delay,
-                            )
+                    for item_id, outcome in zip(import_ids, outcomes):
+                        if not isinstance(outcome, BaseException):
                             total_imported += 1
-                        except requests.exceptions.HTTPError as retry_exc:
-                            if retry_exc.response.status_code == 404:
+                            continue
+                        if isinstance(outcome, aiohttp.ClientResponseError):
+                            if outcome.status == 404:
                                 continue
-                            if retry_exc.response.status_code == 500:
-                                failed_items += 1
+                            if outcome.status >= 500:
+                                failed_ids.append(item_id)
                                 continue
-                    raise
-
-            return {
-                "status": "success",
-                "processed_items": total_imported,
-                "skipped_items": total_skipped,
-                "failed_items": failed_items,
-                "total_items": total_items,
-                "range": f"{start_id}-{end_id}",
-            }
-        except Exception as exc:
-            return {
-                "status": "error",
-                "error": str(exc),
-                "processed_items": total_imported,
-                "skipped_items": total_skipped,
-                "failed_items": failed_items,
-                "total_items": total_items,
-            }
+                        raise outcome
+
+                return {
+                    "status": "success",
+                    "processed_items": total_imported,
+                    "skipped_items": total_skipped,
+                    "failed_items": len(failed_ids),
+                    "failed_ids": failed_ids,
+                    "total_items": total_items,
+                    "unchanged_items": self.unchanged_items,
+                    "fetch": fetcher.stats(),
+                    "images": self._image_stats(),
+                }
+            except Exception as exc:
+                failed_ids.extend(item_ids[batch_start:])
+                return {
+                    "status": "error",
+                    "error": str(exc),
+                    "processed_items": total_imported,
+                    "skipped_items": total_skipped,
+                    "failed_items": len(failed_ids),
+                    "failed_ids": failed_ids,
+                    "total_items": total_items,
+                    "unchanged_items": self.unchanged_items,
+                    "fetch": fetcher.stats(),
+                    "images": self._image_stats(),
+                }
+
+    def _image_stats(self) -> dict[str, Any] | None:
+        if self.image_downloader is None:
+            return None
+        return self.image_downloader.stats()
 
     async def import_image(
         self,
@@ -731,34 +1078,12 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         save_directory: str = "public",
         rate_limit_delay: float = 1.0,
     ) -> Optional[str]:
-        await asyncio.sleep(rate_limit_delay)
-
-        image_url = f"https://de.dasi.cnr.it/cgi-bin/wsimg.pl?recId={rec_id}&size={size}"
-
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(image_url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    response.raise_for_status()
-
-                    content_type = response.headers.get("content-type", "")
-                    if not content_type.startswith("image/"):
-                        return None
-
-                    images_dir = Path(save_directory) / "images"
-                    images_dir.mkdir(parents=True, exist_ok=True)
-
-                    filename = f"rec_{rec_id}_{size}.jpg"
-                    file_path = images_dir / filename
-
-                    with open(file_path, "wb") as file_handle:
-                        async for chunk in response.content.iter_chunked(8192):
-                            file_handle.write(chunk)
-
-                    return f"images/{filename}"
-
-        except aiohttp.ClientError:
-            return None
-        except Exception:
+            async with self._fetch_session(rate_limit_delay):
+                downloader = cast(ImageDownloader, self.image_downloader)
+                return await downloader.download(rec_id, size=size, save_directory=save_directory)
+        except Exception as exc:
+            logging.error(f"Error downloading image {rec_id}: {exc!r}")
             return None
 
     async def import_images_range(
@@ -774,28 +1099,36 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         total_range = end_id - start_id + 1
 
         try:
-            for rec_id in range(start_id, end_id + 1):
-                image_path = await self.import_image(
-                    rec_id=rec_id,
-                    size=image_size,
-                    save_directory="public",
-                    rate_limit_delay=rate_limit_delay,
+            async with self._fetch_session(rate_limit_delay):
+                rec_ids = list(range(start_id, end_id + 1))
+                image_paths = await asyncio.gather(
+                    *(
+                        self.import_image(
+                            rec_id=rec_id,
+                            size=image_size,
+                            save_directory="public",
+                            rate_limit_delay=rate_limit_delay,
+                        )
+                        for rec_id in rec_ids
+                    )
                 )
 
-                if image_path:
-                    successful_downloads += 1
-                    downloaded_images.append({"rec_id": rec_id, "image_path": image_path})
-                else:
-                    failed_downloads += 1
-
-            return {
-                "status": "success",
-                "processed_items": total_range,
-                "total_items": total_range,
-                "successful_downloads": successful_downloads,
-                "failed_items": failed_downloads,
-                "downloaded_images": downloaded_images[:100],
-            }
+                for rec_id, image_path in zip(rec_ids, image_paths):
+                    if image_path:
+                        successful_downloads += 1
+                        downloaded_images.append({"rec_id": rec_id, "image_path": image_path})
+                    else:
+                        failed_downloads += 1
+
+                return {
+                    "status": "success",
+                    "processed_items": total_range,
+                    "total_items": total_range,
+                    "successful_downloads": successful_downloads,
+                    "failed_items": failed_downloads,
+                    "downloaded_images": downloaded_images[:100],
+                    "images": self._image_stats(),
+                }
         except Exception as exc:
             return {
                 "status": "error",
@@ -812,47 +1145,63 @@ class ImportService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         rate_limit_delay: float = 2.0,
         max_consecutive_failures: int = 50,
     ) -> dict[str, Any]:
-        try:
-            current_rec_id = start_rec_id
-            consecutive_failures = 0
-            successful_downloads = 0
-            total_attempts = 0
-            downloaded_images: list[dict[str, Any]] = []
-
-            while consecutive_failures < max_consecutive_failures:
-                total_attempts += 1
-
-                image_path = await self.import_image(
-                    rec_id=current_rec_id,
-                    size=image_size,
-                    save_directory="public",
-                    rate_limit_delay=rate_limit_delay,
-                )
-
-                if image_path:
-                    consecutive_failures = 0
-                    successful_downloads += 1
-                    downloaded_images.append({"rec_id": current_rec_id, "image_path": image_path})
-                else:
-                    consecutive_failures += 1
+        """
+        Download images by ascending rec id until too many consecutive ids fail.
+
+        Ids are fetched in windows as wide as the downloader's concurrency and
+        evaluated in order, so the stopping point matches a sequential walk.
+        """
+        current_rec_id = start_rec_id
+        consecutive_failures = 0
+        successful_downloads = 0
+        total_attempts = 0
+        downloaded_images: list[dict[str, Any]] = []
 
-                current_rec_id += 1
+        try:
+            async with self._fetch_session(rate_limit_delay):
+                window_size = cast(ImageDownloader, self.image_downloader).max_concurrency
+                while consecutive_failures < max_consecutive_failures:
+                    rec_ids = list(range(current_rec_id, current_rec_id + window_size))
+                    image_paths = await asyncio.gather(
+                        *(
+                            self.import_image(
+                                rec_id=rec_id,
+                                size=image_size,
+                                save_directory="public",
+                                rate_limit_delay=rate_limit_delay,
+                            )
+                            for rec_id in rec_ids
+                        )
+                    )
 
-            return {
-                "status": "success",
-                "processed_items": successful_downloads,
-                "total_items": total_attempts,
-                "failed_items": total_attempts - successful_downloads,
-                "final_rec_id": current_rec_id - 1,
-                "consecutive_failures": consecutive_failures,
-                "downloaded_images": downloaded_images[:100],
-            }
+                    for rec_id, image_path in zip(rec_ids, image_paths):
+                        total_attempts += 1
+                        current_rec_id = rec_id + 1
+                        if image_path:
+                            consecutive_failures = 0
+                            successful_downloads += 1
+                            downloaded_images.append({"rec_id": rec_id, "image_path": image_path})
+                        else:
+                            consecutive_failures += 1
+
+                        if consecutive_failures >= max_consecutive_failures:
+                            break
+
+                return {
+                    "status": "success",
+                    "processed_items": successful_downloads,
+                    "total_items": total_attempts,
+                    "failed_items": total_attempts - successful_downloads,
+                    "final_rec_id": current_rec_id - 1,
+                    "consecutive_failures": consecutive_failures,
+                    "downloaded_images": downloaded_images[:100],
+                    "images": self._image_stats(),
+                }
         except Exception as exc:
-            total_attempts = total_attempts if "total_attempts" in locals() else 0
             return {
                 "status": "error",
                 "error": str(exc),
                 "processed_items": 0,
                 "total_items": total_attempts,
                 "failed_items": total_attempts,
-            }
\ No newline at end of file
+            }
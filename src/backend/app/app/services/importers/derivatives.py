@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+
+DERIVATIVE_DIRECTORY = "images/derivatives"
+DERIVATIVE_FORMATS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+DERIVATIVE_EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+
+_executor: Executor | None = None
+
+
+def _save_atomic(image: Image.Image, path: Path, options: dict[str, Any]) -> None:
+    file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file_handle:
+            image.save(file_handle, **options)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def generate_derivatives(
+    source_path: str,
+    output_root: str,
+    widths: tuple[int, ...],
+) -> dict[str, Any]:
+    """
+    Render resized WebP and JPEG variants of one image and return its manifest.
+
+    Filenames embed a hash of the source bytes, so the files are immutable and
+    regenerating an unchanged image is a no-op. Runs in a worker process.
+    """
+    source = Path(source_path)
+    content_hash = hashlib.sha256(source.read_bytes()).hexdigest()[:16]
+    output_dir = Path(output_root) / DERIVATIVE_DIRECTORY
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened).convert("RGB")
+
+    original_width, original_height = image.size
+    target_widths = sorted({min(width, original_width) for width in widths})
+
+    variants = []
+    for width in target_widths:
+        height = max(round(original_height * width / original_width), 1)
+        resized = image if width == original_width else image.resize((width, height), Image.Resampling.LANCZOS)
+
+        for format_name, options in DERIVATIVE_FORMATS.items():
+            filename = f"{source.stem}_{content_hash}_{width}w.{DERIVATIVE_EXTENSIONS[format_name]}"
+            output_path = output_dir / filename
+            if not output_path.exists():
+                _save_atomic(resized, output_path, options)
+
+            variants.append({
+                "format": format_name,
+                "width": width,
+                "height": height,
+                "path": f"{DERIVATIVE_DIRECTORY}/{filename}",
+                "bytes": output_path.stat().st_size,
+            })
+
+    return {
+        "hash": content_hash,
+        "width": original_width,
+        "height": original_height,
+        "variants": variants,
+    }
+
+
+def _get_executor() -> Executor:
+    """
+    Return the shared derivative executor.
+
+    Daemonic processes such as Celery prefork workers cannot start children, so
+    they fall back to threads; Pillow releases the GIL while resizing and encoding.
+    """
+    global _executor
+    if _executor is None:
+        if multiprocessing.current_process().daemon:
+            _executor = ThreadPoolExecutor(max_workers=settings.IMAGE_DERIVATIVE_WORKERS)
+        else:
+            _executor = ProcessPoolExecutor(max_workers=settings.IMAGE_DERIVATIVE_WORKERS)
+    return _executor
+
+
+def configured_widths() -> tuple[int, ...]:
+    return tuple(int(width) for width in settings.IMAGE_DERIVATIVE_WIDTHS.split(",") if width.strip())
+
+
+async def build_image_derivatives(
+    image_data: list[dict[str, Any]],
+    *,
+    public_root: str = "public",
+    widths: tuple[int, ...] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Attach a `derivatives` manifest to every copyright-free image in `image_data`.
+
+    Only public images get derivatives since private ones are never served.
+    Rendering runs in a process pool so it does not block the event loop.
+    """
+    widths = widths or configured_widths()
+    loop = asyncio.get_running_loop()
+
+    async def build(image: dict[str, Any]) -> dict[str, Any]:
+        image_id = image.get("image_id")
+        if not image.get("copyright_free") or not image_id:
+            return image
+
+        source_path = Path(public_root) / "images" / f"rec_{image_id}_high.jpg"
+        if not source_path.exists():
+            return image
+
+        try:
+            manifest = await loop.run_in_executor(
+                _get_executor(),
+                generate_derivatives,
+                str(source_path),
+                public_root,
+                widths,
+            )
+        except Exception as exc:
+            logging.error(f"Error generating derivatives for image {image_id}: {exc!r}")
+            return image
+
+        return {**image, "derivatives": manifest}
+
+    return list(await asyncio.gather(*(build(image) for image in image_data)))
@@ -1,17 +1,17 @@
-import requests
-import re
 import logging
 import os
 import shutil
 import asyncio
+from typing import Any, cast
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-from sqlmodel import Session
+import aiohttp
+from sqlmodel import Session, select
 
 from app.crud.crud_epigraph import epigraph as crud_epigraph
 from app.models.epigraph import Epigraph, EpigraphCreate, EpigraphUpdate
 from app.services.importers.base import ImportService
+from app.services.importers.derivatives import build_image_derivatives
+from app.services.importers.scraping import parse_epigraph_page
 from app.core.config import settings
 
 
@@ -25,38 +25,19 @@ class EpigraphImportService(ImportService[Epigraph, EpigraphCreate, EpigraphUpda
             api_endpoint="/epigraphs",
         )
 
-    def import_single(
-        self,
-        item_id: int,
-        dasi_published: bool | None = None,
-        rate_limit_delay: float = 10,
-    ) -> Epigraph:
-        return asyncio.run(
-            self._import_single_async(
-                item_id,
-                dasi_published=dasi_published,
-                rate_limit_delay=rate_limit_delay,
-            )
-        )
-
-    async def _import_single_async(
+    async def _post_process_imported_item(
         self,
+        db_item: Epigraph,
+        *,
         item_id: int,
+        detail_data: dict[str, Any],
         dasi_published: bool | None = None,
         rate_limit_delay: float = 10,
     ) -> Epigraph:
-        await asyncio.sleep(rate_limit_delay)
-        detail_data = self._fetch_detail_data(item_id, rate_limit_delay=0)
-        db_item = self._persist_detail_data(
-            item_id=item_id,
-            detail_data=detail_data,
-            dasi_published=dasi_published,
-        )
-
         if db_item.uri:
             db_item = await self.scrape_single(db_item.dasi_id, rate_limit_delay)
 
-        return self._finalize_imported_item(db_item, detail_data)
+        return db_item
 
     def _process_copyright_free_images(self, image_data: list) -> list:
         """
@@ -83,7 +64,7 @@ class EpigraphImportService(ImportService[Epigraph, EpigraphCreate, EpigraphUpda
                     if os.path.exists(private_path):
                         shutil.move(private_path, public_path)
                         logging.info(f"Moved copyright-free image {image_id} from private to public storage")
-                    else:
+                    elif not os.path.exists(public_path):
                         logging.warning(f"Copyright-free image {image_id} not found in private storage at {private_path}")
                 except Exception as e:
                     logging.error(f"Error moving copyright-free image {image_id}: {str(e)}")
@@ -92,6 +73,71 @@ class EpigraphImportService(ImportService[Epigraph, EpigraphCreate, EpigraphUpda
 
         return processed_image_data
 
+    async def generate_image_derivatives(
+        self,
+        update_existing: bool = False,
+        batch_size: int = 100,
+    ) -> dict[str, Any]:
+        """
+        Backfill derivative manifests for the public images of stored epigraphs.
+        """
+        processed_items = 0
+        updated_items = 0
+        generated_images = 0
+        last_id = 0
+
+        try:
+            while True:
+                epigraphs = self.session.exec(
+                    select(Epigraph)
+                    .where(Epigraph.id > last_id, Epigraph.images.is_not(None))
+                    .order_by(Epigraph.id)
+                    .limit(batch_size)
+                ).all()
+                if not epigraphs:
+                    break
+
+                last_id = cast(int, epigraphs[-1].id)
+                processed_items += len(epigraphs)
+                pending = [
+                    (epigraph, list(epigraph.images or []))
+                    for epigraph in epigraphs
+                    if any(
+                        image.get("copyright_free") and (update_existing or "derivatives" not in image)
+                        for image in epigraph.images or []
+                    )
+                ]
+                # Render the whole batch at once so the process pool is not limited to one epigraph's images.
+                results = await asyncio.gather(*(build_image_derivatives(images) for _, images in pending))
+
+                for (epigraph, images), updated_images in zip(pending, results):
+                    generated = sum(
+                        1 for before, after in zip(images, updated_images)
+                        if after.get("derivatives") != before.get("derivatives")
+                    )
+                    if generated:
+                        self.crud.update(self.session, db_obj=epigraph, obj_in={"images": updated_images}, commit=False)
+                        generated_images += generated
+                        updated_items += 1
+
+                self.session.commit()
+
+            return {
+                "status": "success",
+                "processed_items": processed_items,
+                "updated_items": updated_items,
+                "generated_images": generated_images,
+            }
+        except Exception as exc:
+            self.session.rollback()
+            return {
+                "status": "error",
+                "error": str(exc),
+                "processed_items": processed_items,
+                "updated_items": updated_items,
+                "generated_images": generated_images,
+            }
+
     def _should_skip_existing_item(
         self,
         *,
@@ -121,126 +167,63 @@ class EpigraphImportService(ImportService[Epigraph, EpigraphCreate, EpigraphUpda
         if not epigraph:
             raise ValueError(f"Epigraph with DASI ID {dasi_id} not found.")
 
-        for attempt in range(max_retries + 1):
+        async with self._fetch_session(rate_limit_delay) as fetcher:
             try:
-                await asyncio.sleep(rate_limit_delay)
-                response = requests.get(
+                document = await fetcher.get_document(
                     f"{settings.DASI_ADDRESS}/project/1/epigraphs/{dasi_id}",
-                    timeout=30,
+                    max_retries=max_retries,
                 )
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                alert_box = soup.find("div", {"id": "alert_box"})
-                if alert_box:
-                    alert_content = alert_box.get_text().strip()
-                    if "not found or not yet published" in alert_content.lower():
-                        updated_epigraph = self.crud.update(
-                            db=self.session,
-                            db_obj=epigraph,
-                            obj_in={"dasi_published": False, "images": []}
-                        )
-                        return updated_epigraph
-                break
-
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 500:
-                    if attempt < max_retries:
-                        logging.warning(f"500 Server Error for DASI ID {dasi_id}, attempt {attempt + 1}/{max_retries + 1}. Retrying...")
-                        continue
-                    else:
-                        logging.warning(f"500 Server Error for DASI ID {dasi_id} after {max_retries + 1} attempts. Skipping and marking as scraped with no images.")
-                        updated_epigraph = self.crud.update(
-                            db=self.session,
-                            db_obj=epigraph,
-                            obj_in={"images": []}
-                        )
-                        return updated_epigraph
-                else:
+            except aiohttp.ClientResponseError as e:
+                if e.status != 500:
                     raise
-            except Exception:
-                raise
-
-        image_data = []
-
-        main_img = soup.find("img", {"class": "cloudzoom"})
-        if isinstance(main_img, Tag):
-            main_src = str(main_img.get("src", "") or "")
-            main_title = str(main_img.get("title", "") or "")
-
-            rec_id_match = re.search(r"recId=(\d+)", main_src)
-            if rec_id_match:
-                image_id = rec_id_match.group(1)
-
-                caption_id = str(main_img.get("data-cloudzoom", "") or "")
-                caption_match = re.search(r'"captionSource":"#([^"]+)"', caption_id)
-                caption_text = main_title
-
-                if caption_match:
-                    caption_element_id = caption_match.group(1)
-                    caption_element = soup.find("div", {"id": caption_element_id})
-                    if caption_element:
-                        caption_text = caption_element.get_text(separator=" ").strip()
-
-                image_data.append({
-                    "image_id": image_id,
-                    "caption": caption_text,
-                    "is_main": True
-                })
-
-        thumbnail_links = soup.find_all("a", {"class": "cloudzoom-gallery"})
-        for link in thumbnail_links:
-            if not isinstance(link, Tag):
-                continue
-
-            data_cloudzoom = str(link.get("data-cloudzoom", "") or "")
-            title = str(link.get("title", "") or "")
-
-            image_url_match = re.search(r"image: '([^']+)'", data_cloudzoom)
-            if image_url_match:
-                image_url = image_url_match.group(1)
-                rec_id_match = re.search(r"recId=(\d+)", image_url)
-
-                if rec_id_match:
-                    image_id = rec_id_match.group(1)
-
-                    caption_source_match = re.search(r"captionSource: '#([^']+)'", data_cloudzoom)
-                    caption_text = title
-
-                    if caption_source_match:
-                        caption_element_id = caption_source_match.group(1)
-                        caption_element = soup.find("div", {"id": caption_element_id})
-                        if caption_element:
-                            caption_text = caption_element.get_text(separator=" ").strip()
-
-                    if not any(img["image_id"] == image_id for img in image_data):
-                        image_data.append({
-                            "image_id": image_id,
-                            "caption": caption_text,
-                            "is_main": False
-                        })
+                logging.warning(f"500 Server Error for DASI ID {dasi_id} after {max_retries + 1} attempts. Skipping and marking as scraped with no images.")
+                updated_epigraph = self.crud.update(
+                    db=self.session,
+                    db_obj=epigraph,
+                    obj_in={"images": []}
+                )
+                return updated_epigraph
 
-        for image in image_data:
-            image_id = image.get("image_id")
-            if image_id:
-                try:
-                    image_path = await self.import_image(
-                        rec_id=int(image_id),
-                        size="high",
-                        save_directory="private",
-                        rate_limit_delay=1.0,
-                    )
-                    if image_path:
-                        logging.info(f"Downloaded image {image_id} to private storage: {image_path}")
-                    else:
-                        logging.warning(f"Failed to download image {image_id}")
-                except Exception as e:
-                    logging.error(f"Error downloading image {image_id}: {str(e)}")
+            if not document.changed and epigraph.images is not None:
+                return epigraph
+
+            page = parse_epigraph_page(document.body)
+            if page.unpublished:
+                updated_epigraph = self.crud.update(
+                    db=self.session,
+                    db_obj=epigraph,
+                    obj_in={"dasi_published": False, "images": []}
+                )
+                return updated_epigraph
+
+            image_data = page.images
+            await self._download_images(image_data)
 
         processed_image_data = self._process_copyright_free_images(image_data)
+        processed_image_data = await build_image_derivatives(processed_image_data)
         updated_epigraph = self.crud.update(
             db=self.session,
             db_obj=epigraph,
             obj_in={"dasi_published": True, "images": processed_image_data}
         )
-        return updated_epigraph
\ No newline at end of file
+        return updated_epigraph
+
+    async def _download_images(self, image_data: list[dict[str, Any]]) -> None:
+        async def download(image_id: str) -> None:
+            try:
+                image_path = await self.import_image(
+                    rec_id=int(image_id),
+                    size="high",
+                    save_directory="private",
+                    rate_limit_delay=1.0,
+                )
+                if image_path:
+                    logging.info(f"Downloaded image {image_id} to private storage: {image_path}")
+                else:
+                    logging.warning(f"Failed to download image {image_id}")
+            except Exception as e:
+                logging.error(f"Error downloading image {image_id}: {str(e)}")
+
+        await asyncio.gather(
+            *(download(image["image_id"]) for image in image_data if image.get("image_id"))
+        )
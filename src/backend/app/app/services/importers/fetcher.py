@@ -0,0 +1,339 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, TypeVar, cast
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from app.core.config import settings
+from app.services.importers.archive import ResponseArchive
+from app.services.importers.rate_limit import RedisRateLimiter
+
+ResultType = TypeVar("ResultType")
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class ArchiveMissError(aiohttp.ClientResponseError):
+    """Raised in replay mode when a URL has no archived response."""
+
+    def __init__(self, url: str):
+        request_url = URL(url)
+        super().__init__(
+            aiohttp.RequestInfo(request_url, "GET", CIMultiDictProxy(CIMultiDict()), request_url),
+            (),
+            status=404,
+            message=f"No archived response for {url}",
+        )
+
+
+@dataclass
+class FetchedDocument:
+    body: bytes
+    changed: bool = True
+    from_archive: bool = False
+
+    def json(self) -> dict[str, Any]:
+        return cast(dict[str, Any], json.loads(self.body))
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.body.decode(encoding, errors="replace")
+
+
+class TokenBucket:
+    """Async token bucket shared by every request made through a fetcher."""
+
+    def __init__(self, rate: float | None, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            self._tokens = self.capacity
+        else:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def block_for(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + max(seconds, 0.0))
+
+    def set_rate(self, rate: float | None) -> None:
+        self._refill(time.monotonic())
+        self.rate = rate
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                rate = cast(float, self.rate)
+                await asyncio.sleep((1 - self._tokens) / rate)
+
+
+class DasiFetcher:
+    """
+    Pooled HTTP client for DASI requests.
+
+    All requests share one aiohttp session, a token bucket limiting the request
+    rate and a semaphore bounding the number of in-flight requests. Throttling
+    responses (429/5xx) honour `Retry-After` and halve the allowed rate, while
+    successful responses grow it back additively up to the configured maximum.
+    An optional `shared_limiter` additionally caps the rate across processes.
+    """
+
+    AIMD_DECREASE_FACTOR = 0.5
+    AIMD_INCREASE_FRACTION = 0.1
+    MIN_REQUESTS_PER_SECOND = 0.01
+    BACKOFF_BASE_SECONDS = 1.0
+    BACKOFF_MAX_SECONDS = 60.0
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: float | None = None,
+        max_concurrency: int | None = None,
+        burst: int | None = None,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+        archive: ResponseArchive | None = None,
+        replay: bool = False,
+        shared_limiter: RedisRateLimiter | None = None,
+    ):
+        if replay and archive is None:
+            raise ValueError("Replay mode requires a response archive")
+
+        self.archive = archive
+        self.replay = replay
+        self.max_rate = requests_per_second
+        self.max_concurrency = max(max_concurrency or settings.DASI_MAX_CONCURRENT_REQUESTS, 1)
+        self.timeout = timeout or settings.DASI_REQUEST_TIMEOUT_SECONDS
+        self.max_retries = settings.DASI_MAX_RETRIES if max_retries is None else max_retries
+        self.bucket = TokenBucket(requests_per_second, burst or settings.DASI_RATE_LIMIT_BURST)
+        self.shared_limiter = shared_limiter
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session: aiohttp.ClientSession | None = None
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "throttled": 0,
+            "errors": 0,
+            "not_modified": 0,
+            "unchanged": 0,
+            "replayed": 0,
+        }
+
+    async def __aenter__(self) -> "DasiFetcher":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        if self._session is not None:
+            return
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            raise_for_status=False,
+        )
+
+    async def close(self) -> None:
+        if self.shared_limiter is not None:
+            await self.shared_limiter.close()
+        if self._session is None:
+            return
+
+        await self._session.close()
+        self._session = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "requests_per_second": self.bucket.rate,
+            "max_requests_per_second": self.max_rate,
+            "max_concurrency": self.max_concurrency,
+        }
+
+    def _parse_retry_after(self, value: str | None) -> float | None:
+        if not value:
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return min(self.BACKOFF_BASE_SECONDS * (2 ** attempt), self.BACKOFF_MAX_SECONDS)
+
+    def _on_success(self) -> None:
+        if self.max_rate is None or self.bucket.rate is None or self.bucket.rate >= self.max_rate:
+            return
+
+        self.bucket.set_rate(min(self.max_rate, self.bucket.rate + self.max_rate * self.AIMD_INCREASE_FRACTION))
+
+    def _on_throttled(self, retry_after: float | None) -> None:
+        self._stats["throttled"] += 1
+        if self.bucket.rate is not None:
+            self.bucket.set_rate(max(self.bucket.rate * self.AIMD_DECREASE_FACTOR, self.MIN_REQUESTS_PER_SECOND))
+        if retry_after is not None:
+            self.bucket.block_for(retry_after)
+
+    async def fetch(
+        self,
+        url: str,
+        handler: Callable[[aiohttp.ClientResponse], Awaitable[ResultType]],
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        max_retries: int | None = None,
+    ) -> ResultType:
+        """
+        Perform a rate-limited GET and pass the successful response to `handler`.
+
+        Raises `aiohttp.ClientResponseError` for non-retryable errors or once the
+        retry budget for throttling/transient errors is exhausted.
+        """
+        if self.replay:
+            raise ArchiveMissError(ResponseArchive.build_key(url, params))
+        if self._session is None:
+            raise RuntimeError("DasiFetcher must be opened before fetching")
+
+        retries = self.max_retries if max_retries is None else max_retries
+        attempt = 0
+
+        while True:
+            await self.bucket.acquire()
+            if self.shared_limiter is not None:
+                await self.shared_limiter.acquire()
+            async with self._semaphore:
+                self._stats["requests"] += 1
+                try:
+                    async with self._session.get(url, params=params, headers=headers) as response:
+                        if response.status in RETRYABLE_STATUS_CODES:
+                            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                            self._on_throttled(retry_after)
+                            if self.shared_limiter is not None and retry_after is not None:
+                                await self.shared_limiter.block_for(retry_after)
+                            if attempt >= retries:
+                                self._stats["errors"] += 1
+                                response.raise_for_status()
+
+                            delay = retry_after if retry_after is not None else self._backoff_delay(attempt)
+                        elif response.status < 400:
+                            result = await handler(response)
+                            self._on_success()
+                            return result
+                        else:
+                            self._stats["errors"] += 1
+                            response.raise_for_status()
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                    if attempt >= retries:
+                        self._stats["errors"] += 1
+                        raise
+                    logging.warning(f"Transient error fetching {url}: {exc!r}. Retrying...")
+                    delay = self._backoff_delay(attempt)
+
+            attempt += 1
+            self._stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+    async def get_document(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        max_retries: int | None = None,
+    ) -> FetchedDocument:
+        """
+        Fetch a document, going through the response archive when one is configured.
+
+        Archived URLs are revalidated with a conditional request; a 304 or an
+        identical body hash yields `changed=False`. In replay mode the archive is
+        the only source and no network request is made.
+        """
+        if self.archive is None:
+            body = await self.fetch(url, self._read_body, params=params, max_retries=max_retries)
+            return FetchedDocument(body=body)
+
+        key = ResponseArchive.build_key(url, params)
+        entry = self.archive.get(key)
+
+        if self.replay:
+            if entry is None:
+                raise ArchiveMissError(key)
+            self._stats["replayed"] += 1
+            return FetchedDocument(body=self.archive.read_body(entry), from_archive=True)
+
+        async def read_conditional(response: aiohttp.ClientResponse) -> tuple[int, bytes, dict[str, str | None]]:
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "content_type": response.headers.get("Content-Type"),
+            }
+            if response.status == 304:
+                return response.status, b"", validators
+            return response.status, await response.read(), validators
+
+        status, body, validators = await self.fetch(
+            url,
+            read_conditional,
+            params=params,
+            headers=self.archive.conditional_headers(entry),
+            max_retries=max_retries,
+        )
+
+        if status == 304 and entry is not None:
+            self._stats["not_modified"] += 1
+            return FetchedDocument(body=self.archive.read_body(entry), changed=False, from_archive=True)
+
+        _, changed = self.archive.put(key, body, **validators)
+        if not changed:
+            self._stats["unchanged"] += 1
+        return FetchedDocument(body=body, changed=changed)
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        return await response.read()
+
+    async def get_json(self, url: str, **kwargs: Any) -> dict[str, Any]:
+        return (await self.get_document(url, **kwargs)).json()
+
+    async def get_bytes(self, url: str, **kwargs: Any) -> bytes:
+        return (await self.get_document(url, **kwargs)).body
+
+    async def get_text(self, url: str, **kwargs: Any) -> str:
+        async def read_text(response: aiohttp.ClientResponse) -> str:
+            return await response.text()
+
+        if self.archive is None:
+            return await self.fetch(url, read_text, **kwargs)
+        return (await self.get_document(url, **kwargs)).text()
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from app.core.config import settings
+from app.services.importers.fetcher import DasiFetcher
+
+IMAGE_URL_TEMPLATE = "https://de.dasi.cnr.it/cgi-bin/wsimg.pl?recId={rec_id}&size={size}"
+PUBLIC_IMAGE_DIRECTORY = "public"
+
+JPEG_START_OF_IMAGE = b"\xff\xd8"
+JPEG_END_OF_IMAGE = b"\xff\xd9"
+
+
+class ImageDownloader:
+    """
+    Concurrent DASI image downloader sharing the import run's fetcher.
+
+    Images are streamed to a `.part` file and atomically renamed into place, so
+    a file at its final path is always complete. Complete files already on disk
+    are skipped, and `.part` files left by an interrupted run are resumed with
+    an HTTP range request.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    PARTIAL_SUFFIX = ".part"
+
+    def __init__(self, fetcher: DasiFetcher, *, max_concurrency: int | None = None):
+        self.fetcher = fetcher
+        self.max_concurrency = max(max_concurrency or settings.DASI_IMAGE_MAX_CONCURRENT_DOWNLOADS, 1)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._in_flight: dict[Path, asyncio.Task[str | None]] = {}
+        self._started_at = time.perf_counter()
+        self._stats = {
+            "downloaded": 0,
+            "resumed": 0,
+            "skipped": 0,
+            "failed": 0,
+            "bytes_downloaded": 0,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        duration_seconds = time.perf_counter() - self._started_at
+        completed = self._stats["downloaded"] + self._stats["skipped"]
+        return {
+            **self._stats,
+            "max_concurrency": self.max_concurrency,
+            "duration_seconds": round(duration_seconds, 3),
+            "images_per_second": round(completed / duration_seconds, 2) if duration_seconds else None,
+            "bytes_per_second": round(self._stats["bytes_downloaded"] / duration_seconds, 1) if duration_seconds else None,
+        }
+
+    @staticmethod
+    def image_filename(rec_id: int, size: str) -> str:
+        return f"rec_{rec_id}_{size}.jpg"
+
+    @staticmethod
+    def is_complete_file(path: Path) -> bool:
+        """Treat non-empty files as complete, requiring the end-of-image marker for JPEGs."""
+        try:
+            file_size = path.stat().st_size
+            if file_size == 0:
+                return False
+
+            with open(path, "rb") as file_handle:
+                if file_handle.read(2) != JPEG_START_OF_IMAGE:
+                    return True
+                file_handle.seek(max(file_size - 2, 0))
+                return file_handle.read(2) == JPEG_END_OF_IMAGE
+        except OSError:
+            return False
+
+    def find_existing(self, filename: str, save_directory: str) -> Path | None:
+        candidates = [Path(save_directory) / "images" / filename]
+        if save_directory != PUBLIC_IMAGE_DIRECTORY:
+            candidates.append(Path(PUBLIC_IMAGE_DIRECTORY) / "images" / filename)
+
+        for candidate in candidates:
+            if self.is_complete_file(candidate):
+                return candidate
+        return None
+
+    async def download(
+        self,
+        rec_id: int,
+        size: str = "high",
+        save_directory: str = "public",
+    ) -> str | None:
+        """Download one image and return its path relative to the storage directory."""
+        filename = self.image_filename(rec_id, size)
+        if self.find_existing(filename, save_directory) is not None:
+            self._stats["skipped"] += 1
+            return f"images/{filename}"
+
+        target_path = Path(save_directory) / "images" / filename
+        task = self._in_flight.get(target_path)
+        if task is None:
+            task = asyncio.ensure_future(self._download_to(rec_id, size, target_path))
+            self._in_flight[target_path] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(target_path, None))
+
+        return await asyncio.shield(task)
+
+    async def _download_to(self, rec_id: int, size: str, target_path: Path) -> str | None:
+        async with self._semaphore:
+            image_url = IMAGE_URL_TEMPLATE.format(rec_id=rec_id, size=size)
+            partial_path = target_path.with_name(target_path.name + self.PARTIAL_SUFFIX)
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+
+            try:
+                try:
+                    saved = await self._fetch_to_partial(image_url, partial_path)
+                except aiohttp.ClientResponseError as exc:
+                    if exc.status != 416:
+                        raise
+                    partial_path.unlink(missing_ok=True)
+                    saved = await self._fetch_to_partial(image_url, partial_path)
+            except aiohttp.ClientResponseError:
+                self._stats["failed"] += 1
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+                logging.warning(f"Error downloading image {rec_id}: {exc!r}")
+                self._stats["failed"] += 1
+                return None
+
+            if not saved:
+                self._stats["failed"] += 1
+                return None
+
+            os.replace(partial_path, target_path)
+            self._stats["downloaded"] += 1
+            return f"images/{target_path.name}"
+
+    @staticmethod
+    def _content_range(response: aiohttp.ClientResponse) -> tuple[int, int | None] | None:
+        """Return the first byte and total size from a `bytes start-end/total` Content-Range header."""
+        unit, _, byte_range = response.headers.get("Content-Range", "").partition(" ")
+        span, _, total = byte_range.partition("/")
+        start = span.partition("-")[0]
+        if unit != "bytes" or not start.isdigit():
+            return None
+        return int(start), int(total) if total.isdigit() else None
+
+    async def _fetch_to_partial(self, image_url: str, partial_path: Path) -> bool:
+        resume_from = partial_path.stat().st_size if partial_path.exists() else 0
+        headers = {"Range": f"bytes={resume_from}-"} if resume_from else None
+
+        async def save_image(response: aiohttp.ClientResponse) -> bool:
+            content_type = response.headers.get("content-type", "")
+            if not content_type.startswith("image/"):
+                return False
+
+            resuming = resume_from > 0 and response.status == 206
+            expected_size = response.content_length
+            expected_total = None
+            if resuming:
+                content_range = self._content_range(response)
+                if content_range is None or content_range[0] != resume_from:
+                    return False
+                expected_total = content_range[1]
+
+            offset = resume_from if resuming else 0
+            written = 0
+
+            with open(partial_path, "r+b" if resuming else "wb") as file_handle:
+                # The fetcher retries with the same Range header, so drop whatever
+                # a failed earlier attempt appended past the requested offset.
+                file_handle.truncate(offset)
+                file_handle.seek(offset)
+                async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                    file_handle.write(chunk)
+                    written += len(chunk)
+
+            self._stats["bytes_downloaded"] += written
+            if resuming:
+                self._stats["resumed"] += 1
+            if expected_total is not None and partial_path.stat().st_size != expected_total:
+                return False
+            return expected_size is None or written == expected_size
+
+        return await self.fetcher.fetch(image_url, save_image, headers=headers)
@@ -0,0 +1,53 @@
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+
+
+class LinkBatchWriter:
+    """
+    Buffer link-table rows and write them with one multi-row insert per table.
+
+    Rows that already exist are ignored through `ON CONFLICT DO NOTHING` on the
+    link tables' composite primary keys, replacing the query-then-commit round
+    trip of the per-link CRUD helpers.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self._pending: dict[type[Any], set[tuple[tuple[str, int], ...]]] = {}
+
+    def add(self, link_model: type[Any], **columns: int) -> None:
+        self._pending.setdefault(link_model, set()).add(tuple(sorted(columns.items())))
+
+    def pending_count(self) -> int:
+        return sum(len(rows) for rows in self._pending.values())
+
+    def clear(self) -> None:
+        self._pending.clear()
+
+    def flush(self, commit: bool = True) -> int:
+        """Insert every buffered row and return the number of new links."""
+        if not self._pending:
+            return 0
+
+        inserted = 0
+        try:
+            for link_model, rows in self._pending.items():
+                statement = (
+                    insert(link_model)
+                    .values([dict(row) for row in rows])
+                    .on_conflict_do_nothing()
+                )
+                result = self.session.execute(statement)
+                inserted += max(result.rowcount or 0, 0)
+            if commit:
+                self.session.commit()
+        except Exception:
+            if commit:
+                self.session.rollback()
+            raise
+        finally:
+            self._pending.clear()
+
+        return inserted
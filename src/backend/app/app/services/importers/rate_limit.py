@@ -0,0 +1,83 @@
+import asyncio
+
+from redis import asyncio as redis_asyncio
+
+from app.core.config import settings
+
+# Refills the bucket from the Redis clock and takes one token. Returns 0 when a
+# token was taken, otherwise the number of milliseconds to wait before retrying.
+TOKEN_BUCKET_SCRIPT = """
+local blocked = redis.call('PTTL', KEYS[2])
+if blocked > 0 then
+    return blocked
+end
+
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - updated_at, 0) * rate / 1000)
+
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * 1000 / rate) + 1000)
+return wait
+"""
+
+
+class RedisRateLimiter:
+    """
+    Token bucket kept in Redis so several worker processes share one request budget.
+
+    Used alongside each fetcher's local bucket: the local bucket still adapts to
+    throttling, while this one caps the combined rate of every shard of a run.
+    A `Retry-After` seen by any shard pauses all of them.
+    """
+
+    KEY_PREFIX = "hudhud:rate_limit"
+
+    def __init__(
+        self,
+        name: str,
+        rate: float | None,
+        *,
+        capacity: int | None = None,
+        redis_url: str | None = None,
+    ):
+        self.rate = rate
+        self.capacity = max(capacity or settings.DASI_RATE_LIMIT_BURST, 1)
+        self.key = f"{self.KEY_PREFIX}:{name}"
+        self.block_key = f"{self.key}:blocked"
+        self._client = redis_asyncio.from_url(redis_url or settings.REDIS_URL)
+        self._script = self._client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def acquire(self) -> None:
+        if self.rate is None:
+            return
+
+        while True:
+            wait_ms = int(await self._script(keys=[self.key, self.block_key], args=[self.rate, self.capacity]))
+            if wait_ms <= 0:
+                return
+            await asyncio.sleep(wait_ms / 1000)
+
+    async def block_for(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+
+        blocked_ms = int(seconds * 1000)
+        if await self._client.pttl(self.block_key) < blocked_ms:
+            await self._client.set(self.block_key, 1, px=blocked_ms)
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,47 @@
+from typing import Any, Iterable
+
+from sqlalchemy import select
+from sqlmodel import Session
+
+
+class DasiIdResolver:
+    """
+    Per-run cache of `dasi_id -> id` maps for the linked DASI entities.
+
+    Each map is loaded with a single query the first time an entity type is
+    resolved and kept current through `remember` as the import creates rows,
+    so resolving related ids never needs a per-id lookup.
+    """
+
+    def __init__(self, session: Session, models: dict[str, Any]):
+        self.session = session
+        self.models = models
+        self._maps: dict[str, dict[int, int]] = {}
+
+    def reset(self) -> None:
+        self._maps.clear()
+
+    def _load(self, entity: str) -> dict[int, int]:
+        if entity not in self._maps:
+            model = self.models.get(entity)
+            if model is None:
+                raise ValueError(f"Unknown entity type: {entity}")
+
+            rows = self.session.execute(
+                select(model.dasi_id, model.id).where(model.dasi_id.is_not(None))
+            ).all()
+            self._maps[entity] = {dasi_id: local_id for dasi_id, local_id in rows}
+
+        return self._maps[entity]
+
+    def resolve(self, entity: str, dasi_id: int) -> int | None:
+        return self._load(entity).get(dasi_id)
+
+    def resolve_many(self, entity: str, dasi_ids: Iterable[int]) -> dict[int, int]:
+        id_map = self._load(entity)
+        return {dasi_id: id_map[dasi_id] for dasi_id in dasi_ids if dasi_id in id_map}
+
+    def remember(self, entity: str, dasi_id: int | None, local_id: int | None) -> None:
+        if dasi_id is None or local_id is None or entity not in self._maps:
+            return
+        self._maps[entity][dasi_id] = local_id
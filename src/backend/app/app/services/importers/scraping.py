@@ -0,0 +1,260 @@
+import html
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+from lxml import etree
+from lxml import html as lxml_html
+
+HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+REC_ID_RE = re.compile(r"recId=(\d+)")
+MAIN_CAPTION_SOURCE_RE = re.compile(r'"captionSource":"#([^"]+)"')
+GALLERY_IMAGE_URL_RE = re.compile(r"image: '([^']+)'")
+GALLERY_CAPTION_SOURCE_RE = re.compile(r"captionSource: '#([^']+)'")
+
+
+def _has_class(class_name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+ALERT_BOX_XPATH = etree.XPath("//div[@id='alert_box'][1]")
+MAIN_IMAGE_XPATH = etree.XPath(f"(//img[{_has_class('cloudzoom')}])[1]")
+GALLERY_LINKS_XPATH = etree.XPath(f"//a[{_has_class('cloudzoom-gallery')}]")
+DIV_BY_ID_XPATH = etree.XPath("(//div[@id=$element_id])[1]")
+
+FIRST_ROW_FLUID_XPATH = etree.XPath(f"(//div[{_has_class('row-fluid')}])[1]")
+INNER_ROW_FLUID_XPATH = etree.XPath(f"(.//div[{_has_class('row-fluid')}])[1]")
+ACCORDION_XPATH = etree.XPath(f"(.//div[{_has_class('accordion')}])[1]")
+FIRST_PARAGRAPH_XPATH = etree.XPath("(.//p)[1]")
+HEADINGS_XPATH = etree.XPath(".//h3")
+ACCORDION_INNER_XPATH = etree.XPath(f"(.//div[{_has_class('accordion-inner')}])[1]")
+ACCORDION_TOGGLE_XPATH = etree.XPath(f"(.//a[{_has_class('accordion-toggle')}])[1]")
+FIRST_TABLE_XPATH = etree.XPath("(.//table)[1]")
+TABLE_ROWS_XPATH = etree.XPath(".//tr")
+ROW_CELLS_XPATH = etree.XPath(".//*[self::td or self::th]")
+LINE_BREAKS_XPATH = etree.XPath(".//br")
+STRONG_XPATH = etree.XPath("(.//strong)[1]")
+LINKS_XPATH = etree.XPath(".//a")
+ELEMENTS_XPATH = etree.XPath(".//*")
+
+
+@dataclass
+class EpigraphPage:
+    unpublished: bool = False
+    images: list[dict[str, Any]] = field(default_factory=list)
+
+
+def parse_document(body: bytes | str) -> Any | None:
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not body.strip():
+        return None
+
+    try:
+        return lxml_html.document_fromstring(body, parser=HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _first(xpath: etree.XPath, element: Any, **variables: Any) -> Any | None:
+    matches = xpath(element, **variables)
+    return matches[0] if matches else None
+
+
+def _text_nodes(element: Any) -> Iterator[str]:
+    """Yield the text nodes of `element` in document order, skipping comments."""
+    if element.text and isinstance(element.tag, str):
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str):
+            yield from _text_nodes(child)
+        if child.tail:
+            yield child.tail
+
+
+def get_text(element: Any, separator: str = "", strip: bool = False) -> str:
+    """Mirror BeautifulSoup's `get_text(separator, strip)` for an lxml element."""
+    strings: Iterator[str] = _text_nodes(element)
+    if strip:
+        strings = (string.strip() for string in strings)
+        return separator.join(string for string in strings if string)
+    return separator.join(strings)
+
+
+def outer_html(element: Any) -> str:
+    return lxml_html.tostring(element, encoding="unicode", with_tail=False)
+
+
+def inner_html(element: Any) -> str:
+    parts = [html.escape(element.text, quote=False)] if element.text else []
+    parts.extend(lxml_html.tostring(child, encoding="unicode") for child in element)
+    return "".join(parts)
+
+
+def _replace_with_text(element: Any, text: str) -> None:
+    parent = element.getparent()
+    if parent is None:
+        return
+
+    previous = element.getprevious()
+    replacement = text + (element.tail or "")
+    if previous is not None:
+        previous.tail = (previous.tail or "") + replacement
+    else:
+        parent.text = (parent.text or "") + replacement
+    parent.remove(element)
+
+
+def parse_epigraph_page(body: bytes | str) -> EpigraphPage:
+    """Extract the publication state and image references from a DASI epigraph page."""
+    document = parse_document(body)
+    if document is None:
+        return EpigraphPage()
+
+    alert_box = _first(ALERT_BOX_XPATH, document)
+    if alert_box is not None and "not found or not yet published" in get_text(alert_box).strip().lower():
+        return EpigraphPage(unpublished=True)
+
+    def caption_for(element_id: str, default: str) -> str:
+        caption_element = _first(DIV_BY_ID_XPATH, document, element_id=element_id)
+        if caption_element is None:
+            return default
+        return get_text(caption_element, separator=" ").strip()
+
+    image_data: list[dict[str, Any]] = []
+    seen_image_ids: set[str] = set()
+
+    main_img = _first(MAIN_IMAGE_XPATH, document)
+    if main_img is not None:
+        rec_id_match = REC_ID_RE.search(main_img.get("src") or "")
+        if rec_id_match:
+            image_id = rec_id_match.group(1)
+            caption_text = main_img.get("title") or ""
+            caption_match = MAIN_CAPTION_SOURCE_RE.search(main_img.get("data-cloudzoom") or "")
+            if caption_match:
+                caption_text = caption_for(caption_match.group(1), caption_text)
+
+            image_data.append({"image_id": image_id, "caption": caption_text, "is_main": True})
+            seen_image_ids.add(image_id)
+
+    for link in GALLERY_LINKS_XPATH(document):
+        data_cloudzoom = link.get("data-cloudzoom") or ""
+        image_url_match = GALLERY_IMAGE_URL_RE.search(data_cloudzoom)
+        if not image_url_match:
+            continue
+
+        rec_id_match = REC_ID_RE.search(image_url_match.group(1))
+        if not rec_id_match:
+            continue
+
+        image_id = rec_id_match.group(1)
+        caption_text = link.get("title") or ""
+        caption_source_match = GALLERY_CAPTION_SOURCE_RE.search(data_cloudzoom)
+        if caption_source_match:
+            caption_text = caption_for(caption_source_match.group(1), caption_text)
+
+        if image_id not in seen_image_ids:
+            image_data.append({"image_id": image_id, "caption": caption_text, "is_main": False})
+            seen_image_ids.add(image_id)
+
+    return EpigraphPage(images=image_data)
+
+
+def _clean_cell(cell: Any, process_link: Callable[[str], str]) -> str:
+    for link in LINKS_XPATH(cell):
+        href = link.get("href")
+        if href:
+            processed_link = process_link(href)
+            if processed_link:
+                link.set("href", processed_link)
+
+    for element in ELEMENTS_XPATH(cell):
+        if element.tag != "a" and isinstance(element.tag, str):
+            element.drop_tag()
+
+    return inner_html(cell)
+
+
+def parse_table(table: Any, process_link: Callable[[str], str]) -> dict | list:
+    """Parse a DASI table into a dict (two-column key/value rows) or a list of cells."""
+    for line_break in LINE_BREAKS_XPATH(table):
+        _replace_with_text(line_break, "\n")
+
+    rows = [(row, ROW_CELLS_XPATH(row)) for row in TABLE_ROWS_XPATH(table)]
+    has_headers = any(
+        len(cells) == 2 and _first(STRONG_XPATH, cells[0]) is not None
+        for _, cells in rows
+    )
+
+    if has_headers:
+        result: dict[str, str] = {}
+        for _, cells in rows:
+            if len(cells) != 2:
+                continue
+
+            key = get_text(cells[0], strip=True).replace(":", "")
+            value = _clean_cell(cells[1], process_link)
+            if key:
+                result[key] = value
+        return result
+
+    return [_clean_cell(cell, process_link) for _, cells in rows for cell in cells]
+
+
+def parse_site_page(body: bytes | str, process_link: Callable[[str], str]) -> dict[str, Any]:
+    """Extract the accordion sections of a DASI site page."""
+    document = parse_document(body)
+    if document is None:
+        return {}
+
+    content_dict: dict[str, Any] = {}
+    first_row_fluid = _first(FIRST_ROW_FLUID_XPATH, document)
+    inner_row_fluid = _first(INNER_ROW_FLUID_XPATH, first_row_fluid) if first_row_fluid is not None else None
+    accordion = _first(ACCORDION_XPATH, inner_row_fluid) if inner_row_fluid is not None else None
+
+    if accordion is None:
+        paragraph = _first(FIRST_PARAGRAPH_XPATH, inner_row_fluid) if inner_row_fluid is not None else None
+        if paragraph is not None and "not published" in get_text(paragraph):
+            paragraph_text = get_text(paragraph, strip=True)
+            content_dict["SITE NOT PUBLISHED"] = {
+                "header": "Site not published",
+                "sections": [paragraph_text],
+                "parsed_data": {"not published": paragraph_text},
+            }
+        return content_dict
+
+    for heading in HEADINGS_XPATH(accordion):
+        header_text = get_text(heading, strip=True)
+        section = content_dict[header_text] = {
+            "header": header_text,
+            "sections": [],
+            "parsed_data": {},
+        }
+
+        for sibling in heading.itersiblings():
+            if not isinstance(sibling.tag, str):
+                continue
+            if sibling.tag == "h3":
+                break
+
+            if sibling.tag == "table":
+                section["sections"].append({"section": header_text, "table": outer_html(sibling)})
+                section["parsed_data"] = parse_table(sibling, process_link)
+                continue
+
+            if sibling.tag != "div" or "accordion-group" not in (sibling.get("class") or "").split():
+                continue
+
+            accordion_inner = _first(ACCORDION_INNER_XPATH, sibling)
+            table = _first(FIRST_TABLE_XPATH, accordion_inner) if accordion_inner is not None else None
+            accordion_toggle = _first(ACCORDION_TOGGLE_XPATH, sibling)
+            if table is None or accordion_toggle is None:
+                continue
+
+            section_title = get_text(accordion_toggle, strip=True)
+            parsed_data = parse_table(table, process_link)
+            section["sections"].append({"section": section_title, "table": outer_html(table)})
+            section["parsed_data"][section_title] = parsed_data
+
+    return content_dict
@@ -1,14 +1,13 @@
+import asyncio
 from typing import Any
-import requests
-import time
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+import aiohttp
 from sqlmodel import Session
 
 from app.crud.crud_site import site as crud_site
 from app.models.site import Site, SiteCreate, SiteUpdate
 from app.services.importers.base import ImportService
+from app.services.importers.scraping import parse_site_page
 
 
 class SiteImportService(ImportService[Site, SiteCreate, SiteUpdate]):
@@ -60,147 +59,24 @@ class SiteImportService(ImportService[Site, SiteCreate, SiteUpdate]):
 
         return (lat, lon)
 
-    def parse_table(self, table) -> dict | list:
-        """Parse table content into either a dictionary or list."""
-        for br in table.find_all("br"):
-            br.replace_with("\n")
-
-        rows = table.find_all("tr")
-
-        has_headers = False
-        for row in rows:
-            cells = row.find_all(["td", "th"])
-            if len(cells) == 2 and cells[0].find("strong"):
-                has_headers = True
-                break
-
-        if has_headers:
-            result = {}
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                if len(cells) == 2:
-                    key = cells[0].get_text(strip=True).replace(":", "")
-
-                    cell = cells[1]
-
-                    for a in cell.find_all("a"):
-                        href = a.get("href")
-                        if href:
-                            processed_link = self._process_link(href)
-                            if processed_link:
-                                a["href"] = processed_link
-
-                    for tag in cell.find_all(True):
-                        if tag.name != "a":
-                            tag.unwrap()
-
-                    value = cell.decode_contents()
-
-                    if key:
-                        result[key] = value
-            return result
-        else:
-            result = []
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                if cells:
-                    for cell in cells:
-                        for a in cell.find_all("a"):
-                            href = a.get("href")
-                            if href:
-                                processed_link = self._process_link(href)
-                                if processed_link:
-                                    a["href"] = processed_link
-                        for tag in cell.find_all(True):
-                            if tag.name != "a":
-                                tag.unwrap()
-                        result.append(cell.decode_contents())
-            return result
-
     def scrape_single(self, site_id: int, rate_limit_delay: float = 10.0) -> Site:
         """Scrape additional data from a site's URI page and update the database record."""
+        return asyncio.run(self.scrape_single_async(site_id, rate_limit_delay))
+
+    async def scrape_single_async(self, site_id: int, rate_limit_delay: float = 10.0) -> Site:
         site = self.crud.get(self.session, id=site_id)
         if not site or not site.uri:
             raise ValueError(f"Site {site_id} not found or has no URI")
 
-        time.sleep(rate_limit_delay)
-
         try:
             uri = site.uri.replace("csai-", "")
-            response = requests.get(uri, timeout=30)
-            response.raise_for_status()
+            async with self._fetch_session(rate_limit_delay) as fetcher:
+                document = await fetcher.get_document(uri)
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            content_dict = {}
+            if not document.changed and site.dasi_object.get("scraped_data"):
+                return site
 
-            first_row_fluid = soup.find("div", class_="row-fluid")
-            inner_row_fluid = (
-                first_row_fluid.find("div", class_="row-fluid")
-                if isinstance(first_row_fluid, Tag)
-                else None
-            )
-            accordion = inner_row_fluid.find("div", class_="accordion") if isinstance(inner_row_fluid, Tag) else None
-            if not accordion:
-                p = inner_row_fluid.find("p") if isinstance(inner_row_fluid, Tag) else None
-                if p and "not published" in p.get_text():
-                    content_dict["SITE NOT PUBLISHED"] = {
-                        "header": "Site not published",
-                        "sections": [p.get_text(strip=True)],
-                        "parsed_data": {
-                            "not published": p.get_text(strip=True)
-                        }
-                    }
-            else:
-                accordion_tag = accordion if isinstance(accordion, Tag) else None
-                h3_elements = accordion_tag.find_all("h3") if accordion_tag else []
-
-                for h3 in h3_elements:
-                    header_text = h3.get_text(strip=True)
-                    content_dict[header_text] = {
-                        "header": header_text,
-                        "sections": [],
-                        "parsed_data": {},
-                    }
-
-                    current = h3.next_sibling
-                    while current:
-                        if isinstance(current, Tag):
-                            if current.name == "h3":
-                                break
-
-                            class_names: list[str] = []
-                            if current.name == "table":
-                                content_dict[header_text]["sections"].append({
-                                    "section": header_text,
-                                    "table": str(current),
-                                })
-                                content_dict[header_text]["parsed_data"] = self.parse_table(current)
-
-                            else:
-                                raw_class_names = current.get("class")
-                                if isinstance(raw_class_names, list):
-                                    class_names = [str(class_name) for class_name in raw_class_names]
-                                elif isinstance(raw_class_names, str):
-                                    class_names = [raw_class_names]
-                                else:
-                                    class_names = []
-
-                            if current.name == "div" and "accordion-group" in class_names:
-                                accordion_inner = current.find("div", class_="accordion-inner")
-                                table = accordion_inner.find("table") if isinstance(accordion_inner, Tag) else None
-                                accordion_toggle = current.find("a", class_="accordion-toggle")
-
-                                if table and isinstance(accordion_toggle, Tag):
-                                    section_title = accordion_toggle.get_text(strip=True)
-                                    parsed_data = self.parse_table(table)
-
-                                    content_dict[header_text]["sections"].append({
-                                        "section": section_title,
-                                        "table": str(table),
-                                    })
-                                    content_dict[header_text]["parsed_data"][section_title] = parsed_data
-
-                        current = current.next_sibling
+            content_dict = parse_site_page(document.body, self._process_link)
 
             updated_site = self.crud.update(
                 self.session,
@@ -211,27 +87,34 @@ class SiteImportService(ImportService[Site, SiteCreate, SiteUpdate]):
             )
             return updated_site
 
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             raise Exception(f"Failed to scrape URI {site.uri}: {str(e)}")
 
     def scrape_all(self, rate_limit_delay: float = 10.0) -> dict[str, Any]:
         """Scrape data for all sites with URIs."""
+        return asyncio.run(self._scrape_all_async(rate_limit_delay))
+
+    async def _scrape_all_async(self, rate_limit_delay: float = 10.0) -> dict[str, Any]:
         total_scraped = 0
         failed_items = 0
 
         try:
             sites = self.crud.get_multi(self.session, skip=0, limit=10000)
             total_sites = len(sites)
+            site_ids = [site.id for site in sites if site.uri]
+
+            async with self._fetch_session(rate_limit_delay):
+                outcomes = await asyncio.gather(
+                    *(self.scrape_single_async(site_id, rate_limit_delay) for site_id in site_ids),
+                    return_exceptions=True,
+                )
 
-            for site in sites:
-                if site.uri:
-                    try:
-                        self.scrape_single(site.id, rate_limit_delay)
-                        total_scraped += 1
-                    except Exception as e:
-                        print(f"Error scraping site {site.id}: {str(e)}")
-                        failed_items += 1
-                        continue
+            for site_id, outcome in zip(site_ids, outcomes):
+                if isinstance(outcome, BaseException):
+                    print(f"Error scraping site {site_id}: {str(outcome)}")
+                    failed_items += 1
+                    continue
+                total_scraped += 1
 
             return {
                 "status": "success",
@@ -311,7 +194,7 @@ class SiteImportService(ImportService[Site, SiteCreate, SiteUpdate]):
 
         return SiteUpdate(**update_data)
 
-    def _post_process_imported_item(
+    async def _post_process_imported_item(
         self,
         db_item: Site,
         *,
@@ -321,7 +204,7 @@ class SiteImportService(ImportService[Site, SiteCreate, SiteUpdate]):
         rate_limit_delay: float = 10,
     ) -> Site:
         if db_item.uri and db_item.id is not None:
-            db_item = self.scrape_single(db_item.id, rate_limit_delay)
+            db_item = await self.scrape_single_async(db_item.id, rate_limit_delay)
 
         scraped_data = db_item.dasi_object.get("scraped_data", {})
         site_update: SiteUpdate | None = None
@@ -3,6 +3,8 @@ import json
 from datetime import datetime, timezone
 from typing import Any
 
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select
 
 from app.models.dasi_sync import DasiImportCursor, DasiSourceSnapshot
@@ -12,6 +14,12 @@ class DasiSyncStateService:
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def hash_payload(payload: dict[str, Any]) -> str:
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        ).hexdigest()
+
     def get_cursor(self, entity_type: str) -> DasiImportCursor | None:
         statement = select(DasiImportCursor).where(DasiImportCursor.entity_type == entity_type)
         return self.session.exec(statement).first()
@@ -70,6 +78,16 @@ class DasiSyncStateService:
         )
         return self.session.exec(statement).first()
 
+    def get_snapshots(self, entity_type: str, dasi_ids: list[int]) -> dict[int, DasiSourceSnapshot]:
+        if not dasi_ids:
+            return {}
+
+        statement = select(DasiSourceSnapshot).where(
+            DasiSourceSnapshot.entity_type == entity_type,
+            DasiSourceSnapshot.dasi_id.in_(dasi_ids),  # type: ignore[attr-defined]
+        )
+        return {snapshot.dasi_id: snapshot for snapshot in self.session.exec(statement).all()}
+
     def upsert_snapshot(
         self,
         *,
@@ -79,9 +97,7 @@ class DasiSyncStateService:
         payload: dict[str, Any],
         source_last_modified: datetime | None,
     ) -> tuple[DasiSourceSnapshot, bool]:
-        payload_hash = hashlib.sha256(
-            json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
-        ).hexdigest()
+        payload_hash = self.hash_payload(payload)
         snapshot = self.get_snapshot(entity_type, dasi_id)
         has_changed = (
             snapshot is None
@@ -108,3 +124,38 @@ class DasiSyncStateService:
         self.session.commit()
         self.session.refresh(snapshot)
         return snapshot, has_changed
+
+    def upsert_snapshots(self, entity_type: str, rows: list[dict[str, Any]]) -> int:
+        """
+        Upsert many snapshots with one `INSERT ... ON CONFLICT DO UPDATE` without committing.
+
+        Each row needs `dasi_id`, `source_url`, `payload` and `source_last_modified`;
+        the caller owns the transaction so snapshots commit together with the page.
+        """
+        if not rows:
+            return 0
+
+        values = {
+            row["dasi_id"]: {
+                "entity_type": entity_type,
+                "dasi_id": row["dasi_id"],
+                "source_url": row["source_url"],
+                "source_last_modified": row.get("source_last_modified"),
+                "payload_hash": self.hash_payload(row["payload"]),
+                "payload": row["payload"],
+            }
+            for row in rows
+        }
+        statement = insert(DasiSourceSnapshot).values(list(values.values()))
+        statement = statement.on_conflict_do_update(
+            constraint="uq_dasisourcesnapshot_entity_type_dasi_id",
+            set_={
+                "source_url": statement.excluded.source_url,
+                "source_last_modified": statement.excluded.source_last_modified,
+                "payload_hash": statement.excluded.payload_hash,
+                "payload": statement.excluded.payload,
+                "updated_at": func.now(),
+            },
+        )
+        self.session.execute(statement)
+        return len(values)
@@ -3,7 +3,8 @@ from sqlmodel import Session
 from app.models.pipeline_run import PipelineRun, PipelineTrigger
 from app.services.pipeline.orchestrator import DasiPipelineOrchestrator
 from app.services.pipeline.run_service import PipelineRunService
-from app.workers.pipeline_tasks import run_dasi_sync_pipeline
+from app.services.pipeline.sharding import ShardedRangeImportService
+from app.workers.pipeline_tasks import dispatch_range_import_stage, run_dasi_sync_pipeline
 
 
 INLINE_SEARCH_REINDEX_DISABLED_STEPS = (
@@ -40,6 +41,20 @@ def dispatch_dasi_pipeline(
         refreshed_run = pipeline_runs.get_run(str(pipeline_run.uuid))
         return refreshed_run or pipeline_run
 
+    sharded_import = ShardedRangeImportService(session)
+    first_stage = sharded_import.next_stage(None, parameters)
+    if first_stage is not None and sharded_import.should_shard(parameters):
+        async_result = dispatch_range_import_stage(
+            str(pipeline_run.uuid),
+            first_stage,
+            sharded_import.plan_shards(parameters),
+            parameters,
+        )
+        return pipeline_runs.mark_queued(
+            str(pipeline_run.uuid),
+            celery_task_id=async_result.id,
+        )
+
     async_result = run_dasi_sync_pipeline.apply_async(
         args=[str(pipeline_run.uuid), parameters],
         queue="pipeline",
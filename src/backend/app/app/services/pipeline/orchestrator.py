@@ -13,6 +13,7 @@ from app.services.importers.object import ObjectImportService
 from app.services.importers.site import SiteImportService
 from app.services.pipeline.run_service import PipelineRunService
 from app.services.search.service import SearchService
+from app.services.text.word_index import WordIndexBuilder
 
 
 class DasiPipelineOrchestrator:
@@ -42,39 +43,71 @@ class DasiPipelineOrchestrator:
                 metrics={"imports": import_metrics},
                 merge_metrics=True,
             )
+            self._run_post_import_steps(run_uuid=run_uuid, parameters=payload, import_totals=import_totals)
+        except Exception as exc:
+            self.session.rollback()
+            self.pipeline_runs.mark_failed(run_uuid, error=str(exc))
+            raise
 
-            chunk_metrics = {
-                "enabled": payload.get("run_chunking", True),
-                "processed_epigraphs": 0,
-                "chunks_created": 0,
-                "failed_ids": [],
-            }
-            if payload.get("run_chunking", True):
-                self.pipeline_runs.mark_running(run_uuid, current_step="chunk")
-                chunk_metrics = self._run_chunking(parameters=payload)
-                self.pipeline_runs.update_run(
-                    run_uuid,
-                    failed_items=import_totals["failed_items"] + len(chunk_metrics["failed_ids"]),
-                    metrics={"chunking": chunk_metrics},
-                    merge_metrics=True,
-                )
-
-            indexing_metrics = {"enabled": payload.get("reindex_search", True), "indexed": 0}
-            if payload.get("reindex_search", True):
-                self.pipeline_runs.mark_running(run_uuid, current_step="index")
-                indexed = SearchService(self.session).reindex_all_epigraphs() or 0
-                indexing_metrics["indexed"] = indexed
-
-            self.pipeline_runs.mark_completed(
-                run_uuid,
-                metrics={"indexing": indexing_metrics},
-                merge_metrics=True,
-            )
+    def finish_after_imports(
+        self,
+        run_uuid: str,
+        parameters: dict[str, Any],
+        import_totals: dict[str, int],
+    ) -> None:
+        """Run the chunking and indexing steps of a run whose imports ran as shards."""
+        try:
+            self._run_post_import_steps(run_uuid=run_uuid, parameters=parameters, import_totals=import_totals)
         except Exception as exc:
             self.session.rollback()
             self.pipeline_runs.mark_failed(run_uuid, error=str(exc))
             raise
 
+    def _run_post_import_steps(
+        self,
+        *,
+        run_uuid: str,
+        parameters: dict[str, Any],
+        import_totals: dict[str, int],
+    ) -> None:
+        # Epigraph texts only change through the epigraph import, so runs that
+        # skip it (e.g. search-only reindexing) leave the word index alone.
+        if parameters.get("update_word_index", parameters.get("import_epigraphs", True)):
+            self.pipeline_runs.mark_running(run_uuid, current_step="words")
+            word_index_metrics = WordIndexBuilder(self.session).update_changed()
+            self.pipeline_runs.update_run(
+                run_uuid,
+                metrics={"word_index": {"enabled": True, **word_index_metrics}},
+                merge_metrics=True,
+            )
+
+        chunk_metrics = {
+            "enabled": parameters.get("run_chunking", True),
+            "processed_epigraphs": 0,
+            "chunks_created": 0,
+            "failed_ids": [],
+        }
+        if parameters.get("run_chunking", True):
+            self.pipeline_runs.mark_running(run_uuid, current_step="chunk")
+            chunk_metrics = self._run_chunking(parameters=parameters)
+            self.pipeline_runs.update_run(
+                run_uuid,
+                failed_items=import_totals["failed_items"] + len(chunk_metrics["failed_ids"]),
+                metrics={"chunking": chunk_metrics},
+                merge_metrics=True,
+            )
+
+        indexing_metrics: dict[str, Any] = {"enabled": parameters.get("reindex_search", True), "indexed": 0}
+        if parameters.get("reindex_search", True):
+            self.pipeline_runs.mark_running(run_uuid, current_step="index")
+            indexing_metrics.update(SearchService(self.session).reindex_all_epigraphs() or {})
+
+        self.pipeline_runs.mark_completed(
+            run_uuid,
+            metrics={"indexing": indexing_metrics},
+            merge_metrics=True,
+        )
+
     def _run_imports(self, *, run_uuid: str, parameters: dict[str, Any]) -> tuple[dict[str, Any], dict[str, int]]:
         import_metrics = {}
         totals = {
@@ -105,17 +138,12 @@ class DasiPipelineOrchestrator:
         stage_name: str,
         parameters: dict[str, Any],
     ) -> tuple[dict[str, Any], dict[str, int]]:
-        stage_lookup: dict[str, Any] = {
-            name: service_class
-            for name, _, service_class in self.IMPORT_STAGE_CONFIG
-        }
-        service_class: Any = stage_lookup[stage_name]
         self.pipeline_runs.mark_running(
             run_uuid,
             current_step=f"import_{stage_name}",
         )
 
-        import_service = service_class(self.session)
+        import_service = self.build_import_service(stage_name, parameters)
         start_id = parameters.get("start_id")
         end_id = parameters.get("end_id")
         dasi_published = parameters.get("dasi_published")
@@ -164,6 +192,16 @@ class DasiPipelineOrchestrator:
             "failed_items": result_data.get("failed_items", 0),
         }
 
+    def build_import_service(self, stage_name: str, parameters: dict[str, Any]) -> Any:
+        stage_lookup: dict[str, Any] = {
+            name: service_class
+            for name, _, service_class in self.IMPORT_STAGE_CONFIG
+        }
+        import_service = stage_lookup[stage_name](self.session)
+        if parameters.get("archive_mode"):
+            import_service.archive_mode = parameters["archive_mode"]
+        return import_service
+
     def _build_import_plan(self, parameters: dict[str, Any]) -> list[tuple[str, str, type]]:
         selected_stages = []
         for stage_name, flag_name, service_class in self.IMPORT_STAGE_CONFIG:
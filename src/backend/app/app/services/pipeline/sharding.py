@@ -0,0 +1,192 @@
+from typing import Any
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.services.pipeline.orchestrator import DasiPipelineOrchestrator
+from app.services.pipeline.run_service import PipelineRunService
+
+SHARED_RATE_LIMIT_KEY = "dasi"
+COUNT_KEYS = ("processed_items", "skipped_items", "total_items", "unchanged_items")
+FETCH_COUNTER_KEYS = ("requests", "retries", "throttled", "errors", "not_modified", "unchanged", "replayed")
+
+
+def split_range(start_id: int, end_id: int, shard_size: int) -> list[dict[str, int]]:
+    shard_size = max(shard_size, 1)
+    return [
+        {"start_id": shard_start, "end_id": min(shard_start + shard_size - 1, end_id)}
+        for shard_start in range(start_id, end_id + 1, shard_size)
+    ]
+
+
+def shard_item_ids(shard: dict[str, Any]) -> list[int]:
+    if "item_ids" in shard:
+        return [int(item_id) for item_id in shard["item_ids"]]
+    return list(range(shard["start_id"], shard["end_id"] + 1))
+
+
+def merge_shard_results(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Sum the counters of per-shard import results into one stage result."""
+    merged: dict[str, Any] = {key: 0 for key in COUNT_KEYS}
+    failed_ids: set[int] = set()
+    fetch: dict[str, int] = {key: 0 for key in FETCH_COUNTER_KEYS}
+    errors = []
+
+    for result in results:
+        for key in COUNT_KEYS:
+            merged[key] += result.get(key) or 0
+        failed_ids.update(result.get("failed_ids") or [])
+        for key in FETCH_COUNTER_KEYS:
+            fetch[key] += (result.get("fetch") or {}).get(key) or 0
+        if result.get("status") == "error":
+            errors.append({"shard": result.get("shard"), "error": result.get("error", "unknown error")})
+
+    return {
+        "status": "error" if errors else "success",
+        **merged,
+        "failed_items": len(failed_ids),
+        "failed_ids": sorted(failed_ids),
+        "shards": len(results),
+        "errors": errors,
+        "fetch": fetch,
+    }
+
+
+class ShardedRangeImportService:
+    """
+    Bookkeeping for range imports split into id shards run as Celery tasks.
+
+    Each import stage runs as a chord of shard tasks whose results are merged
+    into the stage metrics of one `PipelineRun`. Ids that failed are retried as
+    a follow-up shard before moving on to the next stage.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.pipeline_runs = PipelineRunService(session)
+        self.orchestrator = DasiPipelineOrchestrator(session)
+
+    @staticmethod
+    def shard_size(parameters: dict[str, Any]) -> int:
+        return int(parameters.get("shard_size") or settings.DASI_RANGE_SHARD_SIZE)
+
+    @classmethod
+    def should_shard(cls, parameters: dict[str, Any]) -> bool:
+        start_id = parameters.get("start_id")
+        end_id = parameters.get("end_id")
+        if start_id is None or end_id is None or not parameters.get("shard_range", True):
+            return False
+        return end_id - start_id + 1 > cls.shard_size(parameters)
+
+    @classmethod
+    def plan_shards(cls, parameters: dict[str, Any]) -> list[dict[str, int]]:
+        return split_range(parameters["start_id"], parameters["end_id"], cls.shard_size(parameters))
+
+    def stage_names(self, parameters: dict[str, Any]) -> list[str]:
+        return [stage_name for stage_name, _, _ in self.orchestrator._build_import_plan(parameters)]
+
+    def next_stage(self, stage_name: str | None, parameters: dict[str, Any]) -> str | None:
+        stage_names = self.stage_names(parameters)
+        if stage_name is None:
+            return stage_names[0] if stage_names else None
+
+        position = stage_names.index(stage_name) + 1
+        return stage_names[position] if position < len(stage_names) else None
+
+    def run_shard(
+        self,
+        run_uuid: str,
+        stage_name: str,
+        shard: dict[str, Any],
+        parameters: dict[str, Any],
+    ) -> dict[str, Any]:
+        item_ids = shard_item_ids(shard)
+        self.pipeline_runs.mark_running(run_uuid, current_step=f"import_{stage_name}")
+
+        import_service = self.orchestrator.build_import_service(stage_name, parameters)
+        import_service.shared_rate_limit_key = SHARED_RATE_LIMIT_KEY
+        try:
+            result = import_service.import_ids(
+                item_ids,
+                dasi_published=parameters.get("dasi_published"),
+                rate_limit_delay=parameters.get("rate_limit_delay", 10.0),
+                update_existing=parameters.get("update_existing", False),
+            )
+        except Exception as exc:
+            self.session.rollback()
+            result = {
+                "status": "error",
+                "error": str(exc),
+                "failed_items": len(item_ids),
+                "failed_ids": item_ids,
+                "total_items": len(item_ids),
+            }
+
+        return {**result, "shard": shard}
+
+    def record_stage(
+        self,
+        run_uuid: str,
+        stage_name: str,
+        shard_results: list[dict[str, Any]],
+        *,
+        retry_round: int = 0,
+    ) -> dict[str, Any]:
+        """Merge one chord's shard results into the run's stage metrics and totals."""
+        run = self.pipeline_runs.get_run(run_uuid)
+        if not run:
+            raise ValueError(f"Pipeline run {run_uuid} not found")
+
+        merged = merge_shard_results(shard_results)
+        import_metrics = dict((run.metrics or {}).get("imports") or {})
+        previous = import_metrics.get(stage_name)
+
+        if retry_round and previous:
+            stage_metrics = {
+                **merged,
+                "processed_items": previous["processed_items"] + merged["processed_items"],
+                "skipped_items": previous["skipped_items"] + merged["skipped_items"],
+                "unchanged_items": previous.get("unchanged_items", 0) + merged["unchanged_items"],
+                "total_items": previous["total_items"],
+                "shards": previous["shards"] + merged["shards"],
+                "retried_items": previous.get("retried_items", 0) + merged["total_items"],
+                "fetch": {
+                    key: previous.get("fetch", {}).get(key, 0) + value
+                    for key, value in merged["fetch"].items()
+                },
+            }
+        else:
+            stage_metrics = {**merged, "retried_items": 0}
+        stage_metrics["retry_rounds"] = retry_round
+        import_metrics[stage_name] = stage_metrics
+
+        self.pipeline_runs.update_run(
+            run_uuid,
+            total_items=sum(metrics["total_items"] for metrics in import_metrics.values()),
+            processed_items=sum(metrics["processed_items"] for metrics in import_metrics.values()),
+            skipped_items=sum(metrics["skipped_items"] for metrics in import_metrics.values()),
+            failed_items=sum(metrics["failed_items"] for metrics in import_metrics.values()),
+            metrics={"imports": import_metrics},
+            merge_metrics=True,
+        )
+        return stage_metrics
+
+    def complete(self, run_uuid: str, parameters: dict[str, Any]) -> None:
+        run = self.pipeline_runs.get_run(run_uuid)
+        if not run:
+            raise ValueError(f"Pipeline run {run_uuid} not found")
+
+        self.orchestrator.finish_after_imports(
+            run_uuid,
+            parameters,
+            {
+                "total_items": run.total_items or 0,
+                "processed_items": run.processed_items,
+                "skipped_items": run.skipped_items,
+                "failed_items": run.failed_items,
+            },
+        )
+
+    def fail(self, run_uuid: str, stage_name: str, stage_metrics: dict[str, Any]) -> None:
+        errors = "; ".join(str(error["error"]) for error in stage_metrics["errors"])
+        self.pipeline_runs.mark_failed(run_uuid, error=f"{stage_name} import failed: {errors}")
@@ -1,5 +1,23 @@
 from app.services.search.ai import AIService
+from app.services.search.breaker import CircuitBreaker, CircuitOpenError, opensearch_breaker
+from app.services.search.client import OpenSearchClientRegistry, get_opensearch_client, opensearch_clients
+from app.services.search.cursor import InvalidCursorError, SearchCursor
 from app.services.search.opensearch import OpenSearchService
+from app.services.search.result_cache import SearchResultCache, search_result_cache
 from app.services.search.service import SearchService
 
-__all__ = ["AIService", "OpenSearchService", "SearchService"]
\ No newline at end of file
+__all__ = [
+    "AIService",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "InvalidCursorError",
+    "OpenSearchClientRegistry",
+    "OpenSearchService",
+    "SearchCursor",
+    "SearchResultCache",
+    "SearchService",
+    "get_opensearch_client",
+    "opensearch_breaker",
+    "opensearch_clients",
+    "search_result_cache",
+]
@@ -0,0 +1,179 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Literal, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+BreakerState = Literal["closed", "open", "half_open"]
+
+KEPT_TRANSITIONS = 20
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a dependency while its breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing dependency for a cool-down period.
+
+    Calls are recorded in a sliding window of `window_seconds`. Once it holds
+    at least `min_calls`, the breaker opens when the share of failed calls or
+    of calls slower than `slow_call_seconds` reaches `failure_rate`. After
+    `cooldown_seconds` it half-opens and lets `half_open_probes` calls through:
+    if they all succeed it closes, and any failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window_seconds: float = 30.0,
+        slow_call_seconds: float = 2.0,
+        cooldown_seconds: float = 15.0,
+        half_open_probes: int = 1,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.slow_call_seconds = slow_call_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_probes = half_open_probes
+
+        self._state: BreakerState = "closed"
+        self._opened_at = 0.0
+        self._calls: deque[tuple[float, bool, bool]] = deque()
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        self._lock = threading.Lock()
+        self._transitions: deque[Dict[str, Any]] = deque(maxlen=KEPT_TRANSITIONS)
+        self._counters = {
+            "calls": 0,
+            "failures": 0,
+            "slow_calls": 0,
+            "short_circuited": 0,
+            "opened": 0,
+        }
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            self._expire_cooldown()
+            return self._state
+
+    def is_open(self) -> bool:
+        """Whether calls are currently being short-circuited."""
+        return self.state == "open"
+
+    def allow(self) -> bool:
+        """Reserve a call, or count it as short-circuited if the breaker won't allow it."""
+        with self._lock:
+            self._expire_cooldown()
+            if self._state == "closed":
+                return True
+            if self._state == "half_open" and self._probes_started < self.half_open_probes:
+                self._probes_started += 1
+                return True
+            self._counters["short_circuited"] += 1
+            return False
+
+    def record(self, duration: float, *, failed: bool) -> None:
+        slow = not failed and duration >= self.slow_call_seconds
+        now = time.monotonic()
+        with self._lock:
+            self._counters["calls"] += 1
+            self._counters["failures"] += failed
+            self._counters["slow_calls"] += slow
+
+            if self._state == "half_open":
+                if failed or slow:
+                    self._transition("open", "probe failed" if failed else "probe was slow")
+                else:
+                    self._probes_succeeded += 1
+                    if self._probes_succeeded >= self.half_open_probes:
+                        self._transition("closed", "probes succeeded")
+                return
+
+            self._calls.append((now, failed, slow))
+            while self._calls and self._calls[0][0] < now - self.window_seconds:
+                self._calls.popleft()
+
+            if self._state == "closed" and len(self._calls) >= self.min_calls:
+                failures = sum(1 for _, call_failed, _ in self._calls if call_failed)
+                slow_calls = sum(1 for _, _, call_slow in self._calls if call_slow)
+                if failures / len(self._calls) >= self.failure_rate:
+                    self._transition("open", f"{failures}/{len(self._calls)} calls failed")
+                elif slow_calls / len(self._calls) >= self.failure_rate:
+                    self._transition("open", f"{slow_calls}/{len(self._calls)} calls were slow")
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+        started = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record(time.monotonic() - started, failed=True)
+            raise
+        self.record(time.monotonic() - started, failed=False)
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._transition("closed", "reset")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire_cooldown()
+            return {
+                "name": self.name,
+                "state": self._state,
+                "window_calls": len(self._calls),
+                "window_failures": sum(1 for _, failed, _ in self._calls if failed),
+                "window_slow_calls": sum(1 for _, _, slow in self._calls if slow),
+                "retry_in_seconds": (
+                    max(0.0, self._opened_at + self.cooldown_seconds - time.monotonic())
+                    if self._state == "open"
+                    else 0.0
+                ),
+                **self._counters,
+                "transitions": list(self._transitions),
+            }
+
+    def _expire_cooldown(self) -> None:
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.cooldown_seconds:
+            self._transition("half_open", "cool-down elapsed")
+
+    def _transition(self, state: BreakerState, reason: str) -> None:
+        if state == self._state:
+            return
+
+        logger.warning(f"{self.name} circuit {self._state} -> {state}: {reason}")
+        self._transitions.append({"at": time.time(), "from": self._state, "to": state, "reason": reason})
+        self._state = state
+        self._calls.clear()
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        if state == "open":
+            self._opened_at = time.monotonic()
+            self._counters["opened"] += 1
+
+
+opensearch_breaker = CircuitBreaker(
+    "opensearch",
+    failure_rate=settings.OPENSEARCH_BREAKER_FAILURE_RATE,
+    min_calls=settings.OPENSEARCH_BREAKER_MIN_CALLS,
+    window_seconds=settings.OPENSEARCH_BREAKER_WINDOW_SECONDS,
+    slow_call_seconds=settings.OPENSEARCH_BREAKER_SLOW_CALL_SECONDS,
+    cooldown_seconds=settings.OPENSEARCH_BREAKER_COOLDOWN_SECONDS,
+    half_open_probes=settings.OPENSEARCH_BREAKER_HALF_OPEN_PROBES,
+)
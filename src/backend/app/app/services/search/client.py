@@ -0,0 +1,161 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from opensearchpy import OpenSearch
+
+from app.core.config import settings
+from app.services.search.breaker import opensearch_breaker
+
+logger = logging.getLogger(__name__)
+
+
+class OpenSearchClientRegistry:
+    """
+    One pooled `OpenSearch` client per process.
+
+    The client is created on first use and rebuilt after a fork, so Celery
+    workers never share sockets with their parent. Connections are kept alive
+    in a pool of `OPENSEARCH_POOL_MAXSIZE` per host. Cluster health is only
+    checked when asked for and cached for `OPENSEARCH_HEALTH_TTL_SECONDS`.
+    Checks go through a separate client with `OPENSEARCH_HEALTH_TIMEOUT_SECONDS`
+    and no retries, and their outcome is recorded in the OpenSearch breaker.
+    """
+
+    def __init__(self):
+        self._client: OpenSearch | None = None
+        self._probe_client: OpenSearch | None = None
+        self._pid: int | None = None
+        self._health: Dict[str, Any] | None = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+
+    def get_client(self) -> OpenSearch:
+        if self._client is not None and self._pid == os.getpid():
+            return self._client
+
+        with self._lock:
+            if self._client is None or self._pid != os.getpid():
+                self._client = self._create_client()
+                self._probe_client = None
+                self._pid = os.getpid()
+                self._health = None
+                self._checked_at = float("-inf")
+        return self._client
+
+    def _get_probe_client(self) -> OpenSearch:
+        self.get_client()
+        with self._lock:
+            if self._probe_client is None:
+                self._probe_client = self._create_client(
+                    pool_maxsize=1,
+                    timeout=settings.OPENSEARCH_HEALTH_TIMEOUT_SECONDS,
+                    max_retries=0,
+                    retry_on_timeout=False,
+                )
+            return self._probe_client
+
+    def _create_client(self, **options: Any) -> OpenSearch:
+        return OpenSearch(**{
+            "hosts": [{"host": settings.OPENSEARCH_HOST, "port": settings.OPENSEARCH_PORT}],
+            "http_auth": (
+                settings.OPENSEARCH_USERNAME,
+                settings.OPENSEARCH_PASSWORD,
+            ),
+            "use_ssl": False,
+            "verify_certs": False,
+            "ssl_show_warn": False,
+            "pool_maxsize": settings.OPENSEARCH_POOL_MAXSIZE,
+            "headers": {"Connection": "keep-alive"},
+            "timeout": settings.OPENSEARCH_TIMEOUT_SECONDS,
+            "max_retries": settings.OPENSEARCH_MAX_RETRIES,
+            "retry_on_timeout": settings.OPENSEARCH_RETRY_ON_TIMEOUT,
+            **options,
+        })
+
+    def health(self, *, force: bool = False) -> Dict[str, Any]:
+        """
+        Return the cached cluster health, checking the cluster if the cache expired.
+
+        Only one thread checks at a time. Unless forced, the others keep the
+        expired health rather than wait on a check of an unreachable cluster.
+        """
+        if not force and self._is_fresh():
+            return self._health
+
+        client = self._get_probe_client()
+        expired = self._health
+        if not self._probe_lock.acquire(blocking=force or expired is None):
+            return expired
+        try:
+            if force or not self._is_fresh():
+                self._health = self._check(client)
+                self._checked_at = time.monotonic()
+        finally:
+            self._probe_lock.release()
+        return self._health
+
+    def is_available(self) -> bool:
+        return bool(self.health()["available"])
+
+    def invalidate(self) -> None:
+        self._checked_at = float("-inf")
+
+    def reset(self) -> None:
+        """Drop the client, closing its pooled connections."""
+        with self._lock:
+            clients = (self._client, self._probe_client) if self._pid == os.getpid() else ()
+            for client in clients:
+                if client is None:
+                    continue
+                try:
+                    client.close()
+                except Exception as exc:
+                    logger.warning(f"Error closing OpenSearch client: {exc}")
+            self._client = None
+            self._probe_client = None
+            self._pid = None
+            self._health = None
+            self._checked_at = float("-inf")
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._health is not None
+            and self._pid == os.getpid()
+            and time.monotonic() - self._checked_at < settings.OPENSEARCH_HEALTH_TTL_SECONDS
+        )
+
+    def _check(self, client: OpenSearch) -> Dict[str, Any]:
+        health: Dict[str, Any] = {
+            "available": False,
+            "checked_at": time.time(),
+            "host": f"{settings.OPENSEARCH_HOST}:{settings.OPENSEARCH_PORT}",
+            "pool_maxsize": settings.OPENSEARCH_POOL_MAXSIZE,
+            "cluster_name": None,
+            "version": None,
+            "status": None,
+            "error": None,
+        }
+        started = time.monotonic()
+        try:
+            info = client.info()
+            health["cluster_name"] = info.get("cluster_name")
+            health["version"] = info.get("version", {}).get("number")
+            health["status"] = client.cluster.health().get("status")
+            health["available"] = health["status"] != "red"
+            logger.info(f"Connected to OpenSearch: {health['version']} ({health['status']})")
+        except Exception as exc:
+            health["error"] = str(exc)
+            logger.error(f"Failed to connect to OpenSearch: {exc}")
+        opensearch_breaker.record(time.monotonic() - started, failed=not health["available"])
+        return health
+
+
+opensearch_clients = OpenSearchClientRegistry()
+
+
+def get_opensearch_client() -> OpenSearch:
+    return opensearch_clients.get_client()
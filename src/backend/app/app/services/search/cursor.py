@@ -0,0 +1,47 @@
+import base64
+import binascii
+import json
+from dataclasses import asdict, dataclass
+from typing import Any, List, Optional
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class SearchCursor:
+    """
+    Position after a page of epigraph search results.
+
+    `query` is the result cache key of the search the cursor belongs to, so a
+    cursor can't be replayed against a different query, and `after` holds the
+    sort values of the page's last hit. `pit` is the point in time the pages
+    are read from, opened when the first cursor page is requested.
+    """
+
+    query: str
+    page: int
+    after: List[Any]
+    pit: Optional[str] = None
+
+    def encode(self) -> str:
+        payload = json.dumps(asdict(self), separators=(",", ":"), ensure_ascii=False)
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str, query: str) -> "SearchCursor":
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            decoded = cls(
+                query=str(payload["query"]),
+                page=int(payload["page"]),
+                after=list(payload["after"]),
+                pit=payload.get("pit"),
+            )
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            raise InvalidCursorError("Invalid search cursor") from exc
+
+        if decoded.query != query:
+            raise InvalidCursorError("Search cursor does not belong to this query")
+        return decoded
@@ -104,7 +104,7 @@ BOOLEAN_FACET_FIELD_KEYS = {
 }
 
 
-def _apply_epigraph_filter(statement: Any, key: str, value: Any) -> Any:
+def apply_epigraph_filter(statement: Any, key: str, value: Any) -> Any:
     column = getattr(Epigraph, key, None)
     if column is None:
         return statement
@@ -206,7 +206,7 @@ def get_epigraph_facet_values(
                 if allowed_filter_keys is not None and key not in allowed_filter_keys:
                     continue
 
-                statement = _apply_epigraph_filter(statement, key, value)
+                statement = apply_epigraph_filter(statement, key, value)
 
         statement = statement.order_by(asc(sort_column))
         raw_values = [
@@ -1,86 +1,67 @@
+import json
 import logging
 import re
+import struct
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from opensearchpy import OpenSearch
 from opensearchpy.exceptions import NotFoundError
 
-from app.core.config import settings
-from app.models.epigraph import Epigraph
-from app.services.search.epigraph_search_schema import get_epigraph_searchable_field_map
+from app.models.epigraph import Epigraph, EpigraphOut
+from app.services.search.client import get_opensearch_client
+from app.services.search.query_plan import (
+    compile_highlight,
+    compile_search_query,
+    serialize_search_body,
+    to_json,
+)
 
 logger = logging.getLogger(__name__)
 
+POINT_IN_TIME_KEEP_ALIVE = "5m"
 
-class QueryParser:
-    """Parse search queries with boolean operators."""
-
-    def __init__(self):
-        self.must_terms = []
-        self.should_terms = []
-        self.must_not_terms = []
-
-    def parse_query(self, query: str) -> Dict[str, List[str]]:
-        self.must_terms = []
-        self.should_terms = []
-        self.must_not_terms = []
-
-        quoted_pattern = r'"([^"]*)"'
-        quoted_matches = re.findall(quoted_pattern, query)
-        for match in quoted_matches:
-            if match.strip():
-                self.must_terms.append(f'"{match}"')
-
-        query_without_quotes = re.sub(quoted_pattern, "", query)
-        tokens = query_without_quotes.split()
-
-        for token in tokens:
-            if not token.strip():
-                continue
-
-            if token.startswith("+"):
-                term = token[1:].strip()
-                if term:
-                    self.must_terms.append(term)
-            elif token.startswith("-"):
-                term = token[1:].strip()
-                if term:
-                    self.must_not_terms.append(term)
-            else:
-                self.should_terms.append(token.strip())
+# Applied to a new index generation while it is bulk loaded, until it is
+# refreshed and swapped behind the alias.
+BULK_LOAD_INDEX_SETTINGS = {"refresh_interval": "-1", "number_of_replicas": 0}
+FORCE_MERGE_TIMEOUT_SECONDS = 600
+
+CARD_SOURCE_FIELD = "card"
+
+# Sort keys that are analysed text in the index and sort on a keyword subfield.
+SORT_FIELD_PATHS = {"title": "title.keyword"}
+
+
+def _site_latitude_longitude(coordinates: Any) -> tuple[Any, Any]:
+    """Sites store coordinates as `[latitude, longitude]`."""
+    if isinstance(coordinates, (list, tuple)) and len(coordinates) == 2:
+        return coordinates[0], coordinates[1]
+    return None, None
 
-        return {
-            "must": self.must_terms,
-            "should": self.should_terms,
-            "must_not": self.must_not_terms,
-        }
+
+def _geo_point(latitude: Any, longitude: Any) -> Optional[Dict[str, Any]]:
+    # An object rather than an array, which OpenSearch would read as [lon, lat].
+    if latitude is None or longitude is None:
+        return None
+    return {"lat": latitude, "lon": longitude}
+
+
+def _next_float32(value: float) -> float:
+    """The smallest single-precision float above `value`, the precision OpenSearch scores use."""
+    bits = struct.unpack("<i", struct.pack("<f", value))[0]
+    bits += 1 if value >= 0 else -1
+    return struct.unpack("<f", struct.pack("<i", bits))[0]
 
 
 class OpenSearchService:
-    def __init__(self):
-        """Initialize OpenSearch client."""
-        self.client = OpenSearch(
-            hosts=[{"host": "opensearch", "port": 9200}],
-            http_auth=(
-                settings.OPENSEARCH_USERNAME,
-                settings.OPENSEARCH_PASSWORD,
-            ),
-            use_ssl=False,
-            verify_certs=False,
-            ssl_show_warn=False,
-        )
+    def __init__(self, client: OpenSearch | None = None):
+        """Use the process-wide OpenSearch client; no request is made until the first query."""
+        self.client = client or get_opensearch_client()
         self.index_name = "epigraphs"
 
-        try:
-            info = self.client.info()
-            logger.info(f"Connected to OpenSearch: {info['version']['number']}")
-        except Exception as exc:
-            logger.error(f"Failed to connect to OpenSearch: {exc}")
-            raise
-
-    def create_index(self, *, recreate: bool = False):
-        """Create the epigraphs index with mapping."""
-        mapping = {
+    def _index_definition(self) -> Dict[str, Any]:
+        """Settings and mappings of an epigraphs index generation."""
+        return {
             "settings": {
                 "number_of_shards": 1,
                 "number_of_replicas": 0,
@@ -124,6 +105,8 @@ class OpenSearchService:
                     "id": {"type": "integer"},
                     "created_at": {"type": "date", "format": "strict_date_optional_time||epoch_millis"},
                     "updated_at": {"type": "date", "format": "strict_date_optional_time||epoch_millis"},
+                    # The API's EpigraphOut for result lists, stored but not indexed.
+                    CARD_SOURCE_FIELD: {"type": "object", "enabled": False},
                     "dasi_id": {"type": "integer"},
                     "title": {
                         "type": "text",
@@ -404,21 +387,107 @@ class OpenSearchService:
             }
         }
 
-        try:
-            if self.client.indices.exists(index=self.index_name):
-                if not recreate:
-                    logger.info(f"Index '{self.index_name}' already exists")
-                    return
+    def create_index(self, *, recreate: bool = False):
+        """Create an empty, live epigraphs index unless one exists.
 
-                logger.info(f"Recreating index '{self.index_name}'")
-                self.delete_index()
+        `recreate` swaps in an empty generation. Reindexing loads a new
+        generation before swapping instead; see `create_index_generation`.
+        """
+        try:
+            if self.client.indices.exists(index=self.index_name) and not recreate:
+                logger.info(f"Index '{self.index_name}' already exists")
+                return
 
-            response = self.client.indices.create(index=self.index_name, body=mapping)
-            logger.info(f"Created index '{self.index_name}': {response}")
+            index_name = self.create_index_generation()
+            self.finish_index_generation(index_name)
+            self.swap_alias(index_name)
         except Exception as e:
             logger.error(f"Error creating index: {e}")
             raise
 
+    def create_index_generation(self) -> str:
+        """
+        Create a new epigraphs index, not yet behind the alias, for a bulk load.
+
+        Refreshes are off and replicas dropped until `finish_index_generation`.
+        """
+        index_name = f"{self.index_name}-{datetime.now(timezone.utc):%Y%m%d%H%M%S%f}"
+        definition = self._index_definition()
+        definition["settings"] = {**definition["settings"], **BULK_LOAD_INDEX_SETTINGS}
+        response = self.client.indices.create(index=index_name, body=definition)
+        logger.info(f"Created index '{index_name}': {response}")
+        return index_name
+
+    def finish_index_generation(self, index_name: str) -> None:
+        """Restore the serving refresh interval and replicas of a loaded generation and refresh it."""
+        self.client.indices.put_settings(
+            index=index_name,
+            body={
+                "index": {
+                    "refresh_interval": None,
+                    "number_of_replicas": self._index_definition()["settings"]["number_of_replicas"],
+                }
+            },
+        )
+        self.client.indices.refresh(index=index_name)
+
+    def force_merge_index(self, index_name: str) -> None:
+        """Merge a generation that no longer takes writes down to one segment."""
+        self.client.indices.forcemerge(
+            index=index_name,
+            params={"max_num_segments": 1, "request_timeout": FORCE_MERGE_TIMEOUT_SECONDS},
+        )
+
+    def count_documents(self, index_name: Optional[str] = None) -> int:
+        return self.client.count(index=index_name or self.index_name)["count"]
+
+    def swap_alias(self, index_name: str) -> List[str]:
+        """
+        Point the epigraphs alias at `index_name` in one atomic update, then
+        delete every other generation. A concrete index still named like the
+        alias, from before generations, is removed in the same update.
+
+        Returns the deleted indices.
+        """
+        previous_indices = self._alias_indices()
+        actions: List[Dict[str, Any]] = [
+            {"remove": {"index": previous_index, "alias": self.index_name}}
+            for previous_index in previous_indices
+        ]
+        deleted_indices: List[str] = []
+        if not previous_indices and self.client.indices.exists(index=self.index_name):
+            actions.append({"remove_index": {"index": self.index_name}})
+            deleted_indices.append(self.index_name)
+        actions.append({"add": {"index": index_name, "alias": self.index_name}})
+
+        self.client.indices.update_aliases(body={"actions": actions})
+        logger.info(f"Alias '{self.index_name}' now points at '{index_name}'")
+
+        for stale_index in self._index_generations():
+            if stale_index != index_name:
+                self.delete_index_generation(stale_index)
+                deleted_indices.append(stale_index)
+        return deleted_indices
+
+    def delete_index_generation(self, index_name: str) -> None:
+        self.client.indices.delete(index=index_name, params={"ignore_unavailable": "true"})
+        logger.info(f"Deleted index '{index_name}'")
+
+    def _alias_indices(self) -> List[str]:
+        """The concrete indices behind the epigraphs alias."""
+        try:
+            return sorted(self.client.indices.get_alias(name=self.index_name))
+        except NotFoundError:
+            return []
+
+    def _index_generations(self) -> List[str]:
+        return sorted(self.client.indices.get(index=f"{self.index_name}-*"))
+
+    def _building_generations(self) -> List[str]:
+        """Generations a running reindex is still loading, not yet behind the alias."""
+        live_indices = set(self._alias_indices())
+        return [index for index in self._index_generations() if index not in live_indices]
+
     def _build_filter_clause(self, field: str, value: Any) -> Dict[str, Any]:
         if isinstance(value, bool):
             return {"term": {field: value}}
@@ -466,10 +535,15 @@ class OpenSearchService:
         return aggregations
 
     def index_epigraph(self, epigraph: Epigraph):
-        """Index a single epigraph."""
+        """
+        Index a single epigraph, also into any generation a reindex is loading
+        so the update is not lost when the alias is swapped.
+        """
         try:
             doc = self._epigraph_to_document(epigraph)
 
+            for building_index in self._building_generations():
+                self.client.index(index=building_index, id=epigraph.id, body=doc)
             response = self.client.index(
                 index=self.index_name,
                 id=epigraph.id,
@@ -482,20 +556,35 @@ class OpenSearchService:
             logger.error(f"Error indexing epigraph {epigraph.id}: {e}")
             raise
 
-    def bulk_index_epigraphs(self, epigraphs: List[Epigraph]):
-        """Bulk index multiple epigraphs."""
+    def bulk_index_epigraphs(
+        self,
+        epigraphs: List[Epigraph],
+        index_name: Optional[str] = None,
+        refresh: bool = True,
+        keep_existing: bool = False,
+    ):
+        """
+        Bulk index multiple epigraphs, into the live index unless `index_name` is given.
+
+        With `keep_existing`, epigraphs already in the index are left alone
+        instead of being counted as failed; a reindex uses this so its load
+        never overwrites a newer single-epigraph write.
+        """
         from opensearchpy.helpers import bulk
-        
+
         def generate_docs():
             for epigraph in epigraphs:
                 yield {
-                    "_index": self.index_name,
+                    "_op_type": "create" if keep_existing else "index",
+                    "_index": index_name or self.index_name,
                     "_id": epigraph.id,
                     "_source": self._epigraph_to_document(epigraph)
                 }
 
         try:
-            success, failed = bulk(self.client, generate_docs(), refresh=True)
+            success, failed = bulk(self.client, generate_docs(), refresh=refresh, raise_on_error=not keep_existing)
+            if keep_existing:
+                failed = [item for item in failed if item.get("create", {}).get("status") != 409]
             logger.info(f"Bulk indexed {success} epigraphs, {len(failed)} failed")
             return success, failed
         except Exception as e:
@@ -513,499 +602,161 @@ class OpenSearchService:
         skip: int = 0,
         limit: int = 100,
         source_includes: Optional[List[str]] = None,
-        include_highlight: bool = True,
+        include_highlight: bool = False,
+        search_after: Optional[List[Any]] = None,
+        pit_id: Optional[str] = None,
+        track_total_hits: Optional[bool | int] = None,
     ) -> Dict[str, Any]:
-        """Searches epigraphs in the OpenSearch index"""
+        """
+        Searches epigraphs in the OpenSearch index.
+
+        Pages continue after the `sort` values of a previous hit when
+        `search_after` is given, and run against a point in time from
+        `open_point_in_time` when `pit_id` is given.
+        """
+        body = self._build_search_body(
+            query=query,
+            fields=fields,
+            filters=filters,
+            facet_fields=facet_fields,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            skip=skip,
+            limit=limit,
+            source_includes=source_includes,
+            include_highlight=include_highlight,
+            search_after=search_after,
+            pit_id=pit_id,
+            track_total_hits=track_total_hits,
+        )
+        try:
+            response = self.client.search(index=None if pit_id else self.index_name, body=body)
+            return self._read_search_response(response, pit_id)
+        except Exception as e:
+            logger.error(f"Error searching epigraphs: {e}")
+            raise
 
-        searchable_fields = get_epigraph_searchable_field_map()
+    def search_epigraphs_with_facets(
+        self,
+        query: str,
+        facet_fields: List[str],
+        fields: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        pit_id: Optional[str] = None,
+        **search_kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Search a page of hits and the facet counts of all hits in one multi-search.
+
+        The hits and the facet aggregations run as separate searches, so a
+        page and its facets can be timed, cached and skipped independently.
+        The total comes with the facets, which are always counted on the live
+        index rather than the page's point in time.
+        """
+        hits_body = self._build_search_body(
+            query=query,
+            fields=fields,
+            filters=filters,
+            pit_id=pit_id,
+            track_total_hits=False,
+            **search_kwargs,
+        )
+        facets_body = self._build_search_body(
+            query=query,
+            fields=fields,
+            filters=filters,
+            facet_fields=facet_fields,
+            limit=0,
+            include_highlight=False,
+            track_total_hits=True,
+        )
+        index_header = {"index": self.index_name}
+        try:
+            response = self.client.msearch(body=[{} if pit_id else index_header, hits_body, index_header, facets_body])
+        except Exception as e:
+            logger.error(f"Error searching epigraphs: {e}")
+            raise
 
-        if not fields:
-            search_fields: List[str] = []
-            for field_name, subfields in searchable_fields.items():
-                if subfields is None:
-                    search_fields.append(field_name)
-                else:
-                    search_fields.extend([field_name + "." + subfield for subfield in subfields])
-        else:
-            search_fields = []
-            for f in fields:
-                subfields = searchable_fields.get(f)
-                if subfields is not None:
-                    search_fields.extend([f + "." + sub for sub in subfields])
-                else:
-                    search_fields.append(f)
-
-        top_fields = [f for f in search_fields if "." not in f]
-        nested_fields = [f for f in search_fields if "." in f]
-
-        ngram_fields = [f for f in top_fields]
-        stemmed_fields = [f for f in top_fields]
-        keyword_fields = [f + ".keyword" for f in top_fields]
-
-        normalised_query = re.sub(r'_', ' ', query)
-        normalised_query = " ".join(normalised_query.split())
-
-        parser = QueryParser()
-        parsed_query = parser.parse_query(normalised_query)
-
-        must_queries = []
-        should_queries = []
-        must_not_queries = []
-
-        for term in parsed_query["must"]:
-            has_wildcard = "*" in term or "?" in term
-            if has_wildcard:
-                wildcard_queries = []
-                if top_fields:
-                    wildcard_queries.append({
-                        "query_string": {
-                            "query": term.strip('"'),
-                            "fields": top_fields,
-                            "default_operator": "OR",
-                            "analyze_wildcard": True,
-                            "boost": 3
-                        }
-                    })
-                    if keyword_fields:
-                        wildcard_queries.append({
-                            "query_string": {
-                                "query": term.strip('"'),
-                                "fields": keyword_fields,
-                                "default_operator": "OR",
-                                "analyze_wildcard": True,
-                                "boost": 5
-                            }
-                        })
-                for nf in nested_fields:
-                    path, field = nf.split(".", 1)
-                    wildcard_queries.append({
-                        "nested": {
-                            "path": path,
-                            "query": {
-                                "query_string": {
-                                    "query": term.strip('"'),
-                                    "fields": [nf],
-                                    "default_operator": "OR",
-                                    "analyze_wildcard": True
-                                }
-                            }
-                        }
-                    })
-                if len(wildcard_queries) == 1:
-                    must_queries.append(wildcard_queries[0])
-                else:
-                    must_queries.append({
-                        "bool": {
-                            "should": wildcard_queries,
-                            "minimum_should_match": 1
-                        }
-                    })
-            else:
-                is_phrase = term.startswith('"') and term.endswith('"')
-                clean_term = term.strip('"')
-
-                term_should_queries = []
-                if top_fields:
-                    if is_phrase:
-                        term_should_queries.append({
-                            "match_phrase": {
-                                "epigraph_text.raw": {
-                                    "query": clean_term,
-                                    "boost": 15
-                                }
-                            }
-                        })
+        hits_response, facets_response = response["responses"]
+        for item in (hits_response, facets_response):
+            if "error" in item:
+                raise RuntimeError(f"Error searching epigraphs: {item['error']}")
 
-                        term_should_queries.append({
-                            "match_phrase": {
-                                "epigraph_text": {
-                                    "query": clean_term,
-                                    "boost": 10
-                                }
-                            }
-                        })
-
-                        for field in stemmed_fields:
-                            if field != "epigraph_text":
-                                term_should_queries.append({
-                                    "match_phrase": {
-                                        f"{field}.raw": {
-                                            "query": clean_term,
-                                            "boost": 12
-                                        }
-                                    }
-                                })
-                                term_should_queries.append({
-                                    "match_phrase": {
-                                        field: {
-                                            "query": clean_term,
-                                            "boost": 8
-                                        }
-                                    }
-                                })
-
-                        term_should_queries.append({
-                            "multi_match": {
-                                "query": clean_term,
-                                "fields": [f + ".raw" for f in stemmed_fields if f + ".raw"],
-                                "type": "phrase",
-                                "boost": 6
-                            }
-                        })
-
-                        term_should_queries.append({
-                            "query_string": {
-                                "query": f'"{clean_term}"',
-                                "fields": [f + ".raw" for f in top_fields],
-                                "default_operator": "AND",
-                                "boost": 5
-                            }
-                        })
-
-                        term_should_queries.append({
-                            "multi_match": {
-                                "query": clean_term,
-                                "fields": [f + ".raw" for f in stemmed_fields],
-                                "type": "phrase_prefix",
-                                "boost": 4
-                            }
-                        })
-                    else:
-                        term_should_queries.append({
-                            "multi_match": {
-                                "query": clean_term,
-                                "fields": stemmed_fields,
-                                "type": "best_fields",
-                                "boost": 3
-                            }
-                        })
-                        term_should_queries.append({
-                            "multi_match": {
-                                "query": clean_term,
-                                "fields": ngram_fields,
-                                "type": "best_fields",
-                                "boost": 2
-                            }
-                        })
-
-                    if keyword_fields:
-                        if is_phrase:
-                            term_should_queries.append({
-                                "query_string": {
-                                    "query": f'"{clean_term}"',
-                                    "fields": keyword_fields,
-                                    "default_operator": "AND",
-                                    "boost": 6
-                                }
-                            })
-                        else:
-                            term_should_queries.append({
-                                "multi_match": {
-                                    "query": clean_term,
-                                    "fields": keyword_fields,
-                                    "type": "best_fields",
-                                    "boost": 5
-                                }
-                            })
+        results = self._read_search_response(hits_response, pit_id)
+        facets = self._read_search_response(facets_response, pit_id)
+        return {
+            **results,
+            "total": facets["total"],
+            "total_relation": facets["total_relation"],
+            "aggregations": facets["aggregations"],
+            "took": {"hits": hits_response.get("took"), "facets": facets_response.get("took")},
+        }
 
-                for nf in nested_fields:
-                    path, field = nf.split(".", 1)
-                    if is_phrase:
-                        term_should_queries.append({
-                            "nested": {
-                                "path": path,
-                                "query": {
-                                    "match_phrase": {
-                                        nf: {
-                                            "query": clean_term,
-                                            "boost": 5
-                                        }
-                                    }
-                                }
-                            }
-                        })
-                        term_should_queries.append({
-                            "nested": {
-                                "path": path,
-                                "query": {
-                                    "multi_match": {
-                                        "query": clean_term,
-                                        "fields": [nf],
-                                        "type": "phrase",
-                                        "boost": 4
-                                    }
-                                }
-                            }
-                        })
-                        term_should_queries.append({
-                            "nested": {
-                                "path": path,
-                                "query": {
-                                    "query_string": {
-                                        "query": f'"{clean_term}"',
-                                        "fields": [nf],
-                                        "default_operator": "AND",
-                                        "boost": 3
-                                    }
-                                }
-                            }
-                        })
-                    else:
-                        term_should_queries.append({
-                            "nested": {
-                                "path": path,
-                                "query": {
-                                    "multi_match": {
-                                        "query": clean_term,
-                                        "fields": [nf],
-                                        "type": "best_fields"
-                                    }
-                                }
-                            }
-                        })
-
-                if len(term_should_queries) == 1:
-                    must_queries.append(term_should_queries[0])
-                else:
-                    must_queries.append({
-                        "bool": {
-                            "should": term_should_queries,
-                            "minimum_should_match": 1
-                        }
-                    })
-
-        if parsed_query["should"]:
-            should_term_query = " ".join(parsed_query["should"])
-            has_wildcard = "*" in should_term_query or "?" in should_term_query
-            
-            if has_wildcard:
-                if top_fields:
-                    should_queries.append({
-                        "query_string": {
-                            "query": should_term_query,
-                            "fields": top_fields,
-                            "default_operator": "OR",
-                            "analyze_wildcard": True,
-                            "boost": 3
-                        }
-                    })
-                    if keyword_fields:
-                        should_queries.append({
-                            "query_string": {
-                                "query": should_term_query,
-                                "fields": keyword_fields,
-                                "default_operator": "OR",
-                                "analyze_wildcard": True,
-                                "boost": 5
-                            }
-                        })
-                for nf in nested_fields:
-                    path, field = nf.split(".", 1)
-                    should_queries.append({
-                        "nested": {
-                            "path": path,
-                            "query": {
-                                "query_string": {
-                                    "query": should_term_query,
-                                    "fields": [nf],
-                                    "default_operator": "OR",
-                                    "analyze_wildcard": True
-                                }
-                            }
-                        }
-                    })
-            else:
-                if top_fields:
-                    should_queries.append({
-                        "multi_match": {
-                            "query": should_term_query,
-                            "fields": stemmed_fields,
-                            "type": "best_fields",
-                            "minimum_should_match": "50%",
-                            "boost": 1
-                        }
-                    })
-                    should_queries.append({
-                        "multi_match": {
-                            "query": should_term_query,
-                            "fields": ngram_fields,
-                            "type": "best_fields",
-                            "minimum_should_match": "50%",
-                            "boost": 2
-                        }
-                    })
-                    if keyword_fields:
-                        should_queries.append({
-                            "multi_match": {
-                                "query": should_term_query,
-                                "fields": keyword_fields,
-                                "type": "best_fields",
-                                "boost": 5
-                            }
-                        })
-                for nf in nested_fields:
-                    path, field = nf.split(".", 1)
-                    should_queries.append({
-                        "nested": {
-                            "path": path,
-                            "query": {
-                                "multi_match": {
-                                    "query": should_term_query,
-                                    "fields": [nf],
-                                    "type": "best_fields",
-                                    "minimum_should_match": "50%"
-                                }
-                            }
-                        }
-                    })
-
-        for term in parsed_query["must_not"]:
-            has_wildcard = "*" in term or "?" in term
-            term_must_not_queries = []
-            
-            if has_wildcard:
-                if top_fields:
-                    term_must_not_queries.append({
-                        "query_string": {
-                            "query": term.strip('"'),
-                            "fields": top_fields,
-                            "default_operator": "OR",
-                            "analyze_wildcard": True
-                        }
-                    })
-                    if keyword_fields:
-                        term_must_not_queries.append({
-                            "query_string": {
-                                "query": term.strip('"'),
-                                "fields": keyword_fields,
-                                "default_operator": "OR",
-                                "analyze_wildcard": True
-                            }
-                        })
-                for nf in nested_fields:
-                    path, field = nf.split(".", 1)
-                    term_must_not_queries.append({
-                        "nested": {
-                            "path": path,
-                            "query": {
-                                "query_string": {
-                                    "query": term.strip('"'),
-                                    "fields": [nf],
-                                    "default_operator": "OR",
-                                    "analyze_wildcard": True
-                                }
-                            }
-                        }
-                    })
-            else:
-                if top_fields:
-                    term_must_not_queries.append({
-                        "multi_match": {
-                            "query": term.strip('"'),
-                            "fields": stemmed_fields + ngram_fields,
-                            "type": "best_fields"
-                        }
-                    })
-                    if keyword_fields:
-                        term_must_not_queries.append({
-                            "multi_match": {
-                                "query": term.strip('"'),
-                                "fields": keyword_fields,
-                                "type": "best_fields"
-                            }
-                        })
-                for nf in nested_fields:
-                    path, field = nf.split(".", 1)
-                    term_must_not_queries.append({
-                        "nested": {
-                            "path": path,
-                            "query": {
-                                "multi_match": {
-                                    "query": term.strip('"'),
-                                    "fields": [nf],
-                                    "type": "best_fields"
-                                }
-                            }
-                        }
-                    })
-            
-            must_not_queries.append({
-                "bool": {
-                    "should": term_must_not_queries,
-                    "minimum_should_match": 1
-                }
-            })
+    def highlight_epigraphs(
+        self,
+        query: str,
+        epigraph_ids: List[int],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[int, Dict[str, List[str]]]:
+        """
+        Highlight the query in the given epigraphs, keyed by id.
+
+        Result searches don't ask for highlights, since highlighting
+        re-analyses the stored text of every hit; this highlights only the
+        epigraphs on screen. Epigraphs the query doesn't match are left out.
+        """
+        if not epigraph_ids:
+            return {}
 
-        bool_query: Dict[str, Any] = {
-            "filter": [
-                {"term": {"dasi_published": True}}
-            ]
-        }
+        restricted_query = (
+            '{"bool":{"must":[' + compile_search_query(query, fields) + '],'
+            '"filter":[' + to_json({"terms": {"id": epigraph_ids}}) + "]}}"
+        )
+        body = serialize_search_body(
+            {"size": len(epigraph_ids), "_source": ["id"]},
+            query=restricted_query,
+            highlight=compile_highlight(fields),
+        )
+        try:
+            response = self.client.search(index=self.index_name, body=body)
+        except Exception as e:
+            logger.error(f"Error highlighting epigraphs: {e}")
+            raise
 
-        if must_queries:
-            bool_query["must"] = must_queries
-            
-        if should_queries:
-            bool_query["should"] = should_queries
-            if not must_queries:
-                bool_query["minimum_should_match"] = 1
-                
-        if must_not_queries:
-            bool_query["must_not"] = must_not_queries
+        return {
+            int(hit["_source"]["id"]): hit.get("highlight", {})
+            for hit in response["hits"]["hits"]
+        }
 
+    def _build_search_body(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        facet_fields: Optional[List[str]] = None,
+        sort_field: Optional[str] = None,
+        sort_order: str = "asc",
+        skip: int = 0,
+        limit: int = 100,
+        source_includes: Optional[List[str]] = None,
+        include_highlight: bool = False,
+        search_after: Optional[List[Any]] = None,
+        pit_id: Optional[str] = None,
+        track_total_hits: Optional[bool | int] = None,
+    ) -> str:
         search_body: Dict[str, Any] = {
-            "query": {
-                "bool": bool_query
-            },
-            "from": skip,
+            "from": 0 if search_after else skip,
             "size": limit,
         }
-
+        if track_total_hits is not None:
+            search_body["track_total_hits"] = track_total_hits
+        if search_after:
+            search_body["search_after"] = search_after
+        if pit_id:
+            search_body["pit"] = {"id": pit_id, "keep_alive": POINT_IN_TIME_KEEP_ALIVE}
+        raw_sections = {"query": compile_search_query(query, fields)}
         if include_highlight:
-            search_body["highlight"] = {
-                "fields": {
-                    "title": {},
-                    "epigraph_text": {},
-                    "general_notes": {},
-                    "translations.text": {},
-                    "translations.notes.note": {},
-                    "translations.bibliography.reference": {},
-                    "translations.bibliography.reference_short": {},
-                    "cultural_notes.note": {},
-                    "apparatus_notes.note": {},
-                    "bibliography.text": {},
-                    "bibliography.reference": {},
-                    "bibliography.title": {},
-                    "bibliography.reference_short": {},
-                    "images.caption": {},
-                    "support_notes": {},
-                    "deposit_notes": {},
-                    "object_cultural_notes.note": {},
-                    "deposits.settlement": {},
-                    "deposits.institution": {},
-                    "deposits.repository": {},
-                    "materials": {},
-                    "shape": {},
-                    "decorations.typeLevel1": {},
-                    "decorations.type": {},
-                    "decorations.typeLevel2": {},
-                    "decorations.subjectLevel1": {},
-                    "decorations.partOfHumanBody": {},
-                    "decorations.subjectLevel2": {},
-                    "decorations.view": {},
-                    "decorations.humanGender": {},
-                    "decorations.humanClothes": {},
-                    "decorations.humanWeapons": {},
-                    "decorations.humanGestures": {},
-                    "decorations.humanJewellery": {},
-                    "decorations.partOfAnimalBody": {},
-                    "decorations.symbolShape": {},
-                    "decorations.symbolReference": {},
-                    "decorations.symbolReferenceText": {},
-                    "decorations.monogramName": {},
-                    "decorations.animalGestures": {}
-                }
-            }
+            raw_sections["highlight"] = compile_highlight(fields)
 
         if source_includes:
             search_body["_source"] = source_includes
@@ -1021,25 +772,225 @@ class OpenSearchService:
         if facet_fields:
             search_body["aggs"] = self._build_facet_aggregations(filter_clauses, facet_fields)
 
+        search_body["sort"] = self._build_sort(sort_field, sort_order)
+
+        return serialize_search_body(search_body, **raw_sections)
+
+    @staticmethod
+    def _read_search_response(response: Dict[str, Any], pit_id: Optional[str] = None) -> Dict[str, Any]:
+        total = response["hits"].get("total") or {"value": 0, "relation": "gte"}
+        return {
+            "hits": response["hits"]["hits"],
+            "total": total["value"],
+            "total_relation": total.get("relation", "eq"),
+            "max_score": response["hits"]["max_score"],
+            "aggregations": response.get("aggregations", {}),
+            "pit_id": response.get("pit_id", pit_id),
+            "took": {"hits": response.get("took")},
+        }
+
+    def _build_sort(self, sort_field: Optional[str], sort_order: str) -> List[Any]:
+        """Sort by the requested field or relevance, then by id so every hit has a unique position."""
         if sort_field and sort_field != "_score":
-            search_body["sort"] = [{sort_field: {"order": sort_order}}]
+            primary: Any = {SORT_FIELD_PATHS.get(sort_field, sort_field): {"order": sort_order}}
+        elif sort_order == "asc":
+            primary = {"_score": {"order": "asc"}}
         else:
-            if sort_order == "asc":
-                search_body["sort"] = [{"_score": {"order": "asc"}}]
-            else:
-                search_body["sort"] = ["_score"]
+            primary = "_score"
+        return [primary, {"id": {"order": "asc"}}]
+
+    def open_point_in_time(self) -> str:
+        response = self.client.create_pit(index=self.index_name, params={"keep_alive": POINT_IN_TIME_KEEP_ALIVE})
+        return response["pit_id"]
 
+    def close_point_in_time(self, pit_id: str) -> None:
         try:
-            response = self.client.search(index=self.index_name, body=search_body)
-            return {
-                "hits": response["hits"]["hits"],
-                "total": response["hits"]["total"]["value"],
-                "max_score": response["hits"]["max_score"],
-                "aggregations": response.get("aggregations", {}),
+            self.client.delete_pit(body={"pit_id": [pit_id]})
+        except NotFoundError:
+            pass
+
+    def locate_epigraph(
+        self,
+        dasi_id: int,
+        query: str,
+        fields: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_field: Optional[str] = None,
+        sort_order: str = "asc",
+    ) -> Optional[int]:
+        """
+        Return the 0-based position of an epigraph in the results of a search, or None.
+
+        The target's sort values are looked up first, then the hits that sort
+        before it are counted, so the cost does not grow with its position.
+        """
+        target = self.search_epigraphs(
+            query=query,
+            fields=fields,
+            filters={**(filters or {}), "dasi_id": dasi_id},
+            sort_field=sort_field,
+            sort_order=sort_order,
+            limit=1,
+            source_includes=["id"],
+            include_highlight=False,
+        )
+        if not target["hits"]:
+            return None
+
+        hit = target["hits"][0]
+        sort_value, target_id = hit["sort"][0], int(hit["_source"]["id"])
+        match_query = json.loads(compile_search_query(query, fields))
+        filter_clauses = [clause for _, clause in self._build_filter_clauses(filters)]
+        before_target_id = {"range": {"id": {"lt": target_id}}}
+
+        def query_body(*extra_filters: Dict[str, Any]) -> Dict[str, Any]:
+            return {"bool": {"must": [match_query], "filter": [*filter_clauses, *extra_filters]}}
+
+        if sort_field and sort_field != "_score":
+            field = SORT_FIELD_PATHS.get(sort_field, sort_field)
+            if sort_value is None:
+                # Hits without the sort field come last in either order.
+                before = [
+                    {"exists": {"field": field}},
+                    {"bool": {"must_not": [{"exists": {"field": field}}], "filter": [before_target_id]}},
+                ]
+            else:
+                before = [
+                    {"range": {field: {"lt" if sort_order == "asc" else "gt": sort_value}}},
+                    {"bool": {"filter": [{"term": {field: sort_value}}, before_target_id]}},
+                ]
+            response = self.client.count(
+                index=self.index_name,
+                body={"query": query_body({"bool": {"should": before, "minimum_should_match": 1}})},
+            )
+            return int(response["count"])
+
+        # Scores can't be range-filtered, so count with min_score thresholds at
+        # the target's score and the next float above it.
+        score = float(sort_value)
+        above_score = _next_float32(score)
+        counts = self._count_many([
+            (query_body(), above_score),
+            (query_body(), score),
+            (query_body(before_target_id), score),
+            (query_body(before_target_id), above_score),
+            (query_body(), None),
+        ])
+        higher, at_least, tied_before, higher_before, total = counts
+        tied_before -= higher_before
+        if sort_order == "asc":
+            return total - at_least + tied_before
+        return higher + tied_before
+
+    def _count_many(self, queries: List[tuple[Dict[str, Any], Optional[float]]]) -> List[int]:
+        """Count hits for several `(query, min_score)` pairs in one multi-search request."""
+        body: List[Dict[str, Any]] = []
+        for query, min_score in queries:
+            search: Dict[str, Any] = {"query": query, "size": 0, "track_total_hits": True}
+            if min_score is not None:
+                search["min_score"] = min_score
+            body.extend([{"index": self.index_name}, search])
+
+        response = self.client.msearch(body=body)
+        counts = []
+        for item in response["responses"]:
+            if "error" in item:
+                raise RuntimeError(f"Error counting epigraphs: {item['error']}")
+            counts.append(int(item["hits"]["total"]["value"]))
+        return counts
+
+    def query_site_map(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        bounds: Optional[Dict[str, float]] = None,
+        precision: Optional[int] = None,
+        marker_limit: int = 10_000,
+        max_tiles: int = 4000,
+    ) -> Dict[str, Any]:
+        """
+        Map the sites of matching epigraphs inside `bounds`.
+
+        With a `precision`, sites are bucketed into geotile cells of that zoom
+        and each cell comes back as its centroid and epigraph count. Without
+        one, the epigraphs with a site in view come back as hits instead.
+        """
+        site_filter: Dict[str, Any] = {"match_all": {}}
+        if bounds:
+            site_filter = {
+                "geo_bounding_box": {
+                    "sites.coordinates": {
+                        "top_left": {"lat": bounds["north"], "lon": bounds["west"]},
+                        "bottom_right": {"lat": bounds["south"], "lon": bounds["east"]},
+                    }
+                }
             }
-        except Exception as e:
-            logger.error(f"Error searching epigraphs: {e}")
-            raise
+
+        in_view_aggs: Dict[str, Any] = {"epigraphs": {"reverse_nested": {}}}
+        if precision is not None:
+            in_view_aggs["tiles"] = {
+                "geotile_grid": {"field": "sites.coordinates", "precision": precision, "size": max_tiles},
+                "aggs": {
+                    "centroid": {"geo_centroid": {"field": "sites.coordinates"}},
+                    "epigraphs": {"reverse_nested": {}},
+                },
+            }
+
+        search_body: Dict[str, Any] = {
+            "size": 0 if precision is not None else marker_limit,
+            "aggs": {
+                # Counted before the post_filter that keeps marker hits in view.
+                "matching": {"value_count": {"field": "id"}},
+                "sites": {
+                    "nested": {"path": "sites"},
+                    "aggs": {"in_view": {"filter": site_filter, "aggs": in_view_aggs}},
+                },
+            },
+        }
+        if precision is None:
+            search_body["_source"] = ["id", "dasi_id", "title", "sites"]
+            search_body["post_filter"] = {"nested": {"path": "sites", "query": site_filter}}
+
+        search_body["query"] = {
+            "bool": {
+                "must": [json.loads(compile_search_query(query, fields))],
+                "filter": [clause for _, clause in self._build_filter_clauses(filters)],
+            }
+        }
+
+        response = self.client.search(index=self.index_name, body=search_body)
+        in_view = response["aggregations"]["sites"]["in_view"]
+        tiles = [
+            {
+                "key": bucket["key"],
+                "lat": bucket["centroid"]["location"]["lat"],
+                "lon": bucket["centroid"]["location"]["lon"],
+                "count": bucket["epigraphs"]["doc_count"],
+            }
+            for bucket in in_view.get("tiles", {}).get("buckets", [])
+        ]
+        return {
+            "hits": response["hits"]["hits"],
+            "total": int(response["aggregations"]["matching"]["value"]),
+            "mapped": in_view["epigraphs"]["doc_count"],
+            "tiles": tiles,
+        }
+
+    def get_epigraph_cards(self, epigraph_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Fetch the stored result cards of epigraphs by id; ids without one are left out."""
+        if not epigraph_ids:
+            return {}
+
+        response = self.client.mget(
+            index=self.index_name,
+            body={"docs": [{"_id": epigraph_id, "_source": [CARD_SOURCE_FIELD]} for epigraph_id in epigraph_ids]},
+        )
+        return {
+            int(doc["_id"]): doc["_source"][CARD_SOURCE_FIELD]
+            for doc in response["docs"]
+            if doc.get("found") and CARD_SOURCE_FIELD in doc.get("_source", {})
+        }
 
     def suggest_terms(self, query: str, field: str = "title") -> List[str]:
         """Get search suggestions."""
@@ -1066,8 +1017,10 @@ class OpenSearchService:
             return []
 
     def delete_epigraph(self, epigraph_id: int):
-        """Delete an epigraph from the index."""
+        """Delete an epigraph from the index and from any generation a reindex is loading."""
         try:
+            for building_index in self._building_generations():
+                self.client.delete(index=building_index, id=epigraph_id, params={"ignore": 404})
             response = self.client.delete(index=self.index_name, id=epigraph_id)
             logger.debug(f"Deleted epigraph {epigraph_id}: {response['result']}")
             return response
@@ -1078,11 +1031,12 @@ class OpenSearchService:
             raise
 
     def delete_index(self):
-        """Delete the epigraphs index."""
+        """Delete the epigraphs index, with every generation behind its alias."""
         try:
             if self.client.indices.exists(index=self.index_name):
-                response = self.client.indices.delete(index=self.index_name)
-                logger.info(f"Deleted index '{self.index_name}': {response}")
+                indices = self._alias_indices() or [self.index_name]
+                response = self.client.indices.delete(index=",".join(indices))
+                logger.info(f"Deleted index '{self.index_name}' ({', '.join(indices)}): {response}")
                 return response
             else:
                 logger.info(f"Index '{self.index_name}' does not exist")
@@ -1153,7 +1107,8 @@ class OpenSearchService:
             "last_modified": epigraph.last_modified.isoformat() if epigraph.last_modified else None,
             "dasi_published": epigraph.dasi_published,
             "created_at": epigraph.created_at.isoformat() if epigraph.created_at else None,
-            "updated_at": epigraph.updated_at.isoformat() if epigraph.updated_at else None
+            "updated_at": epigraph.updated_at.isoformat() if epigraph.updated_at else None,
+            CARD_SOURCE_FIELD: EpigraphOut.model_validate(epigraph).model_dump(mode="json"),
         }
 
         if epigraph.epigraph_text:
@@ -1173,12 +1128,7 @@ class OpenSearchService:
 
         if getattr(epigraph, "sites_objs", None):
             for site in epigraph.sites_objs:
-                coordinates = site.coordinates if site.coordinates else None
-                latitude = None
-                longitude = None
-                if isinstance(coordinates, (list, tuple)) and len(coordinates) == 2:
-                    latitude = coordinates[0]
-                    longitude = coordinates[1]
+                latitude, longitude = _site_latitude_longitude(site.coordinates)
 
                 site_documents.append(
                     {
@@ -1187,7 +1137,7 @@ class OpenSearchService:
                         "ancient_name": site.ancient_name,
                         "id": site.dasi_id or site.id,
                         "uri": site.uri,
-                        "coordinates": coordinates,
+                        "coordinates": _geo_point(latitude, longitude),
                         "latitude": latitude,
                         "longitude": longitude,
                         "region": site.geographical_area,
@@ -1200,12 +1150,7 @@ class OpenSearchService:
                 if not isinstance(site, dict):
                     continue
 
-                coordinates = site.get("coordinates")
-                latitude = None
-                longitude = None
-                if isinstance(coordinates, (list, tuple)) and len(coordinates) == 2:
-                    latitude = coordinates[0]
-                    longitude = coordinates[1]
+                latitude, longitude = _site_latitude_longitude(site.get("coordinates"))
 
                 site_documents.append(
                     {
@@ -1214,7 +1159,7 @@ class OpenSearchService:
                         "ancient_name": site.get("ancient_name"),
                         "id": site.get("id"),
                         "uri": site.get("uri"),
-                        "coordinates": coordinates,
+                        "coordinates": _geo_point(latitude, longitude),
                         "latitude": latitude,
                         "longitude": longitude,
                         "region": site.get("geographical_area") or site.get("region"),
@@ -1335,8 +1280,9 @@ class OpenSearchService:
         try:
             stats = self.client.indices.stats(index=self.index_name)
             return {
-                "document_count": stats["indices"][self.index_name]["total"]["docs"]["count"],
-                "index_size": stats["indices"][self.index_name]["total"]["store"]["size_in_bytes"]
+                "indices": sorted(stats["indices"]),
+                "document_count": stats["_all"]["total"]["docs"]["count"],
+                "index_size": stats["_all"]["total"]["store"]["size_in_bytes"]
             }
         except Exception as e:
             logger.error(f"Error getting index stats: {e}")
@@ -1374,7 +1320,10 @@ class OpenSearchService:
         }
 
         try:
-            response = self.client.search(index=self.index_name, body=search_body)
+            response = self.client.search(
+                index=self.index_name,
+                body=serialize_search_body(search_body),
+            )
             return {
                 "hits": response["hits"]["hits"],
                 "total": response["hits"]["total"]["value"],
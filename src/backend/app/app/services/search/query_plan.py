@@ -0,0 +1,390 @@
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from app.services.search.epigraph_search_schema import get_epigraph_searchable_field_map
+
+# Stands in for the query text while clause templates are built; it survives
+# serialization unchanged so rendering is a single join.
+PLACEHOLDER = "\x00query\x00"
+SERIALIZED_PLACEHOLDER = json.dumps(PLACEHOLDER)[1:-1]
+
+HIGHLIGHT_FIELDS = (
+    "title",
+    "epigraph_text",
+    "general_notes",
+    "translations.text",
+    "translations.notes.note",
+    "translations.bibliography.reference",
+    "translations.bibliography.reference_short",
+    "cultural_notes.note",
+    "apparatus_notes.note",
+    "bibliography.text",
+    "bibliography.reference",
+    "bibliography.title",
+    "bibliography.reference_short",
+    "images.caption",
+    "support_notes",
+    "deposit_notes",
+    "object_cultural_notes.note",
+    "deposits.settlement",
+    "deposits.institution",
+    "deposits.repository",
+    "materials",
+    "shape",
+    "decorations.typeLevel1",
+    "decorations.type",
+    "decorations.typeLevel2",
+    "decorations.subjectLevel1",
+    "decorations.partOfHumanBody",
+    "decorations.subjectLevel2",
+    "decorations.view",
+    "decorations.humanGender",
+    "decorations.humanClothes",
+    "decorations.humanWeapons",
+    "decorations.humanGestures",
+    "decorations.humanJewellery",
+    "decorations.partOfAnimalBody",
+    "decorations.symbolShape",
+    "decorations.symbolReference",
+    "decorations.symbolReferenceText",
+    "decorations.monogramName",
+    "decorations.animalGestures",
+)
+
+
+def to_json(value: Any) -> str:
+    """Serialize the way the OpenSearch client does, so raw sections can be spliced into a body."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+HIGHLIGHT_JSON = to_json({"fields": {field: {} for field in HIGHLIGHT_FIELDS}})
+
+
+@dataclass(frozen=True)
+class QueryTerm:
+    text: str
+    phrase: bool = False
+
+    @property
+    def wildcard(self) -> bool:
+        return "*" in self.text or "?" in self.text
+
+
+@dataclass(frozen=True)
+class QueryAST:
+    """A parsed search query: required terms, optional terms and excluded terms."""
+
+    must: tuple[QueryTerm, ...] = ()
+    should: tuple[QueryTerm, ...] = ()
+    must_not: tuple[QueryTerm, ...] = ()
+
+    @property
+    def should_text(self) -> str:
+        return " ".join(term.text for term in self.should)
+
+
+class QueryParser:
+    """Parse search queries with boolean operators."""
+
+    def parse(self, query: str) -> QueryAST:
+        """Quoted phrases and `+term` are required, `-term` is excluded and bare terms are optional."""
+        quoted_pattern = r'"([^"]*)"'
+        must = [
+            QueryTerm(match, phrase=True)
+            for match in re.findall(quoted_pattern, query)
+            if match.strip()
+        ]
+        should = []
+        must_not = []
+
+        for token in re.sub(quoted_pattern, "", query).split():
+            if token.startswith("+"):
+                term = token[1:].strip()
+                if term:
+                    must.append(QueryTerm(term.strip('"'), phrase=term.startswith('"') and term.endswith('"')))
+            elif token.startswith("-"):
+                term = token[1:].strip()
+                if term:
+                    must_not.append(QueryTerm(term.strip('"')))
+            else:
+                should.append(QueryTerm(token.strip()))
+
+        return QueryAST(must=tuple(must), should=tuple(should), must_not=tuple(must_not))
+
+    def parse_query(self, query: str) -> Dict[str, List[str]]:
+        ast = self.parse(query)
+        return {
+            "must": [f'"{term.text}"' if term.phrase else term.text for term in ast.must],
+            "should": [term.text for term in ast.should],
+            "must_not": [term.text for term in ast.must_not],
+        }
+
+
+@dataclass(frozen=True)
+class FieldGroups:
+    top_fields: tuple[str, ...]
+    nested_fields: tuple[str, ...]
+
+    @property
+    def keyword_fields(self) -> list[str]:
+        return [field + ".keyword" for field in self.top_fields]
+
+    @property
+    def raw_fields(self) -> list[str]:
+        return [field + ".raw" for field in self.top_fields]
+
+
+@lru_cache(maxsize=256)
+def resolve_field_groups(fields: tuple[str, ...] | None) -> FieldGroups:
+    """Expand search field keys into top-level and nested document fields; all fields when None."""
+    searchable_fields = get_epigraph_searchable_field_map()
+    search_fields: List[str] = []
+    for field_name in fields or searchable_fields:
+        subfields = searchable_fields.get(field_name)
+        if subfields is None:
+            search_fields.append(field_name)
+        else:
+            search_fields.extend(f"{field_name}.{subfield}" for subfield in subfields)
+
+    return FieldGroups(
+        top_fields=tuple(field for field in search_fields if "." not in field),
+        nested_fields=tuple(field for field in search_fields if "." in field),
+    )
+
+
+def _nested(field: str, query: Dict[str, Any]) -> Dict[str, Any]:
+    return {"nested": {"path": field.split(".", 1)[0], "query": query}}
+
+
+def _wildcard_clauses(groups: FieldGroups, boosted: bool) -> List[Dict[str, Any]]:
+    def query_string(fields: List[str], boost: int) -> Dict[str, Any]:
+        clause: Dict[str, Any] = {
+            "query": PLACEHOLDER,
+            "fields": fields,
+            "default_operator": "OR",
+            "analyze_wildcard": True,
+        }
+        if boosted:
+            clause["boost"] = boost
+        return {"query_string": clause}
+
+    clauses = []
+    if groups.top_fields:
+        clauses.append(query_string(list(groups.top_fields), 3))
+        clauses.append(query_string(groups.keyword_fields, 5))
+    for field in groups.nested_fields:
+        clauses.append(_nested(field, {
+            "query_string": {
+                "query": PLACEHOLDER,
+                "fields": [field],
+                "default_operator": "OR",
+                "analyze_wildcard": True,
+            }
+        }))
+    return clauses
+
+
+def _phrase_clauses(groups: FieldGroups) -> List[Dict[str, Any]]:
+    quoted = f'"{PLACEHOLDER}"'
+    clauses: List[Dict[str, Any]] = []
+    if groups.top_fields:
+        clauses.append({"match_phrase": {"epigraph_text.raw": {"query": PLACEHOLDER, "boost": 15}}})
+        clauses.append({"match_phrase": {"epigraph_text": {"query": PLACEHOLDER, "boost": 10}}})
+        for field in groups.top_fields:
+            if field != "epigraph_text":
+                clauses.append({"match_phrase": {f"{field}.raw": {"query": PLACEHOLDER, "boost": 12}}})
+                clauses.append({"match_phrase": {field: {"query": PLACEHOLDER, "boost": 8}}})
+        clauses.append({
+            "multi_match": {"query": PLACEHOLDER, "fields": groups.raw_fields, "type": "phrase", "boost": 6}
+        })
+        clauses.append({
+            "query_string": {"query": quoted, "fields": groups.raw_fields, "default_operator": "AND", "boost": 5}
+        })
+        clauses.append({
+            "multi_match": {"query": PLACEHOLDER, "fields": groups.raw_fields, "type": "phrase_prefix", "boost": 4}
+        })
+        clauses.append({
+            "query_string": {"query": quoted, "fields": groups.keyword_fields, "default_operator": "AND", "boost": 6}
+        })
+    for field in groups.nested_fields:
+        clauses.append(_nested(field, {"match_phrase": {field: {"query": PLACEHOLDER, "boost": 5}}}))
+        clauses.append(_nested(field, {
+            "multi_match": {"query": PLACEHOLDER, "fields": [field], "type": "phrase", "boost": 4}
+        }))
+        clauses.append(_nested(field, {
+            "query_string": {"query": quoted, "fields": [field], "default_operator": "AND", "boost": 3}
+        }))
+    return clauses
+
+
+def _term_clauses(groups: FieldGroups) -> List[Dict[str, Any]]:
+    # Top-level fields are analysed with the edge n-gram analyzer, so stemmed and
+    # n-gram matching is one clause; its boost is the sum of the two (3 + 2).
+    clauses: List[Dict[str, Any]] = []
+    if groups.top_fields:
+        clauses.append({
+            "multi_match": {"query": PLACEHOLDER, "fields": list(groups.top_fields), "type": "best_fields", "boost": 5}
+        })
+        clauses.append({
+            "multi_match": {"query": PLACEHOLDER, "fields": groups.keyword_fields, "type": "best_fields", "boost": 5}
+        })
+    for field in groups.nested_fields:
+        clauses.append(_nested(field, {"multi_match": {"query": PLACEHOLDER, "fields": [field], "type": "best_fields"}}))
+    return clauses
+
+
+def _should_clauses(groups: FieldGroups) -> List[Dict[str, Any]]:
+    clauses: List[Dict[str, Any]] = []
+    if groups.top_fields:
+        clauses.append({
+            "multi_match": {
+                "query": PLACEHOLDER,
+                "fields": list(groups.top_fields),
+                "type": "best_fields",
+                "minimum_should_match": "50%",
+                "boost": 3,
+            }
+        })
+        clauses.append({
+            "multi_match": {"query": PLACEHOLDER, "fields": groups.keyword_fields, "type": "best_fields", "boost": 5}
+        })
+    for field in groups.nested_fields:
+        clauses.append(_nested(field, {
+            "multi_match": {
+                "query": PLACEHOLDER,
+                "fields": [field],
+                "type": "best_fields",
+                "minimum_should_match": "50%",
+            }
+        }))
+    return clauses
+
+
+def _must_not_clauses(groups: FieldGroups) -> List[Dict[str, Any]]:
+    clauses: List[Dict[str, Any]] = []
+    if groups.top_fields:
+        clauses.append({"multi_match": {"query": PLACEHOLDER, "fields": list(groups.top_fields), "type": "best_fields"}})
+        clauses.append({"multi_match": {"query": PLACEHOLDER, "fields": groups.keyword_fields, "type": "best_fields"}})
+    for field in groups.nested_fields:
+        clauses.append(_nested(field, {"multi_match": {"query": PLACEHOLDER, "fields": [field], "type": "best_fields"}}))
+    return clauses
+
+
+def _any_of(clauses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"bool": {"should": clauses, "minimum_should_match": 1}}
+
+
+class ClauseTemplate:
+    """A serialized DSL fragment with the query text left as a placeholder."""
+
+    def __init__(self, fragment: Any):
+        self.parts = to_json(fragment).split(SERIALIZED_PLACEHOLDER)
+
+    def render(self, text: str) -> str:
+        return to_json(text)[1:-1].join(self.parts)
+
+
+class ListTemplate(ClauseTemplate):
+    """Clauses that are spliced into a surrounding list rather than wrapped."""
+
+    def __init__(self, clauses: List[Dict[str, Any]]):
+        super().__init__(clauses)
+        self.parts[0] = self.parts[0][1:]
+        self.parts[-1] = self.parts[-1][:-1]
+
+
+class QueryPlan:
+    """
+    Serialized clause templates for one set of search fields.
+
+    Each kind of term (wildcard, phrase, plain) expands to the same clauses for
+    every query on that field set, so the clauses are serialized once and a
+    query is rendered by substituting its terms into the cached templates.
+    """
+
+    def __init__(self, groups: FieldGroups):
+        self.groups = groups
+        self.must_wildcard = ClauseTemplate(_any_of(_wildcard_clauses(groups, boosted=True)))
+        self.must_phrase = ClauseTemplate(_any_of(_phrase_clauses(groups)))
+        self.must_term = ClauseTemplate(_any_of(_term_clauses(groups)))
+        self.should_wildcard = ListTemplate(_wildcard_clauses(groups, boosted=True))
+        self.should_term = ListTemplate(_should_clauses(groups))
+        self.must_not_wildcard = ClauseTemplate(
+            {"bool": {"should": _wildcard_clauses(groups, boosted=False), "minimum_should_match": 1}}
+        )
+        self.must_not_term = ClauseTemplate(
+            {"bool": {"should": _must_not_clauses(groups), "minimum_should_match": 1}}
+        )
+
+    def _must(self, term: QueryTerm) -> str:
+        if term.wildcard:
+            return self.must_wildcard.render(term.text)
+        if term.phrase:
+            return self.must_phrase.render(term.text)
+        return self.must_term.render(term.text)
+
+    def render(self, ast: QueryAST) -> str:
+        """Return the serialized `bool` query for `ast`."""
+        sections = ['"filter":[{"term":{"dasi_published":true}}]']
+        if ast.must:
+            sections.append('"must":[' + ",".join(self._must(term) for term in ast.must) + "]")
+
+        if ast.should:
+            should_text = ast.should_text
+            template = self.should_wildcard if "*" in should_text or "?" in should_text else self.should_term
+            should = template.render(should_text)
+            if should:
+                sections.append(f'"should":[{should}]')
+                if not ast.must:
+                    sections.append('"minimum_should_match":1')
+
+        if ast.must_not:
+            sections.append('"must_not":[' + ",".join(
+                (self.must_not_wildcard if term.wildcard else self.must_not_term).render(term.text)
+                for term in ast.must_not
+            ) + "]")
+
+        return '{"bool":{' + ",".join(sections) + "}}"
+
+
+@lru_cache(maxsize=256)
+def get_query_plan(fields: tuple[str, ...] | None = None) -> QueryPlan:
+    return QueryPlan(resolve_field_groups(fields))
+
+
+def parse_search_query(query: str) -> QueryAST:
+    """Normalise underscores and whitespace, then parse."""
+    return QueryParser().parse(" ".join(query.replace("_", " ").split()))
+
+
+def compile_search_query(query: str, fields: Optional[List[str]] = None) -> str:
+    """Return the serialized OpenSearch query for `query` over the search `fields`."""
+    return get_query_plan(tuple(fields) if fields else None).render(parse_search_query(query))
+
+
+@lru_cache(maxsize=256)
+def _highlight_json(fields: tuple[str, ...] | None) -> str:
+    if fields is None:
+        return HIGHLIGHT_JSON
+    groups = resolve_field_groups(fields)
+    searched = {*groups.top_fields, *groups.nested_fields}
+    return to_json({"fields": {field: {} for field in HIGHLIGHT_FIELDS if field in searched}})
+
+
+def compile_highlight(fields: Optional[List[str]] = None) -> str:
+    """Return the serialized highlight section for the highlightable fields among the search `fields`."""
+    return _highlight_json(tuple(fields) if fields else None)
+
+
+def serialize_search_body(body: Dict[str, Any], **raw_sections: str) -> str:
+    """Serialize `body`, adding already-serialized `raw_sections` without decoding them."""
+    sections = [f'"{name}":{value}' for name, value in raw_sections.items()]
+    serialized_body = to_json(body)
+    if serialized_body != "{}":
+        sections.append(serialized_body[1:-1])
+    return "{" + ",".join(sections) + "}"
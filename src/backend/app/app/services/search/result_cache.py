@@ -0,0 +1,273 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from app.core.config import settings
+from app.services.search.query_plan import parse_search_query
+
+logger = logging.getLogger(__name__)
+
+REDIS_SOCKET_TIMEOUT_SECONDS = 0.25
+REDIS_RETRY_SECONDS = 30.0
+
+
+def search_cache_key(
+    search_text: str,
+    fields: Optional[List[str]],
+    filters: Optional[Dict[str, Any]],
+    sort_field: Optional[str],
+    sort_order: Optional[str],
+    skip: int,
+    limit: int,
+) -> str:
+    """
+    Digest of everything that decides a result page.
+
+    The query is keyed by its parsed terms, so spacing and `_` vs space don't
+    matter, and fields and filter values by their sorted contents.
+    """
+    return _digest(
+        {
+            **_normalise_search(search_text, fields, filters),
+            "sort": [sort_field, sort_order],
+            "page": [skip, limit],
+        }
+    )
+
+
+def search_facets_key(
+    search_text: str,
+    fields: Optional[List[str]],
+    filters: Optional[Dict[str, Any]],
+) -> str:
+    """Digest of what decides the facet counts and total of a search, which every page of it shares."""
+    return _digest(_normalise_search(search_text, fields, filters))
+
+
+def _normalise_search(
+    search_text: str,
+    fields: Optional[List[str]],
+    filters: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    return {
+        "query": asdict(parse_search_query(search_text)),
+        "fields": sorted(set(fields)) if fields else None,
+        "filters": {
+            key: sorted(value, key=json.dumps) if isinstance(value, list) else value
+            for key, value in sorted((filters or {}).items())
+        },
+    }
+
+
+def _digest(normalised: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(normalised, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+class SearchResultCache:
+    """
+    Two-tier cache of search result pages: a per-process LRU in front of Redis.
+
+    Page entries hold hit ids, the total and the last hit's sort values, never
+    documents. Facet entries hold the facet counts and total shared by every
+    page of a search. Both are keyed under the index generation.
+    Anything that changes the index calls `bump_generation`, which orphans
+    every older entry at once; the Redis copies then expire after
+    `SEARCH_CACHE_TTL_SECONDS`. Other processes see a bump within
+    `SEARCH_CACHE_GENERATION_CHECK_SECONDS`.
+
+    If Redis is unreachable the cache carries on with the local tier only and
+    tries Redis again after `REDIS_RETRY_SECONDS`.
+    """
+
+    KEY_PREFIX = "hudhud:search"
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None, *, use_redis: bool = True):
+        self._redis = redis_client
+        self._use_redis = use_redis
+        self._redis_retry_at = 0.0
+        self._local: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._generation = 0
+        self._generation_checked_at = float("-inf")
+        self._lock = threading.Lock()
+        self._counters = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "redis_errors": 0,
+            "generation_bumps": 0,
+        }
+        self._saved_seconds = 0.0
+
+    @property
+    def generation_key(self) -> str:
+        return f"{self.KEY_PREFIX}:generation"
+
+    def _result_key(self, kind: str, generation: int, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{kind}:{generation}:{key}"
+
+    def _get_redis(self) -> Optional[redis.Redis]:
+        if not self._use_redis or time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            )
+        return self._redis
+
+    def _redis_failed(self, exc: Exception) -> None:
+        logger.warning(f"Search result cache Redis error, using the local cache only: {exc}")
+        self._counters["redis_errors"] += 1
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+    def generation(self) -> int:
+        """The current index generation, re-read from Redis at most every few seconds."""
+        if time.monotonic() - self._generation_checked_at < settings.SEARCH_CACHE_GENERATION_CHECK_SECONDS:
+            return self._generation
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                self._set_generation(int(client.get(self.generation_key) or 0))
+            except redis.RedisError as exc:
+                self._redis_failed(exc)
+        self._generation_checked_at = time.monotonic()
+        return self._generation
+
+    def _set_generation(self, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                self._local.clear()
+                self._generation = generation
+
+    def bump_generation(self) -> int:
+        """Invalidate every cached result, here and in every other process."""
+        generation = self._generation + 1
+        client = self._get_redis()
+        if client is not None:
+            try:
+                generation = int(client.incr(self.generation_key))
+            except redis.RedisError as exc:
+                self._redis_failed(exc)
+        self._set_generation(generation)
+        self._generation_checked_at = time.monotonic()
+        self._counters["generation_bumps"] += 1
+        return generation
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """A cached result page."""
+        return self._get("results", key)
+
+    def get_facets(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached facet counts and total for a `search_facets_key`."""
+        return self._get("facets", key)
+
+    def _get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        if not settings.SEARCH_CACHE_ENABLED:
+            return None
+
+        generation = self.generation()
+        local_key = f"{kind}:{key}"
+        with self._lock:
+            entry = self._local.get(local_key)
+            if entry is not None:
+                self._local.move_to_end(local_key)
+                self._counters["local_hits"] += 1
+                self._saved_seconds += entry["took"]
+                return entry
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                payload = client.get(self._result_key(kind, generation, key))
+            except redis.RedisError as exc:
+                self._redis_failed(exc)
+                payload = None
+            if payload is not None:
+                entry = json.loads(payload)
+                self._remember(local_key, entry)
+                self._counters["redis_hits"] += 1
+                self._saved_seconds += entry["took"]
+                return entry
+
+        self._counters["misses"] += 1
+        return None
+
+    def set(
+        self,
+        key: str,
+        *,
+        ids: List[int],
+        total: int,
+        took: float,
+        generation: Optional[int] = None,
+        after: Optional[List[Any]] = None,
+        exact: bool = True,
+    ) -> None:
+        """Store a result page computed under `generation`; it is dropped if the index moved on since."""
+        self._set("results", key, {"ids": ids, "total": total, "took": took, "after": after, "exact": exact}, generation)
+
+    def set_facets(
+        self,
+        key: str,
+        *,
+        facet_counts: Dict[str, Any],
+        total: int,
+        took: float,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store the facet counts and exact total of a search computed under `generation`."""
+        self._set("facets", key, {"facet_counts": facet_counts, "total": total, "took": took}, generation)
+
+    def _set(self, kind: str, key: str, entry: Dict[str, Any], generation: Optional[int]) -> None:
+        if not settings.SEARCH_CACHE_ENABLED:
+            return
+
+        generation = self._generation if generation is None else generation
+        if generation != self._generation:
+            return
+
+        self._remember(f"{kind}:{key}", entry)
+        self._counters["stores"] += 1
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.set(
+                    self._result_key(kind, generation, key),
+                    json.dumps(entry, ensure_ascii=False),
+                    ex=settings.SEARCH_CACHE_TTL_SECONDS,
+                )
+            except redis.RedisError as exc:
+                self._redis_failed(exc)
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._local[key] = entry
+            self._local.move_to_end(key)
+            while len(self._local) > settings.SEARCH_CACHE_LOCAL_SIZE:
+                self._local.popitem(last=False)
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self._counters["local_hits"] + self._counters["redis_hits"] + self._counters["misses"]
+        hits = self._counters["local_hits"] + self._counters["redis_hits"]
+        return {
+            "enabled": settings.SEARCH_CACHE_ENABLED,
+            "generation": self._generation,
+            "local_entries": len(self._local),
+            **self._counters,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "saved_seconds": round(self._saved_seconds, 3),
+        }
+
+
+search_result_cache = SearchResultCache()
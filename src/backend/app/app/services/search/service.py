@@ -1,16 +1,19 @@
 import json
 import logging
 import re
+import time
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 import openai
+from opensearchpy.exceptions import ConnectionError as OpenSearchConnectionError
+from opensearchpy.exceptions import NotFoundError as OpenSearchNotFoundError
 from pydantic import BaseModel
 from sqlalchemy import String, cast as sa_cast, text
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 from sqlmodel import Session, asc, desc, func, or_, select
 
 from app.core.config import settings
-from app.models.epigraph import Epigraph, EpigraphsOut
+from app.models.epigraph import Epigraph, EpigraphOut, EpigraphsOut
 from app.models.epigraph_chunk import EpigraphChunk
 from app.models.links import EpigraphObjectLink
 from app.models.object import Object
@@ -18,6 +21,7 @@ from app.services.enrichment.embeddings import EmbeddingsService
 from app.services.search.epigraph_fields import (
     BOOLEAN_FACET_FIELD_KEYS,
     EPIGRAPH_FACET_FIELDS,
+    apply_epigraph_filter,
     get_epigraph_facet_values,
     sort_epigraph_facet_buckets,
 )
@@ -27,7 +31,20 @@ from app.services.search.epigraph_search_schema import (
     validate_epigraph_search_field_keys,
 )
 from app.services.search.ai import AIService
-from app.services.search.opensearch import OpenSearchService
+from app.services.search.breaker import CircuitOpenError, opensearch_breaker
+from app.services.search.client import opensearch_clients
+from app.services.search.cursor import SearchCursor
+from app.services.search.opensearch import CARD_SOURCE_FIELD, OpenSearchService
+from app.services.search.result_cache import search_cache_key, search_facets_key, search_result_cache
+
+
+# Cluster cells are this many zoom levels finer than the map tiles they are drawn on.
+MAP_CLUSTER_PRECISION_OFFSET = 2
+MAX_GEOTILE_PRECISION = 29
+
+
+def _elapsed_ms(started_at: float) -> float:
+    return round((time.perf_counter() - started_at) * 1000, 2)
 
 
 logging.basicConfig(
@@ -64,11 +81,30 @@ class SearchService:
             self.client = None
             logging.warning("OpenAI API key not configured. AI features will be disabled.")
 
-        try:
-            self.opensearch = OpenSearchService()
-        except Exception as exc:
-            logging.warning(f"OpenSearch not available: {exc}. Falling back to PostgreSQL search.")
-            self.opensearch = None
+        self._opensearch: Optional[OpenSearchService] = None
+
+    @property
+    def opensearch(self) -> Optional[OpenSearchService]:
+        """
+        The OpenSearch service, or None while its circuit breaker is open or the
+        cached cluster health check is failing.
+        """
+        if opensearch_breaker.is_open():
+            logging.info("OpenSearch circuit is open. Falling back to PostgreSQL search.")
+            return None
+        if not opensearch_clients.is_available():
+            logging.warning("OpenSearch not available. Falling back to PostgreSQL search.")
+            return None
+        if self._opensearch is None:
+            self._opensearch = OpenSearchService()
+        return self._opensearch
+
+    def _search_opensearch(self, **kwargs: Any) -> Dict[str, Any]:
+        """Run `OpenSearchService.search_epigraphs` through the OpenSearch circuit breaker."""
+        opensearch = self.opensearch
+        if opensearch is None:
+            raise CircuitOpenError("OpenSearch is not available")
+        return opensearch_breaker.call(opensearch.search_epigraphs, **kwargs)
 
     def get_filter_options(self) -> Dict[str, List[str]]:
         """Get filter options for epigraphs."""
@@ -300,34 +336,24 @@ class SearchService:
                     text(f"to_tsvector({combined_object_vector}) @@ plainto_tsquery(:search_text)")
                 )
 
-        if search_conditions:
+        if search_conditions and processed_search_text:
             base_query = base_query.where(or_(*search_conditions))
             base_query = base_query.params(search_text=processed_search_text)
 
         if filters:
             filters_dict = json.loads(filters) if isinstance(filters, str) else filters
             for key, value in filters_dict.items():
-                if isinstance(value, bool):
-                    base_query = base_query.where(
-                        getattr(Epigraph, key).is_(value)
-                    )
-                elif isinstance(value, list):
-                    base_query = base_query.where(
-                        getattr(Epigraph, key).in_(value)
-                    )
-                else:
-                    base_query = base_query.where(
-                        getattr(Epigraph, key) == value
-                    )
+                base_query = apply_epigraph_filter(base_query, key, value)
 
         epigraph_count = int(self.session.exec(select(func.count()).select_from(base_query.subquery())).one())
         logging.info(f"Found {epigraph_count} epigraphs")
 
-        if sort_field:
+        sort_column = getattr(Epigraph, sort_field, None) if sort_field else None
+        if sort_column is not None:
             if sort_order and sort_order.lower() == "desc":
-                base_query = base_query.order_by(desc(getattr(Epigraph, sort_field)))
+                base_query = base_query.order_by(desc(sort_column))
             else:
-                base_query = base_query.order_by(asc(getattr(Epigraph, sort_field)))
+                base_query = base_query.order_by(asc(sort_column))
 
         base_query = base_query.offset(skip).limit(limit)
 
@@ -494,7 +520,7 @@ class SearchService:
         limit: int = 100,
         include_objects: bool = False,
         object_fields: Optional[str] = None,
-    ) -> Tuple[List[Epigraph], int]:
+    ) -> Tuple[List[Epigraph | EpigraphOut], int]:
         """
         Perform full text search using OpenSearch. Fallback to PostgreSQL.
         """
@@ -534,7 +560,7 @@ class SearchService:
                 filters_dict = json.loads(filters) if isinstance(filters, str) else filters
                 search_filters.update(filters_dict)
 
-            opensearch_results = self.opensearch.search_epigraphs(
+            opensearch_results = self._search_opensearch(
                 query=search_text,
                 fields=search_fields,
                 filters=search_filters,
@@ -542,23 +568,15 @@ class SearchService:
                 sort_order=sort_order or "asc",
                 skip=skip,
                 limit=limit,
+                source_includes=self._result_source_includes(),
             )
 
-            epigraph_ids = [int(hit["_source"]["id"]) for hit in opensearch_results["hits"]]
             total_count = opensearch_results["total"]
 
-            if not epigraph_ids:
+            if not opensearch_results["hits"]:
                 return [], 0
 
-            epigraph_id_column = cast(Any, Epigraph.id)
-            query = select(Epigraph).where(epigraph_id_column.in_(epigraph_ids))
-
-            epigraphs_dict = {epigraph.id: epigraph for epigraph in list(self.session.exec(query).all())}
-            ordered_epigraphs = [
-                epigraphs_dict[eid]
-                for eid in epigraph_ids
-                if eid in epigraphs_dict
-            ]
+            ordered_epigraphs = self._get_result_epigraphs(opensearch_results["hits"])
 
             logging.info(
                 f"OpenSearch found {total_count} epigraphs, returned {len(ordered_epigraphs)}"
@@ -567,6 +585,8 @@ class SearchService:
 
         except Exception as e:
             logging.error(f"OpenSearch error, falling back to PostgreSQL: {e}")
+            if isinstance(e, OpenSearchConnectionError):
+                opensearch_clients.invalidate()
             result = self.full_text_search(
                 search_text=search_text,
                 fields=fields,
@@ -625,10 +645,25 @@ class SearchService:
         filters: Optional[str | Dict[str, Any]] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
+        include_facets: bool = True,
     ) -> Dict[str, Any]:
-        if not self.opensearch:
-            raise RuntimeError("OpenSearch is required for the canonical epigraph query endpoint")
-
+        """
+        Query epigraphs with facet counts, serving repeated result pages from
+        the search result cache.
+
+        Facet counts and the exact total are cached once per query and
+        filters, apart from the pages, so other pages of a search only search
+        for hits. With `include_facets` off no facets are counted or returned,
+        and the total is only counted up to `SEARCH_TOTAL_HITS_CAP` unless it
+        is already cached; `count_exact` says which.
+
+        Every OpenSearch page comes with a `next_cursor`. Passing it back reads
+        the next page with search_after from a point in time instead of an
+        offset, so deep pages cost the same as the first and stay consistent
+        while the index changes. Cursor pages are not cached.
+        """
+        started_at = time.perf_counter()
         search_fields: Optional[List[str]] = None
         if fields:
             search_fields = [field.strip() for field in fields.split(",")]
@@ -639,39 +674,354 @@ class SearchService:
             search_filters.update(filters_dict)
 
         search_filters.pop("dasi_published", None)
+        facets_key = search_facets_key(search_text, search_fields, search_filters)
+
+        if cursor:
+            query_key = search_cache_key(search_text, search_fields, search_filters, sort_field, sort_order, 0, limit)
+            result = self._opensearch_query_epigraphs_after(
+                SearchCursor.decode(cursor, query_key),
+                search_text,
+                search_fields,
+                search_filters,
+                sort_field,
+                sort_order,
+                limit,
+                facets_key=facets_key,
+                include_facets=include_facets,
+            )
+            result["timings"]["total_ms"] = _elapsed_ms(started_at)
+            return result
+
+        cache_key = search_cache_key(search_text, search_fields, search_filters, sort_field, sort_order, skip, limit)
+        generation = search_result_cache.generation()
+        cached = search_result_cache.get(cache_key)
+        cached_facets = search_result_cache.get_facets(facets_key) if cached is not None and include_facets else None
+        if cached is not None and (cached_facets is not None or not include_facets):
+            return {
+                "epigraphs": self._get_cached_result_epigraphs(cached["ids"]),
+                "count": cached["total"],
+                "count_exact": cached.get("exact", True),
+                "facet_counts": cached_facets["facet_counts"] if cached_facets else {},
+                "next_cursor": self._next_cursor(
+                    search_text, search_fields, search_filters, sort_field, sort_order, limit,
+                    page=skip // limit + 1,
+                    returned=skip + len(cached["ids"]),
+                    total=cached["total"],
+                    exact=cached.get("exact", True),
+                    after=cached.get("after"),
+                ),
+                "timings": {
+                    "hits_ms": None,
+                    "facets_ms": None,
+                    "page_cached": True,
+                    "facets_cached": cached_facets is not None,
+                    "total_ms": _elapsed_ms(started_at),
+                },
+            }
+
+        opensearch = self.opensearch
+        if opensearch is None:
+            return self._postgres_query_epigraphs(search_text, fields, sort_field, sort_order, filters, skip, limit)
+
+        try:
+            page = self._search_result_page(
+                opensearch,
+                facets_key=facets_key,
+                generation=generation,
+                include_facets=include_facets,
+                query=search_text,
+                fields=search_fields,
+                filters=search_filters,
+                sort_field=sort_field,
+                sort_order=sort_order or "asc",
+                skip=skip,
+                limit=limit,
+                source_includes=self._result_source_includes(),
+            )
+        except Exception as exc:
+            logging.error(f"OpenSearch error, falling back to PostgreSQL: {exc}")
+            if isinstance(exc, OpenSearchConnectionError):
+                opensearch_clients.invalidate()
+            return self._postgres_query_epigraphs(search_text, fields, sort_field, sort_order, filters, skip, limit)
+
+        hits = page["hits"]
+        epigraph_ids = [int(hit["_source"]["id"]) for hit in hits]
+        after = hits[-1].get("sort") if hits else None
+        search_result_cache.set(
+            cache_key,
+            ids=epigraph_ids,
+            total=page["total"],
+            took=time.perf_counter() - started_at,
+            generation=generation,
+            after=after,
+            exact=page["exact"],
+        )
+
+        return {
+            "epigraphs": self._get_result_epigraphs(hits),
+            "count": page["total"],
+            "count_exact": page["exact"],
+            "facet_counts": page["facet_counts"],
+            "next_cursor": self._next_cursor(
+                search_text, search_fields, search_filters, sort_field, sort_order, limit,
+                page=skip // limit + 1,
+                returned=skip + len(epigraph_ids),
+                total=page["total"],
+                exact=page["exact"],
+                after=after,
+            ),
+            "timings": {**page["timings"], "page_cached": False, "total_ms": _elapsed_ms(started_at)},
+        }
+
+    def _search_result_page(
+        self,
+        opensearch: OpenSearchService,
+        facets_key: str,
+        generation: int,
+        include_facets: bool,
+        **search_kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Search one page of hits, counting facets and the exact total only if
+        they are wanted and not already cached for the search.
+        """
+        facets = search_result_cache.get_facets(facets_key)
+        if facets is not None:
+            results = opensearch_breaker.call(opensearch.search_epigraphs, track_total_hits=False, **search_kwargs)
+            return {
+                "hits": results["hits"],
+                "pit_id": results["pit_id"],
+                "total": facets["total"],
+                "exact": True,
+                "facet_counts": facets["facet_counts"] if include_facets else {},
+                "timings": {"hits_ms": results["took"]["hits"], "facets_ms": None, "facets_cached": True},
+            }
 
-        opensearch_results = self.opensearch.search_epigraphs(
+        if not include_facets:
+            results = opensearch_breaker.call(
+                opensearch.search_epigraphs,
+                track_total_hits=settings.SEARCH_TOTAL_HITS_CAP,
+                **search_kwargs,
+            )
+            return {
+                "hits": results["hits"],
+                "pit_id": results["pit_id"],
+                "total": int(results["total"]),
+                "exact": results["total_relation"] == "eq",
+                "facet_counts": {},
+                "timings": {"hits_ms": results["took"]["hits"], "facets_ms": None, "facets_cached": False},
+            }
+
+        started_at = time.perf_counter()
+        results = opensearch_breaker.call(
+            opensearch.search_epigraphs_with_facets,
+            facet_fields=[field.key for field in EPIGRAPH_FACET_FIELDS],
+            **search_kwargs,
+        )
+        facet_counts = self._normalise_opensearch_facet_counts(results["aggregations"])
+        facets_ms = results["took"]["facets"]
+        search_result_cache.set_facets(
+            facets_key,
+            facet_counts=facet_counts,
+            total=int(results["total"]),
+            took=facets_ms / 1000 if facets_ms is not None else time.perf_counter() - started_at,
+            generation=generation,
+        )
+        return {
+            "hits": results["hits"],
+            "pit_id": results["pit_id"],
+            "total": int(results["total"]),
+            "exact": True,
+            "facet_counts": facet_counts,
+            "timings": {"hits_ms": results["took"]["hits"], "facets_ms": facets_ms, "facets_cached": False},
+        }
+
+    def _opensearch_query_epigraphs_after(
+        self,
+        position: SearchCursor,
+        search_text: str,
+        search_fields: Optional[List[str]],
+        search_filters: Dict[str, Any],
+        sort_field: Optional[str],
+        sort_order: Optional[str],
+        limit: int,
+        facets_key: str,
+        include_facets: bool = True,
+    ) -> Dict[str, Any]:
+        """Read the page after a search cursor, opening a point in time for the first cursor page."""
+        opensearch = self.opensearch
+        if opensearch is None:
+            raise RuntimeError("OpenSearch is required to continue from a search cursor")
+
+        generation = search_result_cache.generation()
+        pit_id = position.pit or opensearch_breaker.call(opensearch.open_point_in_time)
+        search_kwargs: Dict[str, Any] = dict(
+            facets_key=facets_key,
+            generation=generation,
+            include_facets=include_facets,
             query=search_text,
             fields=search_fields,
             filters=search_filters,
-            facet_fields=[field.key for field in EPIGRAPH_FACET_FIELDS],
             sort_field=sort_field,
             sort_order=sort_order or "asc",
-            skip=skip,
             limit=limit,
+            search_after=position.after,
+            source_includes=self._result_source_includes(),
         )
+        try:
+            result_page = self._search_result_page(opensearch, **search_kwargs, pit_id=pit_id)
+        except OpenSearchNotFoundError:
+            # The point in time expired; carry on from the same sort values in a new one.
+            pit_id = opensearch_breaker.call(opensearch.open_point_in_time)
+            result_page = self._search_result_page(opensearch, **search_kwargs, pit_id=pit_id)
+
+        hits = result_page["hits"]
+        page = position.page + 1
+        pit_id = result_page["pit_id"] or pit_id
+        returned = (page - 1) * limit + len(hits)
+        if hits and (returned < result_page["total"] or not result_page["exact"]):
+            next_cursor: Optional[str] = SearchCursor(position.query, page, hits[-1]["sort"], pit_id).encode()
+        else:
+            next_cursor = None
+            opensearch.close_point_in_time(pit_id)
 
-        epigraph_ids = [int(hit["_source"]["id"]) for hit in opensearch_results["hits"]]
-        total_count = int(opensearch_results["total"])
+        return {
+            "epigraphs": self._get_result_epigraphs(hits),
+            "count": result_page["total"],
+            "count_exact": result_page["exact"],
+            "facet_counts": result_page["facet_counts"],
+            "page": page,
+            "next_cursor": next_cursor,
+            "timings": {**result_page["timings"], "page_cached": False},
+        }
 
-        ordered_epigraphs: List[Epigraph] = []
-        if epigraph_ids:
-            epigraph_id_column = cast(Any, Epigraph.id)
-            query = select(Epigraph).where(epigraph_id_column.in_(epigraph_ids))
+    @staticmethod
+    def _next_cursor(
+        search_text: str,
+        search_fields: Optional[List[str]],
+        search_filters: Dict[str, Any],
+        sort_field: Optional[str],
+        sort_order: Optional[str],
+        limit: int,
+        *,
+        page: int,
+        returned: int,
+        total: int,
+        exact: bool,
+        after: Optional[List[Any]],
+    ) -> Optional[str]:
+        if not after or (exact and returned >= total):
+            return None
+        query_key = search_cache_key(search_text, search_fields, search_filters, sort_field, sort_order, 0, limit)
+        return SearchCursor(query_key, page, after).encode()
 
-            epigraphs_dict = {epigraph.id: epigraph for epigraph in list(self.session.exec(query).all())}
-            ordered_epigraphs = [
-                epigraphs_dict[eid]
-                for eid in epigraph_ids
-                if eid in epigraphs_dict
-            ]
+    @staticmethod
+    def _result_source_includes() -> List[str]:
+        if settings.SEARCH_SOURCE_ONLY_RESULTS:
+            return ["id", CARD_SOURCE_FIELD]
+        return ["id"]
+
+    def _get_result_epigraphs(self, hits: List[Dict[str, Any]]) -> List[Epigraph | EpigraphOut]:
+        """
+        Build result epigraphs from the cards stored with the hits.
+
+        Hits without a card, from documents indexed before cards were added
+        or with SEARCH_SOURCE_ONLY_RESULTS off, are loaded from PostgreSQL.
+        """
+        cards = {
+            int(hit["_source"]["id"]): hit["_source"][CARD_SOURCE_FIELD]
+            for hit in hits
+            if CARD_SOURCE_FIELD in hit["_source"]
+        }
+        return self._merge_result_epigraphs([int(hit["_source"]["id"]) for hit in hits], cards)
+
+    def _get_cached_result_epigraphs(self, epigraph_ids: List[int]) -> List[Epigraph | EpigraphOut]:
+        """Build cached result epigraphs from their stored cards, fetched by id, or from PostgreSQL."""
+        cards: Dict[int, Dict[str, Any]] = {}
+        opensearch = self.opensearch if settings.SEARCH_SOURCE_ONLY_RESULTS else None
+        if opensearch is not None:
+            try:
+                cards = opensearch_breaker.call(opensearch.get_epigraph_cards, epigraph_ids)
+            except Exception as exc:
+                logging.warning(f"Could not fetch result cards from OpenSearch: {exc}")
+        return self._merge_result_epigraphs(epigraph_ids, cards)
 
+    def _merge_result_epigraphs(
+        self,
+        epigraph_ids: List[int],
+        cards: Dict[int, Dict[str, Any]],
+    ) -> List[Epigraph | EpigraphOut]:
+        missing_ids = [epigraph_id for epigraph_id in epigraph_ids if epigraph_id not in cards]
+        loaded = {epigraph.id: epigraph for epigraph in self._get_epigraphs_in_order(missing_ids)}
+
+        epigraphs: List[Epigraph | EpigraphOut] = []
+        for epigraph_id in epigraph_ids:
+            if epigraph_id in cards:
+                epigraphs.append(EpigraphOut.model_validate(cards[epigraph_id]))
+            elif epigraph_id in loaded:
+                epigraphs.append(loaded[epigraph_id])
+        return epigraphs
+
+    def opensearch_highlight_epigraphs(
+        self,
+        search_text: str,
+        epigraph_ids: List[int],
+        fields: Optional[str] = None,
+    ) -> Dict[int, Dict[str, List[str]]]:
+        """Highlight a query in a page of result epigraphs."""
+        opensearch = self.opensearch
+        if opensearch is None:
+            raise RuntimeError("OpenSearch is required for the epigraph highlight endpoint")
+
+        search_fields: Optional[List[str]] = None
+        if fields:
+            search_fields = [field.strip() for field in fields.split(",")]
+
+        return opensearch_breaker.call(
+            opensearch.highlight_epigraphs,
+            query=search_text,
+            epigraph_ids=epigraph_ids,
+            fields=search_fields,
+        )
+
+    def _get_epigraphs_in_order(self, epigraph_ids: List[int]) -> List[Epigraph]:
+        """Load epigraphs by id, keeping the order of `epigraph_ids`."""
+        if not epigraph_ids:
+            return []
+
+        epigraph_id_column = cast(Any, Epigraph.id)
+        query = select(Epigraph).where(epigraph_id_column.in_(epigraph_ids))
+        epigraphs_dict = {epigraph.id: epigraph for epigraph in list(self.session.exec(query).all())}
+        return [
+            epigraphs_dict[eid]
+            for eid in epigraph_ids
+            if eid in epigraphs_dict
+        ]
+
+    def _postgres_query_epigraphs(
+        self,
+        search_text: str,
+        fields: Optional[str],
+        sort_field: Optional[str],
+        sort_order: Optional[str],
+        filters: Optional[str | Dict[str, Any]],
+        skip: int,
+        limit: int,
+    ) -> Dict[str, Any]:
+        """Answer a canonical epigraph query from PostgreSQL, without relevance ranking or facet counts."""
+        epigraphs, total_count = self.full_text_search(
+            search_text=search_text,
+            fields=fields or ",".join(get_epigraph_search_field_keys()),
+            sort_field=sort_field,
+            sort_order=sort_order,
+            filters=filters,
+            skip=skip,
+            limit=limit,
+        )
         return {
-            "epigraphs": ordered_epigraphs,
+            "epigraphs": epigraphs,
             "count": total_count,
-            "facet_counts": self._normalise_opensearch_facet_counts(
-                opensearch_results.get("aggregations", {})
-            ),
+            "facet_counts": {field.key: [] for field in EPIGRAPH_FACET_FIELDS},
         }
 
     def opensearch_locate_epigraph_result(
@@ -684,7 +1034,9 @@ class SearchService:
         sort_order: Optional[str] = None,
         filters: Optional[str | Dict[str, Any]] = None,
     ) -> Optional[Dict[str, int]]:
-        if not self.opensearch:
+        """Find the result page of an epigraph from the number of hits that sort before it."""
+        opensearch = self.opensearch
+        if opensearch is None:
             raise RuntimeError("OpenSearch is required for the epigraph result locator endpoint")
 
         search_fields: Optional[List[str]] = None
@@ -698,50 +1050,22 @@ class SearchService:
 
         search_filters.pop("dasi_published", None)
 
-        batch_size = 1000
-        skip = 0
-
-        while True:
-            opensearch_results = self.opensearch.search_epigraphs(
-                query=search_text,
-                fields=search_fields,
-                filters=search_filters,
-                sort_field=sort_field,
-                sort_order=sort_order or "asc",
-                skip=skip,
-                limit=batch_size,
-                source_includes=["dasi_id"],
-                include_highlight=False,
-            )
-
-            hits = opensearch_results["hits"]
-            if not hits:
-                return None
-
-            for index, hit in enumerate(hits):
-                source = hit.get("_source", {})
-                if not isinstance(source, dict):
-                    continue
-
-                hit_dasi_id = source.get("dasi_id")
-                if hit_dasi_id is None:
-                    continue
-
-                try:
-                    if int(hit_dasi_id) != dasi_id:
-                        continue
-                except (TypeError, ValueError):
-                    continue
-
-                absolute_index = skip + index
-                return {
-                    "page": absolute_index // page_size + 1,
-                    "index": absolute_index,
-                }
+        index = opensearch_breaker.call(
+            opensearch.locate_epigraph,
+            dasi_id=dasi_id,
+            query=search_text,
+            fields=search_fields,
+            filters=search_filters,
+            sort_field=sort_field,
+            sort_order=sort_order or "asc",
+        )
+        if index is None:
+            return None
 
-            skip += len(hits)
-            if skip >= int(opensearch_results["total"]):
-                return None
+        return {
+            "page": index // page_size + 1,
+            "index": index,
+        }
 
     @staticmethod
     def _normalise_epigraph_marker_coordinates(site: Dict[str, Any]) -> Optional[Tuple[float, float]]:
@@ -817,7 +1141,7 @@ class SearchService:
 
         search_filters.pop("dasi_published", None)
 
-        opensearch_results = self.opensearch.search_epigraphs(
+        opensearch_results = self._search_opensearch(
             query=search_text,
             fields=search_fields,
             filters=search_filters,
@@ -842,11 +1166,93 @@ class SearchService:
             "mapped_count": len(markers),
         }
 
+    def opensearch_query_epigraph_map(
+        self,
+        search_text: str,
+        zoom: int,
+        fields: Optional[str] = None,
+        filters: Optional[str | Dict[str, Any]] = None,
+        bounds: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Map the epigraphs matching a query at a zoom level, as columns rather than marker objects.
+
+        Below `MAP_CLUSTER_MARKER_ZOOM` the sites in view are clustered by
+        OpenSearch into geotile cells, a little finer than the map's own
+        tiles, and each cluster is its centroid and epigraph count. From that
+        zoom on, the epigraphs in view come back as individual markers.
+        """
+        opensearch = self.opensearch
+        if opensearch is None:
+            raise RuntimeError("OpenSearch is required for the epigraph map endpoint")
+
+        search_fields: Optional[List[str]] = None
+        if fields:
+            search_fields = [field.strip() for field in fields.split(",")]
+
+        search_filters: Dict[str, Any] = {}
+        if filters:
+            filters_dict = json.loads(filters) if isinstance(filters, str) else filters
+            search_filters.update(filters_dict)
+
+        search_filters.pop("dasi_published", None)
+
+        clustered = zoom < settings.MAP_CLUSTER_MARKER_ZOOM
+        site_map = opensearch_breaker.call(
+            opensearch.query_site_map,
+            query=search_text,
+            fields=search_fields,
+            filters=search_filters,
+            bounds=bounds,
+            precision=min(zoom + MAP_CLUSTER_PRECISION_OFFSET, MAX_GEOTILE_PRECISION) if clustered else None,
+            marker_limit=settings.MAP_MARKER_LIMIT,
+            max_tiles=settings.MAP_CLUSTER_MAX_TILES,
+        )
+
+        result: Dict[str, Any] = {
+            "zoom": zoom,
+            "clustered": clustered,
+            "result_count": site_map["total"],
+            "mapped_count": site_map["mapped"],
+            "clusters": None,
+            "markers": None,
+        }
+        if clustered:
+            tiles = site_map["tiles"]
+            result["clusters"] = {
+                "keys": [tile["key"] for tile in tiles],
+                "latitudes": [tile["lat"] for tile in tiles],
+                "longitudes": [tile["lon"] for tile in tiles],
+                "counts": [tile["count"] for tile in tiles],
+            }
+            return result
+
+        markers: List[Dict[str, Any]] = []
+        for hit in site_map["hits"]:
+            source = hit.get("_source", {})
+            if not isinstance(source, dict):
+                continue
+
+            marker = self._build_epigraph_marker_from_hit(source)
+            if marker is not None:
+                markers.append(marker)
+
+        result["markers"] = {
+            "ids": [marker["id"] for marker in markers],
+            "dasi_ids": [marker["dasi_id"] for marker in markers],
+            "titles": [marker["title"] for marker in markers],
+            "site_names": [marker["site_name"] for marker in markers],
+            "latitudes": [marker["coordinates"][0] for marker in markers],
+            "longitudes": [marker["coordinates"][1] for marker in markers],
+        }
+        return result
+
     def index_epigraph_to_opensearch(self, epigraph: Epigraph):
         """Index a single epigraph to OpenSearch."""
         if self.opensearch:
             try:
                 self.opensearch.index_epigraph(epigraph)
+                search_result_cache.bump_generation()
                 logging.info(f"Indexed epigraph {epigraph.id} to OpenSearch")
             except Exception as e:
                 logging.error(f"Failed to index epigraph {epigraph.id} to OpenSearch: {e}")
@@ -856,6 +1262,7 @@ class SearchService:
         if self.opensearch:
             try:
                 success, failed = self.opensearch.bulk_index_epigraphs(epigraphs)
+                search_result_cache.bump_generation()
                 logging.info(
                     f"Bulk indexed {success} epigraphs to OpenSearch, {len(failed)} failed"
                 )
@@ -864,43 +1271,106 @@ class SearchService:
                 logging.error(f"Failed to bulk index epigraphs to OpenSearch: {e}")
                 return 0, []
 
-    def reindex_all_epigraphs(self):
-        """Reindex all published epigraphs to OpenSearch."""
-        if not self.opensearch:
+    def reindex_all_epigraphs(self) -> Optional[Dict[str, Any]]:
+        """
+        Reindex all published epigraphs to OpenSearch without taking search down.
+
+        Epigraphs are streamed in id order into a new index generation with
+        refreshes off, which is refreshed and force-merged before the epigraphs
+        alias is swapped to it; older generations are then deleted. Searches
+        keep hitting the previous generation until the swap, and single
+        epigraph writes meanwhile go to both. If any document failed to load
+        the new generation is deleted and the alias left where it was. Returns
+        document counts and step timings for the pipeline run.
+        """
+        opensearch = self.opensearch
+        if opensearch is None:
             logging.warning("OpenSearch not available for reindexing")
-            return
+            return None
 
-        try:
-            self.opensearch.create_index(recreate=True)
+        started_at = time.perf_counter()
+        timings: Dict[str, float] = {"load_ms": 0.0, "bulk_ms": 0.0}
+        index_name = opensearch.create_index_generation()
 
+        try:
+            epigraph_id_column = cast(Any, Epigraph.id)
             epigraph_published_column = cast(Any, Epigraph.dasi_published)
+            batch_size = 100
             query = (
                 select(Epigraph)
                 .where(epigraph_published_column.is_not(False))
                 .options(
+                    defer(cast(Any, Epigraph.embedding)),
+                    defer(cast(Any, Epigraph.dasi_object)),
                     selectinload(Epigraph.sites_objs),
                     selectinload(Epigraph.objects),
                 )
+                .order_by(epigraph_id_column)
+                .limit(batch_size)
             )
-            epigraphs = list(self.session.exec(query).all())
-
-            batch_size = 100
+            source_documents = 0
             total_indexed = 0
-
-            for i in range(0, len(epigraphs), batch_size):
-                batch = epigraphs[i:i + batch_size]
-                success, failed = self.bulk_index_epigraphs_to_opensearch(batch)
+            total_failed = 0
+            last_id = 0
+
+            while True:
+                step_started_at = time.perf_counter()
+                batch = list(self.session.exec(query.where(epigraph_id_column > last_id)).all())
+                timings["load_ms"] += _elapsed_ms(step_started_at)
+                if not batch:
+                    break
+                last_id = cast(int, batch[-1].id)
+                source_documents += len(batch)
+
+                step_started_at = time.perf_counter()
+                success, failed = opensearch.bulk_index_epigraphs(
+                    batch, index_name=index_name, refresh=False, keep_existing=True
+                )
+                timings["bulk_ms"] += _elapsed_ms(step_started_at)
                 if failed:
-                    logging.warning(f"Failed to index the following epigraph IDs: {[e.id for e in failed]}")
+                    logging.warning(f"Failed to index {len(failed)} epigraphs into '{index_name}': {failed}")
                 total_indexed += success
+                total_failed += len(failed)
+
+            step_started_at = time.perf_counter()
+            opensearch.finish_index_generation(index_name)
+            timings["refresh_ms"] = _elapsed_ms(step_started_at)
 
-            logging.info(f"Reindexed {total_indexed} epigraphs to OpenSearch")
-            return total_indexed
+            index_documents = opensearch.count_documents(index_name)
+            if total_failed or index_documents < source_documents:
+                raise RuntimeError(
+                    f"Index '{index_name}' holds {index_documents} of {source_documents} epigraphs "
+                    f"({total_failed} failed to load)"
+                )
+
+            step_started_at = time.perf_counter()
+            opensearch.force_merge_index(index_name)
+            timings["force_merge_ms"] = _elapsed_ms(step_started_at)
 
+            step_started_at = time.perf_counter()
+            deleted_indices = opensearch.swap_alias(index_name)
+            timings["swap_ms"] = _elapsed_ms(step_started_at)
         except Exception as e:
-            logging.error(f"Failed to reindex epigraphs: {e}")
+            logging.error(f"Failed to reindex epigraphs into '{index_name}': {e}")
+            try:
+                opensearch.delete_index_generation(index_name)
+            except Exception as cleanup_error:
+                logging.error(f"Failed to delete abandoned index '{index_name}': {cleanup_error}")
             raise
 
+        search_result_cache.bump_generation()
+        timings["total_ms"] = _elapsed_ms(started_at)
+        logging.info(f"Reindexed {total_indexed} epigraphs to OpenSearch index '{index_name}'")
+        return {
+            "index": index_name,
+            "source_documents": source_documents,
+            "indexed": total_indexed,
+            "failed": total_failed,
+            "index_documents": index_documents,
+            "deleted_indices": deleted_indices,
+            "timings": timings,
+        }
+
     def get_opensearch_stats(self) -> Dict[str, Any]:
         """Get OpenSearch index statistics."""
         if self.opensearch:
@@ -1,3 +1,4 @@
-from app.services.text.word_parser import WordParser
+from app.services.text.word_index import WordIndexBuilder
+from app.services.text.word_lookup import WordLookupService, fold_word, word_lookup
 
-__all__ = ["WordParser"]
\ No newline at end of file
+__all__ = ["WordIndexBuilder", "WordLookupService", "fold_word", "word_lookup"]
\ No newline at end of file
@@ -0,0 +1,307 @@
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+from sqlalchemy import select
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.links import WordLink
+
+Direction = Literal["successors", "predecessors", "both"]
+
+CURRENT_POINTER = "CURRENT"
+KEPT_SNAPSHOTS = 2
+ARRAY_NAMES = (
+    "node_ids",
+    "successors_indptr",
+    "successors_indices",
+    "successors_counts",
+    "predecessors_indptr",
+    "predecessors_indices",
+    "predecessors_counts",
+)
+
+
+def _build_csr(rows: np.ndarray, columns: np.ndarray, counts: np.ndarray, size: int) -> tuple[np.ndarray, ...]:
+    order = np.lexsort((columns, rows))
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=size), out=indptr[1:])
+    return indptr, columns[order].astype(np.int32), counts[order].astype(np.int32)
+
+
+@dataclass(frozen=True)
+class Adjacency:
+    indptr: np.ndarray
+    indices: np.ndarray
+    counts: np.ndarray
+
+    def row(self, position: int) -> tuple[np.ndarray, np.ndarray]:
+        start, end = self.indptr[position], self.indptr[position + 1]
+        return self.indices[start:end], self.counts[start:end]
+
+    def expand(self, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return `(sources, neighbours)` for every edge leaving `positions`."""
+        starts = self.indptr[positions]
+        lengths = self.indptr[positions + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return np.repeat(positions, lengths), self.indices[np.repeat(starts, lengths) + offsets].astype(np.int64)
+
+
+class WordGraph:
+    """
+    `WordLink` bigrams as compressed sparse rows over word positions.
+
+    Successors follow reading order (the words that come after a word);
+    predecessors are the words that come before it, the direction `WordLink`
+    rows are stored in. Word ids map to positions through the sorted
+    `node_ids` array.
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]):
+        self.node_ids = arrays["node_ids"]
+        self.successors = Adjacency(
+            arrays["successors_indptr"], arrays["successors_indices"], arrays["successors_counts"]
+        )
+        self.predecessors = Adjacency(
+            arrays["predecessors_indptr"], arrays["predecessors_indices"], arrays["predecessors_counts"]
+        )
+
+    @classmethod
+    def from_links(cls, links: np.ndarray) -> "WordGraph":
+        """Build from an `(n, 3)` array of `from_word_id, to_word_id, count` rows."""
+        links = links.reshape(-1, 3).astype(np.int64)
+        node_ids = np.unique(links[:, :2])
+        from_positions = np.searchsorted(node_ids, links[:, 0])
+        to_positions = np.searchsorted(node_ids, links[:, 1])
+        counts = links[:, 2]
+
+        successors = _build_csr(to_positions, from_positions, counts, len(node_ids))
+        predecessors = _build_csr(from_positions, to_positions, counts, len(node_ids))
+        return cls({
+            "node_ids": node_ids,
+            "successors_indptr": successors[0],
+            "successors_indices": successors[1],
+            "successors_counts": successors[2],
+            "predecessors_indptr": predecessors[0],
+            "predecessors_indices": predecessors[1],
+            "predecessors_counts": predecessors[2],
+        })
+
+    @classmethod
+    def load(cls, path: Path) -> "WordGraph":
+        return cls({name: np.load(path / f"{name}.npy", mmap_mode="r") for name in ARRAY_NAMES})
+
+    def save(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            "node_ids": self.node_ids,
+            "successors_indptr": self.successors.indptr,
+            "successors_indices": self.successors.indices,
+            "successors_counts": self.successors.counts,
+            "predecessors_indptr": self.predecessors.indptr,
+            "predecessors_indices": self.predecessors.indices,
+            "predecessors_counts": self.predecessors.counts,
+        }
+        for name, array in arrays.items():
+            np.save(path / f"{name}.npy", np.ascontiguousarray(array))
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.successors.indices)
+
+    def position(self, word_id: int) -> int | None:
+        position = int(np.searchsorted(self.node_ids, word_id))
+        if position < len(self.node_ids) and self.node_ids[position] == word_id:
+            return position
+        return None
+
+    def _adjacencies(self, direction: Direction) -> tuple[Adjacency, ...]:
+        if direction == "successors":
+            return (self.successors,)
+        if direction == "predecessors":
+            return (self.predecessors,)
+        return self.successors, self.predecessors
+
+    def top_neighbours(self, word_id: int, direction: Direction, limit: int) -> list[tuple[int, int]]:
+        """Return up to `limit` `(word_id, count)` neighbours, most frequent first."""
+        position = self.position(word_id)
+        if position is None:
+            return []
+
+        indices, counts = self._neighbour_counts(position, direction)
+        if len(indices) > limit:
+            top = np.argpartition(-counts, limit - 1)[:limit]
+            indices, counts = indices[top], counts[top]
+        order = np.lexsort((self.node_ids[indices], -counts))
+        return [(int(self.node_ids[indices[i]]), int(counts[i])) for i in order]
+
+    def _neighbour_counts(self, position: int, direction: Direction) -> tuple[np.ndarray, np.ndarray]:
+        rows = [adjacency.row(position) for adjacency in self._adjacencies(direction)]
+        if len(rows) == 1:
+            return rows[0]
+
+        indices = np.concatenate([row[0] for row in rows])
+        counts = np.concatenate([row[1] for row in rows]).astype(np.int64)
+        unique_indices, inverse = np.unique(indices, return_inverse=True)
+        return unique_indices, np.bincount(inverse, weights=counts).astype(np.int64)
+
+    def _bfs(
+        self,
+        source: int,
+        direction: Direction,
+        max_depth: int,
+        max_nodes: int,
+        target: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Level-synchronous BFS returning per-position depths and parents (-1 where unreached)."""
+        depths = np.full(len(self.node_ids), -1, dtype=np.int32)
+        parents = np.full(len(self.node_ids), -1, dtype=np.int64)
+        depths[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        reached = 1
+
+        for depth in range(1, max_depth + 1):
+            if not len(frontier) or reached >= max_nodes:
+                break
+
+            expanded = [adjacency.expand(frontier) for adjacency in self._adjacencies(direction)]
+            sources = np.concatenate([edges[0] for edges in expanded])
+            neighbours = np.concatenate([edges[1] for edges in expanded])
+            unseen = depths[neighbours] < 0
+            neighbours, first = np.unique(neighbours[unseen], return_index=True)
+            neighbours = neighbours[: max_nodes - reached]
+
+            depths[neighbours] = depth
+            parents[neighbours] = sources[unseen][first][: len(neighbours)]
+            reached += len(neighbours)
+            frontier = neighbours
+            if target is not None and depths[target] >= 0:
+                break
+
+        return depths, parents
+
+    def reach(
+        self,
+        word_id: int,
+        direction: Direction,
+        max_depth: int,
+        max_nodes: int,
+    ) -> list[tuple[int, int]]:
+        """Return `(word_id, depth)` for words within `max_depth` steps, nearest first."""
+        position = self.position(word_id)
+        if position is None:
+            return []
+
+        depths, _ = self._bfs(position, direction, max_depth, max_nodes + 1)
+        reached = np.flatnonzero(depths > 0)
+        order = np.lexsort((self.node_ids[reached], depths[reached]))
+        return [(int(self.node_ids[reached[i]]), int(depths[reached[i]])) for i in order]
+
+    def shortest_path(
+        self,
+        source_id: int,
+        target_id: int,
+        direction: Direction,
+        max_depth: int,
+    ) -> list[int] | None:
+        """Return the word ids on a shortest path from `source_id` to `target_id`, or None."""
+        source = self.position(source_id)
+        target = self.position(target_id)
+        if source is None or target is None:
+            return [source_id] if source_id == target_id else None
+
+        depths, parents = self._bfs(source, direction, max_depth, len(self.node_ids), target=target)
+        if depths[target] < 0:
+            return None
+
+        path = [target]
+        while path[-1] != source:
+            path.append(int(parents[path[-1]]))
+        return [int(self.node_ids[position]) for position in reversed(path)]
+
+
+def build_word_graph(session: Session) -> WordGraph:
+    statement = select(WordLink.from_word_id, WordLink.to_word_id, WordLink.count).where(WordLink.count > 0)
+    links = np.array(session.execute(statement).all(), dtype=np.int64)
+    return WordGraph.from_links(links)
+
+
+def publish_word_graph(session: Session, directory: str | Path | None = None) -> Path:
+    """
+    Write a new graph snapshot and point `CURRENT` at it.
+
+    Snapshots are immutable directories, so workers that still map an older
+    one keep working; only the newest `KEPT_SNAPSHOTS` are retained.
+    """
+    root = Path(directory or settings.WORD_GRAPH_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+    snapshot_name = f"snapshot-{time.time_ns()}"
+    build_word_graph(session).save(root / snapshot_name)
+
+    pointer = root / CURRENT_POINTER
+    temporary_pointer = root / f"{CURRENT_POINTER}.{snapshot_name}"
+    temporary_pointer.write_text(snapshot_name)
+    os.replace(temporary_pointer, pointer)
+
+    for stale in sorted(root.glob("snapshot-*"))[:-KEPT_SNAPSHOTS]:
+        shutil.rmtree(stale, ignore_errors=True)
+    return root / snapshot_name
+
+
+class WordGraphService:
+    """
+    Serves the published word graph snapshot, memory-mapped once per process.
+
+    The `CURRENT` pointer is re-read when its mtime changes, so workers pick up
+    new snapshots without restarting. Without a snapshot one is published
+    from the database on first use.
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        self.directory = Path(directory) if directory else None
+        self._graph: WordGraph | None = None
+        self._pointer_mtime: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self.directory or Path(settings.WORD_GRAPH_DIR)
+
+    def get_graph(self, session: Session) -> WordGraph:
+        pointer = self.root / CURRENT_POINTER
+        try:
+            mtime = pointer.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if self._graph is not None and mtime == self._pointer_mtime:
+            return self._graph
+
+        with self._lock:
+            if mtime is None:
+                publish_word_graph(session, self.root)
+                mtime = pointer.stat().st_mtime_ns
+            if self._graph is None or mtime != self._pointer_mtime:
+                self._graph = WordGraph.load(self.root / pointer.read_text().strip())
+                self._pointer_mtime = mtime
+        return self._graph
+
+    def publish(self, session: Session) -> None:
+        try:
+            publish_word_graph(session, self.root)
+        except OSError as exc:
+            logging.error(f"Error publishing word graph snapshot: {exc!r}")
+
+
+word_graph = WordGraphService()
@@ -0,0 +1,530 @@
+import logging
+import multiprocessing
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+from xml.etree import ElementTree as ET
+
+from sqlalchemy import Integer, column, delete, func, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.epigraph import Epigraph
+from app.models.links import EpigraphWordLink, WordLink
+from app.models.word import EpigraphWordIndex, Word
+from app.services.text.word_graph import word_graph
+from app.services.text.word_lookup import word_lookup
+
+WordKey = tuple[str, str | None]
+Token = tuple[str, str | None, dict[str, Any]]
+Bigram = tuple[WordKey, WordKey]
+
+WRITE_BATCH_SIZE = 5000
+STATE_BATCH_SIZE = 500
+PARSE_CHUNK_SIZE = 64
+
+# Word rollup columns and the link column each one counts rows of.
+WORD_STAT_SOURCES = (
+    ("epigraph_count", EpigraphWordLink.word_id),
+    ("outgoing_count", WordLink.from_word_id),
+    ("incoming_count", WordLink.to_word_id),
+)
+
+
+def _iter_text_segments(element: ET.Element) -> Iterator[tuple[str | None, str | None, dict[str, Any]]]:
+    """Yield `(text, classification, attributes)` for an element tree in document order."""
+    yield element.text, element.tag, dict(element.attrib)
+    for child in element:
+        yield from _iter_text_segments(child)
+        yield child.tail, None, {}
+
+
+def tokenize_epigraph_text(epigraph_text: str) -> list[Token]:
+    """
+    Split epigraph XML into `(word, classification, attributes)` tokens.
+
+    Element text is classified by its tag; text following a child element is
+    left unclassified.
+    """
+    root = ET.fromstring(epigraph_text)
+    return [
+        (word_text, classification, attributes)
+        for text, classification, attributes in _iter_text_segments(root)
+        if text and not text.isspace()
+        for word_text in text.split()
+    ]
+
+
+def _tokenize_epigraph(item: tuple[int, str]) -> tuple[int, list[Token] | None]:
+    epigraph_id, epigraph_text = item
+    try:
+        return epigraph_id, tokenize_epigraph_text(epigraph_text)
+    except ET.ParseError:
+        return epigraph_id, None
+
+
+def _batches(items: list, size: int) -> Iterator[list]:
+    for batch_start in range(0, len(items), size):
+        yield items[batch_start:batch_start + size]
+
+
+@dataclass
+class WordIndex:
+    """In-memory vocabulary, epigraph-word links and bigram counts."""
+
+    attributes: dict[WordKey, dict[str, Any]] = field(default_factory=dict)
+    frequencies: Counter[WordKey] = field(default_factory=Counter)
+    bigrams: Counter[Bigram] = field(default_factory=Counter)
+    epigraph_counts: dict[int, Counter[WordKey]] = field(default_factory=dict)
+    epigraph_bigrams: dict[int, Counter[Bigram]] = field(default_factory=dict)
+
+    def add_epigraph(self, epigraph_id: int, tokens: list[Token]) -> None:
+        """
+        Add one epigraph's tokens.
+
+        Bigrams point from each word to the word before it, the direction
+        existing `WordLink` rows use.
+        """
+        counts: Counter[WordKey] = Counter()
+        bigrams: Counter[Bigram] = Counter()
+        previous_key: WordKey | None = None
+        for word_text, classification, attributes in tokens:
+            key = (word_text, classification)
+            self.attributes.setdefault(key, attributes)
+            counts[key] += 1
+            if previous_key is not None:
+                bigrams[(key, previous_key)] += 1
+            previous_key = key
+
+        self.epigraph_counts[epigraph_id] = counts
+        self.epigraph_bigrams[epigraph_id] = bigrams
+        self.frequencies.update(counts)
+        self.bigrams.update(bigrams)
+
+    @property
+    def epigraph_link_count(self) -> int:
+        return sum(len(counts) for counts in self.epigraph_counts.values())
+
+
+class WordIndexBuilder:
+    """
+    Build and maintain the word tables from epigraph texts in bulk.
+
+    Epigraph XML is tokenized in a process pool and aggregated in memory, then
+    words, epigraph links and bigram counts are written with multi-row
+    statements (COPY for full rebuilds) in a single transaction.
+
+    Each epigraph's contribution is kept in `EpigraphWordIndex` together with
+    an md5 fingerprint of its text, so later updates only re-parse epigraphs
+    whose text changed and apply the difference to the shared counts.
+    """
+
+    def __init__(self, session: Session, *, workers: int | None = None):
+        self.session = session
+        self.workers = settings.WORD_INDEX_WORKERS if workers is None else workers
+
+    def tokenize(self, items: Iterable[tuple[int, str]]) -> Iterator[tuple[int, list[Token] | None]]:
+        if self.workers <= 1 or multiprocessing.current_process().daemon:
+            yield from map(_tokenize_epigraph, items)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            yield from executor.map(_tokenize_epigraph, items, chunksize=PARSE_CHUNK_SIZE)
+
+    def build_index(self, items: Iterable[tuple[int, str]]) -> tuple[WordIndex, list[int]]:
+        index = WordIndex()
+        failed_ids = []
+        for epigraph_id, tokens in self.tokenize(items):
+            if tokens is None:
+                failed_ids.append(epigraph_id)
+                continue
+            index.add_epigraph(epigraph_id, tokens)
+        return index, failed_ids
+
+    def rebuild(self) -> dict[str, Any]:
+        """Replace the word index with one built from every epigraph's text."""
+        started_at = time.perf_counter()
+        items, text_hashes = self._load_epigraph_texts()
+        index, failed_ids = self.build_index(items)
+
+        try:
+            new_words = self.write(index, text_hashes)
+            self.session.commit()
+        except Exception as exc:
+            self.session.rollback()
+            logging.error(f"Error rebuilding word index: {exc!r}")
+            return {
+                "status": "error",
+                "error": str(exc),
+                "processed_items": 0,
+                "failed_items": len(failed_ids),
+                "total_items": len(items),
+            }
+
+        self._after_commit(links_changed=True)
+        return {
+            "status": "success",
+            "processed_items": len(items) - len(failed_ids),
+            "failed_items": len(failed_ids),
+            "failed_ids": failed_ids,
+            "total_items": len(items),
+            "words": len(index.frequencies),
+            "new_words": new_words,
+            "tokens": sum(index.frequencies.values()),
+            "epigraph_links": index.epigraph_link_count,
+            "word_links": len(index.bigrams),
+            "duration_seconds": round(time.perf_counter() - started_at, 3),
+        }
+
+    def update_changed(self) -> dict[str, Any]:
+        """
+        Bring the index up to date with epigraphs whose text changed since it was built.
+
+        Fingerprints are compared in the database, so unchanged texts are never
+        loaded or parsed. Epigraphs that were deleted or lost their text have
+        their previous contribution removed. Without any fingerprints yet, as
+        right after they were introduced, the index is rebuilt instead.
+        """
+        indexed_hashes = dict(
+            self.session.execute(select(EpigraphWordIndex.epigraph_id, EpigraphWordIndex.text_hash)).all()
+        )
+        if not indexed_hashes:
+            return self.rebuild()
+        current_hashes = dict(
+            self.session.execute(
+                select(Epigraph.id, func.md5(Epigraph.epigraph_text)).where(Epigraph.epigraph_text.is_not(None))
+            ).all()
+        )
+
+        changed_ids = [
+            epigraph_id
+            for epigraph_id, text_hash in current_hashes.items()
+            if indexed_hashes.get(epigraph_id) != text_hash
+        ]
+        removed_ids = [epigraph_id for epigraph_id in indexed_hashes if epigraph_id not in current_hashes]
+
+        result = self.update_epigraphs(changed_ids + removed_ids)
+        result["unchanged_items"] = len(current_hashes) - len(changed_ids)
+        result["removed_items"] = len(removed_ids)
+        return result
+
+    def update_epigraphs(self, epigraph_ids: Iterable[int]) -> dict[str, Any]:
+        """
+        Re-index the given epigraphs, replacing whatever they contributed before.
+
+        Ids without text (or without a row) are removed from the index. Epigraphs
+        whose XML fails to parse keep their previous contribution. Falls back to
+        a full rebuild while no fingerprints exist.
+        """
+        if not self._has_index_state():
+            return self.rebuild()
+
+        started_at = time.perf_counter()
+        epigraph_ids = sorted(set(epigraph_ids))
+        items, text_hashes = self._load_epigraph_texts(epigraph_ids)
+        index, failed_ids = self.build_index(items)
+
+        try:
+            new_words, changes = self.apply(index, text_hashes, sorted(set(epigraph_ids) - set(failed_ids)))
+            self.session.commit()
+        except Exception as exc:
+            self.session.rollback()
+            logging.error(f"Error updating word index: {exc!r}")
+            return {
+                "status": "error",
+                "error": str(exc),
+                "processed_items": 0,
+                "failed_items": len(failed_ids),
+                "total_items": len(epigraph_ids),
+            }
+
+        self._after_commit(links_changed=bool(changes["word_link_changes"]))
+        return {
+            "status": "success",
+            "processed_items": len(epigraph_ids) - len(failed_ids),
+            "failed_items": len(failed_ids),
+            "failed_ids": failed_ids,
+            "total_items": len(epigraph_ids),
+            "new_words": new_words,
+            **changes,
+            "duration_seconds": round(time.perf_counter() - started_at, 3),
+        }
+
+    def index_epigraph(self, epigraph: Epigraph) -> list[Word]:
+        """Re-index one epigraph's words and return them in reading order."""
+        tokens = tokenize_epigraph_text(epigraph.epigraph_text)
+        items, text_hashes = self._load_epigraph_texts([epigraph.id])
+        index, _ = self.build_index(items)
+        if self._has_index_state():
+            _, changes = self.apply(index, text_hashes, [epigraph.id])
+            self.session.commit()
+            self._after_commit(links_changed=bool(changes["word_link_changes"]))
+        else:
+            self.rebuild()
+
+        word_ids = self._resolve_word_ids(list(index.frequencies))
+        ordered_ids = list(dict.fromkeys(word_ids[(word_text, classification)] for word_text, classification, _ in tokens))
+        words_by_id = {
+            word.id: word
+            for word in self.session.execute(select(Word).where(Word.id.in_(ordered_ids))).scalars()
+        }
+        return [words_by_id[word_id] for word_id in ordered_ids]
+
+    def write(self, index: WordIndex, text_hashes: dict[int, str]) -> int:
+        """
+        Replace every link, frequency and fingerprint with `index` without committing.
+
+        Returns the number of new words.
+        """
+        self.session.execute(delete(EpigraphWordLink))
+        self.session.execute(delete(WordLink))
+        self.session.execute(delete(EpigraphWordIndex))
+        self.session.execute(update(Word).values(frequency=0))
+
+        word_ids, new_words = self._ensure_words(index)
+        self._update_frequencies(
+            [(word_ids[key], count) for key, count in index.frequencies.items()],
+            additive=False,
+        )
+        self._copy_rows(
+            EpigraphWordLink.__tablename__,
+            ("epigraph_id", "word_id"),
+            self._epigraph_links(index, word_ids),
+        )
+        self._copy_rows(
+            WordLink.__tablename__,
+            ("from_word_id", "to_word_id", "count"),
+            [
+                (word_ids[from_key], word_ids[to_key], count)
+                for (from_key, to_key), count in index.bigrams.items()
+            ],
+        )
+        self._insert_states(index, word_ids, text_hashes)
+        self._refresh_word_stats()
+        return new_words
+
+    def apply(
+        self,
+        index: WordIndex,
+        text_hashes: dict[int, str],
+        epigraph_ids: list[int],
+    ) -> tuple[int, dict[str, int]]:
+        """
+        Swap the contribution of `epigraph_ids` for the one in `index` without committing.
+
+        The previous counts come from each epigraph's stored state, so only the
+        signed difference is written to word frequencies and bigram counts, and
+        only the words involved have their rollups recomputed.
+        Returns the number of new words and the size of the applied delta.
+        """
+        word_ids, new_words = self._ensure_words(index)
+
+        frequency_delta: Counter[int] = Counter()
+        bigram_delta: Counter[tuple[int, int]] = Counter()
+        for batch in _batches(epigraph_ids, STATE_BATCH_SIZE):
+            statement = select(EpigraphWordIndex.word_counts, EpigraphWordIndex.bigram_counts).where(
+                EpigraphWordIndex.epigraph_id.in_(batch)
+            )
+            for word_counts, bigram_counts in self.session.execute(statement):
+                for word_id, count in word_counts:
+                    frequency_delta[word_id] -= count
+                for from_word_id, to_word_id, count in bigram_counts:
+                    bigram_delta[(from_word_id, to_word_id)] -= count
+
+        for key, count in index.frequencies.items():
+            frequency_delta[word_ids[key]] += count
+        for (from_key, to_key), count in index.bigrams.items():
+            bigram_delta[(word_ids[from_key], word_ids[to_key])] += count
+
+        frequency_rows = [(word_id, delta) for word_id, delta in frequency_delta.items() if delta]
+        bigram_rows = [(from_id, to_id, delta) for (from_id, to_id), delta in bigram_delta.items() if delta]
+        self._update_frequencies(frequency_rows, additive=True)
+        self._apply_bigram_deltas(bigram_rows)
+
+        for batch in _batches(epigraph_ids, WRITE_BATCH_SIZE):
+            self.session.execute(delete(EpigraphWordLink).where(EpigraphWordLink.epigraph_id.in_(batch)))
+            self.session.execute(delete(EpigraphWordIndex).where(EpigraphWordIndex.epigraph_id.in_(batch)))
+        self._copy_rows(
+            EpigraphWordLink.__tablename__,
+            ("epigraph_id", "word_id"),
+            self._epigraph_links(index, word_ids),
+        )
+        self._insert_states(index, word_ids, text_hashes)
+        self._refresh_word_stats(list(frequency_delta))
+
+        return new_words, {
+            "frequency_changes": len(frequency_rows),
+            "word_link_changes": len(bigram_rows),
+            "epigraph_links": index.epigraph_link_count,
+        }
+
+    def _has_index_state(self) -> bool:
+        """
+        Whether any epigraph's contribution is stored. Counts written before
+        fingerprints were kept have nothing to subtract, so applying deltas
+        on top of them would count every epigraph twice.
+        """
+        return self.session.execute(select(EpigraphWordIndex.epigraph_id).limit(1)).first() is not None
+
+    def _after_commit(self, *, links_changed: bool) -> None:
+        """Refresh the lookup and graph views derived from the committed word tables."""
+        word_lookup.invalidate()
+        if links_changed:
+            word_graph.publish(self.session)
+
+    def _load_epigraph_texts(
+        self,
+        epigraph_ids: list[int] | None = None,
+    ) -> tuple[list[tuple[int, str]], dict[int, str]]:
+        statement = select(Epigraph.id, Epigraph.epigraph_text, func.md5(Epigraph.epigraph_text)).where(
+            Epigraph.epigraph_text.is_not(None)
+        )
+        if epigraph_ids is None:
+            rows = self.session.execute(statement).all()
+        else:
+            rows = [
+                row
+                for batch in _batches(epigraph_ids, WRITE_BATCH_SIZE)
+                for row in self.session.execute(statement.where(Epigraph.id.in_(batch)))
+            ]
+        items = [(epigraph_id, epigraph_text) for epigraph_id, epigraph_text, _ in rows]
+        text_hashes = {epigraph_id: text_hash for epigraph_id, _, text_hash in rows}
+        return items, text_hashes
+
+    @staticmethod
+    def _epigraph_links(index: WordIndex, word_ids: dict[WordKey, int]) -> list[tuple[int, int]]:
+        return [
+            (epigraph_id, word_ids[key])
+            for epigraph_id, counts in index.epigraph_counts.items()
+            for key in counts
+        ]
+
+    def _ensure_words(self, index: WordIndex) -> tuple[dict[WordKey, int], int]:
+        """Resolve ids for every word in `index`, inserting missing ones with zero frequency."""
+        word_ids = self._resolve_word_ids(list(index.frequencies))
+        new_keys = [key for key in index.frequencies if key not in word_ids]
+        word_ids.update(self._insert_words(new_keys, index))
+        return word_ids, len(new_keys)
+
+    def _resolve_word_ids(self, keys: list[WordKey]) -> dict[WordKey, int]:
+        """Map `(word, classification)` keys to the oldest matching word row."""
+        word_ids: dict[WordKey, int] = {}
+        wanted = set(keys)
+        words = sorted({word_text for word_text, _ in keys})
+        for batch in _batches(words, WRITE_BATCH_SIZE):
+            statement = (
+                select(Word.id, Word.word, Word.classification)
+                .where(Word.word.in_(batch))
+                .order_by(Word.id)
+            )
+            for word_id, word_text, classification in self.session.execute(statement):
+                key = (word_text, classification)
+                if key in wanted:
+                    word_ids.setdefault(key, word_id)
+        return word_ids
+
+    def _insert_words(self, keys: list[WordKey], index: WordIndex) -> dict[WordKey, int]:
+        word_ids = {}
+        for batch in _batches(keys, WRITE_BATCH_SIZE):
+            rows = [
+                {
+                    "word": word_text,
+                    "classification": classification,
+                    "attributes": index.attributes[(word_text, classification)],
+                    "frequency": 0,
+                }
+                for word_text, classification in batch
+            ]
+            statement = insert(Word).values(rows).returning(Word.id, Word.word, Word.classification)
+            for word_id, word_text, classification in self.session.execute(statement):
+                word_ids[(word_text, classification)] = word_id
+        return word_ids
+
+    def _update_frequencies(self, rows: list[tuple[int, int]], *, additive: bool) -> None:
+        for batch in _batches(rows, WRITE_BATCH_SIZE):
+            counts = values(
+                column("id", Integer),
+                column("frequency", Integer),
+                name="word_counts",
+            ).data(batch)
+            frequency = Word.frequency + counts.c.frequency if additive else counts.c.frequency
+            self.session.execute(
+                update(Word)
+                .where(Word.id == counts.c.id)
+                .values(frequency=frequency)
+                .execution_options(synchronize_session=False)
+            )
+
+    def _apply_bigram_deltas(self, rows: list[tuple[int, int, int]]) -> None:
+        """Add signed deltas to `WordLink.count`, dropping links that no longer occur."""
+        for batch in _batches(rows, WRITE_BATCH_SIZE):
+            statement = insert(WordLink).values([
+                {"from_word_id": from_word_id, "to_word_id": to_word_id, "count": delta}
+                for from_word_id, to_word_id, delta in batch
+            ])
+            self.session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[WordLink.from_word_id, WordLink.to_word_id],
+                    set_={"count": WordLink.count + statement.excluded.count},
+                )
+            )
+
+        decremented_ids = sorted({from_word_id for from_word_id, _, delta in rows if delta < 0})
+        for batch in _batches(decremented_ids, WRITE_BATCH_SIZE):
+            self.session.execute(
+                delete(WordLink).where(WordLink.from_word_id.in_(batch), WordLink.count <= 0)
+            )
+
+    def _refresh_word_stats(self, word_ids: list[int] | None = None) -> None:
+        """Recompute the epigraph and bigram rollups on `Word` for `word_ids`, or for every word."""
+        for batch in [None] if word_ids is None else _batches(word_ids, WRITE_BATCH_SIZE):
+            reset = update(Word).values({column_name: 0 for column_name, _ in WORD_STAT_SOURCES})
+            if batch is not None:
+                reset = reset.where(Word.id.in_(batch))
+            self.session.execute(reset.execution_options(synchronize_session=False))
+
+            for column_name, source in WORD_STAT_SOURCES:
+                counts = select(source.label("word_id"), func.count().label("count")).group_by(source)
+                if batch is not None:
+                    counts = counts.where(source.in_(batch))
+                counts = counts.subquery()
+                self.session.execute(
+                    update(Word)
+                    .where(Word.id == counts.c.word_id)
+                    .values({column_name: counts.c.count})
+                    .execution_options(synchronize_session=False)
+                )
+
+    def _insert_states(
+        self,
+        index: WordIndex,
+        word_ids: dict[WordKey, int],
+        text_hashes: dict[int, str],
+    ) -> None:
+        rows = [
+            {
+                "epigraph_id": epigraph_id,
+                "text_hash": text_hashes[epigraph_id],
+                "word_counts": [[word_ids[key], count] for key, count in counts.items()],
+                "bigram_counts": [
+                    [word_ids[from_key], word_ids[to_key], count]
+                    for (from_key, to_key), count in index.epigraph_bigrams[epigraph_id].items()
+                ],
+            }
+            for epigraph_id, counts in index.epigraph_counts.items()
+        ]
+        for batch in _batches(rows, STATE_BATCH_SIZE):
+            self.session.execute(insert(EpigraphWordIndex).values(batch))
+
+    def _copy_rows(self, table_name: str, columns: tuple[str, ...], rows: list[tuple[int, ...]]) -> None:
+        if not rows:
+            return
+
+        driver_connection = self.session.connection().connection.driver_connection
+        with driver_connection.cursor() as cursor:
+            with cursor.copy(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
@@ -0,0 +1,147 @@
+import heapq
+import threading
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+from sqlalchemy import func, select
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.word import Word, WordSuggestion
+
+# Aleph/ayin marks and the apostrophes commonly typed in their place. They are
+# letters in Unicode, so they have to be dropped explicitly.
+IGNORED_CHARACTERS = frozenset("ʾʿʼʻ'‘’`´")
+
+# Prefixes up to this length match too much of the vocabulary to rank on every
+# request, so their best candidates are ranked once when the index is built.
+RANKED_PREFIX_LENGTH = 2
+MAX_SUGGESTIONS = 50
+
+
+def fold_word(text: str) -> str:
+    """Casefold and strip diacritics, aleph/ayin marks and punctuation, e.g. `ʾlmqh` -> `lmqh`."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(
+        character
+        for character in decomposed
+        if character.isalnum() and not unicodedata.combining(character) and character not in IGNORED_CHARACTERS
+    )
+
+
+class WordLookupIndex:
+    """
+    Words in a sorted array of folded keys, searched by binary search.
+
+    A prefix selects a contiguous range of keys. Within it, exact matches come
+    first, then words by descending frequency, shorter words first on ties.
+    """
+
+    def __init__(self, rows: Iterable[tuple[int, str, str | None, int]]):
+        entries = sorted(
+            (fold_word(word_text), -(frequency or 0), word_id, word_text, classification)
+            for word_id, word_text, classification, frequency in rows
+        )
+        entries = [entry for entry in entries if entry[0]]
+
+        self.keys = [entry[0] for entry in entries]
+        self.frequencies = array("q", (-entry[1] for entry in entries))
+        self.word_ids = array("q", (entry[2] for entry in entries))
+        self.words = [entry[3] for entry in entries]
+        self.classifications = [entry[4] for entry in entries]
+
+        candidates: dict[str, list[int]] = {}
+        for position, key in enumerate(self.keys):
+            for length in range(1, min(len(key), RANKED_PREFIX_LENGTH) + 1):
+                candidates.setdefault(key[:length], []).append(position)
+        self._ranked_prefixes = {
+            prefix: heapq.nsmallest(MAX_SUGGESTIONS, positions, key=self._rank)
+            for prefix, positions in candidates.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _rank(self, position: int) -> tuple[int, int, int]:
+        return -self.frequencies[position], len(self.keys[position]), position
+
+    def search(self, prefix: str, limit: int = 10) -> list[int]:
+        """Return the positions of the best `limit` words starting with `prefix`."""
+        folded = fold_word(prefix)
+        if not folded:
+            return []
+
+        start = bisect_left(self.keys, folded)
+        exact_end = bisect_right(self.keys, folded, start)
+        exact = heapq.nsmallest(limit, range(start, exact_end), key=self._rank)
+        if len(exact) >= limit:
+            return exact
+
+        if len(folded) <= RANKED_PREFIX_LENGTH:
+            candidates = [
+                position
+                for position in self._ranked_prefixes.get(folded, [])
+                if position >= exact_end
+            ]
+        else:
+            candidates = range(exact_end, bisect_left(self.keys, folded + "\U0010ffff", exact_end))
+        return exact + heapq.nsmallest(limit - len(exact), candidates, key=self._rank)
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[WordSuggestion]:
+        return [
+            WordSuggestion(
+                id=self.word_ids[position],
+                word=self.words[position],
+                classification=self.classifications[position],
+                frequency=self.frequencies[position],
+            )
+            for position in self.search(prefix, min(limit, MAX_SUGGESTIONS))
+        ]
+
+
+class WordLookupService:
+    """
+    Keeps a `WordLookupIndex` of the `word` table in process memory.
+
+    The table's row count and latest `updated_at` are checked at most every
+    `WORD_LOOKUP_REFRESH_SECONDS`, and the index is rebuilt when either moved.
+    `invalidate` forces the check on the next lookup.
+    """
+
+    def __init__(self):
+        self._index: WordLookupIndex | None = None
+        self._version: tuple | None = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        self._checked_at = float("-inf")
+
+    def get_index(self, session: Session) -> WordLookupIndex:
+        if self._is_fresh():
+            return self._index
+
+        with self._lock:
+            if not self._is_fresh():
+                version = tuple(session.execute(select(func.count(Word.id), func.max(Word.updated_at))).one())
+                if self._index is None or version != self._version:
+                    rows = session.execute(select(Word.id, Word.word, Word.classification, Word.frequency))
+                    self._index = WordLookupIndex(rows)
+                    self._version = version
+                self._checked_at = time.monotonic()
+        return self._index
+
+    def suggest(self, session: Session, prefix: str, limit: int = 10) -> list[WordSuggestion]:
+        return self.get_index(session).suggest(prefix, limit)
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._index is not None
+            and time.monotonic() - self._checked_at < settings.WORD_LOOKUP_REFRESH_SECONDS
+        )
+
+
+word_lookup = WordLookupService()
@@ -1,3 +1,5 @@
+from celery import chord
+from celery.result import AsyncResult
 from sqlmodel import Session
 
 from app.core.celery_app import celery_app
@@ -7,6 +9,7 @@ from app.models.pipeline_run import PipelineTrigger
 from app.services.enrichment.embeddings import EmbeddingsService
 from app.services.pipeline.orchestrator import DasiPipelineOrchestrator
 from app.services.pipeline.run_service import PipelineRunService
+from app.services.pipeline.sharding import ShardedRangeImportService
 
 
 @celery_app.task(name="app.workers.pipeline_tasks.run_dasi_sync_pipeline", bind=True)
@@ -32,6 +35,7 @@ def dispatch_nightly_dasi_sync() -> str:
             "import_epigraphs": True,
             "incremental": True,
             "update_existing": True,
+            "update_word_index": True,
             "run_chunking": True,
             "generate_embeddings": True,
             "reindex_search": True,
@@ -51,6 +55,78 @@ def dispatch_nightly_dasi_sync() -> str:
         return str(run.uuid)
 
 
+def dispatch_range_import_stage(
+    pipeline_run_uuid: str,
+    stage_name: str,
+    shards: list[dict],
+    parameters: dict,
+    retry_round: int = 0,
+) -> AsyncResult:
+    header = [
+        import_range_shard.si(pipeline_run_uuid, stage_name, shard, parameters).set(queue="pipeline")
+        for shard in shards
+    ]
+    callback = finalize_range_import_stage.s(
+        pipeline_run_uuid,
+        stage_name,
+        parameters,
+        retry_round,
+    ).set(queue="pipeline")
+    return chord(header)(callback)
+
+
+@celery_app.task(name="app.workers.pipeline_tasks.import_range_shard")
+def import_range_shard(pipeline_run_uuid: str, stage_name: str, shard: dict, parameters: dict) -> dict:
+    with Session(engine) as session:
+        return ShardedRangeImportService(session).run_shard(pipeline_run_uuid, stage_name, shard, parameters)
+
+
+@celery_app.task(name="app.workers.pipeline_tasks.finalize_range_import_stage")
+def finalize_range_import_stage(
+    shard_results: list[dict],
+    pipeline_run_uuid: str,
+    stage_name: str,
+    parameters: dict,
+    retry_round: int = 0,
+) -> str:
+    with Session(engine) as session:
+        sharded_import = ShardedRangeImportService(session)
+        stage_metrics = sharded_import.record_stage(
+            pipeline_run_uuid,
+            stage_name,
+            shard_results,
+            retry_round=retry_round,
+        )
+
+        if stage_metrics["failed_ids"] and retry_round < settings.DASI_RANGE_SHARD_RETRY_ROUNDS:
+            dispatch_range_import_stage(
+                pipeline_run_uuid,
+                stage_name,
+                [{"item_ids": stage_metrics["failed_ids"]}],
+                parameters,
+                retry_round + 1,
+            )
+            return pipeline_run_uuid
+
+        if stage_metrics["status"] == "error":
+            sharded_import.fail(pipeline_run_uuid, stage_name, stage_metrics)
+            return pipeline_run_uuid
+
+        next_stage = sharded_import.next_stage(stage_name, parameters)
+        if next_stage is not None:
+            dispatch_range_import_stage(
+                pipeline_run_uuid,
+                next_stage,
+                sharded_import.plan_shards(parameters),
+                parameters,
+            )
+            return pipeline_run_uuid
+
+        sharded_import.complete(pipeline_run_uuid, parameters)
+
+    return pipeline_run_uuid
+
+
 @celery_app.task(name="app.workers.pipeline_tasks.flush_pending_chunk_embeddings")
 def flush_pending_chunk_embeddings() -> dict:
     with Session(engine) as session:
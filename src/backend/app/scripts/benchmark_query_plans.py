@@ -0,0 +1,553 @@
+"""
+Micro-benchmark for compiling `OpenSearchService.search_epigraphs` queries.
+
+Compares the previous builder, which expanded the search fields and built the
+whole bool query as a dict tree on every call, against the cached query plans
+in `app.services.search.query_plan`. Reports the median/p95 time to produce the
+serialized request body and its size for a set of representative queries.
+
+Usage (from src/backend/app):
+
+    PYTHONPATH=. python scripts/benchmark_query_plans.py [--repeat N] [--query TEXT ...]
+"""
+
+import argparse
+import re
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.services.search.epigraph_search_schema import get_epigraph_searchable_field_map
+from app.services.search.query_plan import (
+    HIGHLIGHT_FIELDS,
+    HIGHLIGHT_JSON,
+    QueryParser,
+    compile_search_query,
+    get_query_plan,
+    resolve_field_groups,
+    serialize_search_body,
+    to_json,
+)
+
+DEFAULT_QUERIES = (
+    "almaqah",
+    "krb ʾl bn ḏmrʿly",
+    '"bn ḥlk" mlk',
+    "+mlk sbʾ -ḥḍrmwt",
+    "ʾl* wtr",
+    '"ʿṯtr ḏ-qbḍm" +hqny -qtbn',
+)
+FIELD_SETS: Dict[str, Optional[List[str]]] = {
+    "all fields": None,
+    "title+text": ["title", "epigraph_text"],
+    "translations": ["translations"],
+}
+
+
+def legacy_build_search_body(query: str, fields: Optional[List[str]], skip: int = 0, limit: int = 25) -> Dict[str, Any]:
+    searchable_fields = get_epigraph_searchable_field_map()
+
+    if not fields:
+        search_fields: List[str] = []
+        for field_name, subfields in searchable_fields.items():
+            if subfields is None:
+                search_fields.append(field_name)
+            else:
+                search_fields.extend([field_name + "." + subfield for subfield in subfields])
+    else:
+        search_fields = []
+        for f in fields:
+            subfields = searchable_fields.get(f)
+            if subfields is not None:
+                search_fields.extend([f + "." + sub for sub in subfields])
+            else:
+                search_fields.append(f)
+
+    top_fields = [f for f in search_fields if "." not in f]
+    nested_fields = [f for f in search_fields if "." in f]
+
+    ngram_fields = [f for f in top_fields]
+    stemmed_fields = [f for f in top_fields]
+    keyword_fields = [f + ".keyword" for f in top_fields]
+
+    normalised_query = re.sub(r'_', ' ', query)
+    normalised_query = " ".join(normalised_query.split())
+
+    parser = QueryParser()
+    parsed_query = parser.parse_query(normalised_query)
+
+    must_queries = []
+    should_queries = []
+    must_not_queries = []
+
+    for term in parsed_query["must"]:
+        has_wildcard = "*" in term or "?" in term
+        if has_wildcard:
+            wildcard_queries = []
+            if top_fields:
+                wildcard_queries.append({
+                    "query_string": {
+                        "query": term.strip('"'),
+                        "fields": top_fields,
+                        "default_operator": "OR",
+                        "analyze_wildcard": True,
+                        "boost": 3
+                    }
+                })
+                if keyword_fields:
+                    wildcard_queries.append({
+                        "query_string": {
+                            "query": term.strip('"'),
+                            "fields": keyword_fields,
+                            "default_operator": "OR",
+                            "analyze_wildcard": True,
+                            "boost": 5
+                        }
+                    })
+            for nf in nested_fields:
+                path, field = nf.split(".", 1)
+                wildcard_queries.append({
+                    "nested": {
+                        "path": path,
+                        "query": {
+                            "query_string": {
+                                "query": term.strip('"'),
+                                "fields": [nf],
+                                "default_operator": "OR",
+                                "analyze_wildcard": True
+                            }
+                        }
+                    }
+                })
+            if len(wildcard_queries) == 1:
+                must_queries.append(wildcard_queries[0])
+            else:
+                must_queries.append({
+                    "bool": {
+                        "should": wildcard_queries,
+                        "minimum_should_match": 1
+                    }
+                })
+        else:
+            is_phrase = term.startswith('"') and term.endswith('"')
+            clean_term = term.strip('"')
+
+            term_should_queries = []
+            if top_fields:
+                if is_phrase:
+                    term_should_queries.append({
+                        "match_phrase": {
+                            "epigraph_text.raw": {
+                                "query": clean_term,
+                                "boost": 15
+                            }
+                        }
+                    })
+
+                    term_should_queries.append({
+                        "match_phrase": {
+                            "epigraph_text": {
+                                "query": clean_term,
+                                "boost": 10
+                            }
+                        }
+                    })
+
+                    for field in stemmed_fields:
+                        if field != "epigraph_text":
+                            term_should_queries.append({
+                                "match_phrase": {
+                                    f"{field}.raw": {
+                                        "query": clean_term,
+                                        "boost": 12
+                                    }
+                                }
+                            })
+                            term_should_queries.append({
+                                "match_phrase": {
+                                    field: {
+                                        "query": clean_term,
+                                        "boost": 8
+                                    }
+                                }
+                            })
+
+                    term_should_queries.append({
+                        "multi_match": {
+                            "query": clean_term,
+                            "fields": [f + ".raw" for f in stemmed_fields if f + ".raw"],
+                            "type": "phrase",
+                            "boost": 6
+                        }
+                    })
+
+                    term_should_queries.append({
+                        "query_string": {
+                            "query": f'"{clean_term}"',
+                            "fields": [f + ".raw" for f in top_fields],
+                            "default_operator": "AND",
+                            "boost": 5
+                        }
+                    })
+
+                    term_should_queries.append({
+                        "multi_match": {
+                            "query": clean_term,
+                            "fields": [f + ".raw" for f in stemmed_fields],
+                            "type": "phrase_prefix",
+                            "boost": 4
+                        }
+                    })
+                else:
+                    term_should_queries.append({
+                        "multi_match": {
+                            "query": clean_term,
+                            "fields": stemmed_fields,
+                            "type": "best_fields",
+                            "boost": 3
+                        }
+                    })
+                    term_should_queries.append({
+                        "multi_match": {
+                            "query": clean_term,
+                            "fields": ngram_fields,
+                            "type": "best_fields",
+                            "boost": 2
+                        }
+                    })
+
+                if keyword_fields:
+                    if is_phrase:
+                        term_should_queries.append({
+                            "query_string": {
+                                "query": f'"{clean_term}"',
+                                "fields": keyword_fields,
+                                "default_operator": "AND",
+                                "boost": 6
+                            }
+                        })
+                    else:
+                        term_should_queries.append({
+                            "multi_match": {
+                                "query": clean_term,
+                                "fields": keyword_fields,
+                                "type": "best_fields",
+                                "boost": 5
+                            }
+                        })
+
+            for nf in nested_fields:
+                path, field = nf.split(".", 1)
+                if is_phrase:
+                    term_should_queries.append({
+                        "nested": {
+                            "path": path,
+                            "query": {
+                                "match_phrase": {
+                                    nf: {
+                                        "query": clean_term,
+                                        "boost": 5
+                                    }
+                                }
+                            }
+                        }
+                    })
+                    term_should_queries.append({
+                        "nested": {
+                            "path": path,
+                            "query": {
+                                "multi_match": {
+                                    "query": clean_term,
+                                    "fields": [nf],
+                                    "type": "phrase",
+                                    "boost": 4
+                                }
+                            }
+                        }
+                    })
+                    term_should_queries.append({
+                        "nested": {
+                            "path": path,
+                            "query": {
+                                "query_string": {
+                                    "query": f'"{clean_term}"',
+                                    "fields": [nf],
+                                    "default_operator": "AND",
+                                    "boost": 3
+                                }
+                            }
+                        }
+                    })
+                else:
+                    term_should_queries.append({
+                        "nested": {
+                            "path": path,
+                            "query": {
+                                "multi_match": {
+                                    "query": clean_term,
+                                    "fields": [nf],
+                                    "type": "best_fields"
+                                }
+                            }
+                        }
+                    })
+
+            if len(term_should_queries) == 1:
+                must_queries.append(term_should_queries[0])
+            else:
+                must_queries.append({
+                    "bool": {
+                        "should": term_should_queries,
+                        "minimum_should_match": 1
+                    }
+                })
+
+    if parsed_query["should"]:
+        should_term_query = " ".join(parsed_query["should"])
+        has_wildcard = "*" in should_term_query or "?" in should_term_query
+
+        if has_wildcard:
+            if top_fields:
+                should_queries.append({
+                    "query_string": {
+                        "query": should_term_query,
+                        "fields": top_fields,
+                        "default_operator": "OR",
+                        "analyze_wildcard": True,
+                        "boost": 3
+                    }
+                })
+                if keyword_fields:
+                    should_queries.append({
+                        "query_string": {
+                            "query": should_term_query,
+                            "fields": keyword_fields,
+                            "default_operator": "OR",
+                            "analyze_wildcard": True,
+                            "boost": 5
+                        }
+                    })
+            for nf in nested_fields:
+                path, field = nf.split(".", 1)
+                should_queries.append({
+                    "nested": {
+                        "path": path,
+                        "query": {
+                            "query_string": {
+                                "query": should_term_query,
+                                "fields": [nf],
+                                "default_operator": "OR",
+                                "analyze_wildcard": True
+                            }
+                        }
+                    }
+                })
+        else:
+            if top_fields:
+                should_queries.append({
+                    "multi_match": {
+                        "query": should_term_query,
+                        "fields": stemmed_fields,
+                        "type": "best_fields",
+                        "minimum_should_match": "50%",
+                        "boost": 1
+                    }
+                })
+                should_queries.append({
+                    "multi_match": {
+                        "query": should_term_query,
+                        "fields": ngram_fields,
+                        "type": "best_fields",
+                        "minimum_should_match": "50%",
+                        "boost": 2
+                    }
+                })
+                if keyword_fields:
+                    should_queries.append({
+                        "multi_match": {
+                            "query": should_term_query,
+                            "fields": keyword_fields,
+                            "type": "best_fields",
+                            "boost": 5
+                        }
+                    })
+            for nf in nested_fields:
+                path, field = nf.split(".", 1)
+                should_queries.append({
+                    "nested": {
+                        "path": path,
+                        "query": {
+                            "multi_match": {
+                                "query": should_term_query,
+                                "fields": [nf],
+                                "type": "best_fields",
+                                "minimum_should_match": "50%"
+                            }
+                        }
+                    }
+                })
+
+    for term in parsed_query["must_not"]:
+        has_wildcard = "*" in term or "?" in term
+        term_must_not_queries = []
+
+        if has_wildcard:
+            if top_fields:
+                term_must_not_queries.append({
+                    "query_string": {
+                        "query": term.strip('"'),
+                        "fields": top_fields,
+                        "default_operator": "OR",
+                        "analyze_wildcard": True
+                    }
+                })
+                if keyword_fields:
+                    term_must_not_queries.append({
+                        "query_string": {
+                            "query": term.strip('"'),
+                            "fields": keyword_fields,
+                            "default_operator": "OR",
+                            "analyze_wildcard": True
+                        }
+                    })
+            for nf in nested_fields:
+                path, field = nf.split(".", 1)
+                term_must_not_queries.append({
+                    "nested": {
+                        "path": path,
+                        "query": {
+                            "query_string": {
+                                "query": term.strip('"'),
+                                "fields": [nf],
+                                "default_operator": "OR",
+                                "analyze_wildcard": True
+                            }
+                        }
+                    }
+                })
+        else:
+            if top_fields:
+                term_must_not_queries.append({
+                    "multi_match": {
+                        "query": term.strip('"'),
+                        "fields": stemmed_fields + ngram_fields,
+                        "type": "best_fields"
+                    }
+                })
+                if keyword_fields:
+                    term_must_not_queries.append({
+                        "multi_match": {
+                            "query": term.strip('"'),
+                            "fields": keyword_fields,
+                            "type": "best_fields"
+                        }
+                    })
+            for nf in nested_fields:
+                path, field = nf.split(".", 1)
+                term_must_not_queries.append({
+                    "nested": {
+                        "path": path,
+                        "query": {
+                            "multi_match": {
+                                "query": term.strip('"'),
+                                "fields": [nf],
+                                "type": "best_fields"
+                            }
+                        }
+                    }
+                })
+
+        must_not_queries.append({
+            "bool": {
+                "should": term_must_not_queries,
+                "minimum_should_match": 1
+            }
+        })
+
+    bool_query: Dict[str, Any] = {
+        "filter": [
+            {"term": {"dasi_published": True}}
+        ]
+    }
+
+    if must_queries:
+        bool_query["must"] = must_queries
+
+    if should_queries:
+        bool_query["should"] = should_queries
+        if not must_queries:
+            bool_query["minimum_should_match"] = 1
+
+    if must_not_queries:
+        bool_query["must_not"] = must_not_queries
+
+    search_body: Dict[str, Any] = {
+        "query": {
+            "bool": bool_query
+        },
+        "from": skip,
+        "size": limit,
+    }
+
+    search_body["highlight"] = {"fields": {field: {} for field in HIGHLIGHT_FIELDS}}
+    search_body["sort"] = ["_score"]
+    return search_body
+
+
+def legacy_compile(query: str, fields: Optional[List[str]]) -> str:
+    return to_json(legacy_build_search_body(query, fields))
+
+
+def plan_compile(query: str, fields: Optional[List[str]]) -> str:
+    return serialize_search_body(
+        {"from": 0, "size": 25, "sort": ["_score"]},
+        query=compile_search_query(query, fields),
+        highlight=HIGHLIGHT_JSON,
+    )
+
+
+def cold_plan_compile(query: str, fields: Optional[List[str]]) -> str:
+    get_query_plan.cache_clear()
+    resolve_field_groups.cache_clear()
+    return plan_compile(query, fields)
+
+
+def time_compiler(compiler: Callable[[str, Optional[List[str]]], str], queries: List[str], fields, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        for query in queries:
+            started_at = time.perf_counter()
+            compiler(query, fields)
+            timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+def summarize(timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+    return f"median {statistics.median(ordered):8.3f} ms  p95 {p95:8.3f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--query", action="append", dest="queries", default=None)
+    args = parser.parse_args()
+    queries = args.queries or list(DEFAULT_QUERIES)
+
+    for label, fields in FIELD_SETS.items():
+        legacy = time_compiler(legacy_compile, queries, fields, args.repeat)
+        cold = time_compiler(cold_plan_compile, queries, fields, max(1, args.repeat // 10))
+        warm = time_compiler(plan_compile, queries, fields, args.repeat)
+        legacy_bytes = sum(len(legacy_compile(query, fields).encode()) for query in queries) // len(queries)
+        plan_bytes = sum(len(plan_compile(query, fields).encode()) for query in queries) // len(queries)
+        speedup = statistics.median(legacy) / statistics.median(warm)
+
+        print(f"{label:<13} queries={len(queries)}")
+        print(f"  dict builder     {summarize(legacy)}  body {legacy_bytes:7d} B")
+        print(f"  plan (cold)      {summarize(cold)}")
+        print(f"  plan (cached)    {summarize(warm)}  body {plan_bytes:7d} B  ({speedup:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Micro-benchmark for DASI page parsing.
+
+Compares the previous BeautifulSoup (`html.parser`) extraction against the lxml
+parsers in `app.services.importers.scraping` over archived DASI pages, and
+reports the median/p95 parse time per page for each.
+
+Usage (from src/backend/app):
+
+    PYTHONPATH=. python scripts/benchmark_scraping.py [--archive-dir DIR] [--html-dir DIR]
+
+Pages are read from the response archive (`DASI_ARCHIVE_DIR`, populated by
+running imports with `DASI_ARCHIVE_MODE=record`) and/or a directory of saved
+`.html` files.
+"""
+
+import argparse
+import json
+import re
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+from app.core.config import settings
+from app.services.importers.scraping import parse_epigraph_page, parse_site_page
+
+
+def _identity_link(link: str) -> str:
+    return link
+
+
+def legacy_parse_epigraph_page(body: bytes) -> list[dict[str, Any]]:
+    soup = BeautifulSoup(body, "html.parser")
+
+    alert_box = soup.find("div", {"id": "alert_box"})
+    if alert_box and "not found or not yet published" in alert_box.get_text().strip().lower():
+        return []
+
+    image_data = []
+    main_img = soup.find("img", {"class": "cloudzoom"})
+    if isinstance(main_img, Tag):
+        rec_id_match = re.search(r"recId=(\d+)", str(main_img.get("src", "") or ""))
+        if rec_id_match:
+            caption_text = str(main_img.get("title", "") or "")
+            caption_match = re.search(r'"captionSource":"#([^"]+)"', str(main_img.get("data-cloudzoom", "") or ""))
+            if caption_match:
+                caption_element = soup.find("div", {"id": caption_match.group(1)})
+                if caption_element:
+                    caption_text = caption_element.get_text(separator=" ").strip()
+            image_data.append({"image_id": rec_id_match.group(1), "caption": caption_text, "is_main": True})
+
+    for link in soup.find_all("a", {"class": "cloudzoom-gallery"}):
+        data_cloudzoom = str(link.get("data-cloudzoom", "") or "")
+        image_url_match = re.search(r"image: '([^']+)'", data_cloudzoom)
+        if not image_url_match:
+            continue
+        rec_id_match = re.search(r"recId=(\d+)", image_url_match.group(1))
+        if not rec_id_match:
+            continue
+        image_id = rec_id_match.group(1)
+        caption_text = str(link.get("title", "") or "")
+        caption_source_match = re.search(r"captionSource: '#([^']+)'", data_cloudzoom)
+        if caption_source_match:
+            caption_element = soup.find("div", {"id": caption_source_match.group(1)})
+            if caption_element:
+                caption_text = caption_element.get_text(separator=" ").strip()
+        if not any(img["image_id"] == image_id for img in image_data):
+            image_data.append({"image_id": image_id, "caption": caption_text, "is_main": False})
+
+    return image_data
+
+
+def _legacy_parse_table(table: Tag) -> dict | list:
+    for br in table.find_all("br"):
+        br.replace_with("\n")
+
+    def clean(cell: Tag) -> str:
+        for a in cell.find_all("a"):
+            if a.get("href"):
+                a["href"] = _identity_link(a["href"])
+        for tag in cell.find_all(True):
+            if tag.name != "a":
+                tag.unwrap()
+        return cell.decode_contents()
+
+    rows = table.find_all("tr")
+    if any(
+        len(cells) == 2 and cells[0].find("strong")
+        for cells in (row.find_all(["td", "th"]) for row in rows)
+    ):
+        result = {}
+        for row in rows:
+            cells = row.find_all(["td", "th"])
+            if len(cells) == 2:
+                key = cells[0].get_text(strip=True).replace(":", "")
+                value = clean(cells[1])
+                if key:
+                    result[key] = value
+        return result
+    return [clean(cell) for row in rows for cell in row.find_all(["td", "th"])]
+
+
+def legacy_parse_site_page(body: bytes) -> dict[str, Any]:
+    soup = BeautifulSoup(body.decode("utf-8", errors="replace"), "html.parser")
+    content_dict: dict[str, Any] = {}
+
+    first_row_fluid = soup.find("div", class_="row-fluid")
+    inner_row_fluid = first_row_fluid.find("div", class_="row-fluid") if isinstance(first_row_fluid, Tag) else None
+    accordion = inner_row_fluid.find("div", class_="accordion") if isinstance(inner_row_fluid, Tag) else None
+    if not isinstance(accordion, Tag):
+        return content_dict
+
+    for h3 in accordion.find_all("h3"):
+        header_text = h3.get_text(strip=True)
+        content_dict[header_text] = {"header": header_text, "sections": [], "parsed_data": {}}
+        current = h3.next_sibling
+        while current:
+            if isinstance(current, Tag):
+                if current.name == "h3":
+                    break
+                if current.name == "table":
+                    content_dict[header_text]["sections"].append({"section": header_text, "table": str(current)})
+                    content_dict[header_text]["parsed_data"] = _legacy_parse_table(current)
+                elif current.name == "div" and "accordion-group" in (current.get("class") or []):
+                    accordion_inner = current.find("div", class_="accordion-inner")
+                    table = accordion_inner.find("table") if isinstance(accordion_inner, Tag) else None
+                    accordion_toggle = current.find("a", class_="accordion-toggle")
+                    if table and isinstance(accordion_toggle, Tag):
+                        section_title = accordion_toggle.get_text(strip=True)
+                        parsed_data = _legacy_parse_table(table)
+                        content_dict[header_text]["sections"].append({"section": section_title, "table": str(table)})
+                        content_dict[header_text]["parsed_data"][section_title] = parsed_data
+            current = current.next_sibling
+
+    return content_dict
+
+
+def load_pages(archive_dir: Path | None, html_dir: Path | None) -> dict[str, list[bytes]]:
+    """Group archived HTML pages into epigraph and site pages by URL."""
+    pages: dict[str, list[bytes]] = {"epigraph": [], "site": []}
+
+    def add(url: str, body: bytes) -> None:
+        if not body.lstrip()[:1] == b"<":
+            return
+        pages["epigraph" if "/epigraphs/" in url else "site"].append(body)
+
+    if archive_dir and (archive_dir / "index").exists():
+        for index_path in (archive_dir / "index").glob("*/*.json"):
+            entry = json.loads(index_path.read_text(encoding="utf-8"))
+            object_path = archive_dir / "objects" / entry["body_hash"][:2] / entry["body_hash"]
+            if object_path.exists():
+                add(entry["url"], object_path.read_bytes())
+
+    if html_dir:
+        for html_path in sorted(html_dir.glob("**/*.html")):
+            add(html_path.as_posix(), html_path.read_bytes())
+
+    return pages
+
+
+def time_parser(parser: Callable[[bytes], Any], bodies: list[bytes], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        for body in bodies:
+            started_at = time.perf_counter()
+            parser(body)
+            timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+def summarize(timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+    return f"median {statistics.median(ordered):8.3f} ms  p95 {p95:8.3f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--archive-dir", type=Path, default=Path(settings.DASI_ARCHIVE_DIR))
+    parser.add_argument("--html-dir", type=Path, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = load_pages(args.archive_dir, args.html_dir)
+    parsers = {
+        "epigraph": (legacy_parse_epigraph_page, lambda body: parse_epigraph_page(body).images),
+        "site": (legacy_parse_site_page, lambda body: parse_site_page(body, _identity_link)),
+    }
+
+    for page_type, (legacy_parser, lxml_parser) in parsers.items():
+        bodies = pages[page_type]
+        if not bodies:
+            print(f"{page_type:<9} no archived pages found")
+            continue
+
+        legacy = time_parser(legacy_parser, bodies, args.repeat)
+        current = time_parser(lxml_parser, bodies, args.repeat)
+        speedup = statistics.median(legacy) / statistics.median(current)
+        print(f"{page_type:<9} pages={len(bodies)}")
+        print(f"  bs4/html.parser  {summarize(legacy)}")
+        print(f"  lxml             {summarize(current)}  ({speedup:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark for epigraph search latency with and without highlighting.
+
+Runs representative queries through `OpenSearchService.search_epigraphs`
+against the configured index at several page sizes. Each query is run once
+with the highlight section every result search used to send, across all
+highlight fields, and once without it, as result searches now run. It also
+times the on-demand `highlight_epigraphs` call for the ids of that page.
+Reports the median/p95 round-trip time and OpenSearch's own `took`.
+
+Usage (from src/backend/app, with OpenSearch reachable):
+
+    PYTHONPATH=. python scripts/benchmark_search_highlighting.py [--repeat N] [--page-size N ...] [--query TEXT ...]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from app.services.search.opensearch import OpenSearchService
+
+DEFAULT_QUERIES = (
+    "almaqah",
+    "krb ʾl bn ḏmrʿly",
+    '"bn ḥlk" mlk',
+    "+mlk sbʾ -ḥḍrmwt",
+    "ʾl* wtr",
+)
+DEFAULT_PAGE_SIZES = (10, 25, 50, 100, 250)
+WARMUP_RUNS = 2
+
+
+def time_calls(call: Callable[[str], int], queries: List[str], repeat: int) -> Dict[str, list[float]]:
+    for _ in range(WARMUP_RUNS):
+        for query in queries:
+            call(query)
+
+    timings: Dict[str, list[float]] = {"round_trip": [], "took": []}
+    for _ in range(repeat):
+        for query in queries:
+            started_at = time.perf_counter()
+            took = call(query)
+            timings["round_trip"].append((time.perf_counter() - started_at) * 1000)
+            timings["took"].append(float(took))
+    return timings
+
+
+def summarize(timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+    return f"median {statistics.median(ordered):8.3f} ms  p95 {p95:8.3f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--page-size", type=int, action="append", dest="page_sizes", default=None)
+    parser.add_argument("--query", action="append", dest="queries", default=None)
+    args = parser.parse_args()
+    queries = args.queries or list(DEFAULT_QUERIES)
+    opensearch = OpenSearchService()
+
+    for page_size in args.page_sizes or DEFAULT_PAGE_SIZES:
+        def search(query: str, include_highlight: bool) -> int:
+            results = opensearch.search_epigraphs(
+                query=query,
+                limit=page_size,
+                source_includes=["id"],
+                include_highlight=include_highlight,
+            )
+            return results["took"]["hits"]
+
+        def highlight_page(query: str) -> int:
+            results = opensearch.search_epigraphs(query=query, limit=page_size, source_includes=["id"])
+            epigraph_ids = [int(hit["_source"]["id"]) for hit in results["hits"]]
+            started_at = time.perf_counter()
+            opensearch.highlight_epigraphs(query, epigraph_ids)
+            return round((time.perf_counter() - started_at) * 1000)
+
+        highlighted = time_calls(lambda query: search(query, True), queries, args.repeat)
+        plain = time_calls(lambda query: search(query, False), queries, args.repeat)
+        on_demand = time_calls(highlight_page, queries, args.repeat)
+        speedup = statistics.median(highlighted["round_trip"]) / statistics.median(plain["round_trip"])
+
+        print(f"page size {page_size:<4} queries={len(queries)}")
+        print(f"  with highlight     {summarize(highlighted['round_trip'])}  took {summarize(highlighted['took'])}")
+        print(
+            f"  without highlight  {summarize(plain['round_trip'])}  took {summarize(plain['took'])}"
+            f"  ({speedup:.1f}x faster)"
+        )
+        print(f"  page + highlight   {summarize(on_demand['round_trip'])}  highlight call {summarize(on_demand['took'])}")
+
+
+if __name__ == "__main__":
+    main()
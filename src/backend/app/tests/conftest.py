@@ -5,6 +5,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
 
+from app.core.config import settings
 from app.main import app
 from app.api.deps import get_db
 
@@ -16,6 +17,7 @@ from app.models.pipeline_run import PipelineRun
 from app.models.site import Site
 from app.models.object import Object
 from app.models.word import Word
+from app.services.search.result_cache import SearchResultCache
 
 
 TEST_DATABASE_URL = os.getenv(
@@ -51,6 +53,33 @@ def session_fixture(engine) -> Generator[Session, None, None]:
     connection.close()
 
 
+@pytest.fixture(autouse=True)
+def word_graph_dir(tmp_path, monkeypatch):
+    """Keep word graph snapshots published by the indexer out of the source tree."""
+    monkeypatch.setattr(settings, "WORD_GRAPH_DIR", str(tmp_path / "word_graph"))
+
+
+@pytest.fixture(autouse=True)
+def search_result_cache(monkeypatch):
+    """Give each test its own local-only search result cache."""
+    cache = SearchResultCache(use_redis=False)
+    monkeypatch.setattr("app.services.search.service.search_result_cache", cache)
+    return cache
+
+
+class AvailableOpenSearchClients:
+    """Client registry stand-in that reports the OpenSearch cluster as reachable."""
+
+    def is_available(self):
+        return True
+
+
+@pytest.fixture
+def opensearch_available(monkeypatch):
+    """Let SearchService take its OpenSearch path with a test-supplied client."""
+    monkeypatch.setattr("app.services.search.service.opensearch_clients", AvailableOpenSearchClients())
+
+
 @pytest.fixture(name="client")
 def client_fixture(session: Session) -> Generator[TestClient, None, None]:
     """Create a test client with dependency overrides."""
@@ -0,0 +1,36 @@
+from app.services.search.service import SearchService
+
+
+def test_query_epigraph_map_returns_columnar_clusters(client, monkeypatch):
+    def mock_map(self, **kwargs):
+        assert kwargs["zoom"] == 6
+        assert kwargs["bounds"] == {"west": 43.0, "south": 14.0, "east": 46.0, "north": 17.0}
+        assert kwargs["filters"] == {"dasi_published": True}
+        return {
+            "zoom": 6,
+            "clustered": True,
+            "result_count": 12,
+            "mapped_count": 10,
+            "clusters": {"keys": ["8/160/113"], "latitudes": [15.4], "longitudes": [45.3], "counts": [10]},
+            "markers": None,
+        }
+
+    monkeypatch.setattr(SearchService, "opensearch_query_epigraph_map", mock_map)
+
+    response = client.post(
+        "/api/v1/epigraphs/query/map",
+        json={"zoom": 6, "bounds": {"west": 43, "south": 14, "east": 46, "north": 17}},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["clusters"]["counts"] == [10]
+    assert response.json()["markers"] is None
+
+
+def test_query_epigraph_map_rejects_out_of_range_bounds(client):
+    response = client.post(
+        "/api/v1/epigraphs/query/map",
+        json={"zoom": 6, "bounds": {"west": 43, "south": -100, "east": 46, "north": 17}},
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,111 @@
+import pytest
+from fastapi import HTTPException
+
+from app.api.api_v1.endpoints import words
+from app.models.links import WordLink
+from app.models.word import Word
+from app.services.text.word_graph import WordGraphService
+from app.services.text.word_lookup import WordLookupService
+
+
+def _add_words(session, counts):
+    added = [
+        Word(word=f"w{position}", classification="p", frequency=1, epigraph_count=count)
+        for position, count in enumerate(counts)
+    ]
+    session.add_all(added)
+    session.commit()
+    return added
+
+
+def test_read_words_pages_with_keyset_cursor(session):
+    added = _add_words(session, [3, 1, 3, 2, 1])
+
+    first_page = words.read_words(session, limit=2, sort_field="epigraphs", sort_order="desc")
+    second_page = words.read_words(
+        session,
+        limit=2,
+        sort_field="epigraphs",
+        sort_order="desc",
+        cursor=first_page.next_cursor,
+    )
+    last_page = words.read_words(
+        session,
+        limit=2,
+        sort_field="epigraphs",
+        sort_order="desc",
+        cursor=second_page.next_cursor,
+    )
+
+    ordered = [word.id for page in (first_page, second_page, last_page) for word in page.words]
+    assert ordered == [added[2].id, added[0].id, added[3].id, added[4].id, added[1].id]
+    assert first_page.count == 5
+    assert last_page.next_cursor is None
+
+
+def test_read_words_applies_filters_to_page_and_count(session):
+    _add_words(session, [1, 1])
+    session.add(Word(word="w0", classification="w", frequency=4))
+    session.commit()
+
+    result = words.read_words(session, limit=10, filters='{"word": "w0"}', sort_field="frequency")
+
+    assert result.count == 2
+    assert [(word.classification, word.frequency) for word in result.words] == [("p", 1), ("w", 4)]
+
+
+def test_read_words_rejects_unknown_sort_fields(session):
+    with pytest.raises(HTTPException) as exc_info:
+        words.read_words(session, sort_field="spelling")
+
+    assert exc_info.value.status_code == 400
+
+
+def test_read_words_sorts_other_columns_by_offset(session):
+    _add_words(session, [1, 1, 1])
+
+    result = words.read_words(
+        session,
+        limit=2,
+        skip=1,
+        sort_field="word",
+        sort_order="desc",
+        filters='{"classification": "p"}',
+    )
+
+    assert [word.word for word in result.words] == ["w1", "w0"]
+    assert result.next_cursor is None
+    with pytest.raises(HTTPException) as exc_info:
+        words.read_words(session, sort_field="word", cursor="WzEsIDFd")
+    assert exc_info.value.status_code == 400
+
+
+def test_suggest_words_folds_the_prefix(session, monkeypatch):
+    monkeypatch.setattr(words, "word_lookup", WordLookupService())
+    session.add_all([
+        Word(word="ḥlk", classification="p", frequency=2),
+        Word(word="ḥlkʾmr", classification="p", frequency=9),
+    ])
+    session.commit()
+
+    suggestions = words.suggest_words(session, q="hlk", limit=5)
+
+    assert [(suggestion.word, suggestion.frequency) for suggestion in suggestions] == [("ḥlk", 2), ("ḥlkʾmr", 9)]
+
+
+def test_read_word_graph_returns_neighbours_with_words(session, monkeypatch, tmp_path):
+    monkeypatch.setattr(words, "word_graph", WordGraphService(tmp_path))
+    first, second, third = _add_words(session, [1, 1, 1])
+    session.add_all([
+        WordLink(from_word_id=second.id, to_word_id=first.id, count=3),
+        WordLink(from_word_id=third.id, to_word_id=second.id, count=1),
+    ])
+    session.commit()
+
+    neighbourhood = words.read_word_graph(second.id, session, limit=5)
+    path = words.read_word_path(first.id, third.id, session, direction="successors", max_depth=3)
+
+    assert [(edge.word, edge.count) for edge in neighbourhood.successors] == [(third.word, 1)]
+    assert [(edge.word, edge.count) for edge in neighbourhood.predecessors] == [(first.word, 3)]
+    assert path.found
+    assert [word.id for word in path.words] == [first.id, second.id, third.id]
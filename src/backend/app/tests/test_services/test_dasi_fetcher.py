@@ -0,0 +1,87 @@
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.importers.fetcher import DasiFetcher, TokenBucket
+
+
+async def _start_server(handler) -> TestServer:
+    app = web.Application()
+    app.router.add_get("/items", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def test_token_bucket_spaces_requests_by_rate():
+    bucket = TokenBucket(rate=20.0, capacity=1)
+
+    started_at = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert time.monotonic() - started_at >= 0.14
+
+
+async def test_fetcher_honours_retry_after_and_backs_off_rate():
+    calls = {"count": 0}
+
+    async def handler(request):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response({"page": request.query["page"]})
+
+    server = await _start_server(handler)
+    try:
+        async with DasiFetcher(requests_per_second=100.0, max_retries=2) as fetcher:
+            payload = await fetcher.get_json(str(server.make_url("/items")), params={"page": 3})
+            stats = fetcher.stats()
+    finally:
+        await server.close()
+
+    assert payload == {"page": "3"}
+    assert calls["count"] == 2
+    assert stats["throttled"] == 1
+    assert stats["retries"] == 1
+    assert stats["requests_per_second"] < 100.0
+
+
+async def test_fetcher_raises_after_retry_budget_is_exhausted():
+    async def handler(request):
+        return web.Response(status=503, headers={"Retry-After": "0"})
+
+    server = await _start_server(handler)
+    try:
+        async with DasiFetcher(requests_per_second=None, max_retries=1) as fetcher:
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                await fetcher.get_json(str(server.make_url("/items")))
+            stats = fetcher.stats()
+    finally:
+        await server.close()
+
+    assert exc_info.value.status == 503
+    assert stats["requests"] == 2
+    assert stats["errors"] == 1
+
+
+async def test_fetcher_does_not_retry_client_errors():
+    calls = {"count": 0}
+
+    async def handler(request):
+        calls["count"] += 1
+        return web.Response(status=404)
+
+    server = await _start_server(handler)
+    try:
+        async with DasiFetcher(requests_per_second=None, max_retries=3) as fetcher:
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                await fetcher.get_json(str(server.make_url("/items")))
+    finally:
+        await server.close()
+
+    assert exc_info.value.status == 404
+    assert calls["count"] == 1
@@ -0,0 +1,137 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.importers import images as images_module
+from app.services.importers.fetcher import DasiFetcher
+from app.services.importers.images import ImageDownloader
+
+IMAGE_BODY = b"\xff\xd8" + bytes(range(256)) * 40 + b"\xff\xd9"
+
+
+async def _start_image_server(requests: list[dict[str, str]]) -> TestServer:
+    async def handler(request):
+        requests.append(dict(request.headers))
+        range_header = request.headers.get("Range")
+        if range_header:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            return web.Response(
+                status=206,
+                body=IMAGE_BODY[start:],
+                content_type="image/jpeg",
+                headers={"Content-Range": f"bytes {start}-{len(IMAGE_BODY) - 1}/{len(IMAGE_BODY)}"},
+            )
+        return web.Response(body=IMAGE_BODY, content_type="image/jpeg")
+
+    app = web.Application()
+    app.router.add_get("/img", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def test_image_downloader_writes_atomically_and_skips_existing(tmp_path, monkeypatch):
+    requests: list[dict[str, str]] = []
+    server = await _start_image_server(requests)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        images_module,
+        "IMAGE_URL_TEMPLATE",
+        str(server.make_url("/img")) + "?recId={rec_id}&size={size}",
+    )
+
+    try:
+        async with DasiFetcher(requests_per_second=None) as fetcher:
+            downloader = ImageDownloader(fetcher, max_concurrency=2)
+            first_path = await downloader.download(5, save_directory="private")
+            second_path = await downloader.download(5, save_directory="private")
+            stats = downloader.stats()
+    finally:
+        await server.close()
+
+    assert first_path == second_path == "images/rec_5_high.jpg"
+    assert (tmp_path / "private" / "images" / "rec_5_high.jpg").read_bytes() == IMAGE_BODY
+    assert not list((tmp_path / "private" / "images").glob("*.part"))
+    assert len(requests) == 1
+    assert stats["downloaded"] == 1
+    assert stats["skipped"] == 1
+    assert stats["bytes_downloaded"] == len(IMAGE_BODY)
+
+
+async def test_image_downloader_resumes_partial_and_replaces_truncated_files(tmp_path, monkeypatch):
+    requests: list[dict[str, str]] = []
+    server = await _start_image_server(requests)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        images_module,
+        "IMAGE_URL_TEMPLATE",
+        str(server.make_url("/img")) + "?recId={rec_id}&size={size}",
+    )
+
+    images_dir = tmp_path / "public" / "images"
+    images_dir.mkdir(parents=True)
+    (images_dir / "rec_7_high.jpg.part").write_bytes(IMAGE_BODY[:1000])
+    (images_dir / "rec_8_high.jpg").write_bytes(IMAGE_BODY[:500])
+
+    try:
+        async with DasiFetcher(requests_per_second=None) as fetcher:
+            downloader = ImageDownloader(fetcher)
+            await downloader.download(7)
+            await downloader.download(8)
+            stats = downloader.stats()
+    finally:
+        await server.close()
+
+    assert (images_dir / "rec_7_high.jpg").read_bytes() == IMAGE_BODY
+    assert (images_dir / "rec_8_high.jpg").read_bytes() == IMAGE_BODY
+    assert requests[0]["Range"] == "bytes=1000-"
+    assert "Range" not in requests[1]
+    assert stats["resumed"] == 1
+    assert stats["downloaded"] == 2
+
+
+async def test_image_downloader_restarts_a_resumed_range_after_a_mid_stream_timeout(tmp_path, monkeypatch):
+    requests: list[dict[str, str]] = []
+
+    async def handler(request):
+        requests.append(dict(request.headers))
+        start = int(request.headers["Range"].removeprefix("bytes=").rstrip("-"))
+        response = web.StreamResponse(
+            status=206,
+            headers={"Content-Range": f"bytes {start}-{len(IMAGE_BODY) - 1}/{len(IMAGE_BODY)}"},
+        )
+        response.content_type = "image/jpeg"
+        response.content_length = len(IMAGE_BODY) - start
+        await response.prepare(request)
+        if len(requests) == 1:
+            await response.write(IMAGE_BODY[start:start + 1000])
+            await asyncio.sleep(1)
+        await response.write(IMAGE_BODY[start:])
+        return response
+
+    app = web.Application()
+    app.router.add_get("/img", handler)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        images_module,
+        "IMAGE_URL_TEMPLATE",
+        str(server.make_url("/img")) + "?recId={rec_id}&size={size}",
+    )
+    monkeypatch.setattr(DasiFetcher, "BACKOFF_BASE_SECONDS", 0)
+
+    images_dir = tmp_path / "public" / "images"
+    images_dir.mkdir(parents=True)
+    (images_dir / "rec_9_high.jpg.part").write_bytes(IMAGE_BODY[:1000])
+
+    try:
+        async with DasiFetcher(requests_per_second=None, timeout=0.3, max_retries=1) as fetcher:
+            path = await ImageDownloader(fetcher).download(9)
+    finally:
+        await server.close()
+
+    assert path == "images/rec_9_high.jpg"
+    assert [request["Range"] for request in requests] == ["bytes=1000-", "bytes=1000-"]
+    assert (images_dir / "rec_9_high.jpg").read_bytes() == IMAGE_BODY
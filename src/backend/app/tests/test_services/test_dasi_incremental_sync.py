@@ -1,25 +1,18 @@
+import json
 import uuid as uuid_pkg
 
-from sqlmodel import select
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
 
 from app.models.dasi_sync import DasiImportCursor, DasiSourceSnapshot
 from app.models.pipeline_run import PipelineRun
 from app.models.site import Site
+from app.services.importers.fetcher import DasiFetcher, FetchedDocument
 from app.services.importers.site import SiteImportService
 from app.workers import pipeline_tasks
 
 
-class MockResponse:
-    def __init__(self, payload):
-        self._payload = payload
-
-    def json(self):
-        return self._payload
-
-    def raise_for_status(self):
-        return None
-
-
 def test_site_import_incremental_uses_cursor_and_snapshots(session, monkeypatch):
     service = SiteImportService(session)
     page_calls = []
@@ -71,20 +64,21 @@ def test_site_import_incremental_uses_cursor_and_snapshots(session, monkeypatch)
             "objects": [],
         }
 
-    def fake_get(url, params=None, timeout=30):
+    async def fake_get_document(self, url, params=None, **kwargs):
         if params and "page" in params:
             page_calls.append(params["page"])
-            return MockResponse(listing_page(params["page"]))
+            payload = listing_page(params["page"])
+        else:
+            item_id = int(url.rstrip("/").split("/")[-1])
+            payload = site_detail(item_id)
 
-        item_id = int(url.rstrip("/").split("/")[-1])
-        return MockResponse(site_detail(item_id))
+        return FetchedDocument(body=json.dumps(payload).encode("utf-8"))
 
-    monkeypatch.setattr(
-        service,
-        "scrape_single",
-        lambda site_id, rate_limit_delay=10.0: service.crud.get(service.session, id=site_id),
-    )
-    monkeypatch.setattr("requests.get", fake_get)
+    async def fake_scrape_single_async(site_id, rate_limit_delay=10.0):
+        return service.crud.get(service.session, id=site_id)
+
+    monkeypatch.setattr(service, "scrape_single_async", fake_scrape_single_async)
+    monkeypatch.setattr(DasiFetcher, "get_document", fake_get_document)
 
     first_result = service.import_incremental(rate_limit_delay=0, update_existing=True)
 
@@ -117,6 +111,178 @@ def test_site_import_incremental_uses_cursor_and_snapshots(session, monkeypatch)
     assert session.exec(select(Site).where(Site.dasi_id == 5)).first() is not None
 
 
+def test_site_import_incremental_skips_details_unchanged_in_listing(session, monkeypatch):
+    service = SiteImportService(session)
+    listing_dates = {1: "2026-05-07", 2: "2026-05-07"}
+    detail_calls = []
+
+    async def fake_get_document(self, url, params=None, **kwargs):
+        if params and "page" in params:
+            payload = {
+                "totalItems": 2,
+                "member": [
+                    {"@id": f"http://localhost/test-dasi/sites/{item_id}", "lastModified": last_modified}
+                    for item_id, last_modified in listing_dates.items()
+                ],
+                "view": {},
+            }
+        else:
+            item_id = int(url.rstrip("/").split("/")[-1])
+            detail_calls.append(item_id)
+            payload = {
+                "uri": f"/sites/{item_id}",
+                "modernName": f"Modern Site {item_id}",
+                "ancientName": f"Ancient Site {item_id}",
+                "license": "CC-BY",
+                "lastModified": listing_dates[item_id],
+                "epigraphs": [],
+                "objects": [],
+            }
+
+        return FetchedDocument(body=json.dumps(payload).encode("utf-8"))
+
+    async def fake_scrape_single_async(site_id, rate_limit_delay=10.0):
+        return service.crud.get(service.session, id=site_id)
+
+    monkeypatch.setattr(service, "scrape_single_async", fake_scrape_single_async)
+    monkeypatch.setattr(DasiFetcher, "get_document", fake_get_document)
+
+    first_result = service.import_incremental(rate_limit_delay=0, update_existing=True)
+
+    assert first_result["planned_fetches"] == 2
+    assert first_result["avoided_fetches"] == 0
+    assert sorted(detail_calls) == [1, 2]
+
+    detail_calls.clear()
+    listing_dates[2] = "2026-06-01"
+
+    second_result = service.import_incremental(rate_limit_delay=0, update_existing=True)
+
+    assert second_result["status"] == "success"
+    assert second_result["planned_fetches"] == 1
+    assert second_result["avoided_fetches"] == 1
+    assert detail_calls == [2]
+
+    snapshot = session.exec(
+        select(DasiSourceSnapshot).where(
+            DasiSourceSnapshot.entity_type == "sites",
+            DasiSourceSnapshot.dasi_id == 2,
+        )
+    ).first()
+    assert snapshot is not None
+    assert snapshot.source_last_modified.strftime("%Y-%m-%d") == "2026-06-01"
+
+
+def test_site_import_listings_load_existing_items_once_per_page(session, monkeypatch):
+    service = SiteImportService(session)
+    for item_id in (1, 2):
+        session.add(
+            Site(
+                dasi_id=item_id,
+                uri=f"/sites/{item_id}",
+                modern_name=f"Modern Site {item_id}",
+                ancient_name=f"Ancient Site {item_id}",
+                license="CC-BY",
+            )
+        )
+    session.commit()
+    loaded_pages = []
+    load_existing_items = service._load_existing_items
+
+    def fake_load_existing_items(item_ids):
+        loaded_pages.append(sorted(item_ids))
+        return load_existing_items(item_ids)
+
+    def fail_get_by_dasi_id(*args, **kwargs):
+        raise AssertionError("listing members should be looked up per page")
+
+    async def fake_get_document(self, url, params=None, **kwargs):
+        payload = {
+            "totalItems": 2,
+            "member": [{"@id": f"http://localhost/test-dasi/sites/{item_id}"} for item_id in (1, 2)],
+            "view": {},
+        }
+        return FetchedDocument(body=json.dumps(payload).encode("utf-8"))
+
+    monkeypatch.setattr(service, "_load_existing_items", fake_load_existing_items)
+    monkeypatch.setattr(service.crud, "get_by_dasi_id", fail_get_by_dasi_id)
+    monkeypatch.setattr(DasiFetcher, "get_document", fake_get_document)
+
+    all_result = service.import_all(rate_limit_delay=0, update_existing=False)
+    incremental_result = service.import_incremental(rate_limit_delay=0, update_existing=False)
+
+    assert all_result["skipped_items"] == 2
+    assert incremental_result["skipped_items"] == 2
+    assert [page for page in loaded_pages if page] == [[1, 2], [1, 2]]
+
+
+def test_site_import_commits_once_per_page_and_retries_transient_errors(session, monkeypatch):
+    # The retry rolls back, so work in savepoints to keep the fixture's outer transaction intact.
+    session = Session(bind=session.connection(), join_transaction_mode="create_savepoint")
+    service = SiteImportService(session)
+    commits = []
+    write_attempts = {"count": 0}
+    original_write_page = service._write_page
+
+    async def fake_get_document(self, url, params=None, **kwargs):
+        if params and "page" in params:
+            payload = {
+                "totalItems": 3,
+                "member": [{"@id": f"http://localhost/test-dasi/sites/{item_id}"} for item_id in (21, 22, 23)],
+                "view": {},
+            }
+        else:
+            item_id = int(url.rstrip("/").split("/")[-1])
+            payload = {
+                "uri": f"/sites/{item_id}",
+                "modernName": f"Modern Site {item_id}",
+                "ancientName": f"Ancient Site {item_id}",
+                "license": "CC-BY",
+                "lastModified": "2026-05-07",
+                "epigraphs": [],
+                "objects": [],
+            }
+
+        return FetchedDocument(body=json.dumps(payload).encode("utf-8"))
+
+    async def fake_scrape_single_async(site_id, rate_limit_delay=10.0):
+        return service.crud.get(service.session, id=site_id)
+
+    def flaky_write_page(items, *, dasi_published):
+        write_attempts["count"] += 1
+        if write_attempts["count"] == 1:
+            original_write_page(items, dasi_published=dasi_published)
+            raise OperationalError("INSERT", {}, Exception("connection reset"))
+        return original_write_page(items, dasi_published=dasi_published)
+
+    monkeypatch.setattr(service, "scrape_single_async", fake_scrape_single_async)
+    monkeypatch.setattr(service, "_write_page", flaky_write_page)
+    monkeypatch.setattr(DasiFetcher, "get_document", fake_get_document)
+
+    def record_commit(_session):
+        commits.append(True)
+
+    event.listen(session, "after_commit", record_commit)
+    try:
+        result = service.import_all(rate_limit_delay=0)
+    finally:
+        event.remove(session, "after_commit", record_commit)
+
+    assert result["status"] == "success"
+    assert result["processed_items"] == 3
+    assert write_attempts["count"] == 2
+    assert len(commits) == 1
+    assert len(session.exec(select(Site).where(Site.dasi_id.in_([21, 22, 23]))).all()) == 3
+    assert len(
+        session.exec(
+            select(DasiSourceSnapshot).where(
+                DasiSourceSnapshot.entity_type == "sites",
+                DasiSourceSnapshot.dasi_id.in_([21, 22, 23]),
+            )
+        ).all()
+    ) == 3
+
+
 def test_dispatch_nightly_dasi_sync_queues_incremental_run(session, monkeypatch):
     captured = {}
 
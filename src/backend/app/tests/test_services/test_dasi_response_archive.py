@@ -0,0 +1,77 @@
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.importers.archive import ResponseArchive
+from app.services.importers.fetcher import DasiFetcher
+
+
+async def _start_server(state: dict) -> TestServer:
+    async def handler(request):
+        state["requests"].append(dict(request.headers))
+        if request.headers.get("If-None-Match") == state["etag"]:
+            return web.Response(status=304)
+        return web.json_response(state["payload"], headers={"ETag": state["etag"]})
+
+    app = web.Application()
+    app.router.add_get("/epigraphs/1", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def test_archive_revalidates_with_conditional_request(tmp_path):
+    state = {"etag": '"v1"', "payload": {"title": "First"}, "requests": []}
+    server = await _start_server(state)
+    archive = ResponseArchive(tmp_path)
+    url = str(server.make_url("/epigraphs/1"))
+
+    try:
+        async with DasiFetcher(requests_per_second=None, archive=archive) as fetcher:
+            first = await fetcher.get_document(url)
+            second = await fetcher.get_document(url)
+
+            state["etag"] = '"v2"'
+            state["payload"] = {"title": "Second"}
+            third = await fetcher.get_document(url)
+            stats = fetcher.stats()
+    finally:
+        await server.close()
+
+    assert first.changed is True
+    assert second.changed is False
+    assert second.json() == {"title": "First"}
+    assert state["requests"][1]["If-None-Match"] == '"v1"'
+    assert third.changed is True
+    assert third.json() == {"title": "Second"}
+    assert stats["not_modified"] == 1
+
+
+async def test_archive_marks_identical_body_as_unchanged(tmp_path):
+    archive = ResponseArchive(tmp_path)
+
+    first_entry, first_changed = archive.put("https://dasi.test/sites/1", b'{"a": 1}')
+    second_entry, second_changed = archive.put("https://dasi.test/sites/1", b'{"a": 1}')
+    _, third_changed = archive.put("https://dasi.test/sites/1", b'{"a": 2}')
+
+    assert first_changed is True
+    assert second_changed is False
+    assert third_changed is True
+    assert first_entry.body_hash == second_entry.body_hash
+    assert archive.read_body(archive.get("https://dasi.test/sites/1")) == b'{"a": 2}'
+
+
+async def test_replay_mode_serves_archive_without_network(tmp_path):
+    archive = ResponseArchive(tmp_path)
+    key = ResponseArchive.build_key("https://dasi.invalid/sites", {"page": 2})
+    archive.put(key, b'{"member": []}')
+
+    async with DasiFetcher(requests_per_second=None, archive=archive, replay=True) as fetcher:
+        payload = await fetcher.get_json("https://dasi.invalid/sites", params={"page": 2})
+
+        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+            await fetcher.get_json("https://dasi.invalid/sites", params={"page": 3})
+
+    assert payload == {"member": []}
+    assert exc_info.value.status == 404
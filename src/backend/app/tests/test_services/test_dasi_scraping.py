@@ -0,0 +1,106 @@
+from app.services.importers.scraping import parse_epigraph_page, parse_site_page
+
+EPIGRAPH_PAGE = b"""<!DOCTYPE html>
+<html><head><title>Epigraph</title></head>
+<body>
+<div class="row-fluid">
+  <img class="cloudzoom main" src="/cgi-bin/wsimg.pl?recId=101&amp;size=medium"
+       title="Fallback caption" data-cloudzoom='{"zoomImage":"x","captionSource":"#caption_101"}'>
+  <div id="caption_101">Front <em>face</em> <!-- photographer --> of the stele</div>
+  <a class="cloudzoom-gallery" title="Duplicate"
+     data-cloudzoom="useZoom: '.cloudzoom', image: '/cgi-bin/wsimg.pl?recId=101&size=medium'"></a>
+  <a class="cloudzoom-gallery" title="Side view"
+     data-cloudzoom="useZoom: '.cloudzoom', image: '/cgi-bin/wsimg.pl?recId=102&size=medium', captionSource: '#caption_102'"></a>
+  <div id="caption_102">Left   side</div>
+  <a class="cloudzoom-gallery" title="Untitled" data-cloudzoom="image: '/cgi-bin/wsimg.pl?recId=103&size=medium'"></a>
+  <a class="cloudzoom-gallery" data-cloudzoom="useZoom: '.cloudzoom'"></a>
+</div>
+</body></html>
+"""
+
+UNPUBLISHED_EPIGRAPH_PAGE = b"""<html><body>
+<div id="alert_box"> Epigraph Not Found or not yet published. </div>
+<img class="cloudzoom" src="/cgi-bin/wsimg.pl?recId=1">
+</body></html>"""
+
+SITE_PAGE = b"""<html><body>
+<div class="row-fluid"><div class="span12"><div class="row-fluid"><div class="accordion">
+  <h3>General information</h3>
+  <table>
+    <tr><td><strong>Ancient name:</strong></td><td><i>Ma&#8216;&#299;n</i><br>Qarnaw</td></tr>
+    <tr><td><strong>Type:</strong></td><td><span>town &amp; <a href="/site/12">capital</a></span></td></tr>
+    <tr><td colspan="2">ignored</td></tr>
+  </table>
+  <div class="accordion-group">
+    <div class="accordion-heading"><a class="accordion-toggle" href="#c1"> Bibliography </a></div>
+    <div class="accordion-inner"><table>
+      <tr><td>Robin 1992<br/>p. 3</td></tr>
+      <tr><td><a href="/bibliography/7"><b>Arbach</b></a></td></tr>
+    </table></div>
+  </div>
+  <p>stray</p>
+  <h3>Epigraphs</h3>
+  <div class="accordion-group other">
+    <a class="accordion-toggle">Missing table</a>
+    <div class="accordion-inner"><p>none</p></div>
+  </div>
+</div></div></div></div>
+</body></html>"""
+
+
+def _link(link: str) -> str:
+    return f"https://example.test{link}"
+
+
+def test_parse_epigraph_page_collects_main_and_gallery_images():
+    page = parse_epigraph_page(EPIGRAPH_PAGE)
+
+    assert page.unpublished is False
+    assert page.images == [
+        {"image_id": "101", "caption": "Front  face    of the stele", "is_main": True},
+        {"image_id": "102", "caption": "Left   side", "is_main": False},
+        {"image_id": "103", "caption": "Untitled", "is_main": False},
+    ]
+
+
+def test_parse_epigraph_page_detects_unpublished_and_empty_pages():
+    assert parse_epigraph_page(UNPUBLISHED_EPIGRAPH_PAGE).unpublished is True
+    assert parse_epigraph_page(UNPUBLISHED_EPIGRAPH_PAGE).images == []
+    assert parse_epigraph_page(b"").images == []
+
+
+def test_parse_site_page_extracts_sections_and_tables():
+    content = parse_site_page(SITE_PAGE, _link)
+
+    assert list(content) == ["General information", "Epigraphs"]
+
+    general = content["General information"]
+    assert general["parsed_data"] == {
+        "Ancient name": "Ma‘īn\nQarnaw",
+        "Type": 'town &amp; <a href="https://example.test/site/12">capital</a>',
+        "Bibliography": [
+            "Robin 1992\np. 3",
+            '<a href="https://example.test/bibliography/7">Arbach</a>',
+        ],
+    }
+    assert [section["section"] for section in general["sections"]] == ["General information", "Bibliography"]
+    assert general["sections"][0]["table"].startswith("<table>")
+    assert "<br>" in general["sections"][0]["table"]
+    assert "<b>" not in general["sections"][1]["table"]
+
+    assert content["Epigraphs"] == {"header": "Epigraphs", "sections": [], "parsed_data": {}}
+
+
+def test_parse_site_page_reports_unpublished_sites():
+    body = b"""<div class="row-fluid"><div class="row-fluid">
+        <p>This site is <b>not published</b> yet.</p>
+    </div></div>"""
+
+    assert parse_site_page(body, _link) == {
+        "SITE NOT PUBLISHED": {
+            "header": "Site not published",
+            "sections": ["This site isnot publishedyet."],
+            "parsed_data": {"not published": "This site isnot publishedyet."},
+        }
+    }
+    assert parse_site_page(b"  ", _link) == {}
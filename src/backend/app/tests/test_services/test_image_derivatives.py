@@ -0,0 +1,72 @@
+import asyncio
+
+from PIL import Image
+from sqlmodel import Session
+
+from app.crud.crud_epigraph import epigraph as crud_epigraph
+from app.models.epigraph import EpigraphCreate
+from app.services.importers.derivatives import build_image_derivatives
+from app.services.importers.epigraph import EpigraphImportService
+
+
+async def test_build_image_derivatives_writes_hashed_variants_for_public_images(tmp_path):
+    images_dir = tmp_path / "images"
+    images_dir.mkdir()
+    Image.new("RGB", (200, 100), color=(180, 120, 60)).save(images_dir / "rec_11_high.jpg", "JPEG")
+
+    image_data = [
+        {"image_id": "11", "caption": "Free from copyright", "copyright_free": True},
+        {"image_id": "12", "caption": "Restricted", "copyright_free": False},
+    ]
+
+    first = await build_image_derivatives(image_data, public_root=str(tmp_path), widths=(100, 400))
+    second = await build_image_derivatives(image_data, public_root=str(tmp_path), widths=(100, 400))
+
+    manifest = first[0]["derivatives"]
+    assert "derivatives" not in first[1]
+    assert manifest == second[0]["derivatives"]
+    assert (manifest["width"], manifest["height"]) == (200, 100)
+    assert sorted((variant["format"], variant["width"]) for variant in manifest["variants"]) == [
+        ("jpeg", 100),
+        ("jpeg", 200),
+        ("webp", 100),
+        ("webp", 200),
+    ]
+    for variant in manifest["variants"]:
+        assert manifest["hash"] in variant["path"]
+        with Image.open(tmp_path / variant["path"]) as derivative:
+            assert derivative.width == variant["width"]
+
+
+async def test_generate_image_derivatives_renders_a_batch_concurrently(session: Session, monkeypatch):
+    for dasi_id in (9801, 9802, 9803):
+        crud_epigraph.create(
+            session,
+            obj_in=EpigraphCreate(
+                dasi_id=dasi_id,
+                title=f"Epigraph {dasi_id}",
+                epigraph_text="text",
+                uri=f"https://dasi.cnr.it/epigraphs/{dasi_id}",
+                chronology_conjectural=False,
+                textual_typology_conjectural=False,
+                royal_inscription=False,
+                license="CC BY-SA 4.0",
+                images=[{"image_id": str(dasi_id), "copyright_free": dasi_id != 9803}],
+            ),
+        )
+    started = []
+    all_started = asyncio.Event()
+
+    async def build(images):
+        started.append(images[0]["image_id"])
+        if len(started) == 2:
+            all_started.set()
+        await all_started.wait()
+        return [{**image, "derivatives": {"hash": image["image_id"]}} for image in images]
+
+    monkeypatch.setattr("app.services.importers.epigraph.build_image_derivatives", build)
+
+    result = await asyncio.wait_for(EpigraphImportService(session).generate_image_derivatives(), timeout=5)
+
+    assert sorted(started) == ["9801", "9802"]
+    assert (result["updated_items"], result["generated_images"]) == (2, 2)
@@ -1,3 +1,5 @@
+import json
+
 from sqlmodel import Session
 
 from app.crud.crud_epigraph import epigraph as crud_epigraph
@@ -8,6 +10,7 @@ from app.models.links import EpigraphObjectLink, EpigraphSiteLink, ObjectSiteLin
 from app.models.object import ObjectCreate
 from app.models.site import SiteCreate
 from app.services.importers.epigraph import EpigraphImportService
+from app.services.importers.fetcher import DasiFetcher, FetchedDocument
 from app.services.importers.object import ObjectImportService
 from app.services.importers.site import SiteImportService
 
@@ -87,6 +90,8 @@ def test_site_cleanup_unreliable_related_links_clears_only_over_limit_links(sess
     assert result["processed_items"] == 1
     assert result["cleaned_items"] == 1
     assert result["removed_links"] == 6
+    assert result["scanned_rows"] >= 1 + len(epigraphs) + len(objects)
+    assert result["removed_links_per_second"] is not None
     assert session.query(EpigraphSiteLink).filter(EpigraphSiteLink.site_id == site.id).count() == 0
     assert session.query(ObjectSiteLink).filter(ObjectSiteLink.site_id == site.id).count() == 2
 
@@ -226,3 +231,35 @@ def test_object_cleanup_unreliable_related_links_clears_only_over_limit_links(se
     assert result["removed_links"] == 6
     assert session.query(ObjectSiteLink).filter(ObjectSiteLink.object_id == obj.id).count() == 2
     assert session.query(EpigraphObjectLink).filter(EpigraphObjectLink.object_id == obj.id).count() == 0
+
+
+def test_site_import_writes_related_links_in_batches(session: Session, monkeypatch):
+    epigraphs = [_create_epigraph(session, 3400 + index) for index in range(2)]
+    obj = _create_object(session, 2400)
+    service = SiteImportService(session)
+
+    async def fake_get_document(self, url, params=None, **kwargs):
+        payload = {
+            "uri": "/sites/1400",
+            "modernName": "Modern Site 1400",
+            "ancientName": "Ancient Site 1400",
+            "license": "CC-BY",
+            "lastModified": "2026-05-07",
+            "epigraphs": _related_refs("epigraphs", [epigraph.dasi_id for epigraph in epigraphs] + [9999]),
+            "objects": _related_refs("objects", [obj.dasi_id]),
+        }
+        return FetchedDocument(body=json.dumps(payload).encode("utf-8"))
+
+    async def fake_scrape_single_async(site_id, rate_limit_delay=10.0):
+        return service.crud.get(service.session, id=site_id)
+
+    monkeypatch.setattr(DasiFetcher, "get_document", fake_get_document)
+    monkeypatch.setattr(service, "scrape_single_async", fake_scrape_single_async)
+
+    site = service.import_single(1400, rate_limit_delay=0)
+    service.import_single(1400, rate_limit_delay=0)
+
+    epigraph_links = session.query(EpigraphSiteLink).filter(EpigraphSiteLink.site_id == site.id).all()
+    assert sorted(link.epigraph_id for link in epigraph_links) == sorted(epigraph.id for epigraph in epigraphs)
+    assert session.query(ObjectSiteLink).filter(ObjectSiteLink.site_id == site.id).count() == 1
+    assert service.resolver.resolve("sites", 1400) == site.id
@@ -0,0 +1,143 @@
+import threading
+
+import pytest
+from opensearchpy.exceptions import ConnectionError as OpenSearchConnectionError
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.services.search.breaker import CircuitBreaker
+from app.services.search.client import OpenSearchClientRegistry
+from app.services.search.opensearch import OpenSearchService
+from app.services.search.service import SearchService
+
+
+class FakeCluster:
+    def __init__(self, client):
+        self.client = client
+
+    def health(self):
+        return {"status": self.client.status}
+
+
+class FakeClient:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.status = "green"
+        self.info_calls = 0
+        self.cluster = FakeCluster(self)
+
+    def info(self):
+        self.info_calls += 1
+        if self.fail:
+            raise OpenSearchConnectionError("N/A", "refused", None)
+        return {"cluster_name": "hudhud", "version": {"number": "2.19.0"}}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch):
+    registry = OpenSearchClientRegistry()
+    clients = []
+    probe_options = []
+
+    def create_client(**options):
+        if options:
+            probe_options.append(options)
+            return clients[-1]
+        clients.append(FakeClient())
+        return clients[-1]
+
+    monkeypatch.setattr(registry, "_create_client", create_client)
+    monkeypatch.setattr("app.services.search.client.opensearch_breaker", CircuitBreaker("test"))
+    monkeypatch.setattr("app.services.search.client.opensearch_clients", registry)
+    monkeypatch.setattr("app.services.search.service.opensearch_clients", registry)
+    registry.clients = clients
+    registry.probe_options = probe_options
+    return registry
+
+
+def test_client_is_shared_and_health_is_cached(registry, monkeypatch: pytest.MonkeyPatch):
+    client = registry.get_client()
+
+    assert registry.get_client() is client
+    assert client.info_calls == 0
+
+    health = registry.health()
+    assert health["available"] is True
+    assert (health["cluster_name"], health["version"], health["status"]) == ("hudhud", "2.19.0", "green")
+    registry.health()
+    assert client.info_calls == 1
+
+    registry.health(force=True)
+    assert client.info_calls == 2
+
+    monkeypatch.setattr(settings, "OPENSEARCH_HEALTH_TTL_SECONDS", 0)
+    registry.health()
+    assert client.info_calls == 3
+
+
+def test_client_is_rebuilt_after_fork(registry, monkeypatch: pytest.MonkeyPatch):
+    parent_client = registry.get_client()
+    registry.health()
+
+    monkeypatch.setattr("app.services.search.client.os.getpid", lambda: -1)
+
+    assert registry.get_client() is not parent_client
+    assert len(registry.clients) == 2
+    registry.health()
+    assert registry.clients[1].info_calls == 1
+
+
+def test_search_service_falls_back_while_cluster_is_down(registry, session: Session):
+    registry.get_client().fail = True
+    search_service = SearchService(session)
+
+    assert registry.clients[0].info_calls == 0
+    assert search_service.opensearch is None
+    assert registry.health()["error"]
+
+    registry.clients[0].fail = False
+    registry.invalidate()
+
+    assert isinstance(search_service.opensearch, OpenSearchService)
+    assert search_service.opensearch.client is registry.clients[0]
+
+
+def test_health_checks_fail_fast_and_feed_the_breaker(registry, monkeypatch: pytest.MonkeyPatch):
+    breaker = CircuitBreaker("test", min_calls=2, failure_rate=1.0)
+    monkeypatch.setattr("app.services.search.client.opensearch_breaker", breaker)
+    registry.get_client().fail = True
+
+    registry.health()
+    registry.health(force=True)
+
+    assert registry.probe_options == [{
+        "pool_maxsize": 1,
+        "timeout": settings.OPENSEARCH_HEALTH_TIMEOUT_SECONDS,
+        "max_retries": 0,
+        "retry_on_timeout": False,
+    }]
+    assert breaker.is_open()
+
+
+def test_expired_health_is_served_while_another_thread_checks(registry, monkeypatch: pytest.MonkeyPatch):
+    expired = registry.health()
+    monkeypatch.setattr(settings, "OPENSEARCH_HEALTH_TTL_SECONDS", 0)
+    checking, release = threading.Event(), threading.Event()
+
+    def slow_info():
+        checking.set()
+        release.wait(5)
+        return {"cluster_name": "hudhud", "version": {"number": "2.19.0"}}
+
+    monkeypatch.setattr(registry.clients[0], "info", slow_info)
+    checker = threading.Thread(target=registry.health)
+    checker.start()
+    checking.wait(5)
+
+    assert registry.health() is expired
+    release.set()
+    checker.join(5)
+    assert registry.health() is not expired
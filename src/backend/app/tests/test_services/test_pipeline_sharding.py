@@ -0,0 +1,169 @@
+from contextlib import nullcontext
+
+from app.models.pipeline_run import PipelineStatus
+from app.services.pipeline import dispatch as pipeline_dispatch
+from app.services.pipeline.run_service import PipelineRunService
+from app.services.pipeline.sharding import (
+    ShardedRangeImportService,
+    merge_shard_results,
+    split_range,
+)
+from app.workers import pipeline_tasks
+
+RANGE_PARAMETERS = {
+    "import_sites": False,
+    "import_objects": True,
+    "import_epigraphs": True,
+    "start_id": 1,
+    "end_id": 10,
+    "shard_size": 4,
+    "run_chunking": False,
+    "generate_embeddings": False,
+    "reindex_search": False,
+}
+
+
+def test_split_range_and_merge_shard_results():
+    assert split_range(1, 10, 4) == [
+        {"start_id": 1, "end_id": 4},
+        {"start_id": 5, "end_id": 8},
+        {"start_id": 9, "end_id": 10},
+    ]
+
+    merged = merge_shard_results([
+        {
+            "status": "success",
+            "processed_items": 3,
+            "skipped_items": 1,
+            "failed_ids": [],
+            "total_items": 4,
+            "fetch": {"requests": 4, "throttled": 1, "requests_per_second": 0.5},
+        },
+        {
+            "status": "success",
+            "processed_items": 1,
+            "skipped_items": 0,
+            "failed_ids": [8, 6],
+            "total_items": 4,
+            "fetch": {"requests": 6},
+        },
+    ])
+
+    assert merged["status"] == "success"
+    assert merged["processed_items"] == 4
+    assert merged["skipped_items"] == 1
+    assert merged["total_items"] == 8
+    assert merged["failed_items"] == 2
+    assert merged["failed_ids"] == [6, 8]
+    assert merged["fetch"]["requests"] == 10
+    assert merged["fetch"]["throttled"] == 1
+
+
+def test_dispatch_shards_wide_range_imports(session, monkeypatch):
+    captured = {}
+
+    class DummyAsyncResult:
+        id = "chord-callback-123"
+
+    def fake_dispatch_stage(run_uuid, stage_name, shards, parameters, retry_round=0):
+        captured.update(run_uuid=run_uuid, stage_name=stage_name, shards=shards)
+        return DummyAsyncResult()
+
+    def fail_apply_async(*args, **kwargs):
+        raise AssertionError("sharded range imports should not run as a single pipeline task")
+
+    monkeypatch.setattr(pipeline_dispatch, "dispatch_range_import_stage", fake_dispatch_stage)
+    monkeypatch.setattr(pipeline_dispatch.run_dasi_sync_pipeline, "apply_async", fail_apply_async)
+
+    result = pipeline_dispatch.dispatch_dasi_pipeline(session, parameters=RANGE_PARAMETERS)
+
+    assert captured == {
+        "run_uuid": str(result.uuid),
+        "stage_name": "objects",
+        "shards": split_range(1, 10, 4),
+    }
+    assert result.status == PipelineStatus.QUEUED
+    assert result.celery_task_id == "chord-callback-123"
+
+
+def test_run_shard_imports_ids_under_shared_rate_limit(session, monkeypatch):
+    calls = []
+
+    class FakeImportService:
+        shared_rate_limit_key = None
+
+        def import_ids(self, item_ids, **kwargs):
+            calls.append((self.shared_rate_limit_key, item_ids, kwargs))
+            return {"status": "success", "processed_items": len(item_ids), "failed_ids": [], "total_items": len(item_ids)}
+
+    sharded_import = ShardedRangeImportService(session)
+    monkeypatch.setattr(sharded_import.orchestrator, "build_import_service", lambda stage_name, parameters: FakeImportService())
+    run = sharded_import.pipeline_runs.create_run("dasi_sync", trigger="manual", parameters=RANGE_PARAMETERS)
+
+    result = sharded_import.run_shard(str(run.uuid), "objects", {"item_ids": [3, 7]}, RANGE_PARAMETERS)
+
+    assert calls == [(
+        "dasi",
+        [3, 7],
+        {"dasi_published": None, "rate_limit_delay": 10.0, "update_existing": False},
+    )]
+    assert result["shard"] == {"item_ids": [3, 7]}
+    assert sharded_import.pipeline_runs.get_run(str(run.uuid)).current_step == "import_objects"
+
+
+def test_finalize_retries_failed_ids_then_moves_to_next_stage(session, monkeypatch):
+    dispatched = []
+    monkeypatch.setattr(pipeline_tasks, "Session", lambda engine: nullcontext(session))
+    monkeypatch.setattr(
+        pipeline_tasks,
+        "dispatch_range_import_stage",
+        lambda *args: dispatched.append(args),
+    )
+    run = PipelineRunService(session).create_run("dasi_sync", trigger="manual", parameters=RANGE_PARAMETERS)
+    run_uuid = str(run.uuid)
+
+    pipeline_tasks.finalize_range_import_stage(
+        [
+            {"status": "success", "processed_items": 4, "skipped_items": 0, "failed_ids": [], "total_items": 4},
+            {"status": "success", "processed_items": 2, "skipped_items": 0, "failed_ids": [6, 8], "total_items": 4},
+            {"status": "error", "error": "boom", "processed_items": 0, "failed_ids": [9, 10], "total_items": 2},
+        ],
+        run_uuid,
+        "objects",
+        RANGE_PARAMETERS,
+    )
+
+    assert dispatched == [(run_uuid, "objects", [{"item_ids": [6, 8, 9, 10]}], RANGE_PARAMETERS, 1)]
+    run = PipelineRunService(session).get_run(run_uuid)
+    assert run.failed_items == 4
+    assert run.metrics["imports"]["objects"]["errors"] == [{"shard": None, "error": "boom"}]
+
+    pipeline_tasks.finalize_range_import_stage(
+        [{"status": "success", "processed_items": 3, "skipped_items": 0, "failed_ids": [8], "total_items": 4}],
+        run_uuid,
+        "objects",
+        RANGE_PARAMETERS,
+        1,
+    )
+
+    assert dispatched[-1] == (run_uuid, "epigraphs", split_range(1, 10, 4), RANGE_PARAMETERS)
+    run = PipelineRunService(session).get_run(run_uuid)
+    stage_metrics = run.metrics["imports"]["objects"]
+    assert stage_metrics["processed_items"] == 9
+    assert stage_metrics["failed_ids"] == [8]
+    assert stage_metrics["retried_items"] == 4
+    assert stage_metrics["retry_rounds"] == 1
+    assert (run.total_items, run.processed_items, run.failed_items) == (10, 9, 1)
+    assert run.status != PipelineStatus.COMPLETED
+
+    pipeline_tasks.finalize_range_import_stage(
+        [{"status": "success", "processed_items": 10, "skipped_items": 0, "failed_ids": [], "total_items": 10}],
+        run_uuid,
+        "epigraphs",
+        RANGE_PARAMETERS,
+    )
+
+    run = PipelineRunService(session).get_run(run_uuid)
+    assert run.status == PipelineStatus.COMPLETED
+    assert (run.total_items, run.processed_items, run.failed_items) == (20, 19, 1)
+    assert len(dispatched) == 2
@@ -0,0 +1,110 @@
+import json
+
+from app.services.search.opensearch import OpenSearchService
+from app.services.search.query_plan import (
+    HIGHLIGHT_JSON,
+    QueryAST,
+    QueryTerm,
+    compile_highlight,
+    compile_search_query,
+    get_query_plan,
+    parse_search_query,
+    resolve_field_groups,
+    serialize_search_body,
+)
+
+
+def test_parse_search_query_builds_ast():
+    ast = parse_search_query('"bn ḥlk" +mlk_sbʾ ʾl* -qtbn')
+
+    assert ast == QueryAST(
+        must=(QueryTerm("bn ḥlk", phrase=True), QueryTerm("mlk")),
+        should=(QueryTerm("sbʾ"), QueryTerm("ʾl*")),
+        must_not=(QueryTerm("qtbn"),),
+    )
+    assert ast.should_text == "sbʾ ʾl*"
+
+
+def test_field_groups_and_plans_are_cached_per_field_set():
+    groups = resolve_field_groups(("title", "apparatus_notes"))
+
+    assert groups.top_fields == ("title",)
+    assert groups.nested_fields == ("apparatus_notes.note",)
+    assert get_query_plan(("title",)) is get_query_plan(("title",))
+    assert get_query_plan(("title",)) is not get_query_plan(("title", "epigraph_text"))
+
+
+def test_compile_search_query_renders_terms_into_templates():
+    query = json.loads(compile_search_query('"x \\ y" +c d -e', ["title", "apparatus_notes"]))["bool"]
+
+    assert query["filter"] == [{"term": {"dasi_published": True}}]
+    assert query["must"][0]["bool"]["should"][0] == {
+        "match_phrase": {"epigraph_text.raw": {"query": "x \\ y", "boost": 15}}
+    }
+    assert query["must"][1]["bool"]["should"][0] == {
+        "multi_match": {"query": "c", "fields": ["title"], "type": "best_fields", "boost": 5}
+    }
+    assert "minimum_should_match" not in query
+    assert query["should"] == [
+        {
+            "multi_match": {
+                "query": "d",
+                "fields": ["title"],
+                "type": "best_fields",
+                "minimum_should_match": "50%",
+                "boost": 3,
+            }
+        },
+        {"multi_match": {"query": "d", "fields": ["title.keyword"], "type": "best_fields", "boost": 5}},
+        {
+            "nested": {
+                "path": "apparatus_notes",
+                "query": {
+                    "multi_match": {
+                        "query": "d",
+                        "fields": ["apparatus_notes.note"],
+                        "type": "best_fields",
+                        "minimum_should_match": "50%",
+                    }
+                },
+            }
+        },
+    ]
+    assert query["must_not"][0]["bool"]["should"][0] == {
+        "multi_match": {"query": "e", "fields": ["title"], "type": "best_fields"}
+    }
+
+
+def test_compile_search_query_without_terms_only_filters():
+    assert json.loads(compile_search_query("  ")) == {"bool": {"filter": [{"term": {"dasi_published": True}}]}}
+
+
+def test_serialize_search_body_splices_raw_sections():
+    body = serialize_search_body({"from": 0, "size": 10}, query='{"match_all":{}}', highlight=HIGHLIGHT_JSON)
+
+    assert json.loads(body)["query"] == {"match_all": {}}
+    assert json.loads(body)["size"] == 10
+    assert "title" in json.loads(body)["highlight"]["fields"]
+    assert serialize_search_body({}, query="{}") == '{"query":{}}'
+
+
+def test_compile_highlight_covers_only_searched_fields():
+    assert json.loads(compile_highlight(["title", "apparatus_notes"]))["fields"] == {
+        "title": {},
+        "apparatus_notes.note": {},
+    }
+    assert compile_highlight() == HIGHLIGHT_JSON
+
+
+def test_nested_search_sends_the_serialized_body():
+    class FakeClient:
+        def search(self, index, body):
+            self.body = json.loads(body)
+            return {"hits": {"hits": [], "total": {"value": 0}}}
+
+    client = FakeClient()
+
+    result = OpenSearchService(client=client).test_nested_search("almaqah")
+
+    assert result["total"] == 0
+    assert client.body["query"]["bool"]["must"][0]["nested"]["path"] == "translations"
@@ -0,0 +1,112 @@
+import pytest
+from sqlmodel import Session
+
+from app.crud.crud_epigraph import epigraph as crud_epigraph
+from app.models.epigraph import EpigraphCreate
+from app.services.search.breaker import CircuitBreaker, CircuitOpenError
+from app.services.search.service import SearchService
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr("app.services.search.breaker.time.monotonic", clock)
+    return clock
+
+
+def _fail():
+    raise ConnectionError("refused")
+
+
+def test_breaker_opens_on_error_rate_and_half_opens_after_cooldown(clock: Clock):
+    breaker = CircuitBreaker("test", failure_rate=0.5, min_calls=4, cooldown_seconds=10)
+
+    assert breaker.call(lambda: "ok") == "ok"
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "ok")
+
+    clock.now += 10
+    assert breaker.state == "half_open"
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record(0.01, failed=False)
+    assert breaker.state == "closed"
+
+    snapshot = breaker.snapshot()
+    assert (snapshot["opened"], snapshot["short_circuited"], snapshot["failures"]) == (1, 2, 3)
+    assert [transition["to"] for transition in snapshot["transitions"]] == ["open", "half_open", "closed"]
+
+
+def test_breaker_opens_on_slow_calls_and_failed_probe_reopens(clock: Clock):
+    breaker = CircuitBreaker("test", min_calls=2, slow_call_seconds=1, cooldown_seconds=5)
+
+    breaker.record(3, failed=False)
+    breaker.record(2, failed=False)
+    assert breaker.state == "open"
+    assert breaker.snapshot()["transitions"][-1]["reason"] == "2/2 calls were slow"
+
+    clock.now += 5
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+
+    assert breaker.state == "open"
+    assert breaker.snapshot()["retry_in_seconds"] == 5
+
+
+def test_query_falls_back_to_postgres_while_circuit_is_open(
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    for dasi_id, title in ((9401, "Dedication to Almaqah"), (9402, "Building inscription")):
+        crud_epigraph.create(
+            session,
+            obj_in=EpigraphCreate(
+                dasi_id=dasi_id,
+                title=title,
+                epigraph_text="<p>text</p>",
+                uri=f"https://dasi.cnr.it/epigraphs/{dasi_id}",
+                chronology_conjectural=False,
+                textual_typology_conjectural=False,
+                royal_inscription=False,
+                license="CC BY-SA 4.0",
+                dasi_published=True,
+            ),
+        )
+
+    breaker = CircuitBreaker("opensearch", min_calls=1)
+    breaker.record(0.01, failed=True)
+    monkeypatch.setattr("app.services.search.service.opensearch_breaker", breaker)
+
+    result = SearchService(session).opensearch_query_epigraphs(
+        search_text="almaqah",
+        fields="title",
+        sort_field="_score",
+        sort_order="desc",
+        filters={"dasi_published": True},
+        limit=10,
+    )
+
+    assert [epigraph.dasi_id for epigraph in result["epigraphs"]] == [9401]
+    assert result["count"] == 1
+    assert result["facet_counts"]["period"] == []
+    assert breaker.snapshot()["state"] == "open"
+
+    with pytest.raises(RuntimeError):
+        SearchService(session).opensearch_locate_epigraph_result(
+            dasi_id=9401,
+            page_size=10,
+            search_text="almaqah",
+        )
@@ -0,0 +1,179 @@
+import json
+
+import pytest
+from sqlmodel import Session
+
+from app.services.search.cursor import InvalidCursorError, SearchCursor
+from app.services.search.opensearch import OpenSearchService, _next_float32
+from app.services.search.service import SearchService
+
+DOCUMENTS = [
+    {"id": 1, "dasi_id": 101, "period": "Early", "score": 2.25},
+    {"id": 2, "dasi_id": 102, "period": "Late", "score": 1.5},
+    {"id": 3, "dasi_id": 103, "period": None, "score": 2.25},
+    {"id": 4, "dasi_id": 104, "period": "Early", "score": 0.75},
+    {"id": 5, "dasi_id": 105, "period": None, "score": 1.5},
+    {"id": 6, "dasi_id": 106, "period": "Late", "score": 2.25},
+]
+
+
+def _matches(document, clause) -> bool:
+    kind, spec = next(iter(clause.items()))
+    if kind == "range":
+        field, bounds = next(iter(spec.items()))
+        value = document.get(field)
+        if value is None:
+            return False
+        return ("lt" not in bounds or value < bounds["lt"]) and ("gt" not in bounds or value > bounds["gt"])
+    if kind == "term":
+        field, value = next(iter(spec.items()))
+        return document.get(field) == value
+    if kind == "exists":
+        return document.get(spec["field"]) is not None
+    if kind == "bool":
+        return (
+            all(_matches(document, child) for child in spec.get("filter", []))
+            and not any(_matches(document, child) for child in spec.get("must_not", []))
+            and (not spec.get("should") or any(_matches(document, child) for child in spec["should"]))
+        )
+    # Full-text clauses match every document here.
+    return True
+
+
+class FakeIndexClient:
+    """Answers the locator's target lookup and count requests from DOCUMENTS."""
+
+    def __init__(self, sort_field):
+        self.sort_field = sort_field
+        self.requests = 0
+
+    def search(self, index, body):
+        self.requests += 1
+        body = json.loads(body)
+        dasi_id = body["post_filter"]["bool"]["filter"][0]["term"]["dasi_id"]
+        document = next(document for document in DOCUMENTS if document["dasi_id"] == dasi_id)
+        sort_value = document["score"] if self.sort_field == "_score" else document[self.sort_field]
+        return {
+            "hits": {
+                "hits": [{"_source": {"id": document["id"]}, "sort": [sort_value, document["id"]]}],
+                "total": {"value": 1},
+                "max_score": None,
+            }
+        }
+
+    def count(self, index, body):
+        self.requests += 1
+        return {"count": sum(_matches(document, body["query"]) for document in DOCUMENTS)}
+
+    def msearch(self, body):
+        self.requests += 1
+        responses = []
+        for search in body[1::2]:
+            matching = [
+                document
+                for document in DOCUMENTS
+                if _matches(document, search["query"]) and document["score"] >= search.get("min_score", 0)
+            ]
+            responses.append({"hits": {"total": {"value": len(matching)}}})
+        return {"responses": responses}
+
+
+def _expected_positions(sort_field, sort_order):
+    def key(document):
+        value = document["score"] if sort_field == "_score" else document[sort_field]
+        if value is None:
+            return (1, "", document["id"])
+        if sort_order == "desc":
+            value = -value if isinstance(value, float) else tuple(-ord(char) for char in value)
+        return (0, value, document["id"])
+
+    return {document["dasi_id"]: index for index, document in enumerate(sorted(DOCUMENTS, key=key))}
+
+
+@pytest.mark.parametrize(
+    ("sort_field", "sort_order"),
+    [("period", "asc"), ("period", "desc"), ("_score", "desc"), ("_score", "asc")],
+)
+def test_locate_epigraph_counts_hits_sorted_before_the_target(sort_field, sort_order):
+    client = FakeIndexClient(sort_field)
+    opensearch = OpenSearchService(client=client)
+
+    positions = {
+        document["dasi_id"]: opensearch.locate_epigraph(
+            document["dasi_id"], "", sort_field=sort_field, sort_order=sort_order
+        )
+        for document in DOCUMENTS
+    }
+
+    assert positions == _expected_positions(sort_field, sort_order)
+    assert client.requests == 2 * len(DOCUMENTS)
+
+
+def test_next_float32_steps_to_the_adjacent_single_precision_value():
+    assert _next_float32(1.0) == 1.0000001192092896
+    assert _next_float32(0.0) > 0.0
+
+
+class PagedOpenSearch:
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+        self.closed = []
+
+    def open_point_in_time(self):
+        return "pit-1"
+
+    def close_point_in_time(self, pit_id):
+        self.closed.append(pit_id)
+
+    def search_epigraphs(self, **kwargs):
+        self.calls.append(kwargs)
+        start = kwargs["search_after"][1] if kwargs.get("search_after") else kwargs.get("skip", 0)
+        ids = range(start + 1, min(start + kwargs["limit"], self.total) + 1)
+        return {
+            "hits": [{"_source": {"id": epigraph_id}, "sort": [None, epigraph_id]} for epigraph_id in ids],
+            "total": self.total,
+            "total_relation": "eq",
+            "aggregations": {},
+            "pit_id": "pit-2" if kwargs.get("pit_id") else None,
+            "took": {"hits": 1, "facets": 1},
+        }
+
+    def search_epigraphs_with_facets(self, facet_fields, **kwargs):
+        return self.search_epigraphs(**kwargs)
+
+
+def test_query_epigraphs_pages_through_cursors(session: Session, opensearch_available):
+    opensearch = PagedOpenSearch(total=5)
+    search_service = SearchService(session)
+    search_service._opensearch = opensearch
+
+    def query(cursor=None, search_text="almaqah"):
+        return search_service.opensearch_query_epigraphs(
+            search_text=search_text,
+            sort_field="period",
+            sort_order="asc",
+            limit=2,
+            cursor=cursor,
+        )
+
+    first = query()
+    second = query(first["next_cursor"])
+    third = query(second["next_cursor"])
+
+    assert [call.get("search_after") for call in opensearch.calls] == [None, [None, 2], [None, 4]]
+    assert [call.get("pit_id") for call in opensearch.calls] == [None, "pit-1", "pit-2"]
+    assert (second["page"], third["page"]) == (2, 3)
+    assert third["next_cursor"] is None
+    assert opensearch.closed == ["pit-2"]
+
+    with pytest.raises(InvalidCursorError):
+        query(first["next_cursor"], search_text="krb")
+    with pytest.raises(InvalidCursorError):
+        query("not-a-cursor")
+
+
+def test_search_cursor_round_trips():
+    cursor = SearchCursor("key", 2, ["Early", 7], "pit")
+
+    assert SearchCursor.decode(cursor.encode(), "key") == cursor
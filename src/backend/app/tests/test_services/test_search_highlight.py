@@ -0,0 +1,44 @@
+import json
+
+from sqlmodel import Session
+
+from app.services.search.opensearch import OpenSearchService
+from app.services.search.service import SearchService
+
+
+class FakeHighlightClient:
+    def __init__(self):
+        self.bodies = []
+
+    def search(self, index, body):
+        self.bodies.append(json.loads(body))
+        return {
+            "hits": {
+                "hits": [{"_source": {"id": 7}, "highlight": {"title": ["<em>Almaqah</em>"]}}],
+                "total": {"value": 1},
+                "max_score": 1.0,
+            }
+        }
+
+
+def test_highlight_epigraphs_restricts_the_query_to_the_given_ids():
+    client = FakeHighlightClient()
+
+    highlights = OpenSearchService(client=client).highlight_epigraphs("almaqah", [7, 9], fields=["title"])
+
+    assert highlights == {7: {"title": ["<em>Almaqah</em>"]}}
+    body = client.bodies[0]
+    assert body["query"]["bool"]["filter"] == [{"terms": {"id": [7, 9]}}]
+    assert body["size"] == 2
+    assert list(body["highlight"]["fields"]) == ["title"]
+
+
+def test_result_searches_do_not_highlight(session: Session, opensearch_available):
+    client = FakeHighlightClient()
+    search_service = SearchService(session)
+    search_service._opensearch = OpenSearchService(client=client)
+
+    search_service.opensearch_full_text_search(search_text="almaqah")
+    search_service.opensearch_highlight_epigraphs("almaqah", [7], fields="title")
+
+    assert [("highlight" in body) for body in client.bodies] == [False, True]
@@ -0,0 +1,117 @@
+import pytest
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.epigraph import Epigraph
+from app.services.search.opensearch import OpenSearchService
+from app.services.search.service import SearchService
+
+BOUNDS = {"west": 43.0, "south": 14.0, "east": 46.0, "north": 17.0}
+
+
+class FakeMapClient:
+    def __init__(self):
+        self.bodies = []
+
+    def search(self, index, body):
+        self.bodies.append(body)
+        in_view = {"epigraphs": {"doc_count": 3}}
+        hits = []
+        if body["size"] == 0:
+            in_view["tiles"] = {
+                "buckets": [
+                    {
+                        "key": "7/80/56",
+                        "doc_count": 4,
+                        "centroid": {"location": {"lat": 15.4, "lon": 45.3}, "count": 4},
+                        "epigraphs": {"doc_count": 3},
+                    }
+                ]
+            }
+        else:
+            hits = [
+                {
+                    "_source": {
+                        "id": 1,
+                        "dasi_id": 101,
+                        "title": "Dedication",
+                        "sites": [{"modern_name": "Marib", "coordinates": {"lat": 15.4, "lon": 45.3}}],
+                    }
+                },
+                {"_source": {"id": 2, "dasi_id": 102, "title": "Unmapped", "sites": []}},
+            ]
+        return {
+            "hits": {"hits": hits, "total": {"value": len(hits)}},
+            "aggregations": {"matching": {"value": 5}, "sites": {"in_view": in_view}},
+        }
+
+
+@pytest.fixture
+def map_search(session: Session, opensearch_available):
+    client = FakeMapClient()
+    search_service = SearchService(session)
+    search_service._opensearch = OpenSearchService(client=client)
+    return search_service, client
+
+
+def test_low_zoom_returns_geotile_clusters_as_columns(map_search):
+    search_service, client = map_search
+
+    result = search_service.opensearch_query_epigraph_map(
+        search_text="almaqah",
+        zoom=5,
+        filters={"dasi_published": True, "period": ["Early"]},
+        bounds=BOUNDS,
+    )
+
+    assert result["clustered"] is True
+    assert result["clusters"] == {"keys": ["7/80/56"], "latitudes": [15.4], "longitudes": [45.3], "counts": [3]}
+    assert result["markers"] is None
+    assert (result["result_count"], result["mapped_count"]) == (5, 3)
+
+    body = client.bodies[0]
+    in_view = body["aggs"]["sites"]["aggs"]["in_view"]
+    assert in_view["filter"]["geo_bounding_box"]["sites.coordinates"]["top_left"] == {"lat": 17.0, "lon": 43.0}
+    assert in_view["aggs"]["tiles"]["geotile_grid"]["precision"] == 7
+    assert body["query"]["bool"]["filter"] == [{"terms": {"period": ["Early"]}}]
+
+
+def test_high_zoom_returns_individual_markers_in_view(map_search):
+    search_service, client = map_search
+
+    result = search_service.opensearch_query_epigraph_map(
+        search_text="",
+        zoom=settings.MAP_CLUSTER_MARKER_ZOOM,
+        bounds=BOUNDS,
+    )
+
+    assert result["clustered"] is False
+    assert result["clusters"] is None
+    assert result["markers"] == {
+        "ids": [1],
+        "dasi_ids": [101],
+        "titles": ["Dedication"],
+        "site_names": ["Marib"],
+        "latitudes": [15.4],
+        "longitudes": [45.3],
+    }
+    assert client.bodies[0]["post_filter"]["nested"]["path"] == "sites"
+
+
+def test_site_coordinates_are_indexed_as_lat_lon_objects():
+    epigraph = Epigraph(
+        id=1,
+        dasi_id=101,
+        title="Dedication",
+        epigraph_text="text",
+        uri="https://dasi.cnr.it/epigraphs/101",
+        chronology_conjectural=False,
+        textual_typology_conjectural=False,
+        royal_inscription=False,
+        license="CC BY-SA 4.0",
+        sites=[{"modern_name": "Marib", "coordinates": [15.4, 45.3]}],
+    )
+
+    document = OpenSearchService(client=FakeMapClient())._epigraph_to_document(epigraph)
+
+    assert document["sites"][0]["coordinates"] == {"lat": 15.4, "lon": 45.3}
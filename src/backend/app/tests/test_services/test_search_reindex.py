@@ -0,0 +1,248 @@
+from types import SimpleNamespace
+
+import pytest
+from opensearchpy.exceptions import NotFoundError
+from sqlmodel import Session
+
+from app.crud.crud_epigraph import epigraph as crud_epigraph
+from app.models.epigraph import EpigraphCreate
+from app.services.search.opensearch import BULK_LOAD_INDEX_SETTINGS, OpenSearchService
+from app.services.search.service import SearchService
+
+
+class FakeIndices:
+    """Indices, aliases and the calls made on them, as a flat log."""
+
+    def __init__(self, indices, aliases):
+        self.indices = {index: {} for index in indices}
+        self.aliases = aliases
+        self.calls = []
+
+    def exists(self, index):
+        return index in self.indices or index in self.aliases.values()
+
+    def create(self, index, body):
+        self.calls.append(("create", index, body["settings"]["refresh_interval"]))
+        self.indices[index] = {}
+
+    def put_settings(self, index, body):
+        self.calls.append(("put_settings", index, body["index"]["refresh_interval"]))
+
+    def refresh(self, index):
+        self.calls.append(("refresh", index))
+
+    def forcemerge(self, index, params):
+        self.calls.append(("forcemerge", index, params["max_num_segments"]))
+
+    def get_alias(self, name):
+        indices = [index for index, alias in self.aliases.items() if alias == name]
+        if not indices:
+            raise NotFoundError(404, "alias_not_found")
+        return {index: {"aliases": {name: {}}} for index in indices}
+
+    def get(self, index):
+        prefix = index.rstrip("*")
+        return {name: {} for name in self.indices if name.startswith(prefix)}
+
+    def update_aliases(self, body):
+        self.calls.append(("update_aliases", body["actions"]))
+        for action in body["actions"]:
+            kind, spec = next(iter(action.items()))
+            if kind == "remove":
+                del self.aliases[spec["index"]]
+            elif kind == "remove_index":
+                del self.indices[spec["index"]]
+            else:
+                self.aliases[spec["index"]] = spec["alias"]
+
+    def delete(self, index, params=None):
+        self.calls.append(("delete", index))
+        self.indices.pop(index, None)
+
+
+class FakeReindexClient:
+    def __init__(self, indices, aliases):
+        self.indices = FakeIndices(indices, aliases)
+        self.document_count = 0
+        self.writes = []
+
+    def count(self, index):
+        self.indices.calls.append(("count", index))
+        return {"count": self.document_count}
+
+    def index(self, index, id, body, refresh=False):
+        self.writes.append(("index", index, id))
+        return {"result": "updated"}
+
+    def delete(self, index, id, params=None):
+        self.writes.append(("delete", index, id))
+        return {"result": "deleted"}
+
+
+def _generation_calls(calls, index_name):
+    return [call[0] for call in calls if index_name in call[1:2] or call[0] == "update_aliases"]
+
+
+def test_reindex_loads_a_new_generation_before_swapping_the_alias(
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    opensearch_available,
+):
+    for dasi_id in (9701, 9702):
+        crud_epigraph.create(
+            session,
+            obj_in=EpigraphCreate(
+                dasi_id=dasi_id,
+                title=f"Epigraph {dasi_id}",
+                epigraph_text="text",
+                uri=f"https://dasi.cnr.it/epigraphs/{dasi_id}",
+                chronology_conjectural=False,
+                textual_typology_conjectural=False,
+                royal_inscription=False,
+                license="CC BY-SA 4.0",
+            ),
+        )
+    client = FakeReindexClient(["epigraphs-1", "epigraphs-0"], {"epigraphs-1": "epigraphs"})
+    opensearch = OpenSearchService(client=client)
+    bulk_loads = []
+
+    def bulk_index_epigraphs(epigraphs, index_name=None, refresh=True, keep_existing=False):
+        bulk_loads.append((index_name, refresh, keep_existing))
+        client.document_count += len(epigraphs)
+        return len(epigraphs), []
+
+    monkeypatch.setattr(opensearch, "bulk_index_epigraphs", bulk_index_epigraphs)
+    search_service = SearchService(session)
+    search_service._opensearch = opensearch
+
+    metrics = search_service.reindex_all_epigraphs()
+
+    new_index = metrics["index"]
+    assert set(bulk_loads) == {(new_index, False, True)}
+    calls = client.indices.calls
+    assert calls[0] == ("create", new_index, BULK_LOAD_INDEX_SETTINGS["refresh_interval"])
+    assert _generation_calls(calls, new_index) == [
+        "create", "put_settings", "refresh", "count", "forcemerge", "update_aliases",
+    ]
+    assert ("update_aliases", [
+        {"remove": {"index": "epigraphs-1", "alias": "epigraphs"}},
+        {"add": {"index": new_index, "alias": "epigraphs"}},
+    ]) in calls
+    assert client.indices.aliases == {new_index: "epigraphs"}
+    assert sorted(client.indices.indices) == [new_index]
+    assert metrics["deleted_indices"] == ["epigraphs-0", "epigraphs-1"]
+    assert metrics["indexed"] == metrics["source_documents"] >= 2
+    assert metrics["index_documents"] == metrics["source_documents"]
+    assert set(metrics["timings"]) == {"load_ms", "bulk_ms", "refresh_ms", "force_merge_ms", "swap_ms", "total_ms"}
+
+
+def test_swap_alias_replaces_a_concrete_index_named_like_the_alias():
+    client = FakeReindexClient(["epigraphs", "epigraphs-2"], {})
+
+    deleted = OpenSearchService(client=client).swap_alias("epigraphs-2")
+
+    assert client.indices.calls == [("update_aliases", [
+        {"remove_index": {"index": "epigraphs"}},
+        {"add": {"index": "epigraphs-2", "alias": "epigraphs"}},
+    ])]
+    assert deleted == ["epigraphs"]
+    assert client.indices.aliases == {"epigraphs-2": "epigraphs"}
+
+
+def test_failed_load_deletes_the_new_generation_and_keeps_the_alias(
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    opensearch_available,
+):
+    client = FakeReindexClient(["epigraphs-1"], {"epigraphs-1": "epigraphs"})
+    opensearch = OpenSearchService(client=client)
+
+    def fail_force_merge(index_name):
+        raise RuntimeError("merge failed")
+
+    monkeypatch.setattr(opensearch, "force_merge_index", fail_force_merge)
+    search_service = SearchService(session)
+    search_service._opensearch = opensearch
+
+    with pytest.raises(RuntimeError):
+        search_service.reindex_all_epigraphs()
+
+    assert sorted(client.indices.indices) == ["epigraphs-1"]
+    assert client.indices.aliases == {"epigraphs-1": "epigraphs"}
+
+
+def test_partial_load_deletes_the_new_generation_and_keeps_the_alias(
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    opensearch_available,
+):
+    crud_epigraph.create(
+        session,
+        obj_in=EpigraphCreate(
+            dasi_id=9703,
+            title="Epigraph 9703",
+            epigraph_text="text",
+            uri="https://dasi.cnr.it/epigraphs/9703",
+            chronology_conjectural=False,
+            textual_typology_conjectural=False,
+            royal_inscription=False,
+            license="CC BY-SA 4.0",
+        ),
+    )
+    client = FakeReindexClient(["epigraphs-1"], {"epigraphs-1": "epigraphs"})
+    opensearch = OpenSearchService(client=client)
+
+    def bulk_index_epigraphs(epigraphs, index_name=None, refresh=True, keep_existing=False):
+        client.document_count += len(epigraphs) - 1
+        return len(epigraphs) - 1, [{"create": {"_id": epigraphs[0].id, "status": 400}}]
+
+    monkeypatch.setattr(opensearch, "bulk_index_epigraphs", bulk_index_epigraphs)
+    search_service = SearchService(session)
+    search_service._opensearch = opensearch
+
+    with pytest.raises(RuntimeError):
+        search_service.reindex_all_epigraphs()
+
+    assert not [call for call in client.indices.calls if call[0] == "update_aliases"]
+    assert sorted(client.indices.indices) == ["epigraphs-1"]
+    assert client.indices.aliases == {"epigraphs-1": "epigraphs"}
+
+
+def test_single_writes_also_reach_the_generation_being_loaded():
+    client = FakeReindexClient(["epigraphs-1", "epigraphs-2"], {"epigraphs-1": "epigraphs"})
+    opensearch = OpenSearchService(client=client)
+    opensearch._epigraph_to_document = lambda epigraph: {"id": epigraph.id}
+
+    opensearch.index_epigraph(SimpleNamespace(id=5))
+    opensearch.delete_epigraph(6)
+
+    assert client.writes == [
+        ("index", "epigraphs-2", 5),
+        ("index", "epigraphs", 5),
+        ("delete", "epigraphs-2", 6),
+        ("delete", "epigraphs", 6),
+    ]
+
+
+def test_generation_loads_keep_documents_written_during_the_load(monkeypatch: pytest.MonkeyPatch):
+    actions = []
+
+    def bulk(client, docs, refresh, raise_on_error):
+        actions.extend(docs)
+        assert raise_on_error is False
+        return 1, [{"create": {"_id": 1, "status": 409}}, {"create": {"_id": 2, "status": 400}}]
+
+    monkeypatch.setattr("opensearchpy.helpers.bulk", bulk)
+    opensearch = OpenSearchService(client=FakeReindexClient([], {}))
+    opensearch._epigraph_to_document = lambda epigraph: {"id": epigraph.id}
+
+    success, failed = opensearch.bulk_index_epigraphs(
+        [SimpleNamespace(id=1), SimpleNamespace(id=2), SimpleNamespace(id=3)],
+        index_name="epigraphs-2",
+        refresh=False,
+        keep_existing=True,
+    )
+
+    assert {action["_op_type"] for action in actions} == {"create"}
+    assert success == 1
+    assert failed == [{"create": {"_id": 2, "status": 400}}]
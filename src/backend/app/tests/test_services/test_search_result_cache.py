@@ -0,0 +1,194 @@
+import pytest
+import redis
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.crud.crud_epigraph import epigraph as crud_epigraph
+from app.models.epigraph import EpigraphCreate
+from app.services.search.result_cache import SearchResultCache, search_cache_key, search_facets_key
+from app.services.search.service import SearchService
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+class BrokenRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise redis.ConnectionError("refused")
+
+        return fail
+
+
+def _key(search_text="almaqah", fields=None, filters=None, skip=0):
+    return search_cache_key(search_text, fields, filters, "_score", "desc", skip, 25)
+
+
+def test_search_cache_key_normalises_query_fields_and_filters():
+    assert _key("krb  ʾl_bn", ["title", "epigraph_text"], {"period": ["A", "B"], "royal_inscription": True}) == _key(
+        " krb ʾl bn", ["epigraph_text", "title"], {"royal_inscription": True, "period": ["B", "A"]}
+    )
+    assert _key("krb ʾl") != _key("Krb ʾl")
+    assert _key(skip=0) != _key(skip=25)
+
+
+def test_results_are_shared_through_redis_until_the_generation_is_bumped(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "SEARCH_CACHE_GENERATION_CHECK_SECONDS", 0)
+    shared = FakeRedis()
+    api, worker = SearchResultCache(shared), SearchResultCache(shared)
+
+    api.set(_key(), ids=[3, 1], total=2, took=0.25, generation=api.generation())
+
+    assert worker.get(_key())["ids"] == [3, 1]
+    assert worker.get(_key())["total"] == 2
+    snapshot = worker.snapshot()
+    assert (snapshot["redis_hits"], snapshot["local_hits"], snapshot["saved_seconds"]) == (1, 1, 0.5)
+
+    worker.bump_generation()
+
+    assert api.get(_key()) is None
+    assert worker.get(_key()) is None
+    assert api.snapshot()["generation"] == 1
+
+
+def test_results_from_before_a_bump_are_not_stored():
+    cache = SearchResultCache(use_redis=False)
+    generation = cache.generation()
+    cache.bump_generation()
+
+    cache.set(_key(), ids=[1], total=1, took=0.1, generation=generation)
+
+    assert cache.get(_key()) is None
+
+
+def test_local_tier_keeps_working_without_redis():
+    cache = SearchResultCache(BrokenRedis())
+
+    cache.set(_key(), ids=[1], total=1, took=0.1, generation=cache.generation())
+
+    assert cache.get(_key())["ids"] == [1]
+    assert cache.snapshot()["redis_errors"] == 1
+
+
+def test_facets_are_cached_per_search_apart_from_pages():
+    cache = SearchResultCache(use_redis=False)
+
+    cache.set_facets(search_facets_key("almaqah", None, {}), facet_counts={"period": []}, total=3, took=0.2)
+
+    assert cache.get_facets(search_facets_key(" almaqah", None, {}))["total"] == 3
+    assert cache.get(search_facets_key("almaqah", None, {})) is None
+
+
+class FakeOpenSearch:
+    def __init__(self, epigraph_ids):
+        self.epigraph_ids = epigraph_ids
+        self.calls = []
+
+    def search_epigraphs(self, **kwargs):
+        self.calls.append(("hits", kwargs))
+        return {
+            "hits": [
+                {"_source": {"id": epigraph_id}}
+                for epigraph_id in self.epigraph_ids[kwargs.get("skip", 0):][:kwargs["limit"]]
+            ],
+            "total": len(self.epigraph_ids),
+            "total_relation": "eq",
+            "aggregations": {},
+            "pit_id": None,
+            "took": {"hits": 3},
+        }
+
+    def search_epigraphs_with_facets(self, facet_fields, **kwargs):
+        results = self.search_epigraphs(**kwargs)
+        self.calls[-1] = ("hits+facets", kwargs)
+        return {**results, "aggregations": {"period": {"values": {"buckets": [{"key": "Early", "doc_count": 2}]}}},
+                "took": {"hits": 3, "facets": 9}}
+
+
+def test_query_epigraphs_serves_repeated_pages_from_the_cache(
+    session: Session,
+    search_result_cache: SearchResultCache,
+    opensearch_available,
+):
+    epigraphs = [
+        crud_epigraph.create(
+            session,
+            obj_in=EpigraphCreate(
+                dasi_id=dasi_id,
+                title=f"Epigraph {dasi_id}",
+                epigraph_text="<p>text</p>",
+                uri=f"https://dasi.cnr.it/epigraphs/{dasi_id}",
+                chronology_conjectural=False,
+                textual_typology_conjectural=False,
+                royal_inscription=False,
+                license="CC BY-SA 4.0",
+            ),
+        )
+        for dasi_id in (9501, 9502)
+    ]
+    opensearch = FakeOpenSearch([epigraphs[1].id, epigraphs[0].id])
+
+    def query():
+        search_service = SearchService(session)
+        search_service._opensearch = opensearch
+        return search_service.opensearch_query_epigraphs(search_text="text", filters={"dasi_published": True})
+
+    first, second = query(), query()
+
+    assert len(opensearch.calls) == 1
+    assert [epigraph.dasi_id for epigraph in second["epigraphs"]] == [9502, 9501]
+    assert second["count"] == first["count"] == 2
+    assert second["facet_counts"] == first["facet_counts"]
+    assert second["timings"]["page_cached"] is True
+
+    search_result_cache.bump_generation()
+    query()
+    assert len(opensearch.calls) == 2
+
+
+def test_later_pages_reuse_cached_facets_and_total(
+    session: Session,
+    opensearch_available,
+):
+    opensearch = FakeOpenSearch([1, 2, 3])
+    search_service = SearchService(session)
+    search_service._opensearch = opensearch
+
+    def query(skip, include_facets=True):
+        return search_service.opensearch_query_epigraphs(
+            search_text="text", skip=skip, limit=1, include_facets=include_facets
+        )
+
+    first, second = query(0), query(1)
+    third = query(2, include_facets=False)
+
+    assert [call[0] for call in opensearch.calls] == ["hits+facets", "hits", "hits"]
+    assert opensearch.calls[1][1]["track_total_hits"] is False
+    assert first["timings"]["facets_ms"] == 9
+    assert (second["timings"]["facets_cached"], second["timings"]["facets_ms"]) == (True, None)
+    assert second["facet_counts"] == first["facet_counts"]
+    assert second["count"] == third["count"] == 3
+    assert third["facet_counts"] == {}
+
+
+def test_skipped_facets_cap_the_total(session: Session, monkeypatch: pytest.MonkeyPatch, opensearch_available):
+    monkeypatch.setattr(settings, "SEARCH_TOTAL_HITS_CAP", 2)
+    opensearch = FakeOpenSearch([1, 2, 3])
+    search_service = SearchService(session)
+    search_service._opensearch = opensearch
+
+    search_service.opensearch_query_epigraphs(search_text="text", limit=1, include_facets=False)
+
+    assert opensearch.calls[0][1]["track_total_hits"] == 2
@@ -0,0 +1,120 @@
+import pytest
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.crud.crud_epigraph import epigraph as crud_epigraph
+from app.models.epigraph import Epigraph, EpigraphCreate, EpigraphOut
+from app.services.search.opensearch import CARD_SOURCE_FIELD, OpenSearchService
+from app.services.search.service import SearchService
+
+
+def _card(epigraph_id: int, dasi_id: int) -> dict:
+    return EpigraphOut(
+        id=epigraph_id,
+        dasi_id=dasi_id,
+        title=f"Card {dasi_id}",
+        uri=f"https://dasi.cnr.it/epigraphs/{dasi_id}",
+        epigraph_text="<lb n='1'/>text",
+        chronology_conjectural=False,
+        textual_typology_conjectural=False,
+        royal_inscription=False,
+        license="CC BY-SA 4.0",
+    ).model_dump(mode="json")
+
+
+class FakeCardClient:
+    def __init__(self, hits):
+        self.hits = hits
+        self.search_bodies = []
+        self.mget_bodies = []
+
+    def _response(self):
+        return {
+            "hits": {"hits": self.hits, "total": {"value": len(self.hits)}, "max_score": 1.0},
+            "aggregations": {},
+            "took": 1,
+        }
+
+    def search(self, index, body):
+        self.search_bodies.append(body)
+        return self._response()
+
+    def msearch(self, body):
+        # Hits and facets searches; only the hits body matters here.
+        self.search_bodies.append(body[1])
+        return {"responses": [self._response(), self._response()]}
+
+    def mget(self, index, body):
+        self.mget_bodies.append(body)
+        sources = {hit["_source"]["id"]: hit["_source"] for hit in self.hits}
+        return {
+            "docs": [
+                {"_id": str(doc["_id"]), "found": doc["_id"] in sources, "_source": sources.get(doc["_id"], {})}
+                for doc in body["docs"]
+            ]
+        }
+
+
+@pytest.fixture
+def stored_epigraph(session: Session) -> Epigraph:
+    return crud_epigraph.create(
+        session,
+        obj_in=EpigraphCreate(
+            dasi_id=9601,
+            title="Stored epigraph",
+            epigraph_text="<p>text</p>",
+            uri="https://dasi.cnr.it/epigraphs/9601",
+            chronology_conjectural=False,
+            textual_typology_conjectural=False,
+            royal_inscription=False,
+            license="CC BY-SA 4.0",
+        ),
+    )
+
+
+def test_results_come_from_stored_cards_and_fall_back_to_postgres(
+    session: Session,
+    stored_epigraph: Epigraph,
+    opensearch_available,
+):
+    client = FakeCardClient([
+        {"_source": {"id": 900001, CARD_SOURCE_FIELD: _card(900001, 9901)}},
+        {"_source": {"id": stored_epigraph.id}},
+    ])
+    search_service = SearchService(session)
+    search_service._opensearch = OpenSearchService(client=client)
+
+    def query():
+        return search_service.opensearch_query_epigraphs(search_text="text", limit=10)
+
+    first = query()
+
+    assert [epigraph.dasi_id for epigraph in first["epigraphs"]] == [9901, 9601]
+    assert isinstance(first["epigraphs"][0], EpigraphOut)
+    assert first["epigraphs"][0].epigraph_text == "<lb n='1'/>text"
+    assert '"_source":["id","card"]' in client.search_bodies[0]
+
+    cached = query()
+
+    assert [epigraph.dasi_id for epigraph in cached["epigraphs"]] == [9901, 9601]
+    assert len(client.search_bodies) == 1
+    assert [doc["_id"] for doc in client.mget_bodies[0]["docs"]] == [900001, stored_epigraph.id]
+
+
+def test_source_only_results_can_be_turned_off(session: Session, monkeypatch: pytest.MonkeyPatch, opensearch_available):
+    monkeypatch.setattr(settings, "SEARCH_SOURCE_ONLY_RESULTS", False)
+    client = FakeCardClient([])
+    search_service = SearchService(session)
+    search_service._opensearch = OpenSearchService(client=client)
+
+    search_service.opensearch_full_text_search(search_text="text")
+
+    assert '"_source":["id"]' in client.search_bodies[0]
+
+
+def test_documents_carry_the_result_card(stored_epigraph: Epigraph):
+    document = OpenSearchService(client=FakeCardClient([]))._epigraph_to_document(stored_epigraph)
+
+    assert document[CARD_SOURCE_FIELD] == EpigraphOut.model_validate(stored_epigraph).model_dump(mode="json")
+    assert document[CARD_SOURCE_FIELD]["epigraph_text"] == "<p>text</p>"
+    assert document["epigraph_text"] == "text"
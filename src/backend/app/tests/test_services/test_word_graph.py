@@ -0,0 +1,65 @@
+import numpy as np
+
+from app.models.links import WordLink
+from app.models.word import Word
+from app.services.text.word_graph import WordGraph, WordGraphService, publish_word_graph
+
+# Reading order: 10 -> 20 -> 30 -> 40, plus 10 -> 30 and 50 -> 20.
+# `WordLink` rows point from a word to the word before it.
+LINKS = np.array([
+    [20, 10, 5],
+    [30, 20, 2],
+    [40, 30, 1],
+    [30, 10, 7],
+    [20, 50, 3],
+])
+
+
+def test_top_neighbours_follow_reading_order():
+    graph = WordGraph.from_links(LINKS)
+
+    assert graph.top_neighbours(10, "successors", 5) == [(30, 7), (20, 5)]
+    assert graph.top_neighbours(10, "successors", 1) == [(30, 7)]
+    assert graph.top_neighbours(20, "predecessors", 5) == [(10, 5), (50, 3)]
+    assert graph.top_neighbours(20, "both", 5) == [(10, 5), (50, 3), (30, 2)]
+    assert graph.top_neighbours(99, "successors", 5) == []
+
+
+def test_reach_and_shortest_path_are_bounded_by_depth():
+    graph = WordGraph.from_links(LINKS)
+
+    assert graph.reach(10, "successors", 1, 10) == [(20, 1), (30, 1)]
+    assert graph.reach(10, "successors", 3, 10) == [(20, 1), (30, 1), (40, 2)]
+    assert graph.reach(10, "successors", 3, 2) == [(20, 1), (30, 1)]
+    assert graph.reach(40, "predecessors", 2, 10) == [(30, 1), (10, 2), (20, 2)]
+
+    assert graph.shortest_path(10, 40, "successors", 4) == [10, 30, 40]
+    assert graph.shortest_path(50, 40, "successors", 2) is None
+    assert graph.shortest_path(50, 40, "successors", 3) == [50, 20, 30, 40]
+    assert graph.shortest_path(40, 50, "successors", 5) is None
+    assert graph.shortest_path(40, 50, "both", 5) == [40, 30, 20, 50]
+
+
+def test_service_memory_maps_published_snapshots(session, tmp_path):
+    words = [Word(word=text, classification="p", frequency=1) for text in ("a", "b", "c")]
+    session.add_all(words)
+    session.flush()
+    session.add(WordLink(from_word_id=words[1].id, to_word_id=words[0].id, count=4))
+    session.commit()
+    service = WordGraphService(tmp_path)
+
+    graph = service.get_graph(session)
+
+    assert isinstance(graph.successors.indices, np.memmap)
+    assert graph.top_neighbours(words[0].id, "successors", 5) == [(words[1].id, 4)]
+
+    session.add(WordLink(from_word_id=words[2].id, to_word_id=words[0].id, count=9))
+    session.commit()
+    publish_word_graph(session, tmp_path)
+    publish_word_graph(session, tmp_path)
+
+    assert service.get_graph(session).top_neighbours(words[0].id, "successors", 5) == [
+        (words[2].id, 9),
+        (words[1].id, 4),
+    ]
+    assert len(list(tmp_path.glob("snapshot-*"))) == 2
@@ -0,0 +1,204 @@
+from sqlmodel import Session, select
+
+from app.crud.crud_epigraph import epigraph as crud_epigraph
+from app.models.epigraph import EpigraphCreate
+from app.models.links import EpigraphWordLink, WordLink
+from app.models.word import EpigraphWordIndex, Word
+from app.services.text.word_index import WordIndexBuilder, tokenize_epigraph_text
+
+
+def _create_epigraph(session: Session, dasi_id: int, epigraph_text: str):
+    return crud_epigraph.create(
+        session,
+        obj_in=EpigraphCreate(
+            dasi_id=dasi_id,
+            title=f"Epigraph {dasi_id}",
+            epigraph_text=epigraph_text,
+            uri=f"https://dasi.cnr.it/epigraphs/{dasi_id}",
+            chronology_conjectural=False,
+            textual_typology_conjectural=False,
+            royal_inscription=False,
+            license="CC BY-SA 4.0",
+        ),
+    )
+
+
+def _word_links(session: Session) -> dict[tuple[int, int], int]:
+    return {
+        (link.from_word_id, link.to_word_id): link.count
+        for link in session.exec(select(WordLink)).all()
+    }
+
+
+def _word_ids(session: Session) -> dict[tuple[str, str | None], int]:
+    return {
+        (word.word, word.classification): word.id
+        for word in session.exec(select(Word).order_by(Word.id)).all()
+    }
+
+
+def test_tokenize_epigraph_text_follows_document_order():
+    tokens = tokenize_epigraph_text('<p>ʾlmqh <w type="name">Krb ʾl</w> bn <w>Ḥlk</w></p>')
+
+    assert tokens == [
+        ("ʾlmqh", "p", {}),
+        ("Krb", "w", {"type": "name"}),
+        ("ʾl", "w", {"type": "name"}),
+        ("bn", None, {}),
+        ("Ḥlk", "w", {}),
+    ]
+
+
+def test_rebuild_replaces_words_links_and_frequencies(session: Session):
+    first = _create_epigraph(session, 9101, "<p>a <w>b</w> a</p>")
+    second = _create_epigraph(session, 9102, "<p>a a</p>")
+    broken = _create_epigraph(session, 9103, "<p>unclosed")
+
+    stale_word = Word(word="a", classification="p", frequency=99)
+    unused_word = Word(word="gone", classification="p", frequency=5)
+    session.add_all([stale_word, unused_word])
+    session.flush()
+    session.add(EpigraphWordLink(epigraph_id=broken.id, word_id=unused_word.id))
+    session.add(WordLink(from_word_id=unused_word.id, to_word_id=stale_word.id, count=7))
+    session.commit()
+
+    result = WordIndexBuilder(session, workers=0).rebuild()
+
+    assert result["status"] == "success"
+    assert result["failed_ids"] == [broken.id]
+    assert result["new_words"] == 2
+
+    word_ids = _word_ids(session)
+    assert word_ids[("a", "p")] == stale_word.id
+    frequencies = {word.id: word.frequency for word in session.exec(select(Word)).all()}
+    assert frequencies[stale_word.id] == 3
+    assert frequencies[word_ids[("b", "w")]] == 1
+    assert frequencies[word_ids[("a", None)]] == 1
+    assert frequencies[unused_word.id] == 0
+    assert session.get(Word, stale_word.id).epigraph_count == 2
+    assert session.get(Word, stale_word.id).incoming_count == 2
+
+    epigraph_links = {
+        (link.epigraph_id, link.word_id)
+        for link in session.exec(select(EpigraphWordLink)).all()
+    }
+    assert epigraph_links == {
+        (first.id, word_ids[("a", "p")]),
+        (first.id, word_ids[("b", "w")]),
+        (first.id, word_ids[("a", None)]),
+        (second.id, word_ids[("a", "p")]),
+    }
+
+    word_links = {
+        (link.from_word_id, link.to_word_id): link.count
+        for link in session.exec(select(WordLink)).all()
+    }
+    assert word_links == {
+        (word_ids[("b", "w")], word_ids[("a", "p")]): 1,
+        (word_ids[("a", None)], word_ids[("b", "w")]): 1,
+        (word_ids[("a", "p")], word_ids[("a", "p")]): 1,
+    }
+
+
+def test_index_epigraph_replaces_its_previous_counts(session: Session):
+    epigraph = _create_epigraph(session, 9201, "<p>x y x</p>")
+    builder = WordIndexBuilder(session, workers=0)
+
+    words = builder.index_epigraph(epigraph)
+
+    assert [(word.word, word.frequency) for word in words] == [("x", 2), ("y", 1)]
+
+    other = _create_epigraph(session, 9202, "<p>y x</p>")
+    builder.index_epigraph(other)
+    builder.index_epigraph(other)
+
+    word_ids = _word_ids(session)
+    assert _word_links(session)[(word_ids[("x", "p")], word_ids[("y", "p")])] == 2
+    assert session.get(Word, word_ids[("y", "p")]).frequency == 2
+
+
+def test_update_changed_applies_deltas_for_changed_and_deleted_epigraphs(session: Session):
+    kept = _create_epigraph(session, 9301, "<p>a b</p>")
+    changed = _create_epigraph(session, 9302, "<p>a b c</p>")
+    deleted = _create_epigraph(session, 9303, "<p>c d</p>")
+    builder = WordIndexBuilder(session, workers=0)
+    builder.rebuild()
+
+    result = builder.update_changed()
+    assert (result["total_items"], result["unchanged_items"]) == (0, 3)
+
+    changed.epigraph_text = "<p>a e</p>"
+    session.add(changed)
+    session.delete(deleted)
+    added = _create_epigraph(session, 9304, "<p>e a</p>")
+
+    result = builder.update_changed()
+
+    assert result["status"] == "success"
+    assert (result["processed_items"], result["unchanged_items"], result["removed_items"]) == (3, 1, 1)
+
+    word_ids = _word_ids(session)
+    frequencies = {word.id: word.frequency for word in session.exec(select(Word)).all()}
+    assert frequencies[word_ids[("a", "p")]] == 3
+    assert frequencies[word_ids[("b", "p")]] == 1
+    assert frequencies[word_ids[("c", "p")]] == 0
+    assert frequencies[word_ids[("d", "p")]] == 0
+    assert frequencies[word_ids[("e", "p")]] == 2
+
+    stats = {
+        word.id: (word.epigraph_count, word.outgoing_count, word.incoming_count)
+        for word in session.exec(select(Word)).all()
+    }
+    assert stats[word_ids[("a", "p")]] == (3, 1, 2)
+    assert stats[word_ids[("c", "p")]] == (0, 0, 0)
+    assert stats[word_ids[("e", "p")]] == (2, 1, 1)
+
+    assert _word_links(session) == {
+        (word_ids[("b", "p")], word_ids[("a", "p")]): 1,
+        (word_ids[("e", "p")], word_ids[("a", "p")]): 1,
+        (word_ids[("a", "p")], word_ids[("e", "p")]): 1,
+    }
+    epigraph_links = {
+        (link.epigraph_id, link.word_id)
+        for link in session.exec(select(EpigraphWordLink)).all()
+    }
+    assert epigraph_links == {
+        (kept.id, word_ids[("a", "p")]),
+        (kept.id, word_ids[("b", "p")]),
+        (changed.id, word_ids[("a", "p")]),
+        (changed.id, word_ids[("e", "p")]),
+        (added.id, word_ids[("a", "p")]),
+        (added.id, word_ids[("e", "p")]),
+    }
+    assert {state.epigraph_id for state in session.exec(select(EpigraphWordIndex)).all()} == {
+        kept.id,
+        changed.id,
+        added.id,
+    }
+
+
+def test_first_update_after_fingerprints_were_added_rebuilds_instead_of_adding(session: Session):
+    _create_epigraph(session, 9401, "<p>a b</p>")
+    _create_epigraph(session, 9402, "<p>a b</p>")
+    builder = WordIndexBuilder(session, workers=0)
+    builder.rebuild()
+    # Counts filled before fingerprints existed, as right after the migration.
+    session.execute(EpigraphWordIndex.__table__.delete())
+    session.commit()
+
+    builder.update_changed()
+
+    word_ids = _word_ids(session)
+    assert session.get(Word, word_ids[("a", "p")]).frequency == 2
+    assert _word_links(session) == {(word_ids[("b", "p")], word_ids[("a", "p")]): 2}
+    assert len(session.exec(select(EpigraphWordIndex)).all()) == 2
+
+
+def test_build_index_tokenizes_in_worker_processes(session: Session):
+    items = [(epigraph_id, f"<p>w{epigraph_id % 3} common</p>") for epigraph_id in range(200)]
+
+    index, failed_ids = WordIndexBuilder(session, workers=2).build_index(items)
+
+    assert failed_ids == []
+    assert index.frequencies[("common", "p")] == 200
+    assert len(index.epigraph_counts) == 200
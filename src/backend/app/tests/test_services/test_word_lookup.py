@@ -0,0 +1,54 @@
+from app.core.config import settings
+from app.models.word import Word
+from app.services.text.word_lookup import WordLookupIndex, WordLookupService, fold_word
+
+
+def test_fold_word_strips_diacritics_and_aleph_ayin_marks():
+    assert fold_word("ʾlmqh") == "lmqh"
+    assert fold_word("ʿṯtr") == "ttr"
+    assert fold_word("Ḥḏrmwt") == "hdrmwt"
+    assert fold_word("'lmqh") == fold_word("ʾlmqh")
+    assert fold_word("[b]n") == "bn"
+
+
+def test_index_ranks_exact_matches_then_frequency():
+    index = WordLookupIndex([
+        (1, "bn", None, 5),
+        (2, "bnw", "w", 40),
+        (3, "bnt", None, 9),
+        (4, "ḥlk", None, 3),
+        (5, "bʿl", None, 70),
+        (6, "bn", "w", 12),
+    ])
+
+    assert [suggestion.id for suggestion in index.suggest("bn", 3)] == [6, 1, 2]
+    assert [suggestion.id for suggestion in index.suggest("b", 2)] == [5, 2]
+    assert [suggestion.word for suggestion in index.suggest("hl")] == ["ḥlk"]
+    assert index.suggest("ʾ") == []
+
+
+def test_index_ranks_long_prefixes_over_the_matching_range():
+    index = WordLookupIndex([
+        (1, "krb", None, 2),
+        (2, "krbʾl", None, 30),
+        (3, "krbm", None, 8),
+        (4, "kr", None, 100),
+    ])
+
+    assert [suggestion.id for suggestion in index.suggest("krb", 10)] == [1, 2, 3]
+
+
+def test_service_rebuilds_when_words_change(session, monkeypatch):
+    monkeypatch.setattr(settings, "WORD_LOOKUP_REFRESH_SECONDS", 3600)
+    session.add(Word(word="ʾlmqh", classification="p", frequency=7))
+    session.commit()
+    service = WordLookupService()
+
+    assert [suggestion.word for suggestion in service.suggest(session, "'lm")] == ["ʾlmqh"]
+
+    session.add(Word(word="ʾlmqhw", classification="p", frequency=3))
+    session.commit()
+    assert len(service.suggest(session, "lm")) == 1
+
+    service.invalidate()
+    assert [suggestion.word for suggestion in service.suggest(session, "lm")] == ["ʾlmqh", "ʾlmqhw"]
@@ -23,10 +23,18 @@ export type { EpigraphChunkUpdate } from './models/EpigraphChunkUpdate';
 export type { EpigraphCreate } from './models/EpigraphCreate';
 export type { EpigraphFacetBucket } from './models/EpigraphFacetBucket';
 export type { EpigraphFacetSchemaFieldResponse } from './models/EpigraphFacetSchemaFieldResponse';
+export type { EpigraphHighlightRequest } from './models/EpigraphHighlightRequest';
+export type { EpigraphHighlightResponse } from './models/EpigraphHighlightResponse';
+export type { EpigraphMapBounds } from './models/EpigraphMapBounds';
+export type { EpigraphMapClusterColumns } from './models/EpigraphMapClusterColumns';
+export type { EpigraphMapMarkerColumns } from './models/EpigraphMapMarkerColumns';
+export type { EpigraphMapRequest } from './models/EpigraphMapRequest';
+export type { EpigraphMapResponse } from './models/EpigraphMapResponse';
 export type { EpigraphMinimal } from './models/EpigraphMinimal';
 export type { EpigraphOut } from './models/EpigraphOut';
 export type { EpigraphQueryRequest } from './models/EpigraphQueryRequest';
 export type { EpigraphQueryResponse } from './models/EpigraphQueryResponse';
+export type { EpigraphQueryTimings } from './models/EpigraphQueryTimings';
 export type { EpigraphSearchDefaultsResponse } from './models/EpigraphSearchDefaultsResponse';
 export type { EpigraphSearchFieldResponse } from './models/EpigraphSearchFieldResponse';
 export type { EpigraphSearchOperatorResponse } from './models/EpigraphSearchOperatorResponse';
@@ -69,6 +77,7 @@ export type { WordConnection } from './models/WordConnection';
 export type { WordCreate } from './models/WordCreate';
 export type { WordOut } from './models/WordOut';
 export type { WordsOut } from './models/WordsOut';
+export type { WordSuggestion } from './models/WordSuggestion';
 export type { WordUpdate } from './models/WordUpdate';
 
 export { $BatchEmbeddingRequest } from './schemas/$BatchEmbeddingRequest';
@@ -87,10 +96,18 @@ export { $EpigraphChunkUpdate } from './schemas/$EpigraphChunkUpdate';
 export { $EpigraphCreate } from './schemas/$EpigraphCreate';
 export { $EpigraphFacetBucket } from './schemas/$EpigraphFacetBucket';
 export { $EpigraphFacetSchemaFieldResponse } from './schemas/$EpigraphFacetSchemaFieldResponse';
+export { $EpigraphHighlightRequest } from './schemas/$EpigraphHighlightRequest';
+export { $EpigraphHighlightResponse } from './schemas/$EpigraphHighlightResponse';
+export { $EpigraphMapBounds } from './schemas/$EpigraphMapBounds';
+export { $EpigraphMapClusterColumns } from './schemas/$EpigraphMapClusterColumns';
+export { $EpigraphMapMarkerColumns } from './schemas/$EpigraphMapMarkerColumns';
+export { $EpigraphMapRequest } from './schemas/$EpigraphMapRequest';
+export { $EpigraphMapResponse } from './schemas/$EpigraphMapResponse';
 export { $EpigraphMinimal } from './schemas/$EpigraphMinimal';
 export { $EpigraphOut } from './schemas/$EpigraphOut';
 export { $EpigraphQueryRequest } from './schemas/$EpigraphQueryRequest';
 export { $EpigraphQueryResponse } from './schemas/$EpigraphQueryResponse';
+export { $EpigraphQueryTimings } from './schemas/$EpigraphQueryTimings';
 export { $EpigraphSearchDefaultsResponse } from './schemas/$EpigraphSearchDefaultsResponse';
 export { $EpigraphSearchFieldResponse } from './schemas/$EpigraphSearchFieldResponse';
 export { $EpigraphSearchOperatorResponse } from './schemas/$EpigraphSearchOperatorResponse';
@@ -133,6 +150,7 @@ export { $WordConnection } from './schemas/$WordConnection';
 export { $WordCreate } from './schemas/$WordCreate';
 export { $WordOut } from './schemas/$WordOut';
 export { $WordsOut } from './schemas/$WordsOut';
+export { $WordSuggestion } from './schemas/$WordSuggestion';
 export { $WordUpdate } from './schemas/$WordUpdate';
 
 export { AnalyticsService } from './services/AnalyticsService';
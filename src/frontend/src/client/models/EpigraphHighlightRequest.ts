@@ -0,0 +1,11 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export type EpigraphHighlightRequest = {
+    search_text?: string;
+    fields?: Array<string>;
+    scope_keys?: (Array<string> | null);
+    ids?: Array<number>;
+};
+
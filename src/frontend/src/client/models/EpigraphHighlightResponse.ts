@@ -0,0 +1,8 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export type EpigraphHighlightResponse = {
+    highlights: Record<string, Record<string, Array<string>>>;
+};
+
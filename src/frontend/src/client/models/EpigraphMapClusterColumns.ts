@@ -0,0 +1,11 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export type EpigraphMapClusterColumns = {
+    keys: Array<string>;
+    latitudes: Array<number>;
+    longitudes: Array<number>;
+    counts: Array<number>;
+};
+
@@ -0,0 +1,13 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export type EpigraphMapMarkerColumns = {
+    ids: Array<number>;
+    dasi_ids: Array<number>;
+    titles: Array<string>;
+    site_names: Array<(string | null)>;
+    latitudes: Array<number>;
+    longitudes: Array<number>;
+};
+
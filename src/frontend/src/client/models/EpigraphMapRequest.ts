@@ -0,0 +1,14 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { EpigraphMapBounds } from './EpigraphMapBounds';
+export type EpigraphMapRequest = {
+    search_text?: string;
+    fields?: Array<string>;
+    scope_keys?: (Array<string> | null);
+    filters?: Record<string, any>;
+    zoom: number;
+    bounds?: (EpigraphMapBounds | null);
+};
+
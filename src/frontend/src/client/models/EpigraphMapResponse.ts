@@ -0,0 +1,15 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { EpigraphMapClusterColumns } from './EpigraphMapClusterColumns';
+import type { EpigraphMapMarkerColumns } from './EpigraphMapMarkerColumns';
+export type EpigraphMapResponse = {
+    zoom: number;
+    clustered: boolean;
+    result_count: number;
+    mapped_count: number;
+    clusters?: (EpigraphMapClusterColumns | null);
+    markers?: (EpigraphMapMarkerColumns | null);
+};
+
@@ -13,5 +13,7 @@ export type EpigraphQueryRequest = {
     page_size?: number;
     sort_field?: (string | null);
     sort_order?: (string | null);
+    cursor?: (string | null);
+    include_facets?: boolean;
 };
 
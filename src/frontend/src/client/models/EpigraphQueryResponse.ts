@@ -4,6 +4,7 @@
 /* eslint-disable */
 import type { EpigraphFacetBucket } from './EpigraphFacetBucket';
 import type { EpigraphFacetSchemaFieldResponse } from './EpigraphFacetSchemaFieldResponse';
+import type { EpigraphQueryTimings } from './EpigraphQueryTimings';
 import type { EpigraphsOut } from './EpigraphsOut';
 export type EpigraphQueryResponse = {
     results: EpigraphsOut;
@@ -14,5 +15,8 @@ export type EpigraphQueryResponse = {
     page_size: number;
     sort_field?: (string | null);
     sort_order: string;
+    next_cursor?: (string | null);
+    count_exact?: boolean;
+    timings?: (EpigraphQueryTimings | null);
 };
 
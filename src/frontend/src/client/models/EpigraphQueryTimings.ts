@@ -0,0 +1,12 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export type EpigraphQueryTimings = {
+    hits_ms?: (number | null);
+    facets_ms?: (number | null);
+    page_cached?: boolean;
+    facets_cached?: boolean;
+    total_ms?: (number | null);
+};
+
@@ -11,11 +11,13 @@ export type TriggerDasiPipelineRequest = {
     end_id?: (number | null);
     dasi_published?: (boolean | null);
     update_existing?: boolean;
+    update_word_index?: (boolean | null);
     run_chunking?: boolean;
     generate_embeddings?: boolean;
     rechunk?: boolean;
     reindex_search?: boolean;
     rate_limit_delay?: number;
+    archive_mode?: (string | null);
     chunk_limit?: (number | null);
 };
 
@@ -9,6 +9,9 @@ export type WordOut = {
     attributes?: (Record<string, any> | null);
     id: number;
     frequency: number;
+    epigraph_count?: number;
+    outgoing_count?: number;
+    incoming_count?: number;
     words?: Array<WordConnection>;
 };
 
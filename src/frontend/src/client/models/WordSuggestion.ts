@@ -0,0 +1,11 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export type WordSuggestion = {
+    id: number;
+    word: string;
+    classification?: (string | null);
+    frequency: number;
+};
+
@@ -6,5 +6,6 @@ import type { WordOut } from './WordOut';
 export type WordsOut = {
     words: Array<WordOut>;
     count: number;
+    next_cursor?: (string | null);
 };
 
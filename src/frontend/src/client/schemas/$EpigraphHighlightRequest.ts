@@ -0,0 +1,34 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export const $EpigraphHighlightRequest = {
+    properties: {
+        search_text: {
+            type: 'string',
+        },
+        fields: {
+            type: 'array',
+            contains: {
+                type: 'string',
+            },
+        },
+        scope_keys: {
+            type: 'any-of',
+            contains: [{
+                type: 'array',
+                contains: {
+                    type: 'string',
+                },
+            }, {
+                type: 'null',
+            }],
+        },
+        ids: {
+            type: 'array',
+            contains: {
+                type: 'number',
+            },
+        },
+    },
+} as const;
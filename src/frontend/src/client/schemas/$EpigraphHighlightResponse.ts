@@ -0,0 +1,21 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export const $EpigraphHighlightResponse = {
+    properties: {
+        highlights: {
+            type: 'dictionary',
+            contains: {
+                type: 'dictionary',
+                contains: {
+                    type: 'array',
+                    contains: {
+                        type: 'string',
+                    },
+                },
+            },
+            isRequired: true,
+        },
+    },
+} as const;
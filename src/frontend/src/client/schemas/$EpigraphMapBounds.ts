@@ -0,0 +1,32 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export const $EpigraphMapBounds = {
+    properties: {
+        west: {
+            type: 'number',
+            isRequired: true,
+            maximum: 180,
+            minimum: -180,
+        },
+        south: {
+            type: 'number',
+            isRequired: true,
+            maximum: 90,
+            minimum: -90,
+        },
+        east: {
+            type: 'number',
+            isRequired: true,
+            maximum: 180,
+            minimum: -180,
+        },
+        north: {
+            type: 'number',
+            isRequired: true,
+            maximum: 90,
+            minimum: -90,
+        },
+    },
+} as const;
@@ -0,0 +1,55 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export const $EpigraphMapMarkerColumns = {
+    properties: {
+        ids: {
+            type: 'array',
+            contains: {
+                type: 'number',
+            },
+            isRequired: true,
+        },
+        dasi_ids: {
+            type: 'array',
+            contains: {
+                type: 'number',
+            },
+            isRequired: true,
+        },
+        titles: {
+            type: 'array',
+            contains: {
+                type: 'string',
+            },
+            isRequired: true,
+        },
+        site_names: {
+            type: 'array',
+            contains: {
+                type: 'any-of',
+                contains: [{
+                    type: 'string',
+                }, {
+                    type: 'null',
+                }],
+            },
+            isRequired: true,
+        },
+        latitudes: {
+            type: 'array',
+            contains: {
+                type: 'number',
+            },
+            isRequired: true,
+        },
+        longitudes: {
+            type: 'array',
+            contains: {
+                type: 'number',
+            },
+            isRequired: true,
+        },
+    },
+} as const;
@@ -0,0 +1,49 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export const $EpigraphMapRequest = {
+    properties: {
+        search_text: {
+            type: 'string',
+        },
+        fields: {
+            type: 'array',
+            contains: {
+                type: 'string',
+            },
+        },
+        scope_keys: {
+            type: 'any-of',
+            contains: [{
+                type: 'array',
+                contains: {
+                    type: 'string',
+                },
+            }, {
+                type: 'null',
+            }],
+        },
+        filters: {
+            type: 'dictionary',
+            contains: {
+                properties: {
+                },
+            },
+        },
+        zoom: {
+            type: 'number',
+            isRequired: true,
+            maximum: 24,
+            minimum: 0,
+        },
+        bounds: {
+            type: 'any-of',
+            contains: [{
+                type: 'EpigraphMapBounds',
+            }, {
+                type: 'null',
+            }],
+        },
+    },
+} as const;
@@ -0,0 +1,40 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export const $EpigraphMapResponse = {
+    properties: {
+        zoom: {
+            type: 'number',
+            isRequired: true,
+        },
+        clustered: {
+            type: 'boolean',
+            isRequired: true,
+        },
+        result_count: {
+            type: 'number',
+            isRequired: true,
+        },
+        mapped_count: {
+            type: 'number',
+            isRequired: true,
+        },
+        clusters: {
+            type: 'any-of',
+            contains: [{
+                type: 'EpigraphMapClusterColumns',
+            }, {
+                type: 'null',
+            }],
+        },
+        markers: {
+            type: 'any-of',
+            contains: [{
+                type: 'EpigraphMapMarkerColumns',
+            }, {
+                type: 'null',
+            }],
+        },
+    },
+} as const;
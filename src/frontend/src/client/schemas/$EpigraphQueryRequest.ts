@@ -65,5 +65,16 @@ export const $EpigraphQueryRequest = {
                 type: 'null',
             }],
         },
+        cursor: {
+            type: 'any-of',
+            contains: [{
+                type: 'string',
+            }, {
+                type: 'null',
+            }],
+        },
+        include_facets: {
+            type: 'boolean',
+        },
     },
 } as const;
@@ -69,5 +69,24 @@ export const $EpigraphQueryResponse = {
             type: 'string',
             isRequired: true,
         },
+        next_cursor: {
+            type: 'any-of',
+            contains: [{
+                type: 'string',
+            }, {
+                type: 'null',
+            }],
+        },
+        count_exact: {
+            type: 'boolean',
+        },
+        timings: {
+            type: 'any-of',
+            contains: [{
+                type: 'EpigraphQueryTimings',
+            }, {
+                type: 'null',
+            }],
+        },
     },
 } as const;
@@ -43,6 +43,14 @@ export const $TriggerDasiPipelineRequest = {
         update_existing: {
             type: 'boolean',
         },
+        update_word_index: {
+            type: 'any-of',
+            contains: [{
+                type: 'boolean',
+            }, {
+                type: 'null',
+            }],
+        },
         run_chunking: {
             type: 'boolean',
         },
@@ -58,6 +66,14 @@ export const $TriggerDasiPipelineRequest = {
         rate_limit_delay: {
             type: 'number',
         },
+        archive_mode: {
+            type: 'any-of',
+            contains: [{
+                type: 'string',
+            }, {
+                type: 'null',
+            }],
+        },
         chunk_limit: {
             type: 'any-of',
             contains: [{
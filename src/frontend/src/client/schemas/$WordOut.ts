@@ -36,6 +36,15 @@ export const $WordOut = {
             type: 'number',
             isRequired: true,
         },
+        epigraph_count: {
+            type: 'number',
+        },
+        outgoing_count: {
+            type: 'number',
+        },
+        incoming_count: {
+            type: 'number',
+        },
         words: {
             type: 'array',
             contains: {
@@ -0,0 +1,28 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export const $WordSuggestion = {
+    properties: {
+        id: {
+            type: 'number',
+            isRequired: true,
+        },
+        word: {
+            type: 'string',
+            isRequired: true,
+        },
+        classification: {
+            type: 'any-of',
+            contains: [{
+                type: 'string',
+            }, {
+                type: 'null',
+            }],
+        },
+        frequency: {
+            type: 'number',
+            isRequired: true,
+        },
+    },
+} as const;
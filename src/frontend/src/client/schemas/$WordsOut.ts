@@ -15,5 +15,13 @@ export const $WordsOut = {
             type: 'number',
             isRequired: true,
         },
+        next_cursor: {
+            type: 'any-of',
+            contains: [{
+                type: 'string',
+            }, {
+                type: 'null',
+            }],
+        },
     },
 } as const;
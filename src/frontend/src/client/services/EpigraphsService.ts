@@ -4,6 +4,10 @@
 /* eslint-disable */
 import type { EpigraphCreate } from '../models/EpigraphCreate';
 import type { EpigraphFacetSchemaFieldResponse } from '../models/EpigraphFacetSchemaFieldResponse';
+import type { EpigraphHighlightRequest } from '../models/EpigraphHighlightRequest';
+import type { EpigraphHighlightResponse } from '../models/EpigraphHighlightResponse';
+import type { EpigraphMapRequest } from '../models/EpigraphMapRequest';
+import type { EpigraphMapResponse } from '../models/EpigraphMapResponse';
 import type { EpigraphOut } from '../models/EpigraphOut';
 import type { EpigraphQueryRequest } from '../models/EpigraphQueryRequest';
 import type { EpigraphQueryResponse } from '../models/EpigraphQueryResponse';
@@ -240,6 +244,16 @@ export class EpigraphsService {
     /**
      * Query Epigraphs
      * Run the new canonical epigraph query contract backed by OpenSearch plus canonical facet values.
+     *
+     * While OpenSearch is unavailable the results come from PostgreSQL, without facet counts.
+     *
+     * Pass a response's `next_cursor` back as `cursor`, with the same query, to
+     * read the following page; `page` is then ignored.
+     *
+     * Set `include_facets` to false when only the page changed and the facets
+     * from an earlier page are still shown: no facets are computed or returned,
+     * and the count may be a lower bound, see `count_exact`. `timings` splits
+     * OpenSearch time between hits and facets.
      * @returns EpigraphQueryResponse Successful Response
      * @throws ApiError
      */
@@ -258,6 +272,55 @@ export class EpigraphsService {
             },
         });
     }
+    /**
+     * Highlight Epigraph Query Results
+     * Return highlighted fragments of the canonical query for the given epigraph ids.
+     *
+     * Query results come without highlights; request them here for the results
+     * on screen. Epigraphs the query doesn't match are left out.
+     * @returns EpigraphHighlightResponse Successful Response
+     * @throws ApiError
+     */
+    public static epigraphsHighlightEpigraphQueryResults({
+        requestBody,
+    }: {
+        requestBody: EpigraphHighlightRequest,
+    }): CancelablePromise<EpigraphHighlightResponse> {
+        return __request(OpenAPI, {
+            method: 'POST',
+            url: '/api/v1/epigraphs/query/highlight',
+            body: requestBody,
+            mediaType: 'application/json',
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Query Epigraph Map
+     * Return clustered map markers for the published epigraphs matching the canonical query filters.
+     *
+     * Below a configured zoom level the sites in `bounds` are aggregated into
+     * clusters, each a centroid and an epigraph count; at and above it the
+     * individual markers in view are returned. Both come as parallel arrays.
+     * @returns EpigraphMapResponse Successful Response
+     * @throws ApiError
+     */
+    public static epigraphsQueryEpigraphMap({
+        requestBody,
+    }: {
+        requestBody: EpigraphMapRequest,
+    }): CancelablePromise<EpigraphMapResponse> {
+        return __request(OpenAPI, {
+            method: 'POST',
+            url: '/api/v1/epigraphs/query/map',
+            body: requestBody,
+            mediaType: 'application/json',
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
     /**
      * Get Epigraph Search Schema Endpoint
      * Return the canonical epigraph search schema for search scopes, advanced fields, and sort options.
@@ -463,6 +526,7 @@ export class EpigraphsService {
     /**
      * Import Epigraphs Range
      * Import epigraphs from external api in a range.
+     * Ranges wider than `shard_size` are split into shards imported in parallel.
      * @returns PipelineRunOut Successful Response
      * @throws ApiError
      */
@@ -471,11 +535,13 @@ export class EpigraphsService {
         endId,
         dasiPublished,
         updateExisting = false,
+        shardSize,
     }: {
         startId: number,
         endId: number,
         dasiPublished?: (boolean | null),
         updateExisting?: boolean,
+        shardSize?: (number | null),
     }): CancelablePromise<PipelineRunOut> {
         return __request(OpenAPI, {
             method: 'POST',
@@ -485,6 +551,7 @@ export class EpigraphsService {
                 'end_id': endId,
                 'dasi_published': dasiPublished,
                 'update_existing': updateExisting,
+                'shard_size': shardSize,
             },
             errors: {
                 422: `Validation Error`,
@@ -655,14 +722,24 @@ export class EpigraphsService {
     }
     /**
      * Parse All Words
-     * Parse words in all epigraphs.
+     * Update the word index for epigraphs whose text changed, or rebuild it from all epigraphs.
      * @returns any Successful Response
      * @throws ApiError
      */
-    public static epigraphsParseAllWords(): CancelablePromise<any> {
+    public static epigraphsParseAllWords({
+        fullRebuild = false,
+    }: {
+        fullRebuild?: boolean,
+    }): CancelablePromise<any> {
         return __request(OpenAPI, {
             method: 'POST',
             url: '/api/v1/epigraphs/parse-words',
+            query: {
+                'full_rebuild': fullRebuild,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
         });
     }
     /**
@@ -197,6 +197,7 @@ export class ObjectsService {
     /**
      * Import Objects Range
      * Import objects from external api in a range.
+     * Ranges wider than `shard_size` are split into shards imported in parallel.
      * @returns PipelineRunOut Successful Response
      * @throws ApiError
      */
@@ -205,11 +206,13 @@ export class ObjectsService {
         endId,
         dasiPublished,
         updateExisting = false,
+        shardSize,
     }: {
         startId: number,
         endId: number,
         dasiPublished?: (boolean | null),
         updateExisting?: boolean,
+        shardSize?: (number | null),
     }): CancelablePromise<PipelineRunOut> {
         return __request(OpenAPI, {
             method: 'POST',
@@ -219,6 +222,7 @@ export class ObjectsService {
                 'end_id': endId,
                 'dasi_published': dasiPublished,
                 'update_existing': updateExisting,
+                'shard_size': shardSize,
             },
             errors: {
                 422: `Validation Error`,
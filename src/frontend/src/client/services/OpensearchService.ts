@@ -31,6 +31,30 @@ export class OpensearchService {
             url: '/api/v1/opensearch/stats',
         });
     }
+    /**
+     * Get Opensearch Health
+     * Get the cached OpenSearch cluster health and info, checking again if `refresh` is set,
+     * together with the state and transitions of the OpenSearch circuit breaker and
+     * the hit/miss counters of the search result cache in this process.
+     * @returns any Successful Response
+     * @throws ApiError
+     */
+    public static opensearchGetOpensearchHealth({
+        refresh = false,
+    }: {
+        refresh?: boolean,
+    }): CancelablePromise<Record<string, any>> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/opensearch/health',
+            query: {
+                'refresh': refresh,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
     /**
      * Index Epigraph
      * Index a specific epigraph to OpenSearch.
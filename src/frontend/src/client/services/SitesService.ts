@@ -213,6 +213,7 @@ export class SitesService {
     /**
      * Import Sites Range
      * Import sites from external api in a range.
+     * Ranges wider than `shard_size` are split into shards imported in parallel.
      * @returns PipelineRunOut Successful Response
      * @throws ApiError
      */
@@ -220,10 +221,12 @@ export class SitesService {
         startId,
         endId,
         updateExisting = false,
+        shardSize,
     }: {
         startId: number,
         endId: number,
         updateExisting?: boolean,
+        shardSize?: (number | null),
     }): CancelablePromise<PipelineRunOut> {
         return __request(OpenAPI, {
             method: 'POST',
@@ -232,6 +235,7 @@ export class SitesService {
                 'start_id': startId,
                 'end_id': endId,
                 'update_existing': updateExisting,
+                'shard_size': shardSize,
             },
             errors: {
                 422: `Validation Error`,
@@ -5,6 +5,7 @@
 import type { WordCreate } from '../models/WordCreate';
 import type { WordOut } from '../models/WordOut';
 import type { WordsOut } from '../models/WordsOut';
+import type { WordSuggestion } from '../models/WordSuggestion';
 import type { WordUpdate } from '../models/WordUpdate';
 import type { CancelablePromise } from '../core/CancelablePromise';
 import { OpenAPI } from '../core/OpenAPI';
@@ -13,6 +14,9 @@ export class WordsService {
     /**
      * Read Words
      * Retrieve words.
+     *
+     * Pass the returned `next_cursor` as `cursor` to fetch the following page;
+     * `skip` is only applied when no cursor is given.
      * @returns WordsOut Successful Response
      * @throws ApiError
      */
@@ -22,6 +26,7 @@ export class WordsService {
         sortField,
         sortOrder,
         filters,
+        cursor,
     }: {
         /**
          * Number of records to skip before returning results
@@ -43,6 +48,10 @@ export class WordsService {
          * JSON-encoded filters
          */
         filters?: (string | null),
+        /**
+         * Opaque cursor returned by the previous page
+         */
+        cursor?: (string | null),
     }): CancelablePromise<WordsOut> {
         return __request(OpenAPI, {
             method: 'GET',
@@ -53,6 +62,7 @@ export class WordsService {
                 'sort_field': sortField,
                 'sort_order': sortOrder,
                 'filters': filters,
+                'cursor': cursor,
             },
             errors: {
                 422: `Validation Error`,
@@ -80,6 +90,34 @@ export class WordsService {
             },
         });
     }
+    /**
+     * Suggest Words
+     * Suggest words starting with `q`, ignoring case, diacritics and aleph/ayin marks.
+     * @returns WordSuggestion Successful Response
+     * @throws ApiError
+     */
+    public static wordsSuggestWords({
+        q,
+        limit = 10,
+    }: {
+        /**
+         * Prefix typed so far
+         */
+        q: string,
+        limit?: number,
+    }): CancelablePromise<Array<WordSuggestion>> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/words/suggest',
+            query: {
+                'q': q,
+                'limit': limit,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
     /**
      * Read Word
      * Retrieve a word by ID.
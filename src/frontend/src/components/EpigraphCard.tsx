@@ -8,11 +8,14 @@ import { Eye, Image, ArrowSquareOut, WarningCircle, X, MagnifyingGlass } from "@
 import { MyDisclosure } from "./Disclosure"
 import { Button, Tooltip, TooltipTrigger, OverlayArrow, ModalOverlay } from "react-aria-components"
 import Carousel from "./Carousel"
+import { derivativeSrcSet, originalImageSrc } from "../utils/imageDerivatives"
 
 const TextRenderer = dynamic(() => import("./TextRenderer"), {
   ssr: false,
 })
 
+const CARD_IMAGE_SIZES = "(min-width: 768px) 384px, 100vw"
+
 interface EpigraphCardProps {
   epigraph: EpigraphOut
   notes?: boolean
@@ -171,25 +174,38 @@ export const EpigraphCard: React.FC<EpigraphCardProps> = ({
                     {image.copyright_free && (
                       <div className="bg-white/40 backdrop-blur-xs rounded-lg p-3 h-full flex flex-col border border-gray-200">
                         <div className="flex-shrink-0 mb-3 relative group aspect-[4/3] w-full">
-                          <img
-                            src={`/public/images/rec_${image.image_id}_high.jpg`}
-                            alt={image.caption || "Epigraph Image"}
-                            className="w-full h-full object-cover rounded-md bg-white border border-gray-200 cursor-pointer hover:opacity-90 transition-opacity"
-                            style={{ minHeight: "120px", maxHeight: "320px" }}
-                            onClick={() => {
-                              const copyrightFreeImages = ((epigraph as any).images as any[])?.filter((img: any) => img.copyright_free) || []
-                              const currentImageIndex = copyrightFreeImages.findIndex((img: any) => img.image_id === image.image_id)
-                              setEnlargedImage({ 
-                                images: copyrightFreeImages.map((img: any) => ({ id: img.image_id, caption: img.caption })),
-                                currentIndex: currentImageIndex
-                              })
-                            }}
-                            onError={(e) => {
-                              e.currentTarget.style.display = "none"
-                              const errorDiv = e.currentTarget.nextElementSibling as HTMLElement
-                              if (errorDiv) errorDiv.style.display = "block"
-                            }}
-                          />
+                          <picture className="contents">
+                            {image.derivatives && (
+                              <source
+                                type="image/webp"
+                                srcSet={derivativeSrcSet(image.derivatives, "webp")}
+                                sizes={CARD_IMAGE_SIZES}
+                              />
+                            )}
+                            <img
+                              src={originalImageSrc(image.image_id)}
+                              srcSet={derivativeSrcSet(image.derivatives, "jpeg")}
+                              sizes={CARD_IMAGE_SIZES}
+                              loading="lazy"
+                              decoding="async"
+                              alt={image.caption || "Epigraph Image"}
+                              className="w-full h-full object-cover rounded-md bg-white border border-gray-200 cursor-pointer hover:opacity-90 transition-opacity"
+                              style={{ minHeight: "120px", maxHeight: "320px" }}
+                              onClick={() => {
+                                const copyrightFreeImages = ((epigraph as any).images as any[])?.filter((img: any) => img.copyright_free) || []
+                                const currentImageIndex = copyrightFreeImages.findIndex((img: any) => img.image_id === image.image_id)
+                                setEnlargedImage({ 
+                                  images: copyrightFreeImages.map((img: any) => ({ id: img.image_id, caption: img.caption })),
+                                  currentIndex: currentImageIndex
+                                })
+                              }}
+                              onError={(e) => {
+                                e.currentTarget.style.display = "none"
+                                const errorDiv = e.currentTarget.parentElement?.nextElementSibling as HTMLElement
+                                if (errorDiv) errorDiv.style.display = "block"
+                              }}
+                            />
+                          </picture>
                           <div className="absolute inset-0 flex items-center justify-center transition-all duration-200 rounded-md cursor-pointer opacity-0 group-hover:opacity-100"
                                onClick={() => {
                                  const copyrightFreeImages = ((epigraph as any).images as any[])?.filter((img: any) => img.copyright_free) || []
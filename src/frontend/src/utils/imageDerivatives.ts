@@ -0,0 +1,28 @@
+export interface ImageDerivativeVariant {
+  format: "webp" | "jpeg"
+  width: number
+  height: number
+  path: string
+}
+
+export interface ImageDerivatives {
+  hash: string
+  width: number
+  height: number
+  variants: ImageDerivativeVariant[]
+}
+
+export const originalImageSrc = (imageId: string): string => `/public/images/rec_${imageId}_high.jpg`
+
+export const derivativeSrcSet = (
+  derivatives: ImageDerivatives | undefined,
+  format: ImageDerivativeVariant["format"],
+): string | undefined => {
+  const variants = derivatives?.variants?.filter((variant) => variant.format === format) || []
+  if (variants.length === 0) return undefined
+
+  return [...variants]
+    .sort((a, b) => a.width - b.width)
+    .map((variant) => `/public/${variant.path} ${variant.width}w`)
+    .join(", ")
+}
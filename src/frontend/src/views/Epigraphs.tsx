@@ -376,6 +376,7 @@ const Epigraphs: React.FC = () => {
   const [pendingScrollEpigraphId, setPendingScrollEpigraphId] = useState<string | null>(null)
   const epigraphRefs = useRef<{[key: string]: HTMLDivElement | null}>({})
   const loadedResultMapMarkerRequestKeyRef = useRef<string | null>(null)
+  const loadedFacetRequestKeyRef = useRef<string | null>(null)
   const hasLoadedAllMapMarkersRef = useRef(false)
 
   useEffect(() => {
@@ -669,6 +670,7 @@ const Epigraphs: React.FC = () => {
             })
           : null
 
+      const includeFacets = markerRequestKey !== loadedFacetRequestKeyRef.current
       const result: EpigraphQueryResponse = await EpigraphsService.epigraphsQueryEpigraphs({
         requestBody: {
           ...queryRequest.requestBody,
@@ -676,12 +678,16 @@ const Epigraphs: React.FC = () => {
           page_size: size,
           sort_field: sort,
           sort_order: order,
+          include_facets: includeFacets,
         },
       })
 
       setEpigraphs(result.results)
-      setFieldValues(result.facets)
-      setFacetCounts(result.facet_counts)
+      if (includeFacets) {
+        loadedFacetRequestKeyRef.current = markerRequestKey
+        setFieldValues(result.facets)
+        setFacetCounts(result.facet_counts)
+      }
       setFacetSchema(result.facet_schema)
       setCurrentPage(page)
       setPageSize(size)